@@ -0,0 +1,36 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Deduplicate concurrent calls for the same key.
+
+    While a call for a key is in flight, further calls for that key wait for its
+    result instead of starting their own. Once it completes, the next call
+    starts anew, so results are shared but never cached.
+
+    The call keeps running if the callers waiting for it are cancelled, so that
+    late joiners can still use its result.
+    """
+
+    def __init__(self):
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._calls
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: K, future: asyncio.Future[V]) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Callers may all be gone, which would leave the exception unretrieved
+        if not future.cancelled():
+            future.exception()
@@ -1,4 +1,5 @@
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Literal
 
 from pydantic import HttpUrl, PostgresDsn, computed_field, field_validator
 from pydantic_settings import BaseSettings, NoDecode
@@ -17,11 +18,41 @@ class Settings(
     LOG_LEVEL: str = "INFO"
     LOG_JSON: bool = True
 
+    STORAGE_BACKEND: Literal["s3", "filesystem"] = "s3"
+    STORAGE_DIR: Path = Path("storage")  # filesystem backend only
     STORAGE_PUBLIC_URL: HttpUrl
     STORAGE_URL: HttpUrl
     STORAGE_ACCESS_KEY: str
     STORAGE_SECRET_KEY: str
     STORAGE_NAME_AUDIO: str
+    STORAGE_MAX_POOL_CONNECTIONS: int = 50
+    STORAGE_KEEPALIVE_TIMEOUT: float = 60.0  # seconds
+    STORAGE_URL_CACHE_MAX_SIZE: int = 10_000
+    STORAGE_URL_CACHE_MIN_VALIDITY: int = 900  # seconds
+    STORAGE_MULTIPART_THRESHOLD: int = 16 * 1024 * 1024  # 16MB
+    STORAGE_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # 8MB
+    STORAGE_MULTIPART_CONCURRENCY: int = 4
+    STORAGE_DOWNLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # 8MB
+    STORAGE_DOWNLOAD_CONCURRENCY: int = 4
+    STORAGE_DELETE_CONCURRENCY: int = 4
+
+    TRACK_CACHE_DIR: Path | None = None  # defaults to a temporary directory
+    TRACK_CACHE_MAX_SIZE: int = 2 * 1024 * 1024 * 1024  # 2GB, 0 disables the cache
+    TRACK_UPLOAD_EXPIRATION: int = 3600  # seconds
+    DIRECT_UPLOAD_EXPIRATION: int = 24 * 3600  # seconds after the upload started
+    UPLOAD_SESSION_EXPIRATION: int = 24 * 3600  # seconds after the last chunk
+    UPLOAD_SESSION_PURGE_INTERVAL: float = 3600.0  # seconds
+
+    AUDIO_PROCESSOR: Literal["native", "pooled"] = "pooled"
+    AUDIO_POOL_MAX_WORKERS: int = 2
+    AUDIO_POOL_MAX_QUEUE_SIZE: int = 16
+    AUDIO_POOL_TIMEOUT: float = 300.0  # seconds
+
+    CLIP_WORKERS: int = 2
+    CLIP_WORKER_POLL_INTERVAL: float = 1.0  # seconds
+    # Seconds a worker has to render a clip before another one takes it over,
+    # which has to be longer than rendering takes
+    CLIP_RENDER_LEASE: int = 600
 
     DB_HOST: str
     DB_PORT: int
@@ -29,6 +60,23 @@ class Settings(
     DB_USER: str
     DB_PASSWORD: str
     DB_ROOT_NAME: str
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a connection
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 keeps connections forever
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # prepared statements per connection
+    # PgBouncer in transaction mode pools the connections and may run each
+    # transaction on another server connection
+    DB_PGBOUNCER: bool = False
+    # Read-only requests go to the replica if set, with the credentials of the
+    # primary
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int | None = None  # defaults to DB_PORT
+    # Seconds a client reads from the primary after a write, to see its own
+    # writes while the replica catches up. Clients have to echo the
+    # X-Read-Primary-Until header of the write back for that.
+    DB_REPLICA_LAG_WINDOW: int = 5
 
     @computed_field
     @property
@@ -42,6 +90,20 @@ class Settings(
             password=self.DB_PASSWORD,
         )
 
+    @computed_field
+    @property
+    def SQLALCHEMY_DATABASE_REPLICA_URI(self) -> PostgresDsn | None:
+        if self.DB_REPLICA_HOST is None:
+            return None
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            host=self.DB_REPLICA_HOST,
+            port=self.DB_REPLICA_PORT or self.DB_PORT,
+            path=self.DB_NAME,
+            username=self.DB_USER,
+            password=self.DB_PASSWORD,
+        )
+
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_ROOT_URI(self) -> PostgresDsn:
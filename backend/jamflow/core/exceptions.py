@@ -103,6 +103,16 @@ class DuplicateEntityError(DataIntegrityError):
     pass
 
 
+class ConcurrentModificationError(DataIntegrityError):
+    """
+    Raised when a resource was changed by someone else since it was read.
+
+    Examples:
+        - Two requests appending to the same upload at the same offset
+        - Saving a record whose version no longer matches the stored one
+    """
+
+
 class RateLimitError(ApplicationError):
     """
     Rate limit exceeded for an external request.
@@ -0,0 +1,56 @@
+import base64
+import binascii
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+
+from jamflow.core.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Rows fetched at a time when a whole listing is streamed
+STREAM_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """
+    Position of the last item of a page in a listing ordered by creation time.
+
+    The ID breaks ties between items created at the same time. Clients receive
+    the cursor as an opaque token and hand it back to request the next page.
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        token = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(token).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """
+        :raises ValidationError: If the token is not a valid cursor.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id = base64.urlsafe_b64decode(padded).decode().split("|")
+            cursor = cls(
+                created_at=datetime.fromisoformat(created_at), id=uuid.UUID(id)
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValidationError("Invalid cursor", field="cursor") from exc
+        # Creation times are stored with a timezone and can't be compared to
+        # naive ones
+        if cursor.created_at.tzinfo is None:
+            raise ValidationError("Invalid cursor", field="cursor")
+        return cursor
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    items: Sequence[T]
+    next_cursor: Cursor | None = None
@@ -1,6 +1,9 @@
 import uuid
+from collections.abc import AsyncIterator
 from typing import Protocol, Sequence
 
+from jamflow.core.pagination import Cursor, Page
+
 
 class Repository[M](Protocol):
     async def create(self, model: M) -> M:
@@ -12,4 +15,18 @@ class Repository[M](Protocol):
 
     async def get_by_id(self, id: uuid.UUID) -> M | None: ...
     async def list_all(self) -> Sequence[M]: ...
+
+    async def list_page(self, *, limit: int, cursor: Cursor | None = None) -> Page[M]:
+        """
+        List up to `limit` models in order of creation, starting after `cursor`.
+        """
+        ...
+
+    def iter_batches(self, *, batch_size: int) -> AsyncIterator[Sequence[M]]:
+        """
+        Go through all models in order of creation, fetching up to `batch_size`
+        of them at a time as the batches are consumed.
+        """
+        ...
+
     async def list_by_ids(self, ids: list[uuid.UUID]) -> Sequence[M]: ...
@@ -0,0 +1,138 @@
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, BinaryIO, cast
+
+
+async def read_at_least(chunks: AsyncIterator[bytes], size: int) -> bytes:
+    """
+    Read chunks until at least `size` bytes are gathered or the chunks run out.
+    """
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = await anext(chunks, None)
+        if chunk is None:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+async def prepend(data: bytes, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Put `data` in front of already partially consumed chunks."""
+    if data:
+        yield data
+    async for chunk in chunks:
+        yield chunk
+
+
+async def rechunk(chunks: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    """
+    Regroup chunks into blocks of `size` bytes. Only the last block may be
+    smaller.
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+class EdgeBuffer:
+    """
+    Keeps the first and last bytes of a stream passing through.
+
+    Most audio formats store what is needed to tell their length in a header
+    at the start or in the last few pages, so the edges of a stream are usually
+    enough to inspect it after it has been passed on.
+    """
+
+    def __init__(self, *, head_size: int, tail_size: int):
+        self._head_size = head_size
+        self._tail_size = tail_size
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        missing = self._head_size - len(self._head)
+        if missing > 0:
+            self._head += chunk[:missing]
+        self._tail += chunk[-self._tail_size :]
+        del self._tail[: -self._tail_size]
+
+    def open(self, fallback: BinaryIO) -> BinaryIO:
+        """
+        Open the stream as a file that serves reads from the kept edges.
+
+        :param fallback: File with the whole stream for reads between the edges.
+        """
+        return open_edges(bytes(self._head), bytes(self._tail), self.size, fallback)
+
+
+def open_edges(head: bytes, tail: bytes, size: int, fallback: BinaryIO) -> BinaryIO:
+    """
+    Open a stream of `size` bytes as a file that serves reads from its first
+    and last bytes.
+
+    :param fallback: File with the whole stream for reads between the edges.
+    """
+    # Unbuffered, since reading ahead would reach past the edges
+    return cast(BinaryIO, _EdgeFile(head, tail, size, fallback))
+
+
+class _EdgeFile(io.RawIOBase):
+    def __init__(self, head: bytes, tail: bytes, size: int, fallback: BinaryIO):
+        super().__init__()
+        self._head = head
+        self._tail = tail
+        self._size = size
+        self._fallback = fallback
+        self._tail_start = self._size - len(tail)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = self._size + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        end = min(self._position + len(view), self._size)
+        read = 0
+        while self._position < end:
+            if self._position < len(self._head):
+                data = self._head[self._position : end]
+            elif self._position >= self._tail_start:
+                offset = self._position - self._tail_start
+                data = self._tail[offset : end - self._tail_start]
+            else:
+                self._fallback.seek(self._position)
+                data = self._fallback.read(min(end, self._tail_start) - self._position)
+                if not data:
+                    break
+            view[read : read + len(data)] = data
+            read += len(data)
+            self._position += len(data)
+        return read
@@ -1,3 +1,7 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
 from fastapi import FastAPI, status
 from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,9 +18,34 @@ from jamflow.infra.api.exception_handlers import (
     page_not_found_handler,
 )
 from jamflow.infra.api.middlewares import (
+    READ_PRIMARY_HEADER,
+    read_your_writes_middleware,
     request_bind_log_context_middleware,
     request_id_middleware,
 )
+from jamflow.infra.api.v1.schemas import NEXT_CURSOR_HEADER, UPLOAD_SESSION_HEADERS
+from jamflow.infra.audio import pooled_audio_processor
+from jamflow.infra.database.session import get_pool_info
+from jamflow.infra.jobs import clip_worker_pool, upload_session_purger
+from jamflow.infra.storage.s3 import shared_storage_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
+    """
+    Set up and tear down resources shared across requests.
+    """
+    if settings.STORAGE_BACKEND == "s3":
+        await shared_storage_client.start([settings.STORAGE_NAME_AUDIO])
+    clip_worker_pool.start()
+    upload_session_purger.start()
+    try:
+        yield
+    finally:
+        await upload_session_purger.stop()
+        await clip_worker_pool.stop()
+        await shared_storage_client.stop()
+        pooled_audio_processor.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -25,8 +54,9 @@ def create_app() -> FastAPI:
     """
     configure_logging()
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
+    app.middleware("http")(read_your_writes_middleware)
     app.middleware("http")(request_bind_log_context_middleware)
     app.middleware("http")(request_id_middleware)
     app.add_middleware(
@@ -35,6 +65,11 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[
+            NEXT_CURSOR_HEADER,
+            READ_PRIMARY_HEADER,
+            *UPLOAD_SESSION_HEADERS,
+        ],
     )
 
     app.exception_handler(ApplicationError)(application_exception_handler)
@@ -44,8 +79,12 @@ def create_app() -> FastAPI:
     app.add_exception_handler(status.HTTP_404_NOT_FOUND, page_not_found_handler)
 
     @app.get("/health", tags=["health"])
-    def health_check() -> dict[str, str]:
-        return {"status": "ok"}
+    def health_check() -> dict[str, Any]:
+        pool_info = get_pool_info()
+        return {
+            "status": "ok",
+            "database_pool": pool_info._asdict() if pool_info is not None else None,
+        }
 
     app.include_router(api_router)
 
@@ -1,24 +1,48 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Header, Query, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from jamflow.core.config import settings
+from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.core.pagination import MAX_PAGE_SIZE, Cursor
+from jamflow.infra.api.middlewares import READ_PRIMARY_HEADER, reads_primary
+from jamflow.infra.api.uploads import (
+    MultipartTrackUpload,
+    parse_upload_session_create_dto,
+)
 from jamflow.infra.bootstrap import (
+    build_append_to_upload_session,
     build_create_clip,
     build_create_track,
+    build_create_upload_session,
+    build_delete_upload_session,
+    build_finish_track_upload,
     build_list_clip,
     build_list_track,
     build_read_clip,
     build_read_track,
+    build_read_upload_session,
+    build_start_track_upload,
+    default_file_system_storage,
 )
-from jamflow.infra.database import get_session
+from jamflow.infra.database import get_replica_session, get_session
+from jamflow.infra.storage.filesystem import FileSystemStorage
+from jamflow.recordings.protocols import TrackUpload
+from jamflow.recordings.schemas import UploadSessionCreateDto
 from jamflow.recordings.use_cases import (
+    AppendToUploadSession,
     CreateClip,
     CreateTrack,
+    CreateUploadSession,
+    DeleteUploadSession,
+    FinishTrackUpload,
     ListClip,
     ListTrack,
     ReadClip,
     ReadTrack,
+    ReadUploadSession,
+    StartTrackUpload,
 )
 
 SessionDep = Annotated[
@@ -26,6 +50,76 @@ SessionDep = Annotated[
     Depends(get_session),
 ]
 
+ReplicaSessionDep = Annotated[
+    AsyncSession,
+    Depends(get_replica_session),
+]
+
+
+def get_read_only_session(
+    session: SessionDep,
+    replica_session: ReplicaSessionDep,
+    read_primary_until: Annotated[
+        str | None,
+        Header(
+            alias=READ_PRIMARY_HEADER,
+            description="Echo of the header of the last write, to read it back",
+        ),
+    ] = None,
+) -> AsyncSession:
+    """
+    Pick the replica for reads, unless the client wrote something just before.
+
+    Both sessions only connect once used, so the one left out costs nothing.
+    """
+    if reads_primary(read_primary_until):
+        return session
+    return replica_session
+
+
+ReadOnlySessionDep = Annotated[
+    AsyncSession,
+    Depends(get_read_only_session),
+]
+
+
+def get_cursor(cursor: str | None = None) -> Cursor | None:
+    return None if cursor is None else Cursor.decode(cursor)
+
+
+CursorDep = Annotated[
+    Cursor | None,
+    Depends(get_cursor),
+]
+
+PageLimitQuery = Annotated[
+    int,
+    Query(ge=1, le=MAX_PAGE_SIZE),
+]
+
+
+def get_track_upload(request: Request) -> TrackUpload:
+    return MultipartTrackUpload(request)
+
+
+TrackUploadDep = Annotated[
+    TrackUpload,
+    Depends(get_track_upload),
+]
+
+
+def get_upload_session_create_dto(
+    upload_length: Annotated[str | None, Header()] = None,
+    upload_metadata: Annotated[str | None, Header()] = None,
+) -> UploadSessionCreateDto:
+    return parse_upload_session_create_dto(upload_length, upload_metadata)
+
+
+UploadSessionCreateDtoDep = Annotated[
+    UploadSessionCreateDto,
+    Depends(get_upload_session_create_dto),
+]
+
 
 def get_create_track(session: SessionDep) -> CreateTrack:
     return build_create_track(session)
@@ -37,7 +131,67 @@ CreateTrackDep = Annotated[
 ]
 
 
-def get_read_track(session: SessionDep) -> ReadTrack:
+def get_start_track_upload(session: SessionDep) -> StartTrackUpload:
+    return build_start_track_upload(session)
+
+
+StartTrackUploadDep = Annotated[
+    StartTrackUpload,
+    Depends(get_start_track_upload),
+]
+
+
+def get_finish_track_upload(session: SessionDep) -> FinishTrackUpload:
+    return build_finish_track_upload(session)
+
+
+FinishTrackUploadDep = Annotated[
+    FinishTrackUpload,
+    Depends(get_finish_track_upload),
+]
+
+
+def get_create_upload_session(session: SessionDep) -> CreateUploadSession:
+    return build_create_upload_session(session)
+
+
+CreateUploadSessionDep = Annotated[
+    CreateUploadSession,
+    Depends(get_create_upload_session),
+]
+
+
+def get_read_upload_session(session: SessionDep) -> ReadUploadSession:
+    return build_read_upload_session(session)
+
+
+ReadUploadSessionDep = Annotated[
+    ReadUploadSession,
+    Depends(get_read_upload_session),
+]
+
+
+def get_append_to_upload_session(session: SessionDep) -> AppendToUploadSession:
+    return build_append_to_upload_session(session)
+
+
+AppendToUploadSessionDep = Annotated[
+    AppendToUploadSession,
+    Depends(get_append_to_upload_session),
+]
+
+
+def get_delete_upload_session(session: SessionDep) -> DeleteUploadSession:
+    return build_delete_upload_session(session)
+
+
+DeleteUploadSessionDep = Annotated[
+    DeleteUploadSession,
+    Depends(get_delete_upload_session),
+]
+
+
+def get_read_track(session: ReadOnlySessionDep) -> ReadTrack:
     return build_read_track(session)
 
 
@@ -47,7 +201,7 @@ ReadTrackDep = Annotated[
 ]
 
 
-def get_list_track(session: SessionDep) -> ListTrack:
+def get_list_track(session: ReadOnlySessionDep) -> ListTrack:
     return build_list_track(session)
 
 
@@ -67,7 +221,7 @@ CreateClipDep = Annotated[
 ]
 
 
-def get_list_clip(session: SessionDep) -> ListClip:
+def get_list_clip(session: ReadOnlySessionDep) -> ListClip:
     return build_list_clip(session)
 
 
@@ -77,7 +231,7 @@ ListClipDep = Annotated[
 ]
 
 
-def get_read_clip(session: SessionDep) -> ReadClip:
+def get_read_clip(session: ReadOnlySessionDep) -> ReadClip:
     return build_read_clip(session)
 
 
@@ -85,3 +239,16 @@ ReadClipDep = Annotated[
     ReadClip,
     Depends(get_read_clip),
 ]
+
+
+def get_file_system_storage() -> FileSystemStorage:
+    # Only the filesystem backend serves its files through the API
+    if settings.STORAGE_BACKEND != "filesystem":
+        raise ResourceNotFoundError("File not found")
+    return default_file_system_storage()
+
+
+FileSystemStorageDep = Annotated[
+    FileSystemStorage,
+    Depends(get_file_system_storage),
+]
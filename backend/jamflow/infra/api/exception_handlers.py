@@ -66,9 +66,10 @@ async def application_exception_handler(
     else:
         await logger.ainfo("Application exception handled", exc_info=exc, **exc.context)
 
+    field = exc.field if isinstance(exc, ValidationError) else None
     error_content = ApiErrorDto(
         code=error_code,
-        details=[ErrorDetailDto(message=exc.message)],
+        details=[ErrorDetailDto(message=exc.message, field=field)],
     )
 
     return JSONResponse(
@@ -176,11 +177,15 @@ async def page_not_found_handler(
 
 def get_http_status(exec_type: type[ApplicationError]) -> int:
     """
-    Get the HTTP status code for a given application error type.
+    Get the HTTP status code for a given application error type or the closest
+    of its base classes.
 
     :rasises KeyError: If no status code is registered for the error type.
     """
-    return _APP_ERROR_HTTP_STATUS_MAP[exec_type]  # ty: ignore[invalid-argument-type]
+    for error_type in exec_type.__mro__:
+        if error_type in _APP_ERROR_HTTP_STATUS_MAP:
+            return _APP_ERROR_HTTP_STATUS_MAP[error_type]  # ty: ignore[invalid-argument-type]
+    raise KeyError(exec_type)
 
 
 def get_error_code(status_code: int) -> ErrorCode:
@@ -1,12 +1,22 @@
+import math
+import time
 import uuid
 from collections.abc import Awaitable, Callable
 
 from fastapi import Request, Response
 
+from jamflow.core.config import settings
 from jamflow.core.log import bind_log_context, clear_log_context, get_logger
 
 logger = get_logger()
 
+# Sent with the time until which a client should read from the primary, which
+# the client echoes back on its following requests. A header works across
+# origins without credentials, unlike a cookie.
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 
 async def request_id_middleware(
     request: Request,
@@ -50,3 +60,37 @@ async def request_bind_log_context_middleware(
 
     await logger.ainfo("Request processed", status_code=response.status_code)
     return response
+
+
+async def read_your_writes_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    Have a client read from the primary database for a while after it changed
+    something, so that it doesn't miss its own writes on a lagging replica.
+
+    The time is a Unix timestamp, which is only ever compared to the clock of
+    the server.
+    """
+    response = await call_next(request)
+
+    if (
+        settings.SQLALCHEMY_DATABASE_REPLICA_URI is not None
+        and request.method not in _SAFE_METHODS
+        and response.status_code < 400
+    ):
+        read_primary_until = math.ceil(time.time() + settings.DB_REPLICA_LAG_WINDOW)
+        response.headers[READ_PRIMARY_HEADER] = str(read_primary_until)
+
+    return response
+
+
+def reads_primary(read_primary_until: str | None) -> bool:
+    """Check if the time echoed back by a client to read from the primary is ahead."""
+    if read_primary_until is None:
+        return False
+    try:
+        return float(read_primary_until) > time.time()
+    except ValueError:
+        return False
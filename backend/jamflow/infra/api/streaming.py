@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Lines are sent in chunks of about this size rather than one by one, which
+# would cost a write to the socket for every item
+_CHUNK_SIZE = 64 * 1024
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    return accept is not None and NDJSON_MEDIA_TYPE in accept.lower()
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Response with a JSON document per line, sent while the items arrive.
+
+    Neither the items nor the body are held as a whole, so memory use doesn't
+    grow with the number of items and the first ones go out before the last
+    are read.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(self, items: AsyncIterable[BaseModel]):
+        super().__init__(_to_lines(items))
+
+
+async def _to_lines(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    chunk = bytearray()
+    async for item in items:
+        chunk += item.model_dump_json().encode()
+        chunk += b"\n"
+        if len(chunk) >= _CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
@@ -0,0 +1,216 @@
+import base64
+import binascii
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pydantic
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from python_multipart.multipart import (
+    MultipartParseError,
+    MultipartParser,
+    parse_options_header,
+)
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.recordings.schemas import TrackCreateDto, UploadSessionCreateDto
+
+FILE_FIELD = "upload_file"
+
+# Text fields only carry short metadata
+_MAX_FIELD_SIZE = 64 * 1024
+
+_MISSING_FILE_ERROR = {
+    "type": "missing",
+    "loc": ("body", FILE_FIELD),
+    "msg": "Field required",
+    "input": None,
+}
+
+
+class MultipartTrackUpload:
+    """
+    Track upload read from a multipart form while the request body arrives.
+
+    FastAPI spools uploaded files to disk before the endpoint is called. The
+    body is parsed here instead, handing on the file chunk by chunk as it is
+    received, so that it is read once and never held as a whole. The other
+    fields are collected on the way and validated at the end of the body.
+    """
+
+    def __init__(self, request: Request):
+        self._request = request
+        self._fields: dict[str, str] = {}
+        self._file_chunks: list[bytes] = []
+        self._has_file = False
+        self._track_create_dto: TrackCreateDto | None = None
+
+        self._header_name = b""
+        self._header_value = b""
+        self._content_disposition = b""
+        self._part_name: str | None = None
+        self._part_is_file = False
+        self._part_is_field = False
+        self._field_data = bytearray()
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        :raises ValidationError: if the body is not a valid multipart form.
+        :raises RequestValidationError: if the body is no multipart form or,
+            once its end is reached, if the file is missing or the fields are
+            invalid.
+        """
+        parser = MultipartParser(
+            self._get_boundary(),
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+            },
+        )
+        try:
+            async for data in self._request.stream():
+                parser.write(data)
+                chunks, self._file_chunks = self._file_chunks, []
+                for chunk in chunks:
+                    yield chunk
+            parser.finalize()
+        except MultipartParseError as exc:
+            raise ValidationError("Invalid multipart form") from exc
+
+        self._track_create_dto = self._validate()
+
+    def get_track_create_dto(self) -> TrackCreateDto:
+        if self._track_create_dto is None:
+            raise RuntimeError("The upload has not been read to the end")
+        return self._track_create_dto
+
+    def _get_boundary(self) -> bytes:
+        content_type, options = parse_options_header(
+            self._request.headers.get("Content-Type")
+        )
+        if content_type != b"multipart/form-data":
+            # Forms without files are sent URL encoded
+            raise RequestValidationError([_MISSING_FILE_ERROR])
+        if b"boundary" not in options:
+            raise ValidationError("Missing boundary in multipart form")
+        return options[b"boundary"]
+
+    def _on_part_begin(self) -> None:
+        self._content_disposition = b""
+        self._part_name = None
+        self._part_is_file = False
+        self._part_is_field = False
+        self._field_data.clear()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._content_disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._content_disposition)
+        name = options.get(b"name")
+        self._part_name = name.decode(errors="replace") if name is not None else None
+        has_filename = b"filename" in options
+        # Only the first file is the track, any others are skipped
+        self._part_is_file = (
+            self._part_name == FILE_FIELD and has_filename and not self._has_file
+        )
+        self._part_is_field = self._part_name is not None and not has_filename
+        self._has_file = self._has_file or self._part_is_file
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part_is_file:
+            self._file_chunks.append(data[start:end])
+        elif self._part_is_field:
+            if len(self._field_data) + end - start > _MAX_FIELD_SIZE:
+                raise ValidationError("Form field is too large", field=self._part_name)
+            self._field_data += data[start:end]
+
+    def _on_part_end(self) -> None:
+        if self._part_is_field and self._part_name is not None:
+            self._fields[self._part_name] = self._field_data.decode(errors="replace")
+
+    def _validate(self) -> TrackCreateDto:
+        errors: list[dict[str, Any]] = []
+        if not self._has_file:
+            errors.append(_MISSING_FILE_ERROR)
+
+        track_create_dto = None
+        try:
+            track_create_dto = TrackCreateDto.model_validate(self._fields)
+        except pydantic.ValidationError as exc:
+            errors.extend(
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            )
+
+        if errors or track_create_dto is None:
+            raise RequestValidationError(errors)
+        return track_create_dto
+
+
+def parse_upload_session_create_dto(
+    upload_length: str | None, upload_metadata: str | None
+) -> UploadSessionCreateDto:
+    """
+    Read the metadata of a resumable upload from the headers of its creation
+    request.
+
+    The size is given in `Upload-Length`. The track metadata is given in
+    `Upload-Metadata` as comma separated pairs of a key and its value encoded
+    in base64.
+
+    :raises RequestValidationError: if the size or metadata is invalid.
+    """
+    try:
+        fields = _parse_upload_metadata(upload_metadata or "")
+    except ValueError as exc:
+        error = {
+            "type": "value_error",
+            "loc": ("header", "Upload-Metadata"),
+            "msg": str(exc),
+            "input": upload_metadata,
+        }
+        raise RequestValidationError([error]) from exc
+
+    try:
+        return UploadSessionCreateDto.model_validate(fields | {"size": upload_length})
+    except pydantic.ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("header", *_to_header_loc(error["loc"]))}
+                for error in exc.errors(include_url=False)
+            ]
+        ) from exc
+
+
+def _to_header_loc(loc: tuple[int | str, ...]) -> tuple[int | str, ...]:
+    if loc == ("size",):
+        return ("Upload-Length",)
+    return ("Upload-Metadata", *loc)
+
+
+def _parse_upload_metadata(upload_metadata: str) -> dict[str, str]:
+    fields = {}
+    for pair in upload_metadata.split(","):
+        if not pair.strip():
+            continue
+        key, _, value = pair.strip().partition(" ")
+        try:
+            fields[key] = base64.b64decode(value, validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError) as exc:
+            raise ValueError(f"Invalid base64 value of {key}") from exc
+    return fields
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
-from .routes import clip, track
+from .routes import clip, file, track, upload_session
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(track.router)
+router.include_router(upload_session.router)
 router.include_router(clip.router)
+router.include_router(file.router)
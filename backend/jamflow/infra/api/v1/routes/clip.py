@@ -1,7 +1,18 @@
-from fastapi import APIRouter, status
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Request, Response, status
 from pydantic import UUID4
 
-from jamflow.infra.api.deps import CreateClipDep, ListClipDep, ReadClipDep
+from jamflow.core.pagination import DEFAULT_PAGE_SIZE
+from jamflow.infra.api.deps import (
+    CreateClipDep,
+    CursorDep,
+    ListClipDep,
+    PageLimitQuery,
+    ReadClipDep,
+)
+from jamflow.infra.api.streaming import NDJSONResponse, accepts_ndjson
+from jamflow.infra.api.v1.schemas import NEXT_CURSOR_HEADER, PAGINATED_RESPONSES
 from jamflow.recordings.schemas import ClipCreateDto, ClipReadDto
 
 router = APIRouter(prefix="/clips", tags=["clips"])
@@ -12,16 +23,32 @@ router = APIRouter(prefix="/clips", tags=["clips"])
     status_code=status.HTTP_201_CREATED,
     response_model=ClipReadDto,
     responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": "Clip is rendered in the background, "
+            "requested with `Prefer: respond-async`",
+            "model": ClipReadDto,
+        },
         status.HTTP_404_NOT_FOUND: {
             "description": "Track not found",
             "content": {"application/json": {"example": {"detail": "Track not found"}}},
-        }
+        },
     },
 )
 async def clip_create_view(
-    use_case: CreateClipDep, clip_create_dto: ClipCreateDto
+    use_case: CreateClipDep,
+    clip_create_dto: ClipCreateDto,
+    request: Request,
+    response: Response,
+    prefer: Annotated[str | None, Header()] = None,
 ) -> ClipReadDto:
-    clip = await use_case.execute(clip_create_dto)
+    respond_async = prefer is not None and "respond-async" in prefer.lower()
+    clip = await use_case.execute(clip_create_dto, defer=respond_async)
+    if respond_async:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = str(
+            request.url_for("clip_read_view", clip_id=clip.id)
+        )
+        response.headers["Preference-Applied"] = "respond-async"
     return clip
 
 
@@ -29,12 +56,24 @@ async def clip_create_view(
     "",
     status_code=status.HTTP_200_OK,
     response_model=list[ClipReadDto],
+    responses=PAGINATED_RESPONSES,
 )
 async def clip_list_view(
     use_case: ListClipDep,
+    response: Response,
+    cursor: CursorDep,
     track_id: UUID4 | None = None,
-) -> list[ClipReadDto]:
-    return await use_case.execute(track_id)
+    limit: PageLimitQuery = DEFAULT_PAGE_SIZE,
+    accept: Annotated[str | None, Header()] = None,
+) -> list[ClipReadDto] | Response:
+    # Exports of all clips are streamed instead of paged
+    if accepts_ndjson(accept):
+        return NDJSONResponse(use_case.stream(track_id))
+
+    page = await use_case.execute(track_id, limit=limit, cursor=cursor)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor.encode()
+    return list(page.items)
 
 
 @router.get(
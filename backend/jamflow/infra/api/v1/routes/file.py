@@ -0,0 +1,57 @@
+"""
+Files of the filesystem storage backend, which has no server of its own.
+
+Downloads and uploads are authorized by the signature of the URL or upload
+form the storage generated for them.
+"""
+
+import asyncio
+import mimetypes
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from starlette.datastructures import UploadFile
+
+from jamflow.core.exceptions import ResourceNotFoundError, ValidationError
+from jamflow.infra.api.deps import FileSystemStorageDep
+
+router = APIRouter(prefix="/files", tags=["files"])
+
+_UPLOAD_FILE_FIELD = "file"
+
+
+@router.get("/{path:path}", response_class=FileResponse)
+async def file_read_view(
+    storage: FileSystemStorageDep,
+    path: str,
+    expires: Annotated[int, Query()],
+    signature: Annotated[str, Query()],
+) -> FileResponse:
+    target = storage.verify_url(path, expires=expires, signature=signature)
+    if not await asyncio.to_thread(target.is_file):
+        raise ResourceNotFoundError("File not found")
+
+    # Sent with sendfile where the server supports it, range requests included
+    media_type, _ = mimetypes.guess_type(path)
+    return FileResponse(target, media_type=media_type or "application/octet-stream")
+
+
+@router.post("/", status_code=status.HTTP_204_NO_CONTENT)
+async def file_upload_view(storage: FileSystemStorageDep, request: Request) -> Response:
+    async with request.form() as form:
+        fields = {key: value for key, value in form.items() if isinstance(value, str)}
+        path, content_type, max_size = storage.verify_upload_form(fields)
+
+        upload_file = form.get(_UPLOAD_FILE_FIELD)
+        if not isinstance(upload_file, UploadFile):
+            raise ValidationError("Missing file", field=_UPLOAD_FILE_FIELD)
+        if not upload_file.size or upload_file.size > max_size:
+            raise ValidationError(
+                f"File must be between 1 and {max_size} bytes",
+                field=_UPLOAD_FILE_FIELD,
+            )
+
+        await storage.store_file(upload_file.file, path=path, content_type=content_type)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
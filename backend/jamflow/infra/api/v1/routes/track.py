@@ -1,21 +1,82 @@
-from fastapi import APIRouter, Form, status
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Response, status
 from pydantic import UUID4
 
-from jamflow.infra.api.deps import CreateTrackDep, ListTrackDep, ReadTrackDep
+from jamflow.core.pagination import DEFAULT_PAGE_SIZE
+from jamflow.infra.api.deps import (
+    CreateTrackDep,
+    CursorDep,
+    FinishTrackUploadDep,
+    ListTrackDep,
+    PageLimitQuery,
+    ReadTrackDep,
+    StartTrackUploadDep,
+    TrackUploadDep,
+)
+from jamflow.infra.api.streaming import NDJSONResponse, accepts_ndjson
+from jamflow.infra.api.v1.schemas import (
+    NEXT_CURSOR_HEADER,
+    PAGINATED_RESPONSES,
+    TRACK_UPLOAD_REQUEST_BODY,
+)
 from jamflow.recordings.schemas import (
-    TrackCreateDto,
     TrackReadDto,
+    TrackUploadDto,
+    TrackUploadFinishDto,
+    TrackUploadStartDto,
 )
 
 router = APIRouter(prefix="/tracks", tags=["tracks"])
 
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=TrackReadDto)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    response_model=TrackReadDto,
+    openapi_extra={"requestBody": TRACK_UPLOAD_REQUEST_BODY},
+)
 async def track_create_view(
     use_case: CreateTrackDep,
-    data: TrackCreateDto = Form(..., media_type="multipart/form-data"),
+    track_upload: TrackUploadDep,
+) -> TrackReadDto:
+    track = await use_case.execute(track_upload=track_upload)
+    return track
+
+
+@router.post(
+    "/uploads",
+    status_code=status.HTTP_201_CREATED,
+    response_model=TrackUploadDto,
+)
+async def track_upload_start_view(
+    use_case: StartTrackUploadDep,
+    track_upload_start_dto: TrackUploadStartDto,
+) -> TrackUploadDto:
+    track_upload = await use_case.execute(track_upload_start_dto)
+    return track_upload
+
+
+@router.post(
+    "/uploads/finish",
+    status_code=status.HTTP_201_CREATED,
+    response_model=TrackReadDto,
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Uploaded file not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": {"msg": "Uploaded file not found"}}
+                }
+            },
+        },
+    },
+)
+async def track_upload_finish_view(
+    use_case: FinishTrackUploadDep,
+    track_upload_finish_dto: TrackUploadFinishDto,
 ) -> TrackReadDto:
-    track = await use_case.execute(track_create_dto=data)
+    track = await use_case.execute(track_upload_finish_dto)
     return track
 
 
@@ -23,10 +84,23 @@ async def track_create_view(
     "",
     status_code=status.HTTP_200_OK,
     response_model=list[TrackReadDto],
+    responses=PAGINATED_RESPONSES,
 )
-async def track_list_view(use_case: ListTrackDep) -> list[TrackReadDto]:
-    tracks = await use_case.execute()
-    return tracks
+async def track_list_view(
+    use_case: ListTrackDep,
+    response: Response,
+    cursor: CursorDep,
+    limit: PageLimitQuery = DEFAULT_PAGE_SIZE,
+    accept: Annotated[str | None, Header()] = None,
+) -> list[TrackReadDto] | Response:
+    # Exports of the whole library are streamed instead of paged
+    if accepts_ndjson(accept):
+        return NDJSONResponse(use_case.stream())
+
+    page = await use_case.execute(limit=limit, cursor=cursor)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor.encode()
+    return list(page.items)
 
 
 @router.get(
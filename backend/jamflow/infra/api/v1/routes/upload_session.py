@@ -0,0 +1,153 @@
+"""
+Resumable track uploads following the tus protocol (https://tus.io).
+
+A session is created with the size and metadata of the track, after which the
+file is sent in chunks, each starting at the offset the previous ones reached.
+An interrupted upload is resumed by asking for the offset of its session. The
+track is created along with the last chunk.
+"""
+
+from email.utils import format_datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import UUID4
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.api.deps import (
+    AppendToUploadSessionDep,
+    CreateUploadSessionDep,
+    DeleteUploadSessionDep,
+    ReadUploadSessionDep,
+    UploadSessionCreateDtoDep,
+)
+from jamflow.infra.api.v1.schemas import TUS_EXTENSIONS, TUS_VERSION
+from jamflow.recordings.schemas import (
+    MAX_UPLOAD_FILE_SIZE,
+    TrackReadDto,
+    UploadSessionReadDto,
+)
+
+router = APIRouter(prefix="/tracks/resumable-uploads", tags=["tracks"])
+
+_CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
+
+_UPLOAD_SESSION_NOT_FOUND: dict[int | str, dict] = {
+    status.HTTP_404_NOT_FOUND: {"description": "Upload session not found"},
+}
+
+
+@router.options("", status_code=status.HTTP_204_NO_CONTENT)
+async def upload_session_options_view() -> Response:
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={
+            "Tus-Resumable": TUS_VERSION,
+            "Tus-Version": TUS_VERSION,
+            "Tus-Extension": TUS_EXTENSIONS,
+            "Tus-Max-Size": str(MAX_UPLOAD_FILE_SIZE),
+        },
+    )
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UploadSessionReadDto,
+)
+async def upload_session_create_view(
+    use_case: CreateUploadSessionDep,
+    upload_session_create_dto: UploadSessionCreateDtoDep,
+    request: Request,
+    response: Response,
+) -> UploadSessionReadDto:
+    upload_session = await use_case.execute(upload_session_create_dto)
+    response.headers["Location"] = str(
+        request.url_for("upload_session_read_view", upload_session_id=upload_session.id)
+    )
+    response.headers.update(_get_progress_headers(upload_session))
+    return upload_session
+
+
+@router.head(
+    "/{upload_session_id:uuid}",
+    status_code=status.HTTP_200_OK,
+    responses=_UPLOAD_SESSION_NOT_FOUND,
+)
+async def upload_session_read_view(
+    use_case: ReadUploadSessionDep, upload_session_id: UUID4
+) -> Response:
+    upload_session = await use_case.execute(upload_session_id)
+    return Response(
+        status_code=status.HTTP_200_OK,
+        headers=_get_progress_headers(upload_session) | {"Cache-Control": "no-store"},
+    )
+
+
+@router.patch(
+    "/{upload_session_id:uuid}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Upload complete, the track was created",
+            "model": TrackReadDto,
+        },
+        status.HTTP_409_CONFLICT: {
+            "description": "Upload-Offset is not the offset of the session"
+        },
+        **_UPLOAD_SESSION_NOT_FOUND,
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                _CHUNK_CONTENT_TYPE: {"schema": {"type": "string", "format": "binary"}}
+            },
+        }
+    },
+)
+async def upload_session_append_view(
+    use_case: AppendToUploadSessionDep,
+    upload_session_id: UUID4,
+    upload_offset: Annotated[int, Header(ge=0)],
+    request: Request,
+) -> Response:
+    if request.headers.get("Content-Type") != _CHUNK_CONTENT_TYPE:
+        raise ValidationError(f"Chunks must be sent as {_CHUNK_CONTENT_TYPE}")
+
+    upload_session = await use_case.execute(
+        upload_session_id, offset=upload_offset, chunk=request.stream()
+    )
+    headers = _get_progress_headers(upload_session)
+    if upload_session.track is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=upload_session.track.model_dump(mode="json"),
+        headers=headers,
+    )
+
+
+@router.delete(
+    "/{upload_session_id:uuid}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=_UPLOAD_SESSION_NOT_FOUND,
+)
+async def upload_session_delete_view(
+    use_case: DeleteUploadSessionDep, upload_session_id: UUID4
+) -> Response:
+    await use_case.execute(upload_session_id)
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers={"Tus-Resumable": TUS_VERSION},
+    )
+
+
+def _get_progress_headers(upload_session: UploadSessionReadDto) -> dict[str, str]:
+    return {
+        "Tus-Resumable": TUS_VERSION,
+        "Upload-Offset": str(upload_session.offset),
+        "Upload-Length": str(upload_session.size),
+        "Upload-Expires": format_datetime(upload_session.expires_at, usegmt=True),
+    }
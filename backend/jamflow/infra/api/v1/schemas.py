@@ -3,6 +3,7 @@ import enum
 from pydantic import BaseModel, Field
 
 from jamflow.core.utils import timezone_now
+from jamflow.infra.api.streaming import NDJSON_MEDIA_TYPE
 
 
 @enum.unique
@@ -17,6 +18,60 @@ class ErrorCode(enum.StrEnum):
     INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+PAGINATED_RESPONSES: dict[int | str, dict] = {
+    200: {
+        "description": "A page of items, or all of them one per line when "
+        f"`{NDJSON_MEDIA_TYPE}` is accepted",
+        "content": {NDJSON_MEDIA_TYPE: {}},
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor to request the next page with, "
+                "absent on the last page",
+                "schema": {"type": "string"},
+            }
+        },
+    }
+}
+
+TUS_VERSION = "1.0.0"
+TUS_EXTENSIONS = "creation,expiration,termination"
+
+# Resumable uploads follow the tus protocol, which is spoken in headers
+UPLOAD_SESSION_HEADERS = [
+    "Location",
+    "Tus-Resumable",
+    "Tus-Version",
+    "Tus-Extension",
+    "Tus-Max-Size",
+    "Upload-Offset",
+    "Upload-Length",
+    "Upload-Expires",
+]
+
+# The track form is parsed from the request body by hand, so its schema has to
+# be documented explicitly.
+TRACK_UPLOAD_REQUEST_BODY: dict = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["upload_file", "title"],
+                "properties": {
+                    "upload_file": {"type": "string", "format": "binary"},
+                    "title": {"type": "string", "minLength": 1, "maxLength": 255},
+                    "recorded_date": {"type": "string", "format": "date"},
+                },
+            },
+            # The file is handled as it arrives, so it is best sent first
+            "encoding": {"upload_file": {"contentType": "audio/*"}},
+        }
+    },
+}
+
+
 class ErrorDetailDto(BaseModel):
     message: str
     field: str | None = None
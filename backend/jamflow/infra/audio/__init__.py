@@ -0,0 +1,9 @@
+from .pool import PooledAudioProcessor, pooled_audio_processor
+from .processor import NativeAudioProcessor, native_audio_processor
+
+__all__ = [
+    "NativeAudioProcessor",
+    "PooledAudioProcessor",
+    "native_audio_processor",
+    "pooled_audio_processor",
+]
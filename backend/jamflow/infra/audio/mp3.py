@@ -0,0 +1,606 @@
+"""
+Frame level MPEG audio handling.
+
+Clipping is done by copying the frames that cover the requested range instead of
+decoding and re-encoding the whole track. A fresh Xing/LAME info frame is put in
+front of the copied frames so that gapless aware decoders trim the surplus samples
+at both ends of the clip.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from tempfile import TemporaryFile
+from typing import BinaryIO, Self
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.audio.utils import copy_range
+
+# Samples every MPEG layer III decoder outputs before the first encoded sample.
+DECODER_DELAY = 528 + 1
+
+_READ_AHEAD_SIZE = 64 * 1024
+
+# The bit reservoir can reach up to 511 bytes back which, for the lowest bitrates,
+# spans a few dozen frames.
+_MAX_RESERVOIR_FRAMES = 64
+
+# Number of frames compared to tell constant bitrate streams without a tag apart.
+_CBR_PROBE_FRAMES = 8
+
+_MAX_GAPLESS_PADDING = 4095
+
+_VERSION_1 = 3
+_VERSION_2 = 2
+_VERSION_2_5 = 0
+
+_LAYER_1 = 3
+_LAYER_2 = 2
+_LAYER_3 = 1
+
+_BITRATES = {
+    (_VERSION_1, _LAYER_1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (_VERSION_1, _LAYER_2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (_VERSION_1, _LAYER_3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (_VERSION_2, _LAYER_1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (_VERSION_2, _LAYER_2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (_VERSION_2, _LAYER_3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}  # fmt: skip
+
+_SAMPLE_RATES = {
+    _VERSION_1: (44100, 48000, 32000),
+    _VERSION_2: (22050, 24000, 16000),
+    _VERSION_2_5: (11025, 12000, 8000),
+}
+
+_MODE_MONO = 3
+
+_LAME_ENCODERS = (b"LAME", b"Lavf", b"Lavc")
+_DEFAULT_LAME_VERSION = b"LAME3.100"
+
+_XING_FLAG_FRAMES = 0x1
+_XING_FLAG_BYTES = 0x2
+_XING_FLAG_TOC = 0x4
+_XING_FLAG_QUALITY = 0x8
+_XING_FLAGS_ALL = (
+    _XING_FLAG_FRAMES | _XING_FLAG_BYTES | _XING_FLAG_TOC | _XING_FLAG_QUALITY
+)
+_XING_SIZE = 120
+_LAME_TAG_SIZE = 36
+# The LAME tag CRC covers the info frame up to the CRC field itself.
+_LAME_CRC_COVERAGE = 190
+
+
+@dataclass(frozen=True, slots=True)
+class FrameHeader:
+    version: int
+    layer: int
+    protected: bool
+    bitrate_index: int
+    sample_rate_index: int
+    padding: int
+    mode_byte: int
+
+    @property
+    def bitrate(self) -> int:
+        """Bitrate in bits per second."""
+        return _bitrate_table(self.version, self.layer)[self.bitrate_index] * 1000
+
+    @property
+    def sample_rate(self) -> int:
+        return _SAMPLE_RATES[self.version][self.sample_rate_index]
+
+    @property
+    def channel_mode(self) -> int:
+        return self.mode_byte >> 6
+
+    @property
+    def samples_per_frame(self) -> int:
+        if self.layer == _LAYER_1:
+            return 384
+        if self.layer == _LAYER_3 and self.version != _VERSION_1:
+            return 576
+        return 1152
+
+    @property
+    def frame_size(self) -> int:
+        if self.layer == _LAYER_1:
+            return (12 * self.bitrate // self.sample_rate + self.padding) * 4
+        slots = self.samples_per_frame // 8 * self.bitrate // self.sample_rate
+        return slots + self.padding
+
+    @property
+    def side_info_size(self) -> int:
+        """Size of the layer III side information following the header."""
+        mono = self.channel_mode == _MODE_MONO
+        if self.version == _VERSION_1:
+            return 17 if mono else 32
+        return 9 if mono else 17
+
+    @property
+    def side_info_offset(self) -> int:
+        return 4 + (2 if self.protected else 0)
+
+    @property
+    def main_data_size(self) -> int:
+        """Bytes a layer III frame contributes to the bit reservoir."""
+        if self.layer != _LAYER_3:
+            return 0
+        return self.frame_size - self.side_info_offset - self.side_info_size
+
+    def is_compatible(self, other: Self) -> bool:
+        """Check if two headers can belong to the same stream."""
+        return (
+            self.version == other.version
+            and self.layer == other.layer
+            and self.sample_rate_index == other.sample_rate_index
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    offset: int
+    header: FrameHeader
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.header.frame_size
+
+
+@dataclass(frozen=True, slots=True)
+class InfoTag:
+    """Metadata from a Xing/Info/VBRI frame at the start of a stream."""
+
+    encoder_delay: int | None = None
+    lame_tag: bytes | None = None
+    is_constant_bitrate: bool = False
+
+
+def parse_frame_header(data: bytes) -> FrameHeader | None:
+    """
+    Parse a four byte MPEG audio frame header.
+
+    Returns `None` if the bytes are not a valid header. Free format bitrates are
+    not supported and treated as invalid.
+    """
+    if len(data) < 4 or data[0] != 0xFF or data[1] & 0xE0 != 0xE0:
+        return None
+
+    version = (data[1] >> 3) & 0x3
+    layer = (data[1] >> 1) & 0x3
+    bitrate_index = data[2] >> 4
+    sample_rate_index = (data[2] >> 2) & 0x3
+    if (
+        version == 1
+        or layer == 0
+        or bitrate_index in (0, 15)
+        or sample_rate_index == 3
+        or data[3] & 0x3 == 2
+    ):
+        return None
+
+    return FrameHeader(
+        version=version,
+        layer=layer,
+        protected=not data[1] & 0x1,
+        bitrate_index=bitrate_index,
+        sample_rate_index=sample_rate_index,
+        padding=(data[2] >> 1) & 0x1,
+        mode_byte=data[3],
+    )
+
+
+class _ReadAhead:
+    """
+    Random access reads on top of a file object with a forward read-ahead buffer,
+    so that scanning frame headers does not issue one read per frame.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+        self._start = 0
+        self._data = b""
+
+    def read(self, position: int, size: int) -> bytes:
+        offset = position - self._start
+        if offset < 0 or offset + size > len(self._data):
+            self._file.seek(position)
+            self._data = self._file.read(max(size, _READ_AHEAD_SIZE))
+            self._start = position
+            offset = 0
+        return self._data[offset : offset + size]
+
+
+def iter_frames(file: BinaryIO, offset: int | None = None) -> Iterator[Frame]:
+    """
+    Iterate over all MPEG audio frames of a file in stream order.
+
+    Leading ID3v2 tags are skipped and the scanner resynchronizes on garbage
+    between frames. Trailing tags end the iteration. Pass `offset` to start at the
+    first frame found after it instead.
+    """
+    reader = _ReadAhead(file)
+    if offset is None:
+        offset = _skip_id3v2(reader)
+    position = _find_sync(reader, offset)
+    while position is not None:
+        header = parse_frame_header(reader.read(position, 4))
+        if header is None:
+            position = _find_sync(reader, position + 1)
+            continue
+        yield Frame(offset=position, header=header)
+        position += header.frame_size
+
+
+def read_info_tag(file: BinaryIO, frame: Frame) -> InfoTag | None:
+    """
+    Read a Xing/Info or VBRI tag from the given frame.
+
+    Returns `None` if the frame is a regular audio frame.
+    """
+    header = frame.header
+    file.seek(frame.offset)
+    data = file.read(header.frame_size)
+
+    if data[36:40] == b"VBRI":
+        return InfoTag()
+
+    if header.layer != _LAYER_3:
+        return None
+
+    xing_offset = header.side_info_offset + header.side_info_size
+    marker = data[xing_offset : xing_offset + 4]
+    if marker not in (b"Xing", b"Info"):
+        return None
+    is_constant_bitrate = marker == b"Info"
+
+    flags = int.from_bytes(data[xing_offset + 4 : xing_offset + 8])
+    lame_offset = xing_offset + 8
+    lame_offset += 4 if flags & _XING_FLAG_FRAMES else 0
+    lame_offset += 4 if flags & _XING_FLAG_BYTES else 0
+    lame_offset += 100 if flags & _XING_FLAG_TOC else 0
+    lame_offset += 4 if flags & _XING_FLAG_QUALITY else 0
+
+    lame_tag = data[lame_offset : lame_offset + _LAME_TAG_SIZE]
+    if len(lame_tag) != _LAME_TAG_SIZE or lame_tag[:4] not in _LAME_ENCODERS:
+        return InfoTag(is_constant_bitrate=is_constant_bitrate)
+
+    encoder_delay = int.from_bytes(lame_tag[21:24]) >> 12
+    return InfoTag(
+        encoder_delay=encoder_delay,
+        lame_tag=lame_tag,
+        is_constant_bitrate=is_constant_bitrate,
+    )
+
+
+def clip(file: BinaryIO, *, start: int, end: int) -> BinaryIO:
+    """
+    Clip an MPEG audio stream from `start` to `end` in milliseconds by copying
+    the frames covering the range.
+
+    The frames needed to refill the bit reservoir of the first frame are copied as
+    well. The surplus samples are recorded as encoder delay and padding in a new
+    LAME tag, which keeps the clip sample accurate for gapless aware decoders and
+    frame accurate for all others.
+
+    :raises ValidationError: If the file contains no MPEG audio frames or the range
+        lies outside of the stream.
+    """
+    frames = iter_frames(file)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        raise ValidationError("No MPEG audio frames found")
+
+    info_tag = read_info_tag(file, first_frame)
+    template = first_frame.header
+    audio_offset = first_frame.offset
+    if info_tag is None:
+        frames = _prepend(first_frame, frames)
+    else:
+        audio_offset = first_frame.end
+
+    # Samples are counted in the domain of the decoder output, which includes the
+    # decoder delay and the delay the encoder prepended.
+    priming = 0
+    if info_tag is not None and info_tag.encoder_delay is not None:
+        priming = info_tag.encoder_delay + DECODER_DELAY
+    sample_rate = template.sample_rate
+    samples_per_frame = template.samples_per_frame
+    start_sample = start * sample_rate // 1000 + priming
+    end_sample = -(-end * sample_rate // 1000) + priming
+    first_index = start_sample // samples_per_frame
+    last_index = (end_sample - 1) // samples_per_frame
+
+    # Frames before the bit reservoir of the first frame are never looked at,
+    # so constant bitrate streams are entered right there.
+    first_index_read, frames = _seek_frames(
+        file,
+        frames,
+        index=first_index - _MAX_RESERVOIR_FRAMES - 1,
+        audio_offset=audio_offset,
+        template=template,
+        info_tag=info_tag,
+    )
+    frames = (frame for frame in frames if frame.header.is_compatible(template))
+
+    recent: deque[Frame] = deque(maxlen=_MAX_RESERVOIR_FRAMES)
+    selected: list[Frame] = []
+    first_selected_index = 0
+    for index, frame in enumerate(frames, start=first_index_read):
+        if index > last_index:
+            break
+        if index < first_index:
+            recent.append(frame)
+            continue
+        if index == first_index:
+            priming_frames = _count_reservoir_frames(file, frame, recent)
+            # Decoding needs at least the previous frame for the overlap and the
+            # decoder delay must be covered to express the start as encoder delay.
+            priming_frames = max(
+                priming_frames,
+                1,
+                first_index - (start_sample - DECODER_DELAY) // samples_per_frame,
+            )
+            # The encoder delay field limits how many samples can be trimmed, so
+            # very deep bit reservoirs of low bitrate frames are primed partially.
+            max_priming_frames = (
+                _MAX_GAPLESS_PADDING + DECODER_DELAY - start_sample % samples_per_frame
+            ) // samples_per_frame
+            priming_frames = min(priming_frames, max_priming_frames, len(recent))
+            selected.extend(list(recent)[len(recent) - priming_frames :])
+            first_selected_index = first_index - priming_frames
+        selected.append(frame)
+
+    if len(selected) == 0:
+        raise ValidationError("Clip range exceeds audio stream")
+
+    clip_samples = len(selected) * samples_per_frame
+    start_offset = start_sample - first_selected_index * samples_per_frame
+    end_offset = end_sample - first_selected_index * samples_per_frame
+    encoder_delay = _clamp_padding(start_offset - DECODER_DELAY)
+    encoder_padding = _clamp_padding(clip_samples + DECODER_DELAY - end_offset)
+
+    info_frame = build_info_frame(
+        template,
+        selected,
+        encoder_delay=encoder_delay,
+        encoder_padding=encoder_padding,
+        lame_tag=info_tag.lame_tag if info_tag is not None else None,
+    )
+
+    temp_file = TemporaryFile(mode="wb+")
+    temp_file.write(info_frame)
+    for run_start, run_end in _contiguous_runs(selected):
+        copy_range(file, temp_file, run_start, run_end)
+    temp_file.seek(0)
+    return temp_file
+
+
+def build_info_frame(
+    template: FrameHeader,
+    frames: list[Frame],
+    *,
+    encoder_delay: int,
+    encoder_padding: int,
+    lame_tag: bytes | None = None,
+) -> bytes:
+    """
+    Build a Xing/Info frame including a LAME tag describing the given frames.
+
+    Fields of an existing LAME tag are carried over except for the ones describing
+    the layout of the stream.
+    """
+    xing_offset = 4 + template.side_info_size
+    lame_offset = xing_offset + _XING_SIZE
+    header = _smallest_header(template, lame_offset + _LAME_TAG_SIZE)
+    frame_size = header.frame_size
+
+    audio_size = sum(frame.header.frame_size for frame in frames)
+    total_size = frame_size + audio_size
+    is_cbr = len({frame.header.bitrate_index for frame in frames}) == 1
+
+    toc = bytearray(100)
+    position = frame_size
+    positions = []
+    for frame in frames:
+        positions.append(position)
+        position += frame.header.frame_size
+    for percent in range(100):
+        frame_position = positions[percent * len(frames) // 100]
+        toc[percent] = min(255, frame_position * 256 // total_size)
+
+    tag = bytearray(lame_tag or _DEFAULT_LAME_VERSION.ljust(_LAME_TAG_SIZE, b"\0"))
+    tag[21:24] = ((encoder_delay << 12) | encoder_padding).to_bytes(3)
+    tag[28:32] = min(total_size, 0xFFFFFFFF).to_bytes(4)
+    tag[32:36] = bytes(4)  # music and tag CRC
+
+    data = bytearray(frame_size)
+    data[0:4] = bytes(
+        (
+            0xFF,
+            0xE0 | template.version << 3 | template.layer << 1 | 0x1,
+            header.bitrate_index << 4 | template.sample_rate_index << 2,
+            template.mode_byte,
+        )
+    )
+    data[xing_offset : xing_offset + 4] = b"Info" if is_cbr else b"Xing"
+    data[xing_offset + 4 : xing_offset + 8] = _XING_FLAGS_ALL.to_bytes(4)
+    data[xing_offset + 8 : xing_offset + 12] = len(frames).to_bytes(4)
+    data[xing_offset + 12 : xing_offset + 16] = min(total_size, 0xFFFFFFFF).to_bytes(4)
+    data[xing_offset + 16 : xing_offset + 116] = toc
+    data[lame_offset : lame_offset + _LAME_TAG_SIZE] = tag
+    crc = crc16(bytes(data[:_LAME_CRC_COVERAGE]))
+    data[lame_offset + 34 : lame_offset + 36] = crc.to_bytes(2)
+    return bytes(data)
+
+
+def crc16(data: bytes) -> int:
+    """CRC-16 as used by the LAME tag (polynomial 0x8005, reflected)."""
+    crc = 0
+    for byte in data:
+        crc = _CRC16_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc
+
+
+def _crc16_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def _bitrate_table(version: int, layer: int) -> tuple[int, ...]:
+    if version == _VERSION_2_5:
+        version = _VERSION_2
+    return _BITRATES[(version, layer)]
+
+
+def _smallest_header(template: FrameHeader, min_size: int) -> FrameHeader:
+    """Get a header compatible to `template` for an unpadded frame of `min_size`."""
+    bitrates = _bitrate_table(template.version, template.layer)
+    for bitrate_index in range(1, len(bitrates)):
+        header = FrameHeader(
+            version=template.version,
+            layer=template.layer,
+            protected=False,
+            bitrate_index=bitrate_index,
+            sample_rate_index=template.sample_rate_index,
+            padding=0,
+            mode_byte=template.mode_byte,
+        )
+        if header.frame_size >= min_size:
+            return header
+    raise ValidationError("Unable to fit info frame into stream parameters")
+
+
+def _skip_id3v2(reader: _ReadAhead) -> int:
+    position = 0
+    while (data := reader.read(position, 10))[:3] == b"ID3" and len(data) == 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        position += 10 + size + footer
+    return position
+
+
+def _find_sync(reader: _ReadAhead, position: int) -> int | None:
+    """
+    Find the next position at which a frame header is followed by another
+    compatible frame header or the end of the file.
+    """
+    while True:
+        data = reader.read(position, _READ_AHEAD_SIZE)
+        if len(data) < 4:
+            return None
+        index = data.find(b"\xff")
+        while index != -1:
+            candidate = position + index
+            header = parse_frame_header(reader.read(candidate, 4))
+            if header is not None:
+                following = reader.read(candidate + header.frame_size, 4)
+                if len(following) < 4:
+                    return candidate
+                next_header = parse_frame_header(following)
+                if next_header is not None and next_header.is_compatible(header):
+                    return candidate
+            index = data.find(b"\xff", index + 1)
+        position += len(data) - 3
+
+
+def _count_reservoir_frames(
+    file: BinaryIO,
+    frame: Frame,
+    previous: deque[Frame],
+) -> int:
+    """Count the preceding frames holding the main data `frame` refers back to."""
+    header = frame.header
+    if header.layer != _LAYER_3:
+        return 0
+
+    side_info = _ReadAhead(file).read(frame.offset + header.side_info_offset, 2)
+    if header.version == _VERSION_1:
+        main_data_begin = (side_info[0] << 1) | (side_info[1] >> 7)
+    else:
+        main_data_begin = side_info[0]
+
+    count = 0
+    available = 0
+    for previous_frame in reversed(previous):
+        if available >= main_data_begin:
+            break
+        available += previous_frame.header.main_data_size
+        count += 1
+    return count
+
+
+def _clamp_padding(samples: int) -> int:
+    return max(0, min(samples, _MAX_GAPLESS_PADDING))
+
+
+def _seek_frames(
+    file: BinaryIO,
+    frames: Iterator[Frame],
+    *,
+    index: int,
+    audio_offset: int,
+    template: FrameHeader,
+    info_tag: InfoTag | None,
+) -> tuple[int, Iterator[Frame]]:
+    """
+    Skip ahead to about `index` frames into a constant bitrate stream by computing
+    the frame offset instead of walking all frames before it.
+
+    Variable bitrate streams are returned unchanged, as are streams in which the
+    frame found at the computed offset doesn't match the bitrate of the first
+    audio frames. Returns the index of the first frame of the returned iterator.
+    """
+    if index <= 0:
+        return 0, frames
+    if info_tag is not None and not info_tag.is_constant_bitrate:
+        return 0, frames
+
+    # The bitrate is taken from the audio frames, as the frame of an info tag
+    # may have a higher one to fit the tag. Streams without a tag are taken to
+    # be constant bitrate if their first frames agree on the bitrate.
+    leading = list(islice(frames, _CBR_PROBE_FRAMES))
+    frames = chain(leading, frames)
+    if len(leading) == 0:
+        return 0, frames
+    bitrate = leading[0].header.bitrate
+    if any(frame.header.bitrate != bitrate for frame in leading):
+        return 0, frames
+
+    # Padding makes frames one byte larger every now and then, which averages out
+    # to this frame size.
+    frame_size = template.samples_per_frame / 8 * bitrate / template.sample_rate
+    seek_frames = iter_frames(file, offset=audio_offset + int(index * frame_size))
+    first_frame = next(seek_frames, None)
+    if first_frame is None or first_frame.header.bitrate != bitrate:
+        # Not the stream the first frames suggest, so walk it from the start
+        return 0, frames
+    first_index = round((first_frame.offset - audio_offset) / frame_size)
+    return first_index, _prepend(first_frame, seek_frames)
+
+
+def _prepend(frame: Frame, frames: Iterator[Frame]) -> Iterator[Frame]:
+    yield frame
+    yield from frames
+
+
+def _contiguous_runs(frames: list[Frame]) -> Iterator[tuple[int, int]]:
+    run_start = frames[0].offset
+    run_end = frames[0].end
+    for frame in frames[1:]:
+        if frame.offset != run_end:
+            yield run_start, run_end
+            run_start = frame.offset
+        run_end = frame.end
+    yield run_start, run_end
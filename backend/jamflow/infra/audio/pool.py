@@ -0,0 +1,204 @@
+"""
+Audio processing in a pool of worker processes.
+
+Clipping is CPU bound and the frame parsers hold the GIL while they run, so doing
+it in the API process stalls every other request of that worker. The pool moves
+this work into separate processes and bounds how much of it may pile up.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, cast
+
+from jamflow.core.config import settings
+from jamflow.core.exceptions import ExternalServiceError, RateLimitError
+from jamflow.core.log import get_logger
+from jamflow.infra.audio.processor import NativeAudioProcessor, clip_file
+from jamflow.infra.audio.utils import COPY_CHUNK_SIZE
+from jamflow.infra.storage.remote import RemoteFile
+from jamflow.recordings.models import AudioFileFormat
+
+logger = get_logger()
+
+
+class PooledAudioProcessor(NativeAudioProcessor):
+    """
+    Audio processor that clips audio files in a pool of worker processes.
+
+    Reading the format and duration only touches the file headers and is still
+    done in process.
+
+    Files are passed to the workers by path, so files which do not live on disk
+    are spooled to a temporary file first. Remote files are passed as they are and
+    read by the workers directly. The pool is started on first use.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue_size: int, timeout: float):
+        """
+        :param max_workers: Number of worker processes.
+        :param max_queue_size: Number of jobs that may wait for a free worker
+            before new jobs are rejected.
+        :param timeout: Time in seconds a job may take including waiting time.
+        """
+        self._max_workers = max_workers
+        self._max_pending = max_workers + max_queue_size
+        self._timeout = timeout
+        self._pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def clip(
+        self, file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
+    ) -> BinaryIO:
+        """
+        Clips an audio file from `start` to `end` in milliseconds in a worker
+        process. See `clip_file` for details.
+
+        :raises RateLimitError: If the job queue is full.
+        :raises ExternalServiceError: If the job times out or a worker crashes.
+        """
+        if self._pending >= self._max_pending:
+            raise RateLimitError(
+                "Too many audio processing jobs",
+                context={"pending_jobs": self._pending},
+            )
+
+        self._pending += 1
+        try:
+            source, is_spooled = await asyncio.to_thread(_get_source, file)
+        except BaseException:
+            self._pending -= 1
+            raise
+        try:
+            clip_path = await self._run(source, file_format, start=start, end=end)
+        finally:
+            if is_spooled:
+                os.unlink(cast(str, source))
+
+        return _open_detached(clip_path)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling all jobs that did not start yet."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(
+        self,
+        source: str | RemoteFile,
+        file_format: AudioFileFormat,
+        *,
+        start: int,
+        end: int,
+    ) -> str:
+        """
+        Run a job in the pool, taking over its slot in the queue. The slot is
+        only released once the job is over, which may be long after it timed
+        out, so that the queue keeps matching the load of the workers.
+        """
+        executor = self._get_executor()
+        try:
+            future = executor.submit(
+                _clip_source, source, file_format, start=start, end=end
+            )
+        except BaseException:
+            self._pending -= 1
+            raise
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: _call_soon(loop, self._release_slot))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        except TimeoutError as exc:
+            # A running job cannot be interrupted, its result is discarded instead
+            future.add_done_callback(_discard_result)
+            context = {"timeout": self._timeout, "file_format": file_format}
+            raise ExternalServiceError(
+                "Audio processing timed out", context=context
+            ) from exc
+        except BrokenProcessPool as exc:
+            if self._executor is executor:
+                self._executor = None
+            await logger.awarning("Audio processing pool broke down")
+            raise ExternalServiceError("Audio processing worker crashed") from exc
+
+    def _release_slot(self) -> None:
+        self._pending -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                # Forking a process running an event loop and threads is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+
+def _clip_source(
+    source: str | RemoteFile, file_format: AudioFileFormat, *, start: int, end: int
+) -> str:
+    """Clip the file at `source` and return the path of the clipped file."""
+    file = open(source, "rb") if isinstance(source, str) else source  # noqa: SIM115
+    with file:
+        clipped_file = clip_file(
+            cast(BinaryIO, file), file_format, start=start, end=end
+        )
+    with clipped_file, NamedTemporaryFile(delete=False) as target:
+        shutil.copyfileobj(clipped_file, target, COPY_CHUNK_SIZE)
+    return target.name
+
+
+def _get_source(file: BinaryIO) -> tuple[str | RemoteFile, bool]:
+    """
+    Get something a worker process can open the file from. That is the file
+    itself for remote files and a path otherwise, spooling the file to a temporary
+    file if it has none.
+
+    Returns the source and whether it points to a temporary file.
+    """
+    if isinstance(file, RemoteFile):
+        return file, False
+
+    name = getattr(file, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name, False
+
+    file.seek(0)
+    with NamedTemporaryFile(delete=False) as target:
+        shutil.copyfileobj(file, target, COPY_CHUNK_SIZE)
+    file.seek(0)
+    return target.name, True
+
+
+def _open_detached(path: str) -> BinaryIO:
+    """Open a temporary file and unlink it, so it is removed once closed."""
+    file = open(path, "rb+")  # noqa: SIM115
+    os.unlink(path)
+    return cast(BinaryIO, file)
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+    """Run `callback` in `loop` from the thread that finished a job."""
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        # The loop was closed along with everything waiting for the job
+        pass
+
+
+def _discard_result(future: Future[str]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        os.unlink(future.result())
+
+
+pooled_audio_processor = PooledAudioProcessor(
+    max_workers=settings.AUDIO_POOL_MAX_WORKERS,
+    max_queue_size=settings.AUDIO_POOL_MAX_QUEUE_SIZE,
+    timeout=settings.AUDIO_POOL_TIMEOUT,
+)
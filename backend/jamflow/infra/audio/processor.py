@@ -1,3 +1,4 @@
+import asyncio
 from tempfile import TemporaryFile
 from typing import Any, BinaryIO, cast
 
@@ -9,6 +10,7 @@ from mutagen.wave import WAVE
 from pydub import AudioSegment
 
 from jamflow.core.exceptions import BusinessLogicError, ValidationError
+from jamflow.infra.audio import mp3, ogg, wav
 from jamflow.recordings.models import AudioFileFormat
 
 
@@ -69,35 +71,70 @@ class NativeAudioProcessor:
         return size
 
     @staticmethod
-    def clip(
+    async def clip(
         file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
     ) -> BinaryIO:
         """
         Clips an audio file from `start` to `end` in milliseconds.
 
-        :raises ValidationError: If the start or end times are invalid,
-            or if the file is empty.
+        The work is done in a worker thread to keep the event loop responsive.
+        See `clip_file` for details.
         """
-        if start < 0:
-            raise ValidationError("Start cannot be negative")
-
-        if end <= start:
-            raise ValidationError("Start must be less than end")
-
-        if file_format not in AudioFileFormat:
-            raise ValidationError(f"Unsupported file format: {file_format}")
-
-        file.seek(0, 2)
-        if file.tell() == 0:
-            raise ValidationError("Cannot clip an empty file")
-        file.seek(0)
-
-        audio_segment = AudioSegment.from_file(file, format=file_format)
-        clipped_segment = audio_segment[start:end]
-        temp_file = TemporaryFile(mode="wb+")
-        clipped_segment.export(temp_file, format=file_format)
-        temp_file.seek(0)
-        return temp_file
+        return await asyncio.to_thread(
+            clip_file, file, file_format, start=start, end=end
+        )
+
+
+def clip_file(
+    file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
+) -> BinaryIO:
+    """
+    Clips an audio file from `start` to `end` in milliseconds.
+
+    The encoded data is copied without decoding it. Only formats the copying
+    parsers don't support, such as Ogg streams other than Vorbis, are decoded
+    and the clip re-encoded.
+
+    :raises ValidationError: If the start or end times are invalid,
+        or if the file is empty.
+    """
+    if start < 0:
+        raise ValidationError("Start cannot be negative")
+
+    if end <= start:
+        raise ValidationError("Start must be less than end")
+
+    if file_format not in AudioFileFormat:
+        raise ValidationError(f"Unsupported file format: {file_format}")
+
+    file.seek(0, 2)
+    if file.tell() == 0:
+        raise ValidationError("Cannot clip an empty file")
+    file.seek(0)
+
+    match file_format:
+        case AudioFileFormat.MP3:
+            return mp3.clip(file, start=start, end=end)
+        case AudioFileFormat.OGG if ogg.is_vorbis(file):
+            return ogg.clip(file, start=start, end=end)
+        case AudioFileFormat.WAV:
+            return wav.clip(file, start=start, end=end)
+        case _:
+            return _reencode_clip(file, file_format, start=start, end=end)
+
+
+def _reencode_clip(
+    file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
+) -> BinaryIO:
+    """
+    Clips an audio file by decoding it entirely and encoding the requested range.
+    """
+    audio_segment = AudioSegment.from_file(file, format=file_format)
+    clipped_segment = audio_segment[start:end]
+    temp_file = TemporaryFile(mode="wb+")
+    clipped_segment.export(temp_file, format=file_format)
+    temp_file.seek(0)
+    return temp_file
 
 
 native_audio_processor = NativeAudioProcessor()
@@ -0,0 +1,24 @@
+from typing import BinaryIO
+
+COPY_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def copy_range(source: BinaryIO, target: BinaryIO, start: int, end: int) -> int:
+    """
+    Copy the bytes from `start` to `end` of `source` to the current position of
+    `target` in bounded chunks.
+
+    Returns the number of bytes copied, which is less than requested if `source`
+    ends early.
+    """
+    source.seek(start)
+    remaining = end - start
+    copied = 0
+    while remaining > 0:
+        chunk = source.read(min(remaining, COPY_CHUNK_SIZE))
+        if not chunk:
+            break
+        target.write(chunk)
+        remaining -= len(chunk)
+        copied += len(chunk)
+    return copied
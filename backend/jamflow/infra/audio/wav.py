@@ -0,0 +1,118 @@
+"""
+RIFF/WAVE handling.
+
+PCM data has a fixed number of bytes per sample frame, so clipping only takes
+header arithmetic and a copy of the byte range in between. The sample data is
+never held in memory as a whole.
+"""
+
+import struct
+from dataclasses import dataclass
+from tempfile import TemporaryFile
+from typing import BinaryIO
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.audio.utils import copy_range
+
+# Writers that stream WAVE data set the data size to one of these placeholders.
+_UNKNOWN_SIZES = (0, 0xFFFFFFFF)
+
+
+@dataclass(frozen=True, slots=True)
+class WaveLayout:
+    fmt_chunk: bytes
+    sample_rate: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frame_count(self) -> int:
+        return self.data_size // self.block_align
+
+    def byte_offset(self, milliseconds: int) -> int:
+        """Offset of the sample frame at the given time, clamped to the data."""
+        frame = min(milliseconds * self.sample_rate // 1000, self.frame_count)
+        return self.data_offset + frame * self.block_align
+
+
+def read_layout(file: BinaryIO) -> WaveLayout:
+    """
+    Locate the format and data chunks of a WAVE file.
+
+    :raises ValidationError: If the file is not a valid WAVE file.
+    """
+    file.seek(0, 2)
+    file_size = file.tell()
+    file.seek(0)
+
+    riff_header = file.read(12)
+    if (
+        len(riff_header) < 12
+        or riff_header[:4] != b"RIFF"
+        or riff_header[8:] != b"WAVE"
+    ):
+        raise ValidationError("Not a WAVE file")
+
+    fmt_chunk = None
+    position = 12
+    while True:
+        file.seek(position)
+        chunk_header = file.read(8)
+        if len(chunk_header) < 8:
+            raise ValidationError("WAVE file has no data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        if chunk_id == b"fmt ":
+            fmt_chunk = chunk_header + file.read(chunk_size)
+        elif chunk_id == b"data":
+            break
+        position += 8 + chunk_size + chunk_size % 2
+
+    if fmt_chunk is None or len(fmt_chunk) < 24:
+        raise ValidationError("WAVE file has no format chunk")
+
+    sample_rate, _, block_align = struct.unpack("<IIH", fmt_chunk[12:22])
+    if sample_rate == 0 or block_align == 0:
+        raise ValidationError("WAVE file has an invalid format chunk")
+
+    data_offset = position + 8
+    available = file_size - data_offset
+    data_size = available if chunk_size in _UNKNOWN_SIZES else chunk_size
+    return WaveLayout(
+        fmt_chunk=fmt_chunk,
+        sample_rate=sample_rate,
+        block_align=block_align,
+        data_offset=data_offset,
+        data_size=min(data_size, available),
+    )
+
+
+def clip(file: BinaryIO, *, start: int, end: int) -> BinaryIO:
+    """
+    Clip a WAVE file from `start` to `end` in milliseconds.
+
+    Only the header and the requested byte range are read, so this works on any
+    seekable file object with constant memory.
+
+    :raises ValidationError: If the file is not a valid WAVE file or the range lies
+        outside of the audio data.
+    """
+    layout = read_layout(file)
+    start_offset = layout.byte_offset(start)
+    end_offset = layout.byte_offset(end)
+    if start_offset >= end_offset:
+        raise ValidationError("Clip range exceeds audio stream")
+
+    data_size = end_offset - start_offset
+    fmt_chunk = layout.fmt_chunk + b"\0" * (len(layout.fmt_chunk) % 2)
+    riff_size = 4 + len(fmt_chunk) + 8 + data_size + data_size % 2
+
+    temp_file = TemporaryFile(mode="wb+")
+    temp_file.write(struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE"))
+    temp_file.write(fmt_chunk)
+    temp_file.write(struct.pack("<4sI", b"data", data_size))
+    copy_range(file, temp_file, start_offset, end_offset)
+    if data_size % 2:
+        temp_file.write(b"\0")
+    temp_file.seek(0)
+    return temp_file
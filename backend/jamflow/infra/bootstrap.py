@@ -1,27 +1,46 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from jamflow.core.concurrency import SingleFlight
 from jamflow.core.config import settings
-from jamflow.infra.audio import NativeAudioProcessor, native_audio_processor
+from jamflow.infra.audio import native_audio_processor, pooled_audio_processor
 from jamflow.infra.database.repositories import (
     SQLModelClipRepository,
+    SQLModelDirectUploadRepository,
     SQLModelTrackRepository,
+    SQLModelUploadSessionRepository,
 )
-from jamflow.infra.storage.s3 import S3StorageService
+from jamflow.infra.storage.disk_cache import DiskCachedAudioStorage, track_cache
+from jamflow.infra.storage.filesystem import FileSystemStorage
+from jamflow.infra.storage.s3 import S3StorageService, shared_storage_client
 from jamflow.recordings.protocols import (
     AudioProcessor,
     AudioStorage,
     ClipRepository,
+    DirectUploadRepository,
     TrackRepository,
+    UploadSessionRepository,
 )
 from jamflow.recordings.use_cases import (
+    AppendToUploadSession,
     CreateClip,
     CreateTrack,
+    CreateUploadSession,
+    DeleteUploadSession,
+    FinishTrackUpload,
     ListClip,
     ListTrack,
+    PurgeDirectUploads,
+    PurgeUploadSessions,
     ReadClip,
     ReadTrack,
+    ReadUploadSession,
+    RenderClip,
+    StartTrackUpload,
 )
 
+# Shared by all requests and workers of a process to coalesce identical renders
+clip_render_flight: SingleFlight[str, int] = SingleFlight()
+
 
 def default_clip_repo(session: AsyncSession) -> SQLModelClipRepository:
     return SQLModelClipRepository(session)
@@ -31,12 +50,50 @@ def default_track_repo(session: AsyncSession) -> SQLModelTrackRepository:
     return SQLModelTrackRepository(session)
 
 
-def default_audio_storage() -> S3StorageService:
-    return S3StorageService(settings.STORAGE_NAME_AUDIO)
+def default_upload_session_repo(
+    session: AsyncSession,
+) -> SQLModelUploadSessionRepository:
+    return SQLModelUploadSessionRepository(session)
+
+
+def default_direct_upload_repo(
+    session: AsyncSession,
+) -> SQLModelDirectUploadRepository:
+    return SQLModelDirectUploadRepository(session)
+
+
+def default_audio_storage() -> S3StorageService | FileSystemStorage:
+    match settings.STORAGE_BACKEND:
+        case "s3":
+            return S3StorageService(
+                settings.STORAGE_NAME_AUDIO, client=shared_storage_client.client
+            )
+        case "filesystem":
+            return default_file_system_storage()
+
+
+def default_file_system_storage() -> FileSystemStorage:
+    return FileSystemStorage(
+        settings.STORAGE_DIR / settings.STORAGE_NAME_AUDIO,
+        base_url=str(settings.STORAGE_PUBLIC_URL),
+        secret_key=settings.STORAGE_SECRET_KEY,
+    )
+
 
+def default_cached_audio_storage() -> AudioStorage:
+    """Audio storage for use cases that read whole tracks."""
+    # Files on local disk gain nothing from another copy on local disk
+    if settings.TRACK_CACHE_MAX_SIZE <= 0 or settings.STORAGE_BACKEND == "filesystem":
+        return default_audio_storage()
+    return DiskCachedAudioStorage(default_audio_storage(), track_cache)
 
-def default_audio_processor() -> NativeAudioProcessor:
-    return native_audio_processor
+
+def default_audio_processor() -> AudioProcessor:
+    match settings.AUDIO_PROCESSOR:
+        case "pooled":
+            return pooled_audio_processor
+        case "native":
+            return native_audio_processor
 
 
 def build_create_track(
@@ -53,6 +110,112 @@ def build_create_track(
     )
 
 
+def build_start_track_upload(
+    session: AsyncSession,
+    direct_upload_repo: DirectUploadRepository | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> StartTrackUpload:
+    return StartTrackUpload(
+        session=session,
+        direct_upload_repo=direct_upload_repo or default_direct_upload_repo(session),
+        audio_storage=audio_storage or default_audio_storage(),
+        expiration=settings.TRACK_UPLOAD_EXPIRATION,
+    )
+
+
+def build_finish_track_upload(
+    session: AsyncSession,
+    track_repo: TrackRepository | None = None,
+    direct_upload_repo: DirectUploadRepository | None = None,
+    audio_processor: AudioProcessor | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> FinishTrackUpload:
+    return FinishTrackUpload(
+        session=session,
+        track_repo=track_repo or default_track_repo(session),
+        direct_upload_repo=direct_upload_repo or default_direct_upload_repo(session),
+        audio_processor=audio_processor or default_audio_processor(),
+        audio_storage=audio_storage or default_audio_storage(),
+    )
+
+
+def build_create_upload_session(
+    session: AsyncSession,
+    upload_session_repo: UploadSessionRepository | None = None,
+) -> CreateUploadSession:
+    return CreateUploadSession(
+        session=session,
+        upload_session_repo=upload_session_repo or default_upload_session_repo(session),
+        expiration=settings.UPLOAD_SESSION_EXPIRATION,
+    )
+
+
+def build_read_upload_session(
+    session: AsyncSession,
+    upload_session_repo: UploadSessionRepository | None = None,
+) -> ReadUploadSession:
+    return ReadUploadSession(
+        upload_session_repo=upload_session_repo or default_upload_session_repo(session),
+        expiration=settings.UPLOAD_SESSION_EXPIRATION,
+    )
+
+
+def build_append_to_upload_session(
+    session: AsyncSession,
+    upload_session_repo: UploadSessionRepository | None = None,
+    track_repo: TrackRepository | None = None,
+    audio_processor: AudioProcessor | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> AppendToUploadSession:
+    return AppendToUploadSession(
+        session=session,
+        upload_session_repo=upload_session_repo or default_upload_session_repo(session),
+        track_repo=track_repo or default_track_repo(session),
+        audio_processor=audio_processor or default_audio_processor(),
+        audio_storage=audio_storage or default_audio_storage(),
+        part_size=settings.STORAGE_MULTIPART_PART_SIZE,
+        expiration=settings.UPLOAD_SESSION_EXPIRATION,
+    )
+
+
+def build_delete_upload_session(
+    session: AsyncSession,
+    upload_session_repo: UploadSessionRepository | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> DeleteUploadSession:
+    return DeleteUploadSession(
+        session=session,
+        upload_session_repo=upload_session_repo or default_upload_session_repo(session),
+        audio_storage=audio_storage or default_audio_storage(),
+    )
+
+
+def build_purge_upload_sessions(
+    session: AsyncSession,
+    upload_session_repo: UploadSessionRepository | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> PurgeUploadSessions:
+    return PurgeUploadSessions(
+        session=session,
+        upload_session_repo=upload_session_repo or default_upload_session_repo(session),
+        audio_storage=audio_storage or default_audio_storage(),
+        expiration=settings.UPLOAD_SESSION_EXPIRATION,
+    )
+
+
+def build_purge_direct_uploads(
+    session: AsyncSession,
+    direct_upload_repo: DirectUploadRepository | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> PurgeDirectUploads:
+    return PurgeDirectUploads(
+        session=session,
+        direct_upload_repo=direct_upload_repo or default_direct_upload_repo(session),
+        audio_storage=audio_storage or default_audio_storage(),
+        expiration=settings.DIRECT_UPLOAD_EXPIRATION,
+    )
+
+
 def build_read_track(
     session: AsyncSession,
     track_repo: TrackRepository | None = None,
@@ -113,5 +276,24 @@ def build_create_clip(
         clip_repo=clip_repo or default_clip_repo(session),
         track_repo=track_repo or default_track_repo(session),
         audio_processor=audio_processor or default_audio_processor(),
-        audio_storage=audio_storage or default_audio_storage(),
+        audio_storage=audio_storage or default_cached_audio_storage(),
+        render_flight=clip_render_flight,
+    )
+
+
+def build_render_clip(
+    session: AsyncSession,
+    clip_repo: ClipRepository | None = None,
+    track_repo: TrackRepository | None = None,
+    audio_processor: AudioProcessor | None = None,
+    audio_storage: AudioStorage | None = None,
+) -> RenderClip:
+    return RenderClip(
+        session=session,
+        clip_repo=clip_repo or default_clip_repo(session),
+        track_repo=track_repo or default_track_repo(session),
+        audio_processor=audio_processor or default_audio_processor(),
+        audio_storage=audio_storage or default_cached_audio_storage(),
+        render_flight=clip_render_flight,
+        lease=settings.CLIP_RENDER_LEASE,
     )
@@ -1,5 +1,6 @@
-from .session import get_session
+from .session import get_replica_session, get_session
 
 __all__ = [
+    "get_replica_session",
     "get_session",
 ]
@@ -7,7 +7,12 @@ from jamflow.core.utils import timezone_now
 
 
 class BaseSQLModel(SQLModel):
-    """Base class for models that have a UUID primary key and timestamps."""
+    """
+    Base class for models that have a UUID primary key and timestamps.
+
+    All values are set in Python rather than by the database, so a model is
+    complete once inserted and never has to be read back.
+    """
 
     id: uuid.UUID = Field(primary_key=True, default_factory=uuid.uuid4)
     created_at: datetime = Field(
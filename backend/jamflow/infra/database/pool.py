@@ -0,0 +1,85 @@
+"""
+Connection pool of the database engine.
+"""
+
+import threading
+import time
+from typing import Any, NamedTuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from jamflow.core.log import get_logger
+
+logger = get_logger()
+
+# Checkouts waiting longer than this are logged, as a sign that the pool is too
+# small for the load.
+SLOW_CHECKOUT_TIME = 0.5  # seconds
+
+
+class PoolInfo(NamedTuple):
+    size: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time: float
+    max_wait_time: float
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that keeps count of how long checkouts wait for a connection.
+
+    The wait includes opening a connection if the pool has none idle and
+    checking it with a ping if enabled, which is what a checkout costs. Counters start over when
+    the pool is recreated, e.g. after the engine is disposed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def info(self) -> PoolInfo:
+        with self._stats_lock:
+            return PoolInfo(
+                size=self.size(),
+                checked_out=self.checkedout(),
+                # Counts from minus the pool size while the pool fills up
+                overflow=max(self.overflow(), 0),
+                max_overflow=self._max_overflow,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_time=self._wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            logger.warning("Database pool exhausted", **self.info()._asdict())
+            raise
+        finally:
+            self._record_wait(time.perf_counter() - start)
+
+    def _record_wait(self, wait_time: float) -> None:
+        with self._stats_lock:
+            self._checkouts += 1
+            self._wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        if wait_time > SLOW_CHECKOUT_TIME:
+            logger.warning(
+                "Slow database connection checkout",
+                checkout_time=round(wait_time, 3),
+                **self.info()._asdict(),
+            )
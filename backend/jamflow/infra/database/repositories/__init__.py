@@ -1,7 +1,11 @@
 from .clip import SQLModelClipRepository
+from .direct_upload import SQLModelDirectUploadRepository
 from .track import SQLModelTrackRepository
+from .upload_session import SQLModelUploadSessionRepository
 
 __all__ = [
     "SQLModelClipRepository",
+    "SQLModelDirectUploadRepository",
     "SQLModelTrackRepository",
+    "SQLModelUploadSessionRepository",
 ]
@@ -1,11 +1,15 @@
 import uuid
+from collections.abc import AsyncIterator
 from typing import Sequence
 
+from sqlalchemy import tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from jamflow.core.exceptions import DuplicateEntityError
+from jamflow.core.pagination import Cursor, Page
 from jamflow.infra.database.models import BaseSQLModel
 
 
@@ -39,6 +43,18 @@ class SQLModelBaseRepository[M: BaseSQLModel]:
         result = await self._session.exec(statement)
         return result.all()
 
+    async def list_page(self, *, limit: int, cursor: Cursor | None = None) -> Page[M]:
+        return await self._paginate(
+            select(self.model_class), limit=limit, cursor=cursor
+        )
+
+    async def iter_batches(self, *, batch_size: int) -> AsyncIterator[Sequence[M]]:
+        statement = select(self.model_class).order_by(
+            col(self.model_class.created_at), col(self.model_class.id)
+        )
+        async for batch in self._stream(statement, batch_size=batch_size):
+            yield batch
+
     async def list_by_ids(self, ids: list[uuid.UUID]) -> Sequence[M]:
         statement = (
             select(self.model_class)
@@ -47,3 +63,58 @@ class SQLModelBaseRepository[M: BaseSQLModel]:
         )
         result = await self._session.exec(statement)
         return result.all()
+
+    async def _stream(
+        self, statement: SelectOfScalar[M], *, batch_size: int
+    ) -> AsyncIterator[Sequence[M]]:
+        """
+        Run `statement` on a server side cursor and fetch its rows in batches,
+        so that only one batch is held in memory at a time.
+        """
+        result = await self._session.stream_scalars(
+            statement.execution_options(yield_per=batch_size)
+        )
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
+
+    async def _paginate(
+        self,
+        statement: SelectOfScalar[M],
+        *,
+        limit: int,
+        cursor: Cursor | None,
+        descending: bool = False,
+    ) -> Page[M]:
+        """
+        Fetch a page of `statement` using keyset pagination on `(created_at, id)`.
+
+        Rows are located by comparing against the cursor instead of skipping an
+        offset, so the cost of a page does not grow with its position.
+        """
+        created_at = col(self.model_class.created_at)
+        id = col(self.model_class.id)
+        if cursor is not None:
+            key = tuple_(created_at, id)
+            position = tuple_(cursor.created_at, cursor.id)
+            statement = statement.where(
+                key < position if descending else key > position
+            )
+        if descending:
+            statement = statement.order_by(created_at.desc(), id.desc())
+        else:
+            statement = statement.order_by(created_at, id)
+
+        # Fetching one extra row tells whether there is a next page
+        result = await self._session.exec(statement.limit(limit + 1))
+        models = list(result.all())
+        if len(models) <= limit:
+            return Page(items=models)
+
+        del models[limit:]
+        last = models[-1]
+        return Page(
+            items=models, next_cursor=Cursor(created_at=last.created_at, id=last.id)
+        )
@@ -1,9 +1,12 @@
 import uuid
+from collections.abc import AsyncIterator
 from typing import Sequence
 
-from sqlmodel import col, select
+from sqlmodel import and_, col, or_, select
 
-from jamflow.recordings.models import Clip
+from jamflow.core.pagination import Cursor, Page
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.models import Clip, ClipStatus
 
 from .base import SQLModelBaseRepository
 
@@ -19,3 +22,54 @@ class SQLModelClipRepository(SQLModelBaseRepository[Clip]):
         )
         result = await self._session.exec(statement)
         return result.all()
+
+    async def find_ready_by_path(self, track_id: uuid.UUID, path: str) -> Clip | None:
+        statement = (
+            select(Clip)
+            .where(
+                Clip.track_id == track_id,
+                Clip.path == path,
+                Clip.status == ClipStatus.READY,
+            )
+            .limit(1)
+        )
+        result = await self._session.exec(statement)
+        return result.first()
+
+    async def claim_next_pending(self) -> Clip | None:
+        statement = (
+            select(Clip)
+            .where(
+                or_(
+                    Clip.status == ClipStatus.PENDING,
+                    and_(
+                        Clip.status == ClipStatus.RENDERING,
+                        col(Clip.leased_until) < timezone_now(),
+                    ),
+                )
+            )
+            .order_by(col(Clip.created_at))
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.exec(statement)
+        return result.first()
+
+    async def list_page_by_track_id(
+        self, track_id: uuid.UUID, *, limit: int, cursor: Cursor | None = None
+    ) -> Page[Clip]:
+        statement = select(Clip).where(Clip.track_id == track_id)
+        return await self._paginate(
+            statement, limit=limit, cursor=cursor, descending=True
+        )
+
+    async def iter_batches_by_track_id(
+        self, track_id: uuid.UUID, *, batch_size: int
+    ) -> AsyncIterator[Sequence[Clip]]:
+        statement = (
+            select(Clip)
+            .where(Clip.track_id == track_id)
+            .order_by(col(Clip.created_at).desc(), col(Clip.id).desc())
+        )
+        async for batch in self._stream(statement, batch_size=batch_size):
+            yield batch
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlmodel import col, delete, select
+
+from jamflow.core.exceptions import ConcurrentModificationError
+from jamflow.recordings.models import DirectUpload
+
+from .base import SQLModelBaseRepository
+
+
+class SQLModelDirectUploadRepository(SQLModelBaseRepository[DirectUpload]):
+    model_class = DirectUpload
+
+    async def delete(self, direct_upload: DirectUpload) -> None:
+        # Deleted by statement, since the ORM only warns about a missing row.
+        # The row stays locked until the end of the transaction, so finishing
+        # and purging the same upload can't both go through.
+        statement = delete(DirectUpload).where(col(DirectUpload.id) == direct_upload.id)
+        result = await self._session.exec(statement)
+        if result.rowcount == 0:
+            raise ConcurrentModificationError(
+                "Direct upload was deleted concurrently",
+                context={"direct_upload_id": direct_upload.id},
+            )
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[DirectUpload]:
+        statement = (
+            select(DirectUpload)
+            .where(col(DirectUpload.updated_at) < updated_before)
+            .order_by(col(DirectUpload.updated_at))
+            .limit(limit)
+        )
+        result = await self._session.exec(statement)
+        return result.all()
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy.orm.exc import StaleDataError
+from sqlmodel import col, select
+
+from jamflow.core.exceptions import ConcurrentModificationError
+from jamflow.recordings.models import UploadSession
+
+from .base import SQLModelBaseRepository
+
+
+class SQLModelUploadSessionRepository(SQLModelBaseRepository[UploadSession]):
+    model_class = UploadSession
+
+    async def save(self, upload_session: UploadSession) -> None:
+        self._session.add(upload_session)
+        await self._flush(upload_session)
+
+    async def delete(self, upload_session: UploadSession) -> None:
+        await self._session.delete(upload_session)
+        await self._flush(upload_session)
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[UploadSession]:
+        statement = (
+            select(UploadSession)
+            .where(col(UploadSession.updated_at) < updated_before)
+            .order_by(col(UploadSession.updated_at))
+            .limit(limit)
+        )
+        result = await self._session.exec(statement)
+        return result.all()
+
+    async def _flush(self, upload_session: UploadSession) -> None:
+        # The offset is the version counter of the mapping, so updates and
+        # deletes only match while it is unchanged
+        try:
+            await self._session.flush()
+        except StaleDataError as exc:
+            raise ConcurrentModificationError(
+                "Upload session was changed concurrently",
+                context={"upload_session_id": upload_session.id},
+            ) from exc
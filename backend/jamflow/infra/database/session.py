@@ -1,21 +1,86 @@
+import uuid
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from jamflow.core.config import settings
+from jamflow.infra.database.pool import InstrumentedQueuePool, PoolInfo
 
-engine = create_async_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI),
-    future=True,
-    echo=settings.DEBUG,
-)
+
+def create_engine(url: str) -> AsyncEngine:
+    """
+    Create an engine for the database at `url` with the pool and statement
+    cache configured in the settings.
+
+    Behind PgBouncer in transaction mode the connections are pooled by
+    PgBouncer instead, and prepared statements are neither cached nor named
+    alike, since a transaction may run on another server connection than the
+    one that prepared them.
+    """
+    if settings.DB_PGBOUNCER:
+        return create_async_engine(
+            url,
+            future=True,
+            echo=settings.DEBUG,
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            },
+        )
+    return create_async_engine(
+        url,
+        future=True,
+        echo=settings.DEBUG,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            # Statements are prepared by SQLAlchemy and by asyncpg for its own
+            # queries, which each keep a cache
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+def get_pool_info() -> PoolInfo | None:
+    """Return the state of the connection pool, if the engine keeps one."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return None
+    return pool.info()
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
 AsyncSessionFactory = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Falls back to the primary, so reads work the same without a replica
+replica_engine = (
+    create_engine(str(settings.SQLALCHEMY_DATABASE_REPLICA_URI))
+    if settings.SQLALCHEMY_DATABASE_REPLICA_URI is not None
+    else engine
+)
+ReplicaSessionFactory = async_sessionmaker(
+    bind=replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
     async with AsyncSessionFactory() as session:
@@ -26,3 +91,15 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
             raise
         finally:
             await session.close()
+
+
+async def get_replica_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Open a session on the read replica, which may lag behind the primary and
+    rejects writes.
+    """
+    async with ReplicaSessionFactory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,9 @@
+from .clip_worker import ClipWorkerPool, clip_worker_pool
+from .upload_purger import UploadSessionPurger, upload_session_purger
+
+__all__ = [
+    "ClipWorkerPool",
+    "clip_worker_pool",
+    "UploadSessionPurger",
+    "upload_session_purger",
+]
@@ -0,0 +1,82 @@
+"""
+Background rendering of clips.
+
+Pending clips in the database double as the job queue. Workers claim them with
+`SELECT ... FOR UPDATE SKIP LOCKED`, so any number of workers across processes
+can share the queue without handing out a clip twice.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.config import settings
+from jamflow.core.log import get_logger
+from jamflow.infra.bootstrap import build_render_clip
+from jamflow.infra.database.session import AsyncSessionFactory
+
+logger = get_logger()
+
+
+class ClipWorkerPool:
+    """
+    Asyncio tasks that render pending clips one at a time each.
+
+    Workers poll for pending clips while the queue is empty and keep working
+    without a pause while there are any.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        poll_interval: float,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionFactory,
+    ):
+        """
+        :param workers: Number of clips rendered concurrently.
+        :param poll_interval: Time in seconds to wait when there is nothing to do.
+        """
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._session_factory = session_factory
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        for index in range(self._workers - len(self._tasks)):
+            task = asyncio.create_task(self._work(), name=f"clip-worker-{index}")
+            self._tasks.append(task)
+
+    async def stop(self) -> None:
+        """
+        Stop all workers. Clips being rendered are released and picked up again
+        later.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def run_once(self) -> bool:
+        """Render the next pending clip and return whether there was one."""
+        async with self._session_factory() as session:
+            use_case = build_render_clip(session)
+            clip_id = await use_case.execute()
+        return clip_id is not None
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                rendered = await self.run_once()
+            except Exception:
+                await logger.aexception("Clip worker failed")
+                rendered = False
+            if not rendered:
+                await asyncio.sleep(self._poll_interval)
+
+
+clip_worker_pool = ClipWorkerPool(
+    workers=settings.CLIP_WORKERS,
+    poll_interval=settings.CLIP_WORKER_POLL_INTERVAL,
+)
@@ -0,0 +1,84 @@
+"""
+Background purging of abandoned uploads.
+
+Upload sessions that stop receiving chunks keep their parts in storage until
+they are aborted, and files uploaded straight to storage stay there without a
+track unless the upload is finished. Any number of processes may purge at the
+same time, since an upload that was already discarded by one of them is
+skipped by the others.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.config import settings
+from jamflow.core.log import get_logger
+from jamflow.infra.bootstrap import (
+    build_purge_direct_uploads,
+    build_purge_upload_sessions,
+)
+from jamflow.infra.database.session import AsyncSessionFactory
+
+logger = get_logger()
+
+
+class UploadSessionPurger:
+    """
+    Asyncio task that discards expired upload sessions and direct uploads at an
+    interval.
+
+    Uploads are discarded in batches without a pause until none are left, so
+    a backlog is worked off in one go.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionFactory,
+    ):
+        """
+        :param interval: Time in seconds between purges.
+        """
+        self._interval = interval
+        self._session_factory = session_factory
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._work(), name="upload-purger")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Discard expired uploads and return how many there were."""
+        purged = 0
+        for build_use_case in (build_purge_upload_sessions, build_purge_direct_uploads):
+            while True:
+                async with self._session_factory() as session:
+                    use_case = build_use_case(session)
+                    batch_purged = await use_case.execute()
+                if not batch_purged:
+                    break
+                purged += batch_purged
+        return purged
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                await logger.aexception("Upload purger failed")
+            await asyncio.sleep(self._interval)
+
+
+upload_session_purger = UploadSessionPurger(
+    interval=settings.UPLOAD_SESSION_PURGE_INTERVAL
+)
@@ -0,0 +1,338 @@
+"""
+Local disk cache for files in storage.
+
+Tracks never change once stored, so a copy on local disk can serve every clip
+made from a track after the first one without touching the network.
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Awaitable, Callable, Sequence
+from pathlib import Path
+from tempfile import NamedTemporaryFile, TemporaryFile, gettempdir
+from types import TracebackType
+from typing import BinaryIO, NamedTuple, Self, cast
+
+from jamflow.core.concurrency import SingleFlight
+from jamflow.core.config import settings
+from jamflow.core.log import get_logger
+from jamflow.recordings.protocols import AudioStorage, UploadForm
+
+logger = get_logger()
+
+_PARTIAL_SUFFIX = ".partial"
+
+# Writes a file from storage into the given file
+Download = Callable[[BinaryIO], Awaitable[None]]
+
+
+class DiskCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class DiskCache:
+    """
+    LRU cache of files on local disk with a budget in bytes.
+
+    Files are downloaded next to the cache entries under a temporary name and
+    renamed once complete, so readers never see a partial file and nothing is
+    written twice. Concurrent misses for the same path share a single fill.
+
+    The budget may be exceeded by the most recent entry alone, which is kept even
+    if it is larger than the budget so that the fill isn't wasted. The index is
+    held in memory and rebuilt from the directory on first use, least recently
+    accessed first. Processes sharing a directory each keep their own budget.
+    """
+
+    def __init__(self, directory: Path, *, max_size: int):
+        self._directory = directory
+        self._max_size = max_size
+        self._entries: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._fills: SingleFlight[str, None] = SingleFlight()
+        self._background_fills: set[asyncio.Task[None]] = set()
+        self._hits = 0
+        self._misses = 0
+
+    async def get_or_fill(self, path: str, download: Download) -> BinaryIO:
+        """
+        Open the cached copy of `path`, filling it with `download` first if
+        there is none.
+        """
+        file = self.open(path)
+        if file is not None:
+            self._hits += 1
+            return file
+
+        self._misses += 1
+        await self._fills.do(path, lambda: self._fill(path, download))
+        file = self.open(path)
+        if file is None:
+            # Evicted again right away by concurrent fills
+            return await _download_temp_file(download)
+        return file
+
+    def get_or_fill_in_background(
+        self, path: str, download: Download, *, size: int | None = None
+    ) -> BinaryIO | None:
+        """
+        Open the cached copy of `path`, or return `None` and fill it with
+        `download` in the background if there is none.
+
+        Files of a known `size` beyond the budget are not filled, since they
+        would push out all other entries.
+        """
+        file = self.open(path)
+        if file is not None:
+            self._hits += 1
+            return file
+
+        self._misses += 1
+        if path not in self._fills and (size is None or size <= self._max_size):
+            task = asyncio.create_task(self._fill_in_background(path, download))
+            self._background_fills.add(task)
+            task.add_done_callback(self._background_fills.discard)
+        return None
+
+    def discard(self, path: str) -> None:
+        entries = self._get_entries()
+        name = _entry_name(path)
+        if name in entries:
+            self._remove(name)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        for name in list(self._get_entries()):
+            self._remove(name)
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> DiskCacheInfo:
+        return DiskCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._get_entries()),
+            size=self._size,
+            max_size=self._max_size,
+        )
+
+    def open(self, path: str) -> BinaryIO | None:
+        """Open the cached copy of `path` or return `None` if there is none."""
+        entries = self._get_entries()
+        name = _entry_name(path)
+        if name not in entries:
+            return None
+        try:
+            # Opened files stay readable if their entry is evicted meanwhile
+            file = open(self._directory / name, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            self._remove(name)
+            return None
+        entries.move_to_end(name)
+        return file
+
+    async def _fill_in_background(self, path: str, download: Download) -> None:
+        try:
+            await self._fills.do(path, lambda: self._fill(path, download))
+        except Exception:
+            await logger.aexception("Failed to cache file", path=path)
+
+    async def _fill(self, path: str, download: Download) -> None:
+        name = _entry_name(path)
+        entries = self._get_entries()
+        target = NamedTemporaryFile(  # noqa: SIM115
+            dir=self._directory, suffix=_PARTIAL_SUFFIX, delete=False
+        )
+        try:
+            with target:
+                await download(cast(BinaryIO, target))
+            os.replace(target.name, self._directory / name)
+        except BaseException:
+            os.unlink(target.name)
+            raise
+        size = os.path.getsize(self._directory / name)
+
+        self._size += size - entries.get(name, 0)
+        entries[name] = size
+        entries.move_to_end(name)
+        while self._size > self._max_size and len(entries) > 1:
+            self._remove(next(iter(entries)))
+        await logger.ainfo("File cached", path=path, size=size)
+
+    def _remove(self, name: str) -> None:
+        entries = self._get_entries()
+        self._size -= entries.pop(name)
+        (self._directory / name).unlink(missing_ok=True)
+
+    def _get_entries(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            self._entries = self._load()
+            self._size = sum(self._entries.values())
+        return self._entries
+
+    def _load(self) -> OrderedDict[str, int]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        files = []
+        for entry in os.scandir(self._directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(_PARTIAL_SUFFIX):
+                # Left behind by an interrupted fill
+                os.unlink(entry.path)
+                continue
+            stat = entry.stat()
+            files.append((stat.st_atime, entry.name, stat.st_size))
+        files.sort()
+        return OrderedDict((name, size) for _, name, size in files)
+
+
+class DiskCachedAudioStorage:
+    """
+    Audio storage that reads files through a disk cache.
+
+    Getting a file loads the whole file into the cache, which pays off since
+    files are usually read several times in a row. Opening a file that isn't
+    cached yet opens it in the wrapped storage instead, so that only the
+    regions read are transferred, and fills the cache in the background for
+    the next time. Everything else is passed through to the wrapped storage.
+    """
+
+    def __init__(self, storage: AudioStorage, cache: DiskCache):
+        self._storage = storage
+        self._cache = cache
+
+    async def __aenter__(self) -> Self:
+        await self._storage.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self._storage.__aexit__(exc_type, exc_value, traceback)
+
+    async def store_file(
+        self,
+        file: bytes | BinaryIO,
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        self._cache.discard(path)
+        await self._storage.store_file(file, path=path, content_type=content_type)
+
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        self._cache.discard(path)
+        await self._storage.store_stream(chunks, path=path, content_type=content_type)
+
+    async def start_multipart_upload(self, path: str, *, content_type: str) -> str:
+        return await self._storage.start_multipart_upload(
+            path, content_type=content_type
+        )
+
+    async def upload_part(
+        self, path: str, *, upload_id: str, number: int, data: bytes
+    ) -> str:
+        return await self._storage.upload_part(
+            path, upload_id=upload_id, number=number, data=data
+        )
+
+    async def complete_multipart_upload(
+        self, path: str, *, upload_id: str, part_tags: Sequence[str]
+    ) -> None:
+        self._cache.discard(path)
+        await self._storage.complete_multipart_upload(
+            path, upload_id=upload_id, part_tags=part_tags
+        )
+
+    async def abort_multipart_upload(self, path: str, *, upload_id: str) -> None:
+        await self._storage.abort_multipart_upload(path, upload_id=upload_id)
+
+    async def delete_file(self, path: str) -> None:
+        self._cache.discard(path)
+        await self._storage.delete_file(path)
+
+    async def get_file(self, path: str) -> BinaryIO:
+        return await self._cache.get_or_fill(
+            path, lambda file: self._storage.download_file(path, file)
+        )
+
+    async def download_file(self, path: str, file: BinaryIO) -> None:
+        await self._storage.download_file(path, file)
+
+    async def get_range(self, path: str, start_byte: int, end_byte: int) -> bytes:
+        # Small reads are not worth loading the whole file for
+        file = self._cache.open(path)
+        if file is None:
+            return await self._storage.get_range(path, start_byte, end_byte)
+        with file:
+            file.seek(start_byte)
+            return file.read(end_byte - start_byte)
+
+    async def open_file(self, path: str, size: int | None = None) -> BinaryIO:
+        # The fill may outlive the storage context, which the shared storage
+        # client allows for
+        file = self._cache.get_or_fill_in_background(
+            path, lambda file: self._storage.download_file(path, file), size=size
+        )
+        if file is None:
+            return await self._storage.open_file(path, size)
+        return file
+
+    async def get_file_size(self, path: str) -> int | None:
+        return await self._storage.get_file_size(path)
+
+    async def generate_expiring_url(self, path: str, expiration: int = 3600) -> str:
+        return await self._storage.generate_expiring_url(path, expiration)
+
+    async def generate_expiring_urls(
+        self, paths: Sequence[str], expiration: int = 3600
+    ) -> list[str]:
+        return await self._storage.generate_expiring_urls(paths, expiration)
+
+    async def generate_upload_form(
+        self,
+        path: str,
+        *,
+        content_type: str,
+        max_size: int,
+        expiration: int = 3600,
+    ) -> UploadForm:
+        return await self._storage.generate_upload_form(
+            path, content_type=content_type, max_size=max_size, expiration=expiration
+        )
+
+
+def _entry_name(path: str) -> str:
+    return hashlib.sha256(path.encode()).hexdigest()
+
+
+async def _download_temp_file(download: Download) -> BinaryIO:
+    temp_file = TemporaryFile(mode="wb+")
+    try:
+        await download(temp_file)
+    except BaseException:
+        temp_file.close()
+        raise
+    temp_file.seek(0)
+    return temp_file
+
+
+track_cache = DiskCache(
+    settings.TRACK_CACHE_DIR or Path(gettempdir()) / "jamflow-track-cache",
+    max_size=settings.TRACK_CACHE_MAX_SIZE,
+)
@@ -0,0 +1,414 @@
+"""
+Audio storage on the local filesystem.
+
+Meant for single node deployments and test runs, where an object storage only
+adds network round trips and request signing to every read. Clients get files
+and upload forms from the API under URLs signed with the storage secret key.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterable, Callable, Sequence
+from pathlib import Path
+from stat import S_ISREG
+from tempfile import NamedTemporaryFile
+from types import TracebackType
+from typing import IO, BinaryIO, Self
+from urllib.parse import quote, urlencode
+
+from jamflow.core.exceptions import AuthorizationError, StorageError
+from jamflow.core.log import get_logger
+from jamflow.recordings.protocols import UploadForm
+
+logger = get_logger()
+
+_UPLOADS_DIR = ".uploads"
+_PARTIAL_SUFFIX = ".partial"
+
+
+class FileSystemStorage:
+    """
+    Storage service that keeps files in a directory on local disk.
+
+    Files are written under a temporary name next to their path and renamed once
+    complete, so readers never see a partial file. Getting or opening a file
+    returns the file on disk itself without copying it.
+
+    Paths are relative to the directory and must not contain segments starting
+    with a dot, which are reserved for files in progress.
+    """
+
+    def __init__(self, directory: Path, *, base_url: str, secret_key: str):
+        """
+        :param base_url: URL the API serves the files of the storage under.
+        :param secret_key: Key URLs and upload forms are signed with.
+        """
+        self._directory = directory.resolve()
+        self._base_url = base_url.rstrip("/") + "/"
+        self._secret_key = secret_key.encode()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+    async def store_file(
+        self,
+        file: bytes | BinaryIO,
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        await _store_in_thread(path, _write_file, self.resolve(path), file)
+
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        target = self.resolve(path)
+        # Errors of the chunks themselves are passed on as they are
+        temp_file = await _store_in_thread(path, _create_temp_file, target.parent)
+        try:
+            async for chunk in chunks:
+                await _store_in_thread(path, temp_file.write, chunk)
+            await _store_in_thread(path, _commit_temp_file, temp_file, target)
+        except BaseException:
+            await asyncio.to_thread(_discard_temp_file, temp_file)
+            raise
+
+    async def start_multipart_upload(self, path: str, *, content_type: str) -> str:
+        self.resolve(path)
+        upload_id = uuid.uuid4().hex
+        try:
+            await asyncio.to_thread(self._get_upload_dir(upload_id).mkdir, parents=True)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to start multipart upload",
+                context={"path": path, "error": str(exc)},
+            ) from exc
+        return upload_id
+
+    async def upload_part(
+        self, path: str, *, upload_id: str, number: int, data: bytes
+    ) -> str:
+        upload_dir = self._get_upload_dir(upload_id)
+        try:
+            if not await asyncio.to_thread(upload_dir.is_dir):
+                raise FileNotFoundError(f"No such upload: {upload_id}")
+            await asyncio.to_thread(_write_file, upload_dir / _part_name(number), data)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to upload part",
+                context={
+                    "path": path,
+                    "upload_id": upload_id,
+                    "part_number": number,
+                    "error": str(exc),
+                },
+            ) from exc
+        return _get_part_tag(data)
+
+    async def complete_multipart_upload(
+        self, path: str, *, upload_id: str, part_tags: Sequence[str]
+    ) -> None:
+        target = self.resolve(path)
+        upload_dir = self._get_upload_dir(upload_id)
+        try:
+            await asyncio.to_thread(_join_parts, upload_dir, part_tags, target)
+        except (OSError, ValueError) as exc:
+            raise StorageError(
+                "Failed to complete multipart upload",
+                context={"path": path, "upload_id": upload_id, "error": str(exc)},
+            ) from exc
+        await asyncio.to_thread(shutil.rmtree, upload_dir, ignore_errors=True)
+
+    async def abort_multipart_upload(self, path: str, *, upload_id: str) -> None:
+        upload_dir = self._get_upload_dir(upload_id)
+        try:
+            await asyncio.to_thread(shutil.rmtree, upload_dir)
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            raise StorageError(
+                "Failed to abort multipart upload",
+                context={"path": path, "upload_id": upload_id, "error": str(exc)},
+            ) from exc
+
+    async def delete_file(self, path: str) -> None:
+        target = self.resolve(path)
+        try:
+            await asyncio.to_thread(target.unlink, missing_ok=True)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to delete file", context={"path": path, "error": str(exc)}
+            ) from exc
+
+    async def get_file(self, path: str) -> BinaryIO:
+        target = self.resolve(path)
+        try:
+            return await asyncio.to_thread(_open_file, target)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to get file", context={"path": path, "error": str(exc)}
+            ) from exc
+
+    async def download_file(self, path: str, file: BinaryIO) -> None:
+        target = self.resolve(path)
+        try:
+            await asyncio.to_thread(_copy_file, target, file)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to get file", context={"path": path, "error": str(exc)}
+            ) from exc
+
+    async def get_range(self, path: str, start_byte: int, end_byte: int) -> bytes:
+        target = self.resolve(path)
+        try:
+            return await asyncio.to_thread(_read_range, target, start_byte, end_byte)
+        except OSError as exc:
+            raise StorageError(
+                "Failed to get file range",
+                context={
+                    "path": path,
+                    "start_byte": start_byte,
+                    "end_byte": end_byte,
+                    "error": str(exc),
+                },
+            ) from exc
+
+    async def open_file(self, path: str, size: int | None = None) -> BinaryIO:
+        return await self.get_file(path)
+
+    async def get_file_size(self, path: str) -> int | None:
+        target = self.resolve(path)
+        try:
+            stat = await asyncio.to_thread(target.stat)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            raise StorageError(
+                "Failed to get file size", context={"path": path, "error": str(exc)}
+            ) from exc
+        if not S_ISREG(stat.st_mode):
+            return None
+        return stat.st_size
+
+    async def generate_expiring_url(self, path: str, expiration: int = 3600) -> str:
+        self.resolve(path)
+        expires = int(time.time()) + expiration
+        query = urlencode(
+            {"expires": expires, "signature": self._sign("GET", path, str(expires))}
+        )
+        return f"{self._base_url}{quote(path)}?{query}"
+
+    async def generate_expiring_urls(
+        self, paths: Sequence[str], expiration: int = 3600
+    ) -> list[str]:
+        return [await self.generate_expiring_url(path, expiration) for path in paths]
+
+    async def generate_upload_form(
+        self,
+        path: str,
+        *,
+        content_type: str,
+        max_size: int,
+        expiration: int = 3600,
+    ) -> UploadForm:
+        """
+        Generate a form whose signature pins the path, content type and maximum
+        size of the upload.
+        """
+        self.resolve(path)
+        fields = {
+            "key": path,
+            "Content-Type": content_type,
+            "max_size": str(max_size),
+            "expires": str(int(time.time()) + expiration),
+        }
+        fields["signature"] = self._sign("POST", *fields.values())
+        return UploadForm(url=self._base_url, fields=fields)
+
+    def verify_url(self, path: str, *, expires: int, signature: str) -> Path:
+        """
+        Check an URL made by `generate_expiring_url` and return the file it
+        points to.
+
+        :raises AuthorizationError: if the URL is expired or not signed by this
+            storage.
+        :raises StorageError: if the path is invalid.
+        """
+        self._verify(signature, expires, "GET", path, str(expires))
+        return self.resolve(path)
+
+    def verify_upload_form(self, fields: dict[str, str]) -> tuple[str, str, int]:
+        """
+        Check the fields of a form made by `generate_upload_form` and return
+        the path, content type and maximum size of the upload.
+
+        :raises AuthorizationError: if the form is expired, incomplete or not
+            signed by this storage.
+        """
+        try:
+            path = fields["key"]
+            content_type = fields["Content-Type"]
+            max_size = fields["max_size"]
+            expires = fields["expires"]
+            signature = fields["signature"]
+            self._verify(
+                signature, int(expires), "POST", path, content_type, max_size, expires
+            )
+            return path, content_type, int(max_size)
+        except (KeyError, ValueError) as exc:
+            raise AuthorizationError("Invalid upload form") from exc
+
+    def resolve(self, path: str) -> Path:
+        """
+        Return where the file of a path is kept on disk.
+
+        :raises StorageError: if the path points outside of the storage or to a
+            reserved name.
+        """
+        parts = Path(path).parts
+        if not parts or any(part.startswith((".", "/")) for part in parts):
+            raise StorageError("Invalid path", context={"path": path})
+        return self._directory.joinpath(*parts)
+
+    async def purge(self, prefix: str = "") -> int:
+        """
+        Delete all files in the storage, or those whose path starts with
+        `prefix`, and return how many there were.
+        """
+        deleted = await asyncio.to_thread(self._purge, prefix)
+        await logger.ainfo(
+            "Storage directory purged", prefix=prefix, objects_deleted=deleted
+        )
+        return deleted
+
+    def _purge(self, prefix: str) -> int:
+        deleted = 0
+        for directory, dir_names, file_names in os.walk(self._directory):
+            relative = Path(directory).relative_to(self._directory)
+            if relative.parts[:1] == (_UPLOADS_DIR,):
+                dir_names.clear()
+                continue
+            for file_name in file_names:
+                path = (relative / file_name).as_posix()
+                if path.startswith(prefix) and not file_name.startswith("."):
+                    os.unlink(os.path.join(directory, file_name))
+                    deleted += 1
+        return deleted
+
+    def _get_upload_dir(self, upload_id: str) -> Path:
+        if not upload_id.isalnum():
+            raise StorageError("Invalid upload ID", context={"upload_id": upload_id})
+        return self._directory / _UPLOADS_DIR / upload_id
+
+    def _sign(self, *values: str) -> str:
+        message = "\n".join(values).encode()
+        return hmac.new(self._secret_key, message, hashlib.sha256).hexdigest()
+
+    def _verify(self, signature: str, expires: int, *values: str) -> None:
+        if not hmac.compare_digest(signature, self._sign(*values)):
+            raise AuthorizationError("Invalid signature")
+        if expires < time.time():
+            raise AuthorizationError("Signature expired")
+
+
+async def _store_in_thread[**P, T](
+    path: str, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    try:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    except OSError as exc:
+        raise StorageError(
+            "Failed to store file", context={"path": path, "error": str(exc)}
+        ) from exc
+
+
+def _part_name(number: int) -> str:
+    return f"{number:05d}"
+
+
+def _get_part_tag(data: bytes) -> str:
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+def _create_temp_file(directory: Path) -> IO[bytes]:
+    directory.mkdir(parents=True, exist_ok=True)
+    return NamedTemporaryFile(  # noqa: SIM115
+        dir=directory, prefix=".", suffix=_PARTIAL_SUFFIX, delete=False
+    )
+
+
+def _commit_temp_file(temp_file: IO[bytes], target: Path) -> None:
+    # Flushed to disk before the rename, so that a crash leaves either the old
+    # or the new file behind
+    temp_file.flush()
+    os.fsync(temp_file.fileno())
+    temp_file.close()
+    os.replace(temp_file.name, target)
+
+
+def _discard_temp_file(temp_file: IO[bytes]) -> None:
+    temp_file.close()
+    Path(temp_file.name).unlink(missing_ok=True)
+
+
+def _write_file(target: Path, file: bytes | BinaryIO) -> None:
+    temp_file = _create_temp_file(target.parent)
+    try:
+        if isinstance(file, bytes):
+            temp_file.write(file)
+        else:
+            file.seek(0)
+            shutil.copyfileobj(file, temp_file)
+        _commit_temp_file(temp_file, target)
+    except BaseException:
+        _discard_temp_file(temp_file)
+        raise
+
+
+def _open_file(target: Path) -> BinaryIO:
+    return open(target, "rb")  # noqa: SIM115
+
+
+def _copy_file(target: Path, file: BinaryIO) -> None:
+    with open(target, "rb") as source:
+        shutil.copyfileobj(source, file)
+    file.flush()
+
+
+def _read_range(target: Path, start_byte: int, end_byte: int) -> bytes:
+    with open(target, "rb") as file:
+        file.seek(start_byte)
+        return file.read(end_byte - start_byte)
+
+
+def _join_parts(upload_dir: Path, part_tags: Sequence[str], target: Path) -> None:
+    if not upload_dir.is_dir():
+        raise FileNotFoundError(f"No such upload: {upload_dir.name}")
+    temp_file = _create_temp_file(target.parent)
+    try:
+        for number, tag in enumerate(part_tags, start=1):
+            data = (upload_dir / _part_name(number)).read_bytes()
+            if _get_part_tag(data) != tag:
+                raise ValueError(f"Part {number} does not match its tag")
+            temp_file.write(data)
+        _commit_temp_file(temp_file, target)
+    except BaseException:
+        _discard_temp_file(temp_file)
+        raise
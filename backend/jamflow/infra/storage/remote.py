@@ -0,0 +1,155 @@
+import io
+from collections import OrderedDict
+from typing import Any
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from jamflow.core.exceptions import StorageError
+
+DEFAULT_BLOCK_SIZE = 256 * 1024  # 256KB
+DEFAULT_MAX_BLOCKS = 64
+DEFAULT_TIMEOUT = 30  # seconds
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Read only, seekable file backed by HTTP range requests.
+
+    Reads are served from aligned blocks that are fetched on demand and kept in a
+    small LRU cache, so that parsers doing many small reads around a few positions
+    only transfer those regions. Reads spanning more than a block bypass the cache
+    and are fetched with a single request.
+
+    Instances can be pickled to hand them to worker processes. The cache is not
+    carried over.
+
+    :raises StorageError: if a range can't be fetched.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self._block_size = block_size
+        self._max_blocks = max_blocks
+        self._timeout = timeout
+        self._position = 0
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = self.size + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        end = min(self._position + len(view), self.size)
+        if end <= self._position:
+            return 0
+
+        if end - self._position > self._block_size:
+            data = self._fetch(self._position, end)
+        else:
+            data = self._read_cached(self._position, end)
+
+        view[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        if self._position >= self.size:
+            return b""
+        data = self._fetch(self._position, self.size)
+        self._position += len(data)
+        return data
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "size": self.size,
+            "block_size": self._block_size,
+            "max_blocks": self._max_blocks,
+            "timeout": self._timeout,
+            "position": self._position,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(
+            state["url"],
+            state["size"],
+            block_size=state["block_size"],
+            max_blocks=state["max_blocks"],
+            timeout=state["timeout"],
+        )
+        self._position = state["position"]
+
+    def _read_cached(self, start: int, end: int) -> bytes:
+        first_block = start // self._block_size
+        last_block = (end - 1) // self._block_size
+        data = b"".join(
+            self._get_block(index) for index in range(first_block, last_block + 1)
+        )
+        offset = start - first_block * self._block_size
+        return data[offset : offset + end - start]
+
+    def _get_block(self, index: int) -> bytes:
+        block = self._blocks.get(index)
+        if block is not None:
+            self._blocks.move_to_end(index)
+            return block
+
+        start = index * self._block_size
+        block = self._fetch(start, min(start + self._block_size, self.size))
+        self._blocks[index] = block
+        if len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        request = Request(self.url, headers={"Range": f"bytes={start}-{end - 1}"})
+        try:
+            with urlopen(request, timeout=self._timeout) as response:
+                data = response.read()
+                is_partial = response.status == 206
+        except (URLError, OSError) as exc:
+            raise StorageError(
+                "Failed to read file range",
+                context={"start_byte": start, "end_byte": end},
+            ) from exc
+
+        if not is_partial:
+            # Servers may ignore the range and send the whole file instead
+            data = data[start:end]
+        if len(data) != end - start:
+            raise StorageError(
+                "Incomplete file range received",
+                context={"start_byte": start, "end_byte": end, "received": len(data)},
+            )
+        return data
@@ -1,30 +1,55 @@
+import asyncio
+import io
+import itertools
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
 from tempfile import TemporaryFile
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, BinaryIO, Self
+from typing import TYPE_CHECKING, Any, BinaryIO, Self, cast
 
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
 from botocore.exceptions import BotoCoreError, ClientError
 from types_aiobotocore_s3.client import S3Client
+from types_aiobotocore_s3.type_defs import CompletedPartTypeDef
 
 from jamflow.core.config import settings
 from jamflow.core.exceptions import StorageError
 from jamflow.core.log import bind_log_context, get_logger, unbind_log_context
+from jamflow.core.streams import prepend, read_at_least, rechunk
+from jamflow.infra.storage.remote import RemoteFile
+from jamflow.infra.storage.url_cache import UrlCacheKey, expiring_url_cache
 from jamflow.infra.storage.utils import replace_base_url
+from jamflow.recordings.protocols import UploadForm
 
 if TYPE_CHECKING:
-    from types_aiobotocore_s3.type_defs import ObjectIdentifierTypeDef
+    from types_aiobotocore_s3.type_defs import (
+        ListObjectsV2RequestTypeDef,
+        ObjectIdentifierTypeDef,
+    )
 
 logger = get_logger()
 
+# Remote files are read by clip jobs, which must finish well within this time.
+_REMOTE_FILE_EXPIRATION = 3600  # seconds
+# Most keys S3 lists per page and deletes per request
+_DELETE_BATCH_SIZE = 1000
+
 
 async def get_storage_client() -> S3Client:
     session = get_session()
+    config = AioConfig(
+        max_pool_connections=settings.STORAGE_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connector_args={"keepalive_timeout": settings.STORAGE_KEEPALIVE_TIMEOUT},
+    )
     try:
         client = session.create_client(
             "s3",
             endpoint_url=str(settings.STORAGE_URL),
             aws_access_key_id=settings.STORAGE_ACCESS_KEY,
             aws_secret_access_key=settings.STORAGE_SECRET_KEY,
+            config=config,
         )
 
         return await client.__aenter__()
@@ -38,11 +63,88 @@ async def get_storage_client() -> S3Client:
         ) from exc
 
 
+class SharedStorageClient:
+    """
+    Storage client shared by all requests for the lifetime of the application.
+
+    Every client comes with its own connection pool, so reusing one client keeps
+    connections alive across requests instead of setting them up on each one.
+    """
+
+    def __init__(self):
+        self._client: S3Client | None = None
+
+    @property
+    def client(self) -> S3Client | None:
+        """The shared client or `None` if it has not been started."""
+        return self._client
+
+    async def start(self, bucket_names: Iterable[str]) -> None:
+        """
+        Create the client and make sure the given buckets exist.
+
+        :raises StorageError: if the storage can't be accessed.
+        """
+        client = await get_storage_client()
+        try:
+            for bucket_name in bucket_names:
+                async with S3StorageService(bucket_name, client=client) as storage:
+                    await storage.ensure_bucket()
+        except BaseException:
+            await client.close()
+            raise
+        self._client = client
+
+    async def stop(self) -> None:
+        """Close the client and its connections."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+
 class S3StorageService:
+    """
+    Storage service backed by an S3 compatible object storage.
+
+    When given a shared client it is used as is and the bucket is expected to
+    exist. Otherwise a client is created for every context and the bucket is
+    created if missing.
+    """
+
     _client: S3Client
 
-    def __init__(self, storage_name: str):
+    def __init__(
+        self,
+        storage_name: str,
+        *,
+        client: S3Client | None = None,
+        multipart_threshold: int = settings.STORAGE_MULTIPART_THRESHOLD,
+        multipart_part_size: int = settings.STORAGE_MULTIPART_PART_SIZE,
+        multipart_concurrency: int = settings.STORAGE_MULTIPART_CONCURRENCY,
+        download_chunk_size: int = settings.STORAGE_DOWNLOAD_CHUNK_SIZE,
+        download_concurrency: int = settings.STORAGE_DOWNLOAD_CONCURRENCY,
+        delete_concurrency: int = settings.STORAGE_DELETE_CONCURRENCY,
+    ):
+        """
+        :param multipart_threshold: Size in bytes from which files are stored
+            with a multipart upload.
+        :param multipart_part_size: Size in bytes of the parts of a multipart
+            upload. S3 requires at least 5MB.
+        :param multipart_concurrency: Number of parts uploaded at the same time.
+        :param download_chunk_size: Size in bytes of the ranges files are
+            downloaded in.
+        :param download_concurrency: Number of ranges downloaded at the same time.
+        :param delete_concurrency: Number of batches of files deleted at the
+            same time.
+        """
         self._bucket_name = storage_name
+        self._shared_client = client
+        self._multipart_threshold = multipart_threshold
+        self._multipart_part_size = multipart_part_size
+        self._multipart_concurrency = multipart_concurrency
+        self._download_chunk_size = download_chunk_size
+        self._download_concurrency = download_concurrency
+        self._delete_concurrency = delete_concurrency
 
     async def store_file(
         self,
@@ -51,11 +153,68 @@ class S3StorageService:
         path: str,
         content_type: str,
     ) -> None:
+        size = len(file) if isinstance(file, bytes) else _get_remaining_size(file)
+        try:
+            if size is not None and size < self._multipart_threshold:
+                await self._client.put_object(
+                    Bucket=self._bucket_name,
+                    Key=path,
+                    Body=file,
+                    ContentType=content_type,
+                )
+            else:
+                if isinstance(file, bytes):
+                    file = io.BytesIO(file)
+                parts = _read_parts(file, self._multipart_part_size)
+                await self._store_multipart(parts, path=path, content_type=content_type)
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "content_type": content_type,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to store file", context=context) from exc
+
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        """
+        Store a file while its chunks arrive.
+
+        Streams below the multipart threshold are gathered and stored at once.
+        Longer ones are uploaded part by part, holding no more than the parts
+        being sent in memory.
+        """
+        chunks = aiter(chunks)
+        head = await read_at_least(chunks, self._multipart_threshold)
         try:
-            await self._client.put_object(
+            if len(head) < self._multipart_threshold:
+                await self._client.put_object(
+                    Bucket=self._bucket_name,
+                    Key=path,
+                    Body=head,
+                    ContentType=content_type,
+                )
+            else:
+                parts = rechunk(prepend(head, chunks), self._multipart_part_size)
+                await self._store_multipart(parts, path=path, content_type=content_type)
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "content_type": content_type,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to store file", context=context) from exc
+
+    async def start_multipart_upload(self, path: str, *, content_type: str) -> str:
+        try:
+            response = await self._client.create_multipart_upload(
                 Bucket=self._bucket_name,
                 Key=path,
-                Body=file,
                 ContentType=content_type,
             )
         except (BotoCoreError, ClientError) as exc:
@@ -64,17 +223,122 @@ class S3StorageService:
                 "path": path,
                 "content_type": content_type,
             } | _get_error_context(exc)
-            raise StorageError("Failed to store file", context=context) from exc
+            raise StorageError(
+                "Failed to start multipart upload", context=context
+            ) from exc
+        return response["UploadId"]
+
+    async def upload_part(
+        self, path: str, *, upload_id: str, number: int, data: bytes
+    ) -> str:
+        try:
+            response = await self._client.upload_part(
+                Bucket=self._bucket_name,
+                Key=path,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=data,
+            )
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "upload_id": upload_id,
+                "part_number": number,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to upload part", context=context) from exc
+        return response["ETag"]
+
+    async def complete_multipart_upload(
+        self, path: str, *, upload_id: str, part_tags: Sequence[str]
+    ) -> None:
+        try:
+            await self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=path,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": tag}
+                        for number, tag in enumerate(part_tags, start=1)
+                    ]
+                },
+            )
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "upload_id": upload_id,
+            } | _get_error_context(exc)
+            raise StorageError(
+                "Failed to complete multipart upload", context=context
+            ) from exc
+
+    async def abort_multipart_upload(self, path: str, *, upload_id: str) -> None:
+        try:
+            await self._client.abort_multipart_upload(
+                Bucket=self._bucket_name, Key=path, UploadId=upload_id
+            )
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "upload_id": upload_id,
+            } | _get_error_context(exc)
+            if context.get("s3_error_code") == "NoSuchUpload":
+                return
+            raise StorageError(
+                "Failed to abort multipart upload", context=context
+            ) from exc
+
+    async def delete_file(self, path: str) -> None:
+        try:
+            await self._client.delete_object(Bucket=self._bucket_name, Key=path)
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to delete file", context=context) from exc
 
     async def get_file(self, path: str) -> BinaryIO:
+        """
+        Download a file into a temporary file.
+        """
+        temp_file = TemporaryFile(mode="wb+")
+        try:
+            await self.download_file(path, temp_file)
+        except BaseException:
+            temp_file.close()
+            raise
+
+        temp_file.seek(0)
+        return temp_file
+
+    async def download_file(self, path: str, file: BinaryIO) -> None:
+        """
+        Download a file into `file`.
+
+        The first chunk tells the size of the file. The remaining chunks are
+        fetched as byte ranges over concurrent connections and written at their
+        offsets, since a single stream is often slower than the storage can serve.
+        """
         try:
-            response = await self._client.get_object(Bucket=self._bucket_name, Key=path)
-            stream = response["Body"]
-            temp_file = TemporaryFile(mode="wb+")
-            while chunk := await stream.read(1024 * 1024):  # 1MB
-                temp_file.write(chunk)
-            temp_file.seek(0)
-            return temp_file
+            size = await self._download_range(file, path, 0)
+            offsets = range(self._download_chunk_size, size, self._download_chunk_size)
+            slots = asyncio.Semaphore(self._download_concurrency)
+
+            async def download_chunk(offset: int) -> None:
+                async with slots:
+                    await self._download_range(file, path, offset)
+
+            # Fails all chunks on the first error before the file gets closed
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for offset in offsets:
+                        task_group.create_task(download_chunk(offset))
+            except ExceptionGroup as exc_group:
+                raise exc_group.exceptions[0] from None
         except (BotoCoreError, ClientError) as exc:
             context = {
                 "bucket_name": self._bucket_name,
@@ -82,36 +346,131 @@ class S3StorageService:
             } | _get_error_context(exc)
             raise StorageError("Failed to get file", context=context) from exc
 
-    async def purge(self) -> None:
+    async def get_range(self, path: str, start_byte: int, end_byte: int) -> bytes:
         try:
-            response = await self._client.list_objects_v2(Bucket=self._bucket_name)
-            if "Contents" in response:
-                object_count = len(response["Contents"])
-                await logger.ainfo(
-                    "S3 bucket purge started",
-                    object_count=object_count,
+            response = await self._client.get_object(
+                Bucket=self._bucket_name,
+                Key=path,
+                Range=f"bytes={start_byte}-{end_byte - 1}",
+            )
+            return await response["Body"].read()
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "start_byte": start_byte,
+                "end_byte": end_byte,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to get file range", context=context) from exc
+
+    async def open_file(self, path: str, size: int | None = None) -> BinaryIO:
+        try:
+            if size is None:
+                response = await self._client.head_object(
+                    Bucket=self._bucket_name, Key=path
                 )
+                size = response["ContentLength"]
+            # The URL is used from within the backend, so the internal endpoint
+            # is kept instead of the public one.
+            url = await self._client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self._bucket_name, "Key": path},
+                ExpiresIn=_REMOTE_FILE_EXPIRATION,
+            )
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+            } | _get_error_context(exc)
+            raise StorageError("Failed to open file", context=context) from exc
+
+        return cast(BinaryIO, RemoteFile(url, size))
+
+    async def get_file_size(self, path: str) -> int | None:
+        try:
+            response = await self._client.head_object(
+                Bucket=self._bucket_name, Key=path
+            )
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+            } | _get_error_context(exc)
+            # HEAD responses have no body to tell the error code
+            if context.get("s3_error_code") in ("404", "NoSuchKey"):
+                return None
+            raise StorageError("Failed to get file size", context=context) from exc
+        return response["ContentLength"]
+
+    async def purge(self, prefix: str = "") -> int:
+        """
+        Delete all files in the bucket, or those whose path starts with
+        `prefix`, and return how many there were.
 
-                objects: list[ObjectIdentifierTypeDef] = [
-                    {"Key": obj["Key"]} for obj in response["Contents"]
-                ]
-                await self._client.delete_objects(
+        Each page of the listing is deleted in a single request as soon as it
+        arrives, while the next page is listed. Both are limited to 1000 keys.
+
+        :raises StorageError: if the files can't be listed or any of them
+            can't be deleted. Batches deleted until then stay deleted.
+        """
+        slots = asyncio.Semaphore(self._delete_concurrency)
+        deleted = 0
+
+        async def delete_batch(keys: list[str]) -> None:
+            nonlocal deleted
+            objects: list[ObjectIdentifierTypeDef] = [{"Key": key} for key in keys]
+            try:
+                response = await self._client.delete_objects(
                     Bucket=self._bucket_name,
-                    Delete={"Objects": objects},
+                    Delete={
+                        "Objects": objects,
+                        # Only failed keys are reported back
+                        "Quiet": True,
+                    },
                 )
+            finally:
+                slots.release()
+            errors = response.get("Errors", [])
+            if errors:
+                context = {
+                    "bucket_name": self._bucket_name,
+                    "failed_count": len(errors),
+                    "path": errors[0].get("Key"),
+                    "s3_error_code": errors[0].get("Code"),
+                }
+                raise StorageError("Failed to delete files", context=context)
+            deleted += len(keys)
+            await logger.ainfo(
+                "S3 bucket purge progressed", prefix=prefix, objects_deleted=deleted
+            )
 
-                await logger.ainfo(
-                    "S3 bucket purge completed",
-                    objects_deleted=object_count,
-                )
+        await logger.ainfo("S3 bucket purge started", prefix=prefix)
+        try:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    async for keys in self._list_keys(prefix):
+                        await slots.acquire()
+                        task_group.create_task(delete_batch(keys))
+            except ExceptionGroup as exc_group:
+                raise exc_group.exceptions[0] from None
         except (BotoCoreError, ClientError) as exc:
             context = {
                 "bucket_name": self._bucket_name,
+                "prefix": prefix,
             } | _get_error_context(exc)
             raise StorageError("Failed to purge bucket", context=context) from exc
 
-    # TODO: consider caching the generated URL as it will be requested multiple times
+        await logger.ainfo(
+            "S3 bucket purge completed", prefix=prefix, objects_deleted=deleted
+        )
+        return deleted
+
     async def generate_expiring_url(self, path: str, expiration: int = 3600) -> str:
+        cache_key = UrlCacheKey(self._bucket_name, path, expiration)
+        cached_url = expiring_url_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
+
         try:
             url = await self._client.generate_presigned_url(
                 "get_object",
@@ -139,15 +498,71 @@ class S3StorageService:
                 },
             ) from exc
 
+        expiring_url_cache.put(cache_key, public_url)
         return public_url
 
+    async def generate_expiring_urls(
+        self, paths: Sequence[str], expiration: int = 3600
+    ) -> list[str]:
+        # Presigning happens locally, so the only thing worth saving here is the
+        # per-URL overhead. Duplicate paths are signed once and the misses are
+        # signed concurrently, sharing any credential refresh between them.
+        unique_paths = list(dict.fromkeys(paths))
+        urls = await asyncio.gather(
+            *(self.generate_expiring_url(path, expiration) for path in unique_paths)
+        )
+        url_by_path = dict(zip(unique_paths, urls, strict=True))
+        return [url_by_path[path] for path in paths]
+
+    async def generate_upload_form(
+        self,
+        path: str,
+        *,
+        content_type: str,
+        max_size: int,
+        expiration: int = 3600,
+    ) -> UploadForm:
+        """
+        Generate a presigned POST form whose policy pins the key, content type
+        and size range of the upload.
+        """
+        try:
+            response = await self._client.generate_presigned_post(
+                Bucket=self._bucket_name,
+                Key=path,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size],
+                ],
+                ExpiresIn=expiration,
+            )
+            url = replace_base_url(response["url"], str(settings.STORAGE_PUBLIC_URL))
+        except (BotoCoreError, ClientError) as exc:
+            context = {
+                "bucket_name": self._bucket_name,
+                "path": path,
+                "expiration": expiration,
+            } | _get_error_context(exc)
+            raise StorageError(
+                "Failed to generate presigned upload form", context=context
+            ) from exc
+        except ValueError as exc:
+            raise StorageError(
+                "Failed to replace base URL for presigned upload form",
+                context={"new_base": str(settings.STORAGE_PUBLIC_URL)},
+            ) from exc
+
+        return UploadForm(url=url, fields=response["fields"])
+
     async def __aenter__(self) -> Self:
         bind_log_context(bucket_name=self._bucket_name)
+        if self._shared_client is not None:
+            self._client = self._shared_client
+            return self
+
         self._client = await get_storage_client()
-        found = await self._bucket_exists()
-        if not found:
-            await logger.ainfo("S3 bucket created")
-            await self._bucket_create()
+        await self.ensure_bucket()
         return self
 
     async def __aexit__(
@@ -157,9 +572,137 @@ class S3StorageService:
         traceback: TracebackType | None,
     ) -> None:
         unbind_log_context("bucket_name")
-        if self._client:
+        if self._client and self._client is not self._shared_client:
             await self._client.close()
 
+    async def ensure_bucket(self) -> None:
+        """
+        Create the bucket if it does not exist yet.
+        """
+        found = await self._bucket_exists()
+        if not found:
+            await logger.ainfo("S3 bucket created")
+            await self._bucket_create()
+
+    async def _download_range(self, file: BinaryIO, path: str, offset: int) -> int:
+        """
+        Download the chunk starting at `offset` into the same position of `file`.
+
+        Returns the size of the whole file.
+        """
+        end = offset + self._download_chunk_size - 1
+        try:
+            response = await self._client.get_object(
+                Bucket=self._bucket_name, Key=path, Range=f"bytes={offset}-{end}"
+            )
+        except ClientError as exc:
+            error_code = _get_error_context(exc).get("s3_error_code")
+            # Empty files have no range to request
+            if offset == 0 and error_code == "InvalidRange":
+                return 0
+            raise
+
+        stream = response["Body"]
+        position = offset
+        while chunk := await stream.read(1024 * 1024):  # 1MB
+            os.pwrite(file.fileno(), chunk, position)
+            position += len(chunk)
+        # Content-Range is "bytes <start>-<end>/<size>"
+        return int(response["ContentRange"].rpartition("/")[2])
+
+    async def _store_multipart(
+        self, parts: AsyncIterator[bytes], *, path: str, content_type: str
+    ) -> None:
+        """
+        Upload a file in parts, reading the next part while earlier ones are
+        still being sent.
+
+        Each part is a request of its own, so the client only retries the parts
+        that failed. The upload is aborted if it can't be completed, so no
+        orphaned parts are left behind.
+        """
+        response = await self._client.create_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=path,
+            ContentType=content_type,
+        )
+        upload_id = response["UploadId"]
+        try:
+            completed_parts = await self._upload_parts(
+                parts, path=path, upload_id=upload_id
+            )
+            await self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=path,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed_parts},
+            )
+        except BaseException:
+            try:
+                await self._client.abort_multipart_upload(
+                    Bucket=self._bucket_name, Key=path, UploadId=upload_id
+                )
+            except (BotoCoreError, ClientError) as exc:
+                await logger.awarning(
+                    "Failed to abort multipart upload",
+                    path=path,
+                    upload_id=upload_id,
+                    **_get_error_context(exc),
+                )
+            raise
+
+    async def _upload_parts(
+        self, parts: AsyncIterator[bytes], *, path: str, upload_id: str
+    ) -> list[CompletedPartTypeDef]:
+        # Bounds the parts held in memory to the ones being sent
+        slots = asyncio.Semaphore(self._multipart_concurrency)
+
+        async def upload_part(number: int, data: bytes) -> CompletedPartTypeDef:
+            try:
+                response = await self._client.upload_part(
+                    Bucket=self._bucket_name,
+                    Key=path,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=data,
+                )
+            finally:
+                slots.release()
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        tasks: list[asyncio.Task[CompletedPartTypeDef]] = []
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for number in itertools.count(1):
+                    await slots.acquire()
+                    data = await anext(parts, None)
+                    if data is None:
+                        # An empty file still needs one part
+                        if number > 1:
+                            slots.release()
+                            break
+                        data = b""
+                    tasks.append(task_group.create_task(upload_part(number, data)))
+        except ExceptionGroup as exc_group:
+            raise exc_group.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    async def _list_keys(self, prefix: str) -> AsyncIterator[list[str]]:
+        """Yield the keys starting with `prefix` a page of the listing at a time."""
+        request: ListObjectsV2RequestTypeDef = {
+            "Bucket": self._bucket_name,
+            "Prefix": prefix,
+            "MaxKeys": _DELETE_BATCH_SIZE,
+        }
+        while True:
+            response = await self._client.list_objects_v2(**request)
+            keys = [obj["Key"] for obj in response.get("Contents", [])]
+            if keys:
+                yield keys
+            if not response.get("IsTruncated"):
+                return
+            request["ContinuationToken"] = response["NextContinuationToken"]
+
     async def _bucket_exists(self) -> bool:
         try:
             await self._client.head_bucket(Bucket=self._bucket_name)
@@ -194,3 +737,22 @@ def _get_error_context(exc: BotoCoreError | ClientError) -> dict[str, Any]:
             "s3_error_message": response["Error"].get("Message"),
         }
     return {}
+
+
+async def _read_parts(file: BinaryIO, part_size: int) -> AsyncIterator[bytes]:
+    while data := await asyncio.to_thread(file.read, part_size):
+        yield data
+
+
+def _get_remaining_size(file: BinaryIO) -> int | None:
+    """Number of bytes from the current position to the end or `None` if unknown."""
+    try:
+        position = file.tell()
+        end = file.seek(0, io.SEEK_END)
+        file.seek(position)
+    except OSError:
+        return None
+    return end - position
+
+
+shared_storage_client = SharedStorageClient()
@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from jamflow.core.config import settings
+
+
+class UrlCacheKey(NamedTuple):
+    storage_name: str
+    path: str
+    expiration: int
+
+
+class UrlCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class ExpiringUrlCache:
+    """
+    LRU cache for expiring URLs.
+
+    A cached URL is only handed out while it stays valid for at least
+    `min_validity` seconds, so callers always get a URL they can still use for a
+    while. Reusing URLs also keeps them stable, which lets clients reuse their HTTP
+    cache for the files behind them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        min_validity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = max_size
+        self._min_validity = min_validity
+        self._clock = clock
+        self._entries: OrderedDict[UrlCacheKey, tuple[str, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: UrlCacheKey) -> str | None:
+        """
+        Get a cached URL that is valid for long enough or `None`.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            url, expires_at = entry
+            if expires_at - self._clock() >= self._min_validity:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return url
+            del self._entries[key]
+        self._misses += 1
+        return None
+
+    def put(self, key: UrlCacheKey, url: str) -> None:
+        """
+        Cache a URL that was just created to expire after `key.expiration` seconds.
+        """
+        if key.expiration <= self._min_validity:
+            return
+        self._entries[key] = (url, self._clock() + key.expiration)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all URLs and reset the counters.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> UrlCacheInfo:
+        return UrlCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+
+expiring_url_cache = ExpiringUrlCache(
+    max_size=settings.STORAGE_URL_CACHE_MAX_SIZE,
+    min_validity=settings.STORAGE_URL_CACHE_MIN_VALIDITY,
+)
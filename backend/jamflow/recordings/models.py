@@ -1,8 +1,9 @@
-from datetime import date
+from datetime import date, datetime
 from enum import StrEnum
 
 from pydantic import UUID4
-from sqlmodel import Column, Field
+from sqlalchemy import JSON, Index, Integer, text
+from sqlmodel import Column, DateTime, Field
 
 from jamflow.infra.database.models import BaseSQLModel, str_enum_to_sa_enum
 
@@ -28,7 +29,22 @@ class AudioFileFormat(StrEnum):
 AudioFileFormatDBEnum = str_enum_to_sa_enum(AudioFileFormat)
 
 
+class ClipStatus(StrEnum):
+    PENDING = "pending"
+    RENDERING = "rendering"
+    READY = "ready"
+    FAILED = "failed"
+
+
+ClipStatusDBEnum = str_enum_to_sa_enum(ClipStatus)
+
+
 class Track(BaseSQLModel, table=True):
+    __table_args__ = (
+        # Serves pages in the order of the cursor without sorting
+        Index("ix_track_created_at_id", "created_at", "id"),
+    )
+
     title: str = Field(max_length=255)
     duration: int  # in milliseconds
     format: AudioFileFormat = Field(
@@ -40,13 +56,82 @@ class Track(BaseSQLModel, table=True):
 
 
 class Clip(BaseSQLModel, table=True):
+    __table_args__ = (
+        # Serves the clips of a track in either order of the cursor without
+        # sorting, read backwards for the newest first
+        Index("ix_clip_track_id_created_at_id", "track_id", "created_at", "id"),
+        Index("ix_clip_created_at_id", "created_at", "id"),
+        # Keeps looking up the next clip to render cheap, however many are ready
+        Index(
+            "ix_clip_unrendered_created_at",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'rendering')"),
+        ),
+    )
+
     title: str = Field(max_length=255)
-    track_id: UUID4 = Field(foreign_key="track.id", index=True)
+    track_id: UUID4 = Field(foreign_key="track.id")
     duration: int  # in milliseconds
     start: int  # in milliseconds
     end: int  # in milliseconds
     format: AudioFileFormat = Field(
         sa_column=Column(AudioFileFormatDBEnum, nullable=False)
     )
-    size: int  # in bytes
+    size: int | None  # in bytes, once the file is rendered
+    path: str
+    status: ClipStatus = Field(
+        default=ClipStatus.READY,
+        sa_column=Column(ClipStatusDBEnum, nullable=False),
+    )
+    # While rendering, after which the worker is taken to be gone
+    leased_until: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))
+
+
+# Doubles as version counter, so concurrent requests can't both advance an upload
+_upload_session_offset = Column("offset", Integer, nullable=False)
+
+
+class UploadSession(BaseSQLModel, table=True):
+    """
+    Track file being uploaded in chunks over many requests.
+
+    The chunks are stored as parts of a multipart upload, which is started once
+    the first chunk tells the format of the file. The track gets the ID of the
+    session.
+    """
+
+    __tablename__ = "upload_session"
+    __table_args__ = (Index("ix_upload_session_updated_at", "updated_at"),)
+    __mapper_args__ = {
+        "version_id_col": _upload_session_offset,
+        "version_id_generator": False,
+    }
+
+    title: str = Field(max_length=255)
+    recorded_date: date | None
+    size: int  # in bytes, announced by the client
+    offset: int = Field(  # in bytes, received so far
+        default=0, sa_column=_upload_session_offset
+    )
+    format: AudioFileFormat | None = Field(
+        default=None, sa_column=Column(AudioFileFormatDBEnum, nullable=True)
+    )
+    path: str | None = None
+    storage_upload_id: str | None = None
+    part_tags: list[str] = Field(
+        default_factory=list, sa_column=Column(JSON, nullable=False)
+    )
+
+
+class DirectUpload(BaseSQLModel, table=True):
+    """
+    Track file a client was let upload straight to storage.
+
+    Kept until the upload is finished, so that files that are uploaded but never
+    finished can be found and deleted. The track gets the ID of the upload.
+    """
+
+    __tablename__ = "direct_upload"
+    __table_args__ = (Index("ix_direct_upload_updated_at", "updated_at"),)
+
     path: str
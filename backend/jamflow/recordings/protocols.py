@@ -1,9 +1,19 @@
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
 from types import TracebackType
-from typing import BinaryIO, Protocol, Self, Sequence
+from typing import BinaryIO, NamedTuple, Protocol, Self, Sequence
 
+from jamflow.core.pagination import Cursor, Page
 from jamflow.core.protocols import Repository
-from jamflow.recordings.models import AudioFileFormat, Clip, Track
+from jamflow.recordings.models import (
+    AudioFileFormat,
+    Clip,
+    DirectUpload,
+    Track,
+    UploadSession,
+)
+from jamflow.recordings.schemas import TrackCreateDto
 
 
 class TrackRepository(Repository[Track], Protocol): ...
@@ -12,16 +22,110 @@ class TrackRepository(Repository[Track], Protocol): ...
 class ClipRepository(Repository[Clip], Protocol):
     async def list_by_track_id(self, track_id: uuid.UUID) -> Sequence[Clip]: ...
 
+    async def find_ready_by_path(self, track_id: uuid.UUID, path: str) -> Clip | None:
+        """Get any rendered clip of a track whose file is stored under `path`."""
+        ...
+
+    async def claim_next_pending(self) -> Clip | None:
+        """
+        Get the oldest clip that is pending, or whose rendering lease ran out,
+        and lock it until the end of the transaction.
+
+        Clips locked by other transactions are skipped, so concurrent workers
+        never claim the same clip.
+        """
+        ...
+
+    async def list_page_by_track_id(
+        self, track_id: uuid.UUID, *, limit: int, cursor: Cursor | None = None
+    ) -> Page[Clip]:
+        """
+        List up to `limit` clips of a track, newest first, starting after `cursor`.
+        """
+        ...
+
+    def iter_batches_by_track_id(
+        self, track_id: uuid.UUID, *, batch_size: int
+    ) -> AsyncIterator[Sequence[Clip]]:
+        """
+        Go through the clips of a track, newest first, fetching up to
+        `batch_size` of them at a time as the batches are consumed.
+        """
+        ...
+
+
+class UploadSessionRepository(Repository[UploadSession], Protocol):
+    async def save(self, upload_session: UploadSession) -> None:
+        """
+        Write the changes of an upload session to the database.
+
+        :raises core.exceptions.ConcurrentModificationError: if the offset of the
+            session was changed by someone else since it was read.
+        """
+        ...
+
+    async def delete(self, upload_session: UploadSession) -> None:
+        """
+        :raises core.exceptions.ConcurrentModificationError: if the offset of the
+            session was changed by someone else since it was read.
+        """
+        ...
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[UploadSession]:
+        """List up to `limit` sessions last changed before `updated_before`."""
+        ...
+
+
+class DirectUploadRepository(Repository[DirectUpload], Protocol):
+    async def delete(self, direct_upload: DirectUpload) -> None:
+        """
+        :raises core.exceptions.ConcurrentModificationError: if the upload was
+            deleted by someone else since it was read.
+        """
+        ...
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[DirectUpload]:
+        """List up to `limit` uploads last changed before `updated_before`."""
+        ...
+
+
+class TrackUpload(Protocol):
+    """
+    Track file and metadata as they are received from a client.
+
+    The file can be read only once, chunk by chunk as it arrives. Metadata sent
+    after the file is only known once all chunks have been read.
+    """
+
+    def iter_chunks(self) -> AsyncIterator[bytes]: ...
+
+    def get_track_create_dto(self) -> TrackCreateDto:
+        """
+        :raises RuntimeError: if called before all chunks have been read.
+        """
+        ...
+
 
 class AudioProcessor(Protocol):
     def get_format(self, file: BinaryIO) -> AudioFileFormat: ...
     def get_duration(self, file: BinaryIO, file_format: AudioFileFormat) -> int: ...
     def get_size(self, file: BinaryIO) -> int: ...
-    def clip(
+    async def clip(
         self, file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
     ) -> BinaryIO: ...
 
 
+class UploadForm(NamedTuple):
+    """Form for uploading a file straight to storage with an HTTP POST request."""
+
+    url: str
+    fields: dict[str, str]  # to be sent along with the file, which goes last
+
+
 class AudioStorage(Protocol):
     """
     Storage service used to interact with remote file storage.
@@ -61,6 +165,86 @@ class AudioStorage(Protocol):
         """
         ...
 
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        """
+        Put a file into storage under a given path while its chunks arrive.
+
+        Only a bounded part of the file is held in memory at a time. Nothing is
+        stored if reading the chunks fails.
+
+        :param chunks: The file data to be stored, in chunks of any size.
+        :param path: The path where the file should be stored.
+        :raises StorageError: if the file could not be stored.
+        """
+        ...
+
+    async def start_multipart_upload(self, path: str, *, content_type: str) -> str:
+        """
+        Start putting a file into storage in parts uploaded one at a time.
+
+        The parts can be uploaded by different requests or processes until the
+        upload is completed or aborted. The file only shows up in storage once
+        the upload is completed.
+
+        :param path: The path where the file should be stored.
+        :return: The ID of the upload.
+        :raises StorageError: if the upload could not be started.
+        """
+        ...
+
+    async def upload_part(
+        self, path: str, *, upload_id: str, number: int, data: bytes
+    ) -> str:
+        """
+        Upload a part of a multipart upload.
+
+        All parts but the last must be at least as large as the multipart part
+        size of the storage. Uploading a part again replaces it.
+
+        :param number: The position of the part in the file, counting from 1.
+        :return: The tag that identifies the part when completing the upload.
+        :raises StorageError: if the part could not be uploaded.
+        """
+        ...
+
+    async def complete_multipart_upload(
+        self, path: str, *, upload_id: str, part_tags: Sequence[str]
+    ) -> None:
+        """
+        Put the file of a multipart upload together from its parts.
+
+        :param part_tags: The tags of all parts in the order of their numbers.
+        :raises StorageError: if the upload could not be completed.
+        """
+        ...
+
+    async def abort_multipart_upload(self, path: str, *, upload_id: str) -> None:
+        """
+        Discard a multipart upload and all its parts.
+
+        Aborting an upload that is already gone is not an error.
+
+        :raises StorageError: if the upload could not be aborted.
+        """
+        ...
+
+    async def delete_file(self, path: str) -> None:
+        """
+        Delete a file from storage.
+
+        Deleting a file that is already gone is not an error.
+
+        :param path: The path to the file in storage.
+        :raises StorageError: if the file could not be deleted.
+        """
+        ...
+
     async def get_file(self, path: str) -> BinaryIO:
         """
         Get a file from storage.
@@ -70,6 +254,51 @@ class AudioStorage(Protocol):
         """
         ...
 
+    async def download_file(self, path: str, file: BinaryIO) -> None:
+        """
+        Download a file from storage into a file on disk.
+
+        :param path: The path to the file in storage.
+        :param file: An empty file opened for writing, which is written from the
+            start.
+        :raises StorageError: if the file could not be retrieved.
+        """
+        ...
+
+    async def get_range(self, path: str, start_byte: int, end_byte: int) -> bytes:
+        """
+        Get a byte range of a file from storage.
+
+        :param path: The path to the file in storage.
+        :param start_byte: Offset of the first byte to get.
+        :param end_byte: Offset after the last byte to get.
+        :raises StorageError: if the range could not be retrieved.
+        """
+        ...
+
+    async def open_file(self, path: str, size: int | None = None) -> BinaryIO:
+        """
+        Open a file in storage for reading without downloading it.
+
+        Only the regions that are read are transferred, which makes this the
+        better choice over `get_file` when only parts of a file are needed. The
+        returned file can be read outside of the storage context.
+
+        :param path: The path to the file in storage.
+        :param size: The size of the file in bytes, if known.
+        :raises StorageError: if the file could not be opened.
+        """
+        ...
+
+    async def get_file_size(self, path: str) -> int | None:
+        """
+        Get the size of a file in bytes or `None` if there is no such file.
+
+        :param path: The path to the file in storage.
+        :raises StorageError: if the storage can't be accessed.
+        """
+        ...
+
     async def generate_expiring_url(self, path: str, expiration: int = 3600) -> str:
         """
         Generate an URL for accessing a file that will expire after some time.
@@ -80,3 +309,43 @@ class AudioStorage(Protocol):
         :raises StorageError: if the URL could not be generated.
         """
         ...
+
+    async def generate_expiring_urls(
+        self, paths: Sequence[str], expiration: int = 3600
+    ) -> list[str]:
+        """
+        Generate expiring URLs for many files at once.
+
+        Prefer this over calling `generate_expiring_url` for each file when
+        building listings.
+
+        :param paths: The paths to the files in storage.
+        :param expiration: Time in seconds for the presigned URLs to remain valid.
+                           Defaults to 3600 seconds (1 hour).
+        :return: The URLs in the same order as `paths`.
+        :raises StorageError: if any of the URLs could not be generated.
+        """
+        ...
+
+    async def generate_upload_form(
+        self,
+        path: str,
+        *,
+        content_type: str,
+        max_size: int,
+        expiration: int = 3600,
+    ) -> UploadForm:
+        """
+        Generate a form for clients to upload a file under a path themselves.
+
+        The storage enforces the content type and size of the file, so that the
+        upload doesn't have to pass through the application.
+
+        :param path: The path where the file will be stored.
+        :param content_type: The content type the file must be uploaded with.
+        :param max_size: The maximum size of the file in bytes.
+        :param expiration: Time in seconds for the form to remain valid.
+                           Defaults to 3600 seconds (1 hour).
+        :raises StorageError: if the form could not be generated.
+        """
+        ...
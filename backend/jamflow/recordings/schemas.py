@@ -1,39 +1,43 @@
 from datetime import date, datetime
 from typing import Annotated, Self
 
-from fastapi import File, Form, UploadFile
 from pydantic import (
     UUID4,
-    AfterValidator,
     BaseModel,
     BeforeValidator,
     HttpUrl,
     NonNegativeInt,
+    PositiveInt,
     model_validator,
 )
 
 from jamflow.core.validators import NonBlankBoundedString, empty_string_to_none
-from jamflow.recordings.models import AudioFileFormat
-from jamflow.recordings.validators import (
-    get_file_size_validator,
-    validate_audo_file_format,
-)
+from jamflow.recordings.models import AudioFileFormat, ClipStatus
 
 MAX_UPLOAD_FILE_SIZE = 200 * 1024 * 1024  # 200 MB
 
 
-# TODO: make this depend less on the view details
 class TrackCreateDto(BaseModel):
-    title: NonBlankBoundedString = Form(...)
+    title: NonBlankBoundedString
     recorded_date: Annotated[
         date | None,
         BeforeValidator(empty_string_to_none),
-    ] = Form(None)
-    upload_file: Annotated[
-        UploadFile,
-        AfterValidator(get_file_size_validator(MAX_UPLOAD_FILE_SIZE)),
-        AfterValidator(validate_audo_file_format),
-    ] = File(...)
+    ] = None
+
+
+class TrackUploadStartDto(BaseModel):
+    format: AudioFileFormat
+
+
+class TrackUploadDto(BaseModel):
+    upload_id: str  # to finish the upload with
+    url: HttpUrl  # to POST the form to
+    fields: dict[str, str]  # to send along with the file, which goes last
+    expires_at: datetime
+
+
+class TrackUploadFinishDto(TrackCreateDto):
+    upload_id: str
 
 
 class TrackReadDto(BaseModel, from_attributes=True):
@@ -48,6 +52,18 @@ class TrackReadDto(BaseModel, from_attributes=True):
     url: HttpUrl
 
 
+class UploadSessionCreateDto(TrackCreateDto):
+    size: PositiveInt  # in bytes
+
+
+class UploadSessionReadDto(BaseModel):
+    id: UUID4
+    size: int  # in bytes
+    offset: int  # in bytes
+    expires_at: datetime
+    track: TrackReadDto | None = None  # once the upload is complete
+
+
 class ClipCreateDto(BaseModel):
     title: NonBlankBoundedString
     track_id: UUID4
@@ -71,5 +87,6 @@ class ClipReadDto(BaseModel, from_attributes=True):
     created_at: datetime
     updated_at: datetime
     format: AudioFileFormat
-    size: int  # in bytes
-    url: HttpUrl
+    status: ClipStatus
+    size: int | None  # in bytes, once the file is rendered
+    url: HttpUrl | None  # once the file is rendered
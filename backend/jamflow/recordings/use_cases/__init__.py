@@ -1,15 +1,33 @@
+from .append_upload_session import AppendToUploadSession
 from .create_clip import CreateClip
 from .create_track import CreateTrack
+from .create_upload_session import CreateUploadSession
+from .delete_upload_session import DeleteUploadSession
+from .finish_track_upload import FinishTrackUpload
 from .list_clip import ListClip
 from .list_track import ListTrack
+from .purge_direct_uploads import PurgeDirectUploads
+from .purge_upload_sessions import PurgeUploadSessions
 from .read_clip import ReadClip
 from .read_track import ReadTrack
+from .read_upload_session import ReadUploadSession
+from .render_clip import RenderClip
+from .start_track_upload import StartTrackUpload
 
 __all__ = [
     "CreateClip",
     "ListClip",
     "ReadClip",
+    "RenderClip",
     "CreateTrack",
     "ReadTrack",
     "ListTrack",
+    "StartTrackUpload",
+    "FinishTrackUpload",
+    "CreateUploadSession",
+    "ReadUploadSession",
+    "AppendToUploadSession",
+    "DeleteUploadSession",
+    "PurgeUploadSessions",
+    "PurgeDirectUploads",
 ]
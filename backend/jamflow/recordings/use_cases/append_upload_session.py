@@ -0,0 +1,244 @@
+import io
+import uuid
+from collections.abc import AsyncIterator
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import (
+    ConcurrentModificationError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from jamflow.core.log import get_logger
+from jamflow.core.streams import prepend, read_at_least, rechunk
+from jamflow.recordings.models import AudioFileFormat, UploadSession
+from jamflow.recordings.protocols import (
+    AudioProcessor,
+    AudioStorage,
+    TrackRepository,
+    UploadSessionRepository,
+)
+from jamflow.recordings.schemas import (
+    TrackCreateDto,
+    TrackReadDto,
+    UploadSessionReadDto,
+)
+from jamflow.recordings.use_cases.finish_track_upload import create_stored_track
+from jamflow.recordings.use_cases.read_upload_session import (
+    to_upload_session_read_dto,
+)
+from jamflow.recordings.utils import generate_track_path
+
+logger = get_logger()
+
+# Enough for every file type signature to be recognized
+_FORMAT_PROBE_SIZE = 8 * 1024
+
+
+class AppendToUploadSession:
+    """
+    Add a chunk to an upload session and create the track once it is complete.
+
+    Chunks are cut into parts of a multipart upload in storage. The session is
+    saved after each part, so a chunk that breaks off keeps the parts received
+    until then and the client resumes from the offset after them. What is left
+    of a chunk short of a full part is dropped, unless it ends the file, and
+    has to be sent again.
+    """
+
+    def __init__(
+        self,
+        *,
+        upload_session_repo: UploadSessionRepository,
+        track_repo: TrackRepository,
+        session: AsyncSession,
+        audio_processor: AudioProcessor,
+        audio_storage: AudioStorage,
+        part_size: int,
+        expiration: int,
+    ):
+        """
+        :param part_size: Size in bytes of the parts in storage, which all
+            chunks but the last must be at least.
+        :param expiration: Time in seconds after the last chunk that an
+            unfinished upload is kept.
+        """
+        self._upload_session_repo = upload_session_repo
+        self._track_repo = track_repo
+        self._session = session
+        self._audio_processor = audio_processor
+        self._audio_storage = audio_storage
+        self._part_size = part_size
+        self._expiration = expiration
+
+    async def execute(
+        self,
+        upload_session_id: uuid.UUID,
+        *,
+        offset: int,
+        chunk: AsyncIterator[bytes],
+    ) -> UploadSessionReadDto:
+        """
+        :param offset: Position in the file the chunk starts at, as the client
+            believes it to be.
+        :raises ResourceNotFoundError: if there is no such session.
+        :raises ConcurrentModificationError: if `offset` isn't the offset of the
+            session or another chunk was added meanwhile.
+        :raises ValidationError: if the chunk is too small or too large, or the
+            file is not a supported audio file.
+        """
+        upload_session = await self._upload_session_repo.get_by_id(upload_session_id)
+        if upload_session is None:
+            raise ResourceNotFoundError("Upload session not found")
+        if offset != upload_session.offset:
+            raise ConcurrentModificationError(
+                f"Upload offset is {upload_session.offset}, not {offset}"
+            )
+
+        async with self._audio_storage as audio_storage:
+            if upload_session.offset < upload_session.size:
+                await self._store_parts(upload_session, chunk, audio_storage)
+
+            track = None
+            if upload_session.offset == upload_session.size:
+                track = await self._finish(upload_session, audio_storage)
+
+        return to_upload_session_read_dto(
+            upload_session, expiration=self._expiration, track=track
+        )
+
+    async def _store_parts(
+        self,
+        upload_session: UploadSession,
+        chunk: AsyncIterator[bytes],
+        audio_storage: AudioStorage,
+    ) -> None:
+        previous_offset = upload_session.offset
+        started = upload_session.storage_upload_id is None
+        if started:
+            head = await read_at_least(chunk, _FORMAT_PROBE_SIZE)
+            await self._start_upload(upload_session, head, audio_storage)
+            chunk = prepend(head, chunk)
+
+        path = upload_session.path
+        upload_id = upload_session.storage_upload_id
+        assert path is not None and upload_id is not None
+
+        saved_offset = previous_offset
+        try:
+            parts = rechunk(_limit_size(chunk, upload_session), self._part_size)
+            async for data in parts:
+                if len(data) < self._part_size and (
+                    upload_session.offset + len(data) < upload_session.size
+                ):
+                    break
+                number = len(upload_session.part_tags) + 1
+                tag = await audio_storage.upload_part(
+                    path, upload_id=upload_id, number=number, data=data
+                )
+                upload_session.offset += len(data)
+                upload_session.part_tags = [*upload_session.part_tags, tag]
+                await self._upload_session_repo.save(upload_session)
+                await self._session.commit()
+                saved_offset = upload_session.offset
+        except BaseException:
+            if started and saved_offset == previous_offset:
+                await self._abort_upload(upload_session, audio_storage)
+            raise
+
+        if saved_offset == previous_offset:
+            if started:
+                await self._abort_upload(upload_session, audio_storage)
+            raise ValidationError(
+                f"Chunks must be at least {self._part_size} bytes "
+                "unless they end the file"
+            )
+        await logger.ainfo(
+            "Upload session chunk stored",
+            upload_session_id=upload_session.id,
+            offset=saved_offset,
+        )
+
+    async def _start_upload(
+        self,
+        upload_session: UploadSession,
+        head: bytes,
+        audio_storage: AudioStorage,
+    ) -> None:
+        """
+        Tell the format from the start of the file and start its multipart
+        upload. The session is only saved along with the first part.
+        """
+        if not head:
+            raise ValidationError("File is empty")
+        try:
+            format = self._audio_processor.get_format(io.BytesIO(head))
+        except ValidationError as exc:
+            raise ValidationError(
+                "Unsupported file format. "
+                f"Supported formats: {', '.join(AudioFileFormat)}",
+            ) from exc
+
+        path = generate_track_path(upload_session.id, format)
+        upload_session.format = format
+        upload_session.path = path
+        upload_session.storage_upload_id = await audio_storage.start_multipart_upload(
+            path, content_type=format.mime_type
+        )
+
+    async def _abort_upload(
+        self, upload_session: UploadSession, audio_storage: AudioStorage
+    ) -> None:
+        """Abort a multipart upload that was started but never saved."""
+        path = upload_session.path
+        upload_id = upload_session.storage_upload_id
+        upload_session.format = None
+        upload_session.path = None
+        upload_session.storage_upload_id = None
+        await self._session.rollback()
+        if path is not None and upload_id is not None:
+            await audio_storage.abort_multipart_upload(path, upload_id=upload_id)
+
+    async def _finish(
+        self, upload_session: UploadSession, audio_storage: AudioStorage
+    ) -> TrackReadDto:
+        path = upload_session.path
+        upload_id = upload_session.storage_upload_id
+        format = upload_session.format
+        assert path is not None and upload_id is not None and format is not None
+
+        # Completed already if creating the track failed on an earlier try
+        if await audio_storage.get_file_size(path) is None:
+            await audio_storage.complete_multipart_upload(
+                path, upload_id=upload_id, part_tags=upload_session.part_tags
+            )
+            await logger.ainfo("File stored", path=path, size=upload_session.size)
+
+        track = await create_stored_track(
+            TrackCreateDto.model_validate(upload_session, from_attributes=True),
+            track_id=upload_session.id,
+            path=path,
+            size=upload_session.size,
+            expected_format=format,
+            track_repo=self._track_repo,
+            audio_processor=self._audio_processor,
+            audio_storage=audio_storage,
+        )
+        track_url = await audio_storage.generate_expiring_url(path)
+        await self._upload_session_repo.delete(upload_session)
+        await self._session.commit()
+        await logger.ainfo("Track created", track_id=track.id)
+
+        return TrackReadDto.model_validate(dict(track) | {"url": track_url})
+
+
+async def _limit_size(
+    chunk: AsyncIterator[bytes], upload_session: UploadSession
+) -> AsyncIterator[bytes]:
+    """Pass a chunk through until it runs past the size of the upload."""
+    remaining = upload_session.size - upload_session.offset
+    async for data in chunk:
+        remaining -= len(data)
+        if remaining < 0:
+            raise ValidationError("Chunk runs past the size of the upload")
+        yield data
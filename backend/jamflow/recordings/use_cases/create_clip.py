@@ -2,9 +2,10 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from jamflow.core.concurrency import SingleFlight
 from jamflow.core.exceptions import ResourceNotFoundError, ValidationError
 from jamflow.core.log import get_logger
-from jamflow.recordings.models import Clip
+from jamflow.recordings.models import Clip, ClipStatus
 from jamflow.recordings.protocols import (
     AudioProcessor,
     AudioStorage,
@@ -12,7 +13,8 @@ from jamflow.recordings.protocols import (
     TrackRepository,
 )
 from jamflow.recordings.schemas import ClipCreateDto, ClipReadDto
-from jamflow.recordings.utils import generate_clip_path
+from jamflow.recordings.use_cases.render_clip import ensure_clip_file
+from jamflow.recordings.utils import generate_clip_content_id, generate_clip_path
 
 logger = get_logger()
 
@@ -26,14 +28,24 @@ class CreateClip:
         session: AsyncSession,
         audio_processor: AudioProcessor,
         audio_storage: AudioStorage,
+        render_flight: SingleFlight[str, int],
     ):
         self._clip_repo = clip_repo
         self._track_repo = track_repo
         self._session = session
         self._audio_processor = audio_processor
         self._audio_storage = audio_storage
+        self._render_flight = render_flight
 
-    async def execute(self, clip_create_dto: ClipCreateDto) -> ClipReadDto:
+    async def execute(
+        self, clip_create_dto: ClipCreateDto, *, defer: bool = False
+    ) -> ClipReadDto:
+        """
+        Create a clip and render its audio file.
+
+        :param defer: Leave rendering to the clip workers and return the clip
+            while it is still pending.
+        """
         track = await self._track_repo.get_by_id(clip_create_dto.track_id)
         if track is None:
             raise ResourceNotFoundError("Track not found")
@@ -43,45 +55,39 @@ class CreateClip:
             raise ValidationError("Clip end time exceeds track duration")
 
         clip_id = uuid.uuid4()
-        async with self._audio_storage as audio_storage:
-            track_file = await audio_storage.get_file(track.path)
-
-            clip_file = self._audio_processor.clip(
-                track_file,
-                track.format,
-                start=clip_create_dto.start,
-                end=clip_create_dto.end,
-            )
-            clip_format = track.format
-            path = generate_clip_path(track.path, clip_id, clip_format)
-            content_type = clip_format.mime_type
-
-            await audio_storage.store_file(
-                file=clip_file,
-                path=path,
-                content_type=content_type,
-            )
-            await logger.ainfo("File stored", path=path)
-            clip_url = await audio_storage.generate_expiring_url(path)
-
-        clip_size = self._audio_processor.get_size(clip_file)
-
+        clip_format = track.format
+        content_id = generate_clip_content_id(
+            track.id, clip_create_dto.start, clip_create_dto.end, clip_format
+        )
         clip = Clip.model_validate(
             clip_create_dto,
             update={
                 "id": clip_id,
                 "format": clip_format,
-                "size": clip_size,
-                "path": path,
+                "size": None,
+                "path": generate_clip_path(track.path, content_id, clip_format),
                 "duration": clip_create_dto.end - clip_create_dto.start,
+                "status": ClipStatus.PENDING if defer else ClipStatus.READY,
             },
         )
 
+        clip_url = None
+        if not defer:
+            clip.size = await ensure_clip_file(
+                clip,
+                track,
+                clip_repo=self._clip_repo,
+                audio_processor=self._audio_processor,
+                audio_storage=self._audio_storage,
+                render_flight=self._render_flight,
+            )
+            async with self._audio_storage as audio_storage:
+                clip_url = await audio_storage.generate_expiring_url(clip.path)
+
         clip = await self._clip_repo.create(clip)
         await self._session.commit()
-        await logger.ainfo("Clip created", clip_id=clip.id)
+        await logger.ainfo("Clip created", clip_id=clip.id, status=clip.status)
 
-        await self._session.refresh(clip)
         clip_read_dto = ClipReadDto.model_validate(dict(clip) | {"url": clip_url})
 
         return clip_read_dto
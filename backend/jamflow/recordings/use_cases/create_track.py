@@ -1,17 +1,43 @@
+import asyncio
+import io
 import uuid
+from collections.abc import AsyncIterator
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 from structlog import get_logger
 
-from jamflow.recordings.models import Track
-from jamflow.recordings.protocols import AudioProcessor, AudioStorage, TrackRepository
-from jamflow.recordings.schemas import TrackCreateDto, TrackReadDto
+from jamflow.core.exceptions import StorageError, ValidationError
+from jamflow.core.streams import EdgeBuffer, prepend, read_at_least
+from jamflow.recordings.models import AudioFileFormat, Track
+from jamflow.recordings.protocols import (
+    AudioProcessor,
+    AudioStorage,
+    TrackRepository,
+    TrackUpload,
+)
+from jamflow.recordings.schemas import MAX_UPLOAD_FILE_SIZE, TrackReadDto
 from jamflow.recordings.utils import generate_track_path
 
 logger = get_logger()
 
+# Enough for every file type signature to be recognized
+_FORMAT_PROBE_SIZE = 8 * 1024
+# Cover the tags and stream headers at the start of a file and the last pages
+# of an Ogg stream, which tell its length.
+DURATION_PROBE_HEAD_SIZE = 256 * 1024
+DURATION_PROBE_TAIL_SIZE = 128 * 1024
+
 
 class CreateTrack:
+    """
+    Store an uploaded track in a single pass over its file.
+
+    The format is told from the first chunks and the file is passed on to
+    storage as it arrives. Only its edges are kept to read the duration
+    afterwards, which the rest of the file is fetched from storage for only if
+    they are not enough.
+    """
+
     def __init__(
         self,
         *,
@@ -25,42 +51,88 @@ class CreateTrack:
         self._audio_processor = audio_processor
         self._audio_storage = audio_storage
 
-    async def execute(self, track_create_dto: TrackCreateDto) -> TrackReadDto:
-        format = self._audio_processor.get_format(track_create_dto.upload_file.file)
+    async def execute(self, track_upload: TrackUpload) -> TrackReadDto:
+        chunks = track_upload.iter_chunks()
+        head = await read_at_least(chunks, _FORMAT_PROBE_SIZE)
+        if not head:
+            raise ValidationError("File is empty", field="upload_file")
+
+        try:
+            format = self._audio_processor.get_format(io.BytesIO(head))
+        except ValidationError as exc:
+            raise ValidationError(
+                "Unsupported file format. "
+                f"Supported formats: {', '.join(AudioFileFormat)}",
+                field="upload_file",
+            ) from exc
         content_type = format.mime_type
 
         track_id = uuid.uuid4()
         path = generate_track_path(track_id, format)
+        edges = EdgeBuffer(
+            head_size=DURATION_PROBE_HEAD_SIZE, tail_size=DURATION_PROBE_TAIL_SIZE
+        )
         async with self._audio_storage as audio_storage:
-            await audio_storage.store_file(
-                file=track_create_dto.upload_file.file,
+            await audio_storage.store_stream(
+                _limit_size(prepend(head, chunks), edges),
                 path=path,
                 content_type=content_type,
             )
-            await logger.ainfo("File stored", path=path)
-            track_url = await audio_storage.generate_expiring_url(path)
+            await logger.ainfo("File stored", path=path, size=edges.size)
 
-        track_create_dto.upload_file.file.seek(0)
-        duration = self._audio_processor.get_duration(
-            track_create_dto.upload_file.file, format
-        )
+            # The file is useless without its track, so it mustn't outlive a
+            # failure to create one
+            try:
+                remote_file = await audio_storage.open_file(path, size=edges.size)
+                duration = await asyncio.to_thread(
+                    self._audio_processor.get_duration, edges.open(remote_file), format
+                )
+                track_url = await audio_storage.generate_expiring_url(path)
 
-        track = Track.model_validate(
-            track_create_dto,
-            update={
-                "id": track_id,
-                "duration": duration,
-                "format": format,
-                "size": track_create_dto.upload_file.size,
-                "path": path,
-            },
-        )
-
-        track = await self._track_repo.create(track)
-        await self._session.commit()
+                track = Track.model_validate(
+                    track_upload.get_track_create_dto(),
+                    update={
+                        "id": track_id,
+                        "duration": duration,
+                        "format": format,
+                        "size": edges.size,
+                        "path": path,
+                    },
+                )
+                track = await self._track_repo.create(track)
+                await self._session.commit()
+            except BaseException:
+                await discard_stored_file(path, audio_storage)
+                raise
         await logger.ainfo("Track created", track_id=track.id)
 
-        await self._session.refresh(track)
         track_read_dto = TrackReadDto.model_validate(dict(track) | {"url": track_url})
 
         return track_read_dto
+
+
+async def discard_stored_file(path: str, audio_storage: AudioStorage) -> None:
+    """
+    Delete a stored file, keeping the error that led to it if that fails.
+    `audio_storage` must already be entered.
+    """
+    try:
+        await audio_storage.delete_file(path)
+    except StorageError:
+        await logger.aexception("Failed to delete file", path=path)
+        return
+    await logger.ainfo("File deleted", path=path)
+
+
+async def _limit_size(
+    chunks: AsyncIterator[bytes], edges: EdgeBuffer
+) -> AsyncIterator[bytes]:
+    """Pass chunks through `edges` until the file gets too large."""
+    async for chunk in chunks:
+        edges.feed(chunk)
+        if edges.size > MAX_UPLOAD_FILE_SIZE:
+            raise ValidationError(
+                f"File is larger than {MAX_UPLOAD_FILE_SIZE // (1024 * 1024)} MB",
+                field="upload_file",
+            )
+        yield chunk
@@ -0,0 +1,58 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.core.log import get_logger
+from jamflow.recordings.models import UploadSession
+from jamflow.recordings.protocols import UploadSessionRepository
+from jamflow.recordings.schemas import (
+    MAX_UPLOAD_FILE_SIZE,
+    UploadSessionCreateDto,
+    UploadSessionReadDto,
+)
+from jamflow.recordings.use_cases.read_upload_session import (
+    to_upload_session_read_dto,
+)
+
+logger = get_logger()
+
+
+class CreateUploadSession:
+    """
+    Open a session for uploading a track file in chunks.
+
+    The metadata of the track is validated right away, so that a long upload
+    isn't turned down once it is complete.
+    """
+
+    def __init__(
+        self,
+        *,
+        upload_session_repo: UploadSessionRepository,
+        session: AsyncSession,
+        expiration: int,
+    ):
+        """
+        :param expiration: Time in seconds after the last chunk that an
+            unfinished upload is kept.
+        """
+        self._upload_session_repo = upload_session_repo
+        self._session = session
+        self._expiration = expiration
+
+    async def execute(
+        self, upload_session_create_dto: UploadSessionCreateDto
+    ) -> UploadSessionReadDto:
+        if upload_session_create_dto.size > MAX_UPLOAD_FILE_SIZE:
+            raise ValidationError(
+                f"File is larger than {MAX_UPLOAD_FILE_SIZE // (1024 * 1024)} MB",
+                field="size",
+            )
+
+        upload_session = UploadSession.model_validate(upload_session_create_dto)
+        upload_session = await self._upload_session_repo.create(upload_session)
+        await self._session.commit()
+        await logger.ainfo(
+            "Upload session created", upload_session_id=upload_session.id
+        )
+
+        return to_upload_session_read_dto(upload_session, expiration=self._expiration)
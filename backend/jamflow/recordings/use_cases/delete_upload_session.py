@@ -0,0 +1,73 @@
+import uuid
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.core.log import get_logger
+from jamflow.recordings.models import UploadSession
+from jamflow.recordings.protocols import AudioStorage, UploadSessionRepository
+
+logger = get_logger()
+
+
+class DeleteUploadSession:
+    """Give up an unfinished upload and discard the chunks received so far."""
+
+    def __init__(
+        self,
+        *,
+        upload_session_repo: UploadSessionRepository,
+        session: AsyncSession,
+        audio_storage: AudioStorage,
+    ):
+        self._upload_session_repo = upload_session_repo
+        self._session = session
+        self._audio_storage = audio_storage
+
+    async def execute(self, upload_session_id: uuid.UUID) -> None:
+        """
+        :raises ResourceNotFoundError: if there is no such session.
+        :raises ConcurrentModificationError: if a chunk was added meanwhile.
+        """
+        upload_session = await self._upload_session_repo.get_by_id(upload_session_id)
+        if upload_session is None:
+            raise ResourceNotFoundError("Upload session not found")
+
+        async with self._audio_storage as audio_storage:
+            await discard_upload_session(
+                upload_session,
+                upload_session_repo=self._upload_session_repo,
+                audio_storage=audio_storage,
+            )
+        await self._session.commit()
+        await logger.ainfo(
+            "Upload session deleted", upload_session_id=upload_session.id
+        )
+
+
+async def discard_upload_session(
+    upload_session: UploadSession,
+    *,
+    upload_session_repo: UploadSessionRepository,
+    audio_storage: AudioStorage,
+) -> None:
+    """
+    Delete an upload session, abort its multipart upload and delete its file.
+
+    The file is there if the upload was completed but creating the track
+    failed, which leaves the session in place to finish again. A track always
+    deletes its session in the same transaction, so the file of a session
+    belongs to no track.
+
+    The session is deleted first, so that the upload is only aborted if no
+    chunk was added and no track created meanwhile. `audio_storage` must
+    already be entered.
+    """
+    await upload_session_repo.delete(upload_session)
+    if upload_session.path is None:
+        return
+    if upload_session.storage_upload_id is not None:
+        await audio_storage.abort_multipart_upload(
+            upload_session.path, upload_id=upload_session.storage_upload_id
+        )
+    await audio_storage.delete_file(upload_session.path)
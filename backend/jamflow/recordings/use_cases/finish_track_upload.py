@@ -0,0 +1,190 @@
+import asyncio
+import io
+import uuid
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import (
+    DuplicateEntityError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from jamflow.core.log import get_logger
+from jamflow.core.streams import open_edges
+from jamflow.recordings.models import AudioFileFormat, Track
+from jamflow.recordings.protocols import (
+    AudioProcessor,
+    AudioStorage,
+    DirectUploadRepository,
+    TrackRepository,
+)
+from jamflow.recordings.schemas import (
+    TrackCreateDto,
+    TrackReadDto,
+    TrackUploadFinishDto,
+)
+from jamflow.recordings.use_cases.create_track import (
+    DURATION_PROBE_HEAD_SIZE,
+    DURATION_PROBE_TAIL_SIZE,
+    discard_stored_file,
+)
+from jamflow.recordings.utils import parse_track_path
+
+logger = get_logger()
+
+
+class FinishTrackUpload:
+    """
+    Create the track for a file a client uploaded straight to storage.
+
+    The format and duration are read from the stored file with range requests,
+    so only the regions the parsers look at are transferred. A file that turns
+    out not to be a valid track is deleted, since it can't be finished anymore.
+    """
+
+    def __init__(
+        self,
+        *,
+        track_repo: TrackRepository,
+        direct_upload_repo: DirectUploadRepository,
+        session: AsyncSession,
+        audio_processor: AudioProcessor,
+        audio_storage: AudioStorage,
+    ):
+        self._track_repo = track_repo
+        self._direct_upload_repo = direct_upload_repo
+        self._session = session
+        self._audio_processor = audio_processor
+        self._audio_storage = audio_storage
+
+    async def execute(
+        self, track_upload_finish_dto: TrackUploadFinishDto
+    ) -> TrackReadDto:
+        """
+        :raises ValidationError: if the upload ID is invalid or the uploaded file
+            is not of the format the upload was started for. The file is
+            deleted in the latter case.
+        :raises ResourceNotFoundError: if nothing was uploaded yet.
+        :raises DuplicateEntityError: if the upload was already finished.
+        """
+        path = track_upload_finish_dto.upload_id
+        try:
+            track_id, extension = parse_track_path(path)
+        except ValueError as exc:
+            raise ValidationError("Invalid upload ID", field="upload_id") from exc
+        if extension not in AudioFileFormat:
+            raise ValidationError("Invalid upload ID", field="upload_id")
+        expected_format = AudioFileFormat(extension)
+
+        if await self._track_repo.get_by_id(track_id) is not None:
+            raise DuplicateEntityError("Upload already finished")
+
+        # Taken before the file is read, so that it isn't purged meanwhile.
+        # Uploads started before they were recorded have none.
+        direct_upload = await self._direct_upload_repo.get_by_id(track_id)
+        if direct_upload is not None:
+            await self._direct_upload_repo.delete(direct_upload)
+
+        async with self._audio_storage as audio_storage:
+            size = await audio_storage.get_file_size(path)
+            if size is None:
+                raise ResourceNotFoundError("Uploaded file not found")
+
+            try:
+                track = await create_stored_track(
+                    track_upload_finish_dto,
+                    track_id=track_id,
+                    path=path,
+                    size=size,
+                    expected_format=expected_format,
+                    track_repo=self._track_repo,
+                    audio_processor=self._audio_processor,
+                    audio_storage=audio_storage,
+                )
+            except ValidationError:
+                await discard_stored_file(path, audio_storage)
+                raise
+            track_url = await audio_storage.generate_expiring_url(path)
+
+        await self._session.commit()
+        await logger.ainfo("Track created", track_id=track.id)
+
+        track_read_dto = TrackReadDto.model_validate(dict(track) | {"url": track_url})
+
+        return track_read_dto
+
+
+async def create_stored_track(
+    track_create_dto: TrackCreateDto,
+    *,
+    track_id: uuid.UUID,
+    path: str,
+    size: int,
+    expected_format: AudioFileFormat,
+    track_repo: TrackRepository,
+    audio_processor: AudioProcessor,
+    audio_storage: AudioStorage,
+) -> Track:
+    """
+    Create the track for a file that is already in storage.
+
+    The format and duration are read from the edges of the file, which are
+    fetched with one range request each. `audio_storage` must already be
+    entered.
+
+    :raises ValidationError: if the file is empty or not of `expected_format`.
+    """
+    if size == 0:
+        raise ValidationError("File is empty", field="upload_file")
+
+    head, tail = await read_stored_edges(path, size=size, audio_storage=audio_storage)
+    try:
+        format = audio_processor.get_format(io.BytesIO(head))
+    except ValidationError as exc:
+        raise ValidationError(
+            f"Unsupported file format. Supported formats: {', '.join(AudioFileFormat)}",
+            field="upload_file",
+        ) from exc
+    if format != expected_format:
+        raise ValidationError(
+            f"Uploaded file is not of format {expected_format}",
+            field="upload_file",
+        )
+
+    remote_file = await audio_storage.open_file(path, size=size)
+    duration = await asyncio.to_thread(
+        audio_processor.get_duration, open_edges(head, tail, size, remote_file), format
+    )
+
+    track = Track.model_validate(
+        track_create_dto,
+        update={
+            "id": track_id,
+            "duration": duration,
+            "format": format,
+            "size": size,
+            "path": path,
+        },
+    )
+    return await track_repo.create(track)
+
+
+async def read_stored_edges(
+    path: str, *, size: int, audio_storage: AudioStorage
+) -> tuple[bytes, bytes]:
+    """
+    Fetch the first and last bytes of a stored file, which is what the parsers
+    need to tell its format and duration.
+
+    Both are requested at the same time. Together they never cover more than
+    the whole file, so small files are fetched in a single request.
+    `audio_storage` must already be entered.
+    """
+    head_end = min(size, DURATION_PROBE_HEAD_SIZE)
+    tail_start = max(head_end, size - DURATION_PROBE_TAIL_SIZE)
+    if tail_start == size:
+        return await audio_storage.get_range(path, 0, head_end), b""
+    return await asyncio.gather(
+        audio_storage.get_range(path, 0, head_end),
+        audio_storage.get_range(path, tail_start, size),
+    )
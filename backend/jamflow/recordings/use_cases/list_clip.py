@@ -1,7 +1,10 @@
 import uuid
+from collections.abc import AsyncIterator, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from jamflow.core.pagination import DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE, Cursor, Page
+from jamflow.recordings.models import Clip, ClipStatus
 from jamflow.recordings.protocols import AudioStorage, ClipRepository
 from jamflow.recordings.schemas import ClipReadDto
 
@@ -17,18 +20,56 @@ class ListClip:
         self._session = session
         self._audio_storage = audio_storage
 
-    async def execute(self, track_id: uuid.UUID | None = None) -> list[ClipReadDto]:
-        clips = await (
-            self._clip_repo.list_all()
+    async def execute(
+        self,
+        track_id: uuid.UUID | None = None,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Cursor | None = None,
+    ) -> Page[ClipReadDto]:
+        page = await (
+            self._clip_repo.list_page(limit=limit, cursor=cursor)
+            if track_id is None
+            else self._clip_repo.list_page_by_track_id(
+                track_id, limit=limit, cursor=cursor
+            )
+        )
+        async with self._audio_storage as audio_storage:
+            clip_read_dtos = await _to_read_dtos(page.items, audio_storage)
+        return Page(items=clip_read_dtos, next_cursor=page.next_cursor)
+
+    async def stream(
+        self,
+        track_id: uuid.UUID | None = None,
+        *,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[ClipReadDto]:
+        """
+        List all clips, or those of a track, in the order of `execute` while
+        they are read from the database, holding no more than a batch of them
+        at a time.
+        """
+        batches = (
+            self._clip_repo.iter_batches(batch_size=batch_size)
             if track_id is None
-            else self._clip_repo.list_by_track_id(track_id=track_id)
+            else self._clip_repo.iter_batches_by_track_id(
+                track_id, batch_size=batch_size
+            )
         )
         async with self._audio_storage as audio_storage:
-            clip_read_dtos = [
-                ClipReadDto.model_validate(
-                    dict(clip)
-                    | {"url": await audio_storage.generate_expiring_url(clip.path)}
-                )
-                for clip in clips
-            ]
-        return clip_read_dtos
+            async for clips in batches:
+                for clip_read_dto in await _to_read_dtos(clips, audio_storage):
+                    yield clip_read_dto
+
+
+async def _to_read_dtos(
+    clips: Sequence[Clip], audio_storage: AudioStorage
+) -> list[ClipReadDto]:
+    # Clips that are not rendered yet have no file to link to
+    paths = [c.path for c in clips if c.status == ClipStatus.READY]
+    urls = await audio_storage.generate_expiring_urls(paths)
+    url_by_path = dict(zip(paths, urls, strict=True))
+    return [
+        ClipReadDto.model_validate(dict(clip) | {"url": url_by_path.get(clip.path)})
+        for clip in clips
+    ]
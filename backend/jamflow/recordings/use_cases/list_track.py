@@ -1,5 +1,9 @@
+from collections.abc import AsyncIterator, Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from jamflow.core.pagination import DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE, Cursor, Page
+from jamflow.recordings.models import Track
 from jamflow.recordings.protocols import AudioStorage, TrackRepository
 from jamflow.recordings.schemas import TrackReadDto
 
@@ -15,14 +19,35 @@ class ListTrack:
         self._session = session
         self._audio_storage = audio_storage
 
-    async def execute(self) -> list[TrackReadDto]:
-        tracks = await self._track_repo.list_all()
+    async def execute(
+        self,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Cursor | None = None,
+    ) -> Page[TrackReadDto]:
+        page = await self._track_repo.list_page(limit=limit, cursor=cursor)
+        async with self._audio_storage as audio_storage:
+            track_read_dtos = await _to_read_dtos(page.items, audio_storage)
+        return Page(items=track_read_dtos, next_cursor=page.next_cursor)
+
+    async def stream(
+        self, *, batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[TrackReadDto]:
+        """
+        List all tracks in order of creation while they are read from the
+        database, holding no more than a batch of them at a time.
+        """
         async with self._audio_storage as audio_storage:
-            track_read_dtos = [
-                TrackReadDto.model_validate(
-                    dict(track)
-                    | {"url": await audio_storage.generate_expiring_url(track.path)}
-                )
-                for track in tracks
-            ]
-        return track_read_dtos
+            async for tracks in self._track_repo.iter_batches(batch_size=batch_size):
+                for track_read_dto in await _to_read_dtos(tracks, audio_storage):
+                    yield track_read_dto
+
+
+async def _to_read_dtos(
+    tracks: Sequence[Track], audio_storage: AudioStorage
+) -> list[TrackReadDto]:
+    urls = await audio_storage.generate_expiring_urls([track.path for track in tracks])
+    return [
+        TrackReadDto.model_validate(dict(track) | {"url": url})
+        for track, url in zip(tracks, urls, strict=True)
+    ]
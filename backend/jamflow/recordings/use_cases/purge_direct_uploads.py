@@ -0,0 +1,97 @@
+import uuid
+from datetime import timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ApplicationError
+from jamflow.core.log import get_logger
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.protocols import AudioStorage, DirectUploadRepository
+
+logger = get_logger()
+
+
+class PurgeDirectUploads:
+    """
+    Delete the files of direct uploads that weren't finished in time.
+
+    Files uploaded straight to storage would otherwise stay there indefinitely
+    without a track.
+    """
+
+    def __init__(
+        self,
+        *,
+        direct_upload_repo: DirectUploadRepository,
+        session: AsyncSession,
+        audio_storage: AudioStorage,
+        expiration: int,
+        batch_size: int = 100,
+    ):
+        """
+        :param expiration: Time in seconds after its start that an unfinished
+            upload is kept.
+        :param batch_size: Maximum number of uploads purged per call.
+        """
+        self._direct_upload_repo = direct_upload_repo
+        self._session = session
+        self._audio_storage = audio_storage
+        self._expiration = expiration
+        self._batch_size = batch_size
+
+    async def execute(self) -> int:
+        """
+        Returns the number of purged uploads. Uploads that can't be purged are
+        skipped and retried once they expire again, so that they don't hold up
+        the uploads after them.
+        """
+        updated_before = timezone_now() - timedelta(seconds=self._expiration)
+        direct_uploads = await self._direct_upload_repo.list_stale(
+            updated_before=updated_before, limit=self._batch_size
+        )
+
+        # A failed upload is rolled back, which expires the ones loaded with it
+        direct_upload_ids = [direct_upload.id for direct_upload in direct_uploads]
+
+        purged = 0
+        async with self._audio_storage as audio_storage:
+            for direct_upload_id in direct_upload_ids:
+                direct_upload = await self._direct_upload_repo.get_by_id(
+                    direct_upload_id
+                )
+                if direct_upload is None:
+                    continue
+                try:
+                    # Deleted first, so that the file of an upload being
+                    # finished meanwhile is kept
+                    await self._direct_upload_repo.delete(direct_upload)
+                    await audio_storage.delete_file(direct_upload.path)
+                    await self._session.commit()
+                except ApplicationError:
+                    await logger.aexception(
+                        "Direct upload purge failed",
+                        direct_upload_id=direct_upload_id,
+                    )
+                    await self._session.rollback()
+                    await self._postpone(direct_upload_id)
+                    continue
+                purged += 1
+
+        if purged:
+            await logger.ainfo("Direct uploads purged", count=purged)
+        return purged
+
+    async def _postpone(self, direct_upload_id: uuid.UUID) -> None:
+        """Move an upload behind the other stale ones by touching it."""
+        direct_upload = await self._direct_upload_repo.get_by_id(direct_upload_id)
+        if direct_upload is None:
+            return
+        direct_upload.updated_at = timezone_now()
+        try:
+            await self._session.commit()
+        except ApplicationError:
+            await logger.aexception(
+                "Direct upload purge postponement failed",
+                direct_upload_id=direct_upload_id,
+            )
+            await self._session.rollback()
@@ -0,0 +1,100 @@
+import uuid
+from datetime import timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ApplicationError
+from jamflow.core.log import get_logger
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.protocols import AudioStorage, UploadSessionRepository
+from jamflow.recordings.use_cases.delete_upload_session import discard_upload_session
+
+logger = get_logger()
+
+
+class PurgeUploadSessions:
+    """
+    Discard uploads that haven't received a chunk for longer than they are kept.
+
+    Abandoned multipart uploads would otherwise keep their parts in storage
+    indefinitely.
+    """
+
+    def __init__(
+        self,
+        *,
+        upload_session_repo: UploadSessionRepository,
+        session: AsyncSession,
+        audio_storage: AudioStorage,
+        expiration: int,
+        batch_size: int = 100,
+    ):
+        """
+        :param expiration: Time in seconds after the last chunk that an
+            unfinished upload is kept.
+        :param batch_size: Maximum number of sessions discarded per call.
+        """
+        self._upload_session_repo = upload_session_repo
+        self._session = session
+        self._audio_storage = audio_storage
+        self._expiration = expiration
+        self._batch_size = batch_size
+
+    async def execute(self) -> int:
+        """
+        Returns the number of discarded sessions. Sessions that can't be
+        discarded are skipped and retried once they expire again, so that they
+        don't hold up the sessions after them.
+        """
+        updated_before = timezone_now() - timedelta(seconds=self._expiration)
+        upload_sessions = await self._upload_session_repo.list_stale(
+            updated_before=updated_before, limit=self._batch_size
+        )
+
+        # A failed session is rolled back, which expires the ones loaded with it
+        upload_session_ids = [upload_session.id for upload_session in upload_sessions]
+
+        purged = 0
+        async with self._audio_storage as audio_storage:
+            for upload_session_id in upload_session_ids:
+                upload_session = await self._upload_session_repo.get_by_id(
+                    upload_session_id
+                )
+                if upload_session is None:
+                    continue
+                try:
+                    await discard_upload_session(
+                        upload_session,
+                        upload_session_repo=self._upload_session_repo,
+                        audio_storage=audio_storage,
+                    )
+                    await self._session.commit()
+                except ApplicationError:
+                    await logger.aexception(
+                        "Upload session purge failed",
+                        upload_session_id=upload_session_id,
+                    )
+                    await self._session.rollback()
+                    await self._postpone(upload_session_id)
+                    continue
+                purged += 1
+
+        if purged:
+            await logger.ainfo("Upload sessions purged", count=purged)
+        return purged
+
+    async def _postpone(self, upload_session_id: uuid.UUID) -> None:
+        """Move a session behind the other stale ones by touching it."""
+        upload_session = await self._upload_session_repo.get_by_id(upload_session_id)
+        if upload_session is None:
+            return
+        upload_session.updated_at = timezone_now()
+        try:
+            await self._upload_session_repo.save(upload_session)
+            await self._session.commit()
+        except ApplicationError:
+            await logger.aexception(
+                "Upload session purge postponement failed",
+                upload_session_id=upload_session_id,
+            )
+            await self._session.rollback()
@@ -3,6 +3,7 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.recordings.models import ClipStatus
 from jamflow.recordings.protocols import AudioStorage, ClipRepository
 from jamflow.recordings.schemas import ClipReadDto
 
@@ -23,8 +24,10 @@ class ReadClip:
         if clip is None:
             raise ResourceNotFoundError("Clip not found")
 
-        async with self._audio_storage as audio_storage:
-            clip_url = await audio_storage.generate_expiring_url(clip.path)
+        clip_url = None
+        if clip.status == ClipStatus.READY:
+            async with self._audio_storage as audio_storage:
+                clip_url = await audio_storage.generate_expiring_url(clip.path)
 
         clip_read_dto = ClipReadDto.model_validate(dict(clip) | {"url": clip_url})
 
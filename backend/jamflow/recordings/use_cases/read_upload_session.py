@@ -0,0 +1,45 @@
+import uuid
+from datetime import timedelta
+
+from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.recordings.models import UploadSession
+from jamflow.recordings.protocols import UploadSessionRepository
+from jamflow.recordings.schemas import TrackReadDto, UploadSessionReadDto
+
+
+class ReadUploadSession:
+    """Tell how much of a file has been uploaded, to resume from there."""
+
+    def __init__(
+        self, *, upload_session_repo: UploadSessionRepository, expiration: int
+    ):
+        """
+        :param expiration: Time in seconds after the last chunk that an
+            unfinished upload is kept.
+        """
+        self._upload_session_repo = upload_session_repo
+        self._expiration = expiration
+
+    async def execute(self, upload_session_id: uuid.UUID) -> UploadSessionReadDto:
+        """
+        :raises ResourceNotFoundError: if there is no such session.
+        """
+        upload_session = await self._upload_session_repo.get_by_id(upload_session_id)
+        if upload_session is None:
+            raise ResourceNotFoundError("Upload session not found")
+        return to_upload_session_read_dto(upload_session, expiration=self._expiration)
+
+
+def to_upload_session_read_dto(
+    upload_session: UploadSession,
+    *,
+    expiration: int,
+    track: TrackReadDto | None = None,
+) -> UploadSessionReadDto:
+    return UploadSessionReadDto(
+        id=upload_session.id,
+        size=upload_session.size,
+        offset=upload_session.offset,
+        expires_at=upload_session.updated_at + timedelta(seconds=expiration),
+        track=track,
+    )
@@ -0,0 +1,199 @@
+import uuid
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from jamflow.core.concurrency import SingleFlight
+from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.core.log import get_logger
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.models import Clip, ClipStatus, Track
+from jamflow.recordings.protocols import (
+    AudioProcessor,
+    AudioStorage,
+    ClipRepository,
+    TrackRepository,
+)
+
+logger = get_logger()
+
+
+class RenderClip:
+    """
+    Render the audio file of the oldest pending clip.
+
+    The clip is leased to the worker for rendering, which is committed right
+    away, so that the clip isn't locked and no transaction is open while it
+    is rendered. Should the worker die on the way, the lease runs out and the
+    clip is picked up again.
+    """
+
+    def __init__(
+        self,
+        *,
+        clip_repo: ClipRepository,
+        track_repo: TrackRepository,
+        session: AsyncSession,
+        audio_processor: AudioProcessor,
+        audio_storage: AudioStorage,
+        render_flight: SingleFlight[str, int],
+        lease: int,
+    ):
+        """
+        :param lease: Time in seconds the clip is left to the worker rendering
+            it, before other workers take it over.
+        """
+        self._clip_repo = clip_repo
+        self._track_repo = track_repo
+        self._session = session
+        self._audio_processor = audio_processor
+        self._audio_storage = audio_storage
+        self._render_flight = render_flight
+        self._lease = lease
+
+    async def execute(self) -> uuid.UUID | None:
+        """
+        Returns the ID of the rendered clip or `None` if no clip is pending.
+        """
+        clip = await self._clip_repo.claim_next_pending()
+        if clip is None:
+            return None
+        clip_id = clip.id
+
+        try:
+            track = await self._track_repo.get_by_id(clip.track_id)
+            if track is None:
+                raise ResourceNotFoundError("Track not found")
+
+            size = await find_clip_file_size(clip, clip_repo=self._clip_repo)
+            if size is None:
+                clip.status = ClipStatus.RENDERING
+                clip.leased_until = timezone_now() + timedelta(seconds=self._lease)
+                await self._session.commit()
+
+                size = await render_clip_file_once(
+                    clip,
+                    track,
+                    audio_processor=self._audio_processor,
+                    audio_storage=self._audio_storage,
+                    render_flight=self._render_flight,
+                )
+        except Exception:
+            await logger.aexception("Clip rendering failed", clip_id=clip_id)
+            # The transaction may have failed along with the rendering
+            await self._session.rollback()
+            status = await self._finish(clip_id, ClipStatus.FAILED)
+        else:
+            status = await self._finish(clip_id, ClipStatus.READY, size=size)
+
+        await logger.ainfo("Clip rendered", clip_id=clip_id, status=status)
+        return clip_id
+
+    async def _finish(
+        self, clip_id: uuid.UUID, status: ClipStatus, *, size: int | None = None
+    ) -> ClipStatus:
+        clip = await self._clip_repo.get_by_id(clip_id)
+        if clip is None:
+            # Deleted while it was rendered
+            return status
+        clip.status = status
+        clip.size = size
+        clip.leased_until = None
+        await self._session.commit()
+        return status
+
+
+async def ensure_clip_file(
+    clip: Clip,
+    track: Track,
+    *,
+    clip_repo: ClipRepository,
+    audio_processor: AudioProcessor,
+    audio_storage: AudioStorage,
+    render_flight: SingleFlight[str, int],
+) -> int:
+    """
+    Make sure the file of a clip exists and return its size.
+
+    Clips with identical audio share a path, so the file of an earlier clip is
+    reused and identical clips rendered at the same time share one rendering.
+    `audio_storage` must not be entered yet, see `render_clip_file_once`.
+    """
+    size = await find_clip_file_size(clip, clip_repo=clip_repo)
+    if size is not None:
+        return size
+
+    return await render_clip_file_once(
+        clip,
+        track,
+        audio_processor=audio_processor,
+        audio_storage=audio_storage,
+        render_flight=render_flight,
+    )
+
+
+async def find_clip_file_size(clip: Clip, *, clip_repo: ClipRepository) -> int | None:
+    """Get the size of the file of an identical clip rendered before, if any."""
+    rendered_clip = await clip_repo.find_ready_by_path(clip.track_id, clip.path)
+    if rendered_clip is None or rendered_clip.size is None:
+        return None
+    await logger.ainfo("Clip file reused", path=clip.path)
+    return rendered_clip.size
+
+
+async def render_clip_file_once(
+    clip: Clip,
+    track: Track,
+    *,
+    audio_processor: AudioProcessor,
+    audio_storage: AudioStorage,
+    render_flight: SingleFlight[str, int],
+) -> int:
+    """
+    Render the file of a clip, sharing one rendering between identical clips
+    rendered at the same time.
+
+    The rendering enters `audio_storage` itself rather than using the storage
+    of its caller, which may be cancelled and close its storage while the
+    callers that joined the rendering still wait for it. `audio_storage` must
+    thus not be entered yet.
+    """
+
+    async def render() -> int:
+        async with audio_storage as entered_audio_storage:
+            return await render_clip_file(
+                clip,
+                track,
+                audio_processor=audio_processor,
+                audio_storage=entered_audio_storage,
+            )
+
+    return await render_flight.do(clip.path, render)
+
+
+async def render_clip_file(
+    clip: Clip,
+    track: Track,
+    *,
+    audio_processor: AudioProcessor,
+    audio_storage: AudioStorage,
+) -> int:
+    """
+    Cut the clip from its track and store it under the path of the clip.
+
+    `audio_storage` must already be entered. Returns the size of the clip file.
+    """
+    track_file = await audio_storage.open_file(track.path, size=track.size)
+    clip_file = await audio_processor.clip(
+        track_file,
+        track.format,
+        start=clip.start,
+        end=clip.end,
+    )
+    await audio_storage.store_file(
+        file=clip_file,
+        path=clip.path,
+        content_type=clip.format.mime_type,
+    )
+    await logger.ainfo("File stored", path=clip.path)
+    return audio_processor.get_size(clip_file)
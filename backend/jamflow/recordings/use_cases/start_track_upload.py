@@ -0,0 +1,70 @@
+import uuid
+from datetime import timedelta
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.log import get_logger
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.models import DirectUpload
+from jamflow.recordings.protocols import AudioStorage, DirectUploadRepository
+from jamflow.recordings.schemas import (
+    MAX_UPLOAD_FILE_SIZE,
+    TrackUploadDto,
+    TrackUploadStartDto,
+)
+from jamflow.recordings.utils import generate_track_path
+
+logger = get_logger()
+
+
+class StartTrackUpload:
+    """
+    Let a client upload a track file straight to storage.
+
+    The file doesn't pass through the application, which only hands out a form
+    for a fresh track path. The track is created once the upload is finished
+    with `FinishTrackUpload`. Until then the upload is recorded, so that its
+    file is deleted by `PurgeDirectUploads` if it is never finished.
+    """
+
+    def __init__(
+        self,
+        *,
+        direct_upload_repo: DirectUploadRepository,
+        session: AsyncSession,
+        audio_storage: AudioStorage,
+        expiration: int = 3600,
+    ):
+        """
+        :param expiration: Time in seconds for the upload form to remain valid.
+        """
+        self._direct_upload_repo = direct_upload_repo
+        self._session = session
+        self._audio_storage = audio_storage
+        self._expiration = expiration
+
+    async def execute(
+        self, track_upload_start_dto: TrackUploadStartDto
+    ) -> TrackUploadDto:
+        format = track_upload_start_dto.format
+        track_id = uuid.uuid4()
+        path = generate_track_path(track_id, format)
+        expires_at = timezone_now() + timedelta(seconds=self._expiration)
+        async with self._audio_storage as audio_storage:
+            upload_form = await audio_storage.generate_upload_form(
+                path,
+                content_type=format.mime_type,
+                max_size=MAX_UPLOAD_FILE_SIZE,
+                expiration=self._expiration,
+            )
+        await self._direct_upload_repo.create(DirectUpload(id=track_id, path=path))
+        await self._session.commit()
+        await logger.ainfo("Track upload started", path=path)
+
+        # The path is all that is needed to finish the upload
+        return TrackUploadDto(
+            upload_id=path,
+            url=upload_form.url,
+            fields=upload_form.fields,
+            expires_at=expires_at,
+        )
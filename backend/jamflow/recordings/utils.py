@@ -1,7 +1,13 @@
+import re
 import uuid
 
 from jamflow.core.utils import timezone_now
 
+_TRACK_PATH_PATTERN = re.compile(
+    r"tracks/\d{4}/\d{2}/(?P<hex_digest>[0-9a-f]{32})/(?P=hex_digest)\.(?P<extension>\w+)",
+    re.ASCII,
+)
+
 
 def generate_track_path(unique_id: uuid.UUID, extension: str) -> str:
     """
@@ -31,6 +37,28 @@ def generate_track_path(unique_id: uuid.UUID, extension: str) -> str:
     return path
 
 
+def parse_track_path(path: str) -> tuple[uuid.UUID, str]:
+    """
+    Get the ID and extension from a path generated by `generate_track_path`.
+
+    :raise ValueError: If the path is not a track path.
+    """
+    match = _TRACK_PATH_PATTERN.fullmatch(path)
+    if match is None:
+        raise ValueError("Not a track path")
+    return uuid.UUID(hex=match["hex_digest"]), match["extension"]
+
+
+def generate_clip_content_id(
+    track_id: uuid.UUID, start: int, end: int, extension: str
+) -> uuid.UUID:
+    """
+    Generate an ID that is the same for all clips with identical audio, that is
+    clips of the same track range in the same format.
+    """
+    return uuid.uuid5(track_id, f"{start}-{end}.{extension}")
+
+
 def generate_clip_path(track_path: str, clip_id: uuid.UUID, extension: str) -> str:
     """
     Generate a path including the file name for storing clip files within the track's
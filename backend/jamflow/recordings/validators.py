@@ -1,37 +0,0 @@
-from collections.abc import Callable
-
-from fastapi import UploadFile
-
-from jamflow.core.exceptions import ValidationError
-from jamflow.infra.audio import native_audio_processor
-from jamflow.recordings.models import AudioFileFormat
-
-
-def validate_audo_file_format(upload_file: UploadFile) -> UploadFile:
-    """
-    Validates that a file is an audio file of an accepted format.
-    """
-    try:
-        native_audio_processor.get_format(upload_file.file)
-    except ValidationError as exc:
-        raise ValueError(
-            f"Unsupported file format. Supported formats: {', '.join(AudioFileFormat)}"
-        ) from exc
-    return upload_file
-
-
-def get_file_size_validator(max_size: int) -> Callable[[UploadFile], UploadFile]:
-    """
-    Returns a file size validator with a specific max size.
-    """
-
-    def validate_file_size(upload_file: UploadFile) -> UploadFile:
-        if not upload_file.size:
-            raise ValueError("File is empty")
-
-        if upload_file.size > max_size:
-            raise ValueError(f"File is larger than {max_size // (1024 * 1024)} MB")
-
-        return upload_file
-
-    return validate_file_size
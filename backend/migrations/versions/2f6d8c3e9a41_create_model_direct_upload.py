@@ -0,0 +1,38 @@
+"""create model direct upload
+
+Revision ID: 2f6d8c3e9a41
+Revises: 7b4e2f9c1a63
+Create Date: 2026-10-18 21:07:32.640118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2f6d8c3e9a41"
+down_revision: str | None = "7b4e2f9c1a63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "direct_upload",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("path", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_direct_upload_updated_at", "direct_upload", ["updated_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_direct_upload_updated_at", table_name="direct_upload")
+    op.drop_table("direct_upload")
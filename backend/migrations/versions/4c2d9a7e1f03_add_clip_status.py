@@ -0,0 +1,54 @@
+"""add clip status
+
+Revision ID: 4c2d9a7e1f03
+Revises: e667b2dccbfd
+Create Date: 2026-10-18 10:12:31.284117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql as pg
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2d9a7e1f03"
+down_revision: str | None = "e667b2dccbfd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    pg.ENUM("pending", "ready", "failed", name="clipstatus").create(op.get_bind())
+    # Existing clips were rendered on creation
+    op.add_column(
+        "clip",
+        sa.Column(
+            "status",
+            pg.ENUM(name="clipstatus", create_type=False),
+            nullable=False,
+            server_default="ready",
+        ),
+    )
+    op.alter_column("clip", "status", server_default=None)
+    op.alter_column("clip", "size", existing_type=sa.Integer(), nullable=True)
+    op.create_index(
+        "ix_clip_pending_created_at",
+        "clip",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_clip_pending_created_at",
+        table_name="clip",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.execute("DELETE FROM clip WHERE status != 'ready'")
+    op.alter_column("clip", "size", existing_type=sa.Integer(), nullable=False)
+    op.drop_column("clip", "status")
+    pg.ENUM(name="clipstatus").drop(op.get_bind())
@@ -0,0 +1,83 @@
+"""add listing indexes
+
+Revision ID: 5e8a1c4b7d29
+Revises: 9d3f6b2a7c15
+Create Date: 2026-10-18 16:40:27.803519
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a1c4b7d29"
+down_revision: str | None = "9d3f6b2a7c15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Built without locking out writes, which can't be done in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_clip_track_id_created_at_id",
+            "clip",
+            ["track_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_clip_created_at_id",
+            "clip",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_track_created_at_id",
+            "track",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Covered by the leading column of the index above
+        op.drop_index(
+            "ix_clip_track_id",
+            table_name="clip",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_clip_track_id",
+            "clip",
+            ["track_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_track_created_at_id",
+            table_name="track",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_clip_created_at_id",
+            table_name="clip",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_clip_track_id_created_at_id",
+            table_name="clip",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
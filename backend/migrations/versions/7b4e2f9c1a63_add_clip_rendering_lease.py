@@ -0,0 +1,66 @@
+"""add clip rendering lease
+
+Revision ID: 7b4e2f9c1a63
+Revises: 5e8a1c4b7d29
+Create Date: 2026-10-18 19:21:45.102384
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql as pg
+
+# revision identifiers, used by Alembic.
+revision: str = "7b4e2f9c1a63"
+down_revision: str | None = "5e8a1c4b7d29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # A new enum value can't be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE clipstatus ADD VALUE IF NOT EXISTS 'rendering'")
+    op.add_column(
+        "clip",
+        sa.Column("leased_until", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.drop_index(
+        "ix_clip_pending_created_at",
+        table_name="clip",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_clip_unrendered_created_at",
+        "clip",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'rendering')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_clip_unrendered_created_at",
+        table_name="clip",
+        postgresql_where=sa.text("status IN ('pending', 'rendering')"),
+    )
+    # Values can't be dropped from an enum, so it is replaced by one without
+    op.execute("UPDATE clip SET status = 'pending' WHERE status = 'rendering'")
+    op.execute("ALTER TYPE clipstatus RENAME TO clipstatus_old")
+    pg.ENUM("pending", "ready", "failed", name="clipstatus").create(op.get_bind())
+    op.execute(
+        "ALTER TABLE clip ALTER COLUMN status TYPE clipstatus "
+        "USING status::text::clipstatus"
+    )
+    op.execute("DROP TYPE clipstatus_old")
+    op.create_index(
+        "ix_clip_pending_created_at",
+        "clip",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_column("clip", "leased_until")
@@ -0,0 +1,52 @@
+"""create model upload session
+
+Revision ID: 9d3f6b2a7c15
+Revises: 4c2d9a7e1f03
+Create Date: 2026-10-18 14:02:11.517240
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql as pg
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3f6b2a7c15"
+down_revision: str | None = "4c2d9a7e1f03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "upload_session",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "title", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False
+        ),
+        sa.Column("recorded_date", sa.Date(), nullable=True),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("offset", sa.Integer(), nullable=False),
+        sa.Column(
+            "format", pg.ENUM(name="audiofileformat", create_type=False), nullable=True
+        ),
+        sa.Column("path", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column(
+            "storage_upload_id", sqlmodel.sql.sqltypes.AutoString(), nullable=True
+        ),
+        sa.Column("part_tags", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_upload_session_updated_at", "upload_session", ["updated_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upload_session_updated_at", table_name="upload_session")
+    op.drop_table("upload_session")
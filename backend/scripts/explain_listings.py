@@ -0,0 +1,171 @@
+"""
+Compare the query plans of the track and clip listings with and without the
+listing indexes.
+
+The database is filled with the clips of one busy track and of many others in
+a transaction that is rolled back at the end, so nothing is left behind. The
+tables are locked while it runs, so only point it at a development database
+migrated to the latest revision:
+
+    uv run python scripts/explain_listings.py --clips 200000
+"""
+
+import argparse
+import asyncio
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from jamflow.core.config import settings
+
+PAGE_SIZE = 50
+
+# Mirror the statements of the repositories
+QUERIES = {
+    "Clips of a track": """
+        SELECT * FROM clip
+        WHERE track_id = :track_id
+        ORDER BY created_at DESC
+    """,
+    "Page of the clips of a track": """
+        SELECT * FROM clip
+        WHERE track_id = :track_id AND (created_at, id) < (:created_at, :id)
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+    """,
+    "Page of all clips": """
+        SELECT * FROM clip
+        WHERE (created_at, id) > (:created_at, :id)
+        ORDER BY created_at, id
+        LIMIT :limit
+    """,
+    "Page of all tracks": """
+        SELECT * FROM track
+        WHERE (created_at, id) > (:created_at, :id)
+        ORDER BY created_at, id
+        LIMIT :limit
+    """,
+}
+
+# Restores the indexes from before the listing indexes were added
+DROP_LISTING_INDEXES = [
+    "DROP INDEX ix_clip_track_id_created_at_id",
+    "DROP INDEX ix_clip_created_at_id",
+    "DROP INDEX ix_track_created_at_id",
+    "CREATE INDEX ix_clip_track_id ON clip (track_id)",
+]
+
+
+async def fill(conn: AsyncConnection, *, tracks: int, clips: int) -> None:
+    await conn.execute(
+        text("""
+            INSERT INTO track (
+                id, created_at, updated_at, title, duration, format, size, path
+            )
+            SELECT
+                gen_random_uuid(),
+                now() - n * interval '1 minute',
+                now(),
+                'Track ' || n,
+                300000,
+                'mp3',
+                4800000,
+                'tracks/' || n || '.mp3'
+            FROM generate_series(1, :tracks) AS n
+        """),
+        {"tracks": tracks},
+    )
+    # Half of the clips are of the busy track, the rest spread over the others
+    await conn.execute(
+        text("""
+            WITH ranked AS (
+                SELECT id, row_number() OVER (ORDER BY created_at) AS rank
+                FROM track
+            )
+            INSERT INTO clip (
+                id, created_at, updated_at, title, track_id, duration, start,
+                "end", format, size, path, status
+            )
+            SELECT
+                gen_random_uuid(),
+                now() - n * interval '1 second',
+                now(),
+                'Clip ' || n,
+                ranked.id,
+                10000,
+                0,
+                10000,
+                'mp3',
+                160000,
+                'clips/' || n || '.mp3',
+                'ready'
+            FROM generate_series(1, :clips) AS n
+            JOIN ranked
+                ON ranked.rank = CASE WHEN n % 2 = 0 THEN 1 ELSE 1 + n % :tracks END
+        """),
+        {"tracks": tracks, "clips": clips},
+    )
+    await conn.execute(text("ANALYZE track"))
+    await conn.execute(text("ANALYZE clip"))
+
+
+async def get_params(conn: AsyncConnection) -> dict[str, Any]:
+    """Pick the busy track and a cursor from the middle of its clips."""
+    result = await conn.execute(
+        text("""
+            SELECT track_id, created_at, id FROM clip
+            WHERE track_id = (
+                SELECT track_id FROM clip
+                GROUP BY track_id ORDER BY count(*) DESC LIMIT 1
+            )
+            ORDER BY created_at DESC
+            OFFSET (SELECT count(*) / 4 FROM clip)
+            LIMIT 1
+        """)
+    )
+    track_id, created_at, id = result.one()
+    return {"track_id": track_id, "created_at": created_at, "id": id}
+
+
+async def explain_all(conn: AsyncConnection, params: dict[str, Any]) -> None:
+    for name, query in QUERIES.items():
+        result = await conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) {query}"),
+            params | {"limit": PAGE_SIZE + 1},
+        )
+        print(f"-- {name}")
+        print("\n".join(row[0] for row in result))
+        print()
+
+
+async def main(*, tracks: int, clips: int) -> None:
+    engine = create_async_engine(
+        str(settings.SQLALCHEMY_DATABASE_URI), poolclass=NullPool
+    )
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            await fill(conn, tracks=tracks, clips=clips)
+            params = await get_params(conn)
+
+            print("==== With listing indexes ====\n")
+            await explain_all(conn, params)
+
+            for statement in DROP_LISTING_INDEXES:
+                await conn.execute(text(statement))
+            await conn.execute(text("ANALYZE clip"))
+            print("==== Without listing indexes ====\n")
+            await explain_all(conn, params)
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tracks", type=int, default=1000)
+    parser.add_argument("--clips", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(tracks=args.tracks, clips=args.clips))
@@ -8,13 +8,13 @@ from .fixtures.database import (  # noqa: F401
 from .fixtures.files import (  # noqa: F401
     audio_file_factory,
     mp3_file,
-    mp3_upload_file,
+    mp3_track_upload,
     ogg_file,
-    ogg_upload_file,
+    ogg_track_upload,
     temp_test_dir,
-    txt_upload_file,
+    txt_track_upload,
     wav_file,
-    wav_upload_file,
+    wav_track_upload,
 )
 from .fixtures.http import (  # noqa: F401
     client,
@@ -1,12 +1,14 @@
-from io import BytesIO
+from collections.abc import AsyncIterator
+from datetime import date
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from fastapi import UploadFile
 from pydub.generators import WhiteNoise
 from pytest import TempPathFactory
 
+from jamflow.recordings.schemas import TrackCreateDto
+
 
 @pytest.fixture(scope="module")
 def temp_test_dir(tmp_path_factory: TempPathFactory) -> Generator[Path]:
@@ -55,41 +57,53 @@ def ogg_file(audio_file_factory) -> Generator[Path]:
     yield from audio_file_factory("ogg")
 
 
-@pytest.fixture
-def wav_upload_file(wav_file: Path) -> UploadFile:
-    """Fixture to return a FastAPI UploadFile for WAV."""
-    with open(wav_file, "rb") as file:
-        file_content = BytesIO(file.read())
-    return UploadFile(
-        filename="test.wav", file=file_content, size=wav_file.stat().st_size
-    )
+class InMemoryTrackUpload:
+    """Track upload of a file that is already held in memory."""
+
+    def __init__(
+        self,
+        data: bytes,
+        track_create_dto: TrackCreateDto | None = None,
+        *,
+        chunk_size: int = 4096,
+    ):
+        self.data = data
+        self.track_create_dto = track_create_dto or TrackCreateDto(
+            title="Test Track", recorded_date=date.today()
+        )
+        self._chunk_size = chunk_size
+        self._read = False
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        for offset in range(0, len(self.data), self._chunk_size):
+            yield self.data[offset : offset + self._chunk_size]
+        self._read = True
+
+    def get_track_create_dto(self) -> TrackCreateDto:
+        if not self._read:
+            raise RuntimeError("The upload has not been read to the end")
+        return self.track_create_dto
 
 
 @pytest.fixture
-async def mp3_upload_file(mp3_file: Path) -> UploadFile:
-    """Fixture to return a FastAPI UploadFile for MP3."""
-    with open(mp3_file, "rb") as file:
-        file_content = BytesIO(file.read())
-    return UploadFile(
-        filename="test.mp3", file=file_content, size=mp3_file.stat().st_size
-    )
+def wav_track_upload(wav_file: Path) -> InMemoryTrackUpload:
+    """Fixture to return a track upload of a WAV file."""
+    return InMemoryTrackUpload(wav_file.read_bytes())
 
 
 @pytest.fixture
-async def ogg_upload_file(ogg_file: Path) -> UploadFile:
-    """Fixture to return a FastAPI UploadFile for OGG."""
-    with open(ogg_file, "rb") as file:
-        file_content = BytesIO(file.read())
-    return UploadFile(
-        filename="test.ogg", file=file_content, size=ogg_file.stat().st_size
-    )
+def mp3_track_upload(mp3_file: Path) -> InMemoryTrackUpload:
+    """Fixture to return a track upload of an MP3 file."""
+    return InMemoryTrackUpload(mp3_file.read_bytes())
 
 
 @pytest.fixture
-def txt_upload_file() -> UploadFile:
-    """Fixture to return a FastAPI UploadFile for TXT."""
+def ogg_track_upload(ogg_file: Path) -> InMemoryTrackUpload:
+    """Fixture to return a track upload of an OGG file."""
+    return InMemoryTrackUpload(ogg_file.read_bytes())
+
 
-    file_content = b"testtext"
-    return UploadFile(
-        filename="test.mp3", file=BytesIO(file_content), size=len(file_content)
-    )
+@pytest.fixture
+def txt_track_upload() -> InMemoryTrackUpload:
+    """Fixture to return a track upload of a TXT file."""
+    return InMemoryTrackUpload(b"testtext")
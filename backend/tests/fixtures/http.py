@@ -5,7 +5,7 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from jamflow.infra.database import get_session
+from jamflow.infra.database import get_replica_session, get_session
 
 
 @pytest.fixture
@@ -34,6 +34,7 @@ async def client(
         return pg_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_replica_session] = override_get_session
     yield simple_client
     app.dependency_overrides.clear()
 
@@ -1,7 +1,7 @@
 from datetime import date
+from pathlib import Path
 
 import pytest
-from fastapi import UploadFile
 from sqlmodel import col, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -13,6 +13,7 @@ from jamflow.recordings.schemas import (
     TrackReadDto,
 )
 from jamflow.recordings.use_cases import CreateClip, CreateTrack
+from tests.fixtures.files import InMemoryTrackUpload
 
 
 @pytest.fixture
@@ -55,40 +56,40 @@ def create_track(
 @pytest.fixture
 async def track_1(
     create_track: CreateTrack,
-    mp3_upload_file: UploadFile,
+    mp3_file: Path,
 ) -> TrackReadDto:
     track_create_dto = TrackCreateDto(
         title="Test Track mp3",
         recorded_date=date(2021, 2, 3),
-        upload_file=mp3_upload_file,
     )
-    return await create_track.execute(track_create_dto=track_create_dto)
+    track_upload = InMemoryTrackUpload(mp3_file.read_bytes(), track_create_dto)
+    return await create_track.execute(track_upload=track_upload)
 
 
 @pytest.fixture
 async def track_2(
     create_track: CreateTrack,
-    ogg_upload_file: UploadFile,
+    ogg_file: Path,
 ) -> TrackReadDto:
     track_create_dto = TrackCreateDto(
         title="Test Track ogg",
         recorded_date=date(2021, 4, 5),
-        upload_file=ogg_upload_file,
     )
-    return await create_track.execute(track_create_dto=track_create_dto)
+    track_upload = InMemoryTrackUpload(ogg_file.read_bytes(), track_create_dto)
+    return await create_track.execute(track_upload=track_upload)
 
 
 @pytest.fixture
 async def track_3(
     create_track: CreateTrack,
-    wav_upload_file: UploadFile,
+    wav_file: Path,
 ) -> TrackReadDto:
     track_create_dto = TrackCreateDto(
         title="Test Track wav",
         recorded_date=date(2021, 6, 7),
-        upload_file=wav_upload_file,
     )
-    return await create_track.execute(track_create_dto=track_create_dto)
+    track_upload = InMemoryTrackUpload(wav_file.read_bytes(), track_create_dto)
+    return await create_track.execute(track_upload=track_upload)
 
 
 @pytest.fixture
@@ -1,10 +1,11 @@
+import json
 from uuid import uuid4
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
-from jamflow.recordings.models import Clip
+from jamflow.recordings.models import Clip, ClipStatus
 from jamflow.recordings.schemas import ClipReadDto, TrackReadDto
 
 pytestmark = pytest.mark.usefixtures("audio_storage_isolation")
@@ -40,6 +41,7 @@ async def test_clip_create_returns_complete_clip_with_extracted_metadata(
         "created_at",
         "updated_at",
         "format",
+        "status",
         "size",
         "url",
     }
@@ -57,6 +59,26 @@ async def test_clip_create_returns_complete_clip_with_extracted_metadata(
     assert str(persisted_clip.id) == response_data["id"]
 
 
+async def test_clip_create_with_respond_async_returns_pending_clip(
+    client: AsyncClient,
+    clip_data,
+    get_row,
+):
+    response = await client.post(
+        "/api/v1/clips", json=clip_data, headers={"Prefer": "respond-async"}
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED, response.content
+    assert response.headers["Preference-Applied"] == "respond-async"
+    response_data = response.json()
+    assert response_data["status"] == "pending"
+    assert response_data["url"] is None
+    assert response.headers["Location"].endswith(f"/api/v1/clips/{response_data['id']}")
+
+    persisted_clip = await get_row(Clip, "Test Clip", column=Clip.title)
+    assert persisted_clip is not None
+    assert persisted_clip.status == ClipStatus.PENDING
+
+
 async def test_clip_create_with_non_existent_track_returns_404(
     client: AsyncClient,
     clip_data,
@@ -155,6 +177,7 @@ async def test_clip_list_with_two_clips_returns_all(
             "created_at",
             "updated_at",
             "format",
+            "status",
             "size",
             "url",
         }
@@ -172,6 +195,23 @@ async def test_clip_list_with_two_clips_returns_all(
     assert clip_2_data["url"].startswith(("http://", "https://"))
 
 
+async def test_clip_list_accepting_ndjson_streams_clips_of_track(
+    client: AsyncClient,
+    clip_1: ClipReadDto,
+    clip_2: ClipReadDto,  # noqa: ARG001
+    track_1: TrackReadDto,
+):
+    response = await client.get(
+        "/api/v1/clips",
+        params={"track_id": str(track_1.id)},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    clips = [json.loads(line) for line in response.text.splitlines()]
+    assert [c["id"] for c in clips] == [str(clip_1.id)]
+
+
 async def test_list_clip_with_track_id_filter_returns_filtered_clips(
     client: AsyncClient,
     clip_1: ClipReadDto,
@@ -216,6 +256,7 @@ async def test_clip_read_with_existing_clip_returns_expected_response(
         "created_at",
         "updated_at",
         "format",
+        "status",
         "size",
         "url",
     }
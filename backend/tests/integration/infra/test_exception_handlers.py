@@ -16,6 +16,7 @@ from jamflow.core.exceptions import (
     ConfigurationError,
     DatabaseError,
     DataIntegrityError,
+    DuplicateEntityError,
     ExternalServiceError,
     RateLimitError,
     ResourceNotFoundError,
@@ -268,6 +269,10 @@ def test_all_application_error_children_map_to_http_status_codes():
             pytest.fail(f"{exec_type} not mapped to an HTTP status code")
 
 
+def test_application_error_grandchildren_map_to_http_status_of_parent():
+    assert get_http_status(DuplicateEntityError) == get_http_status(DataIntegrityError)
+
+
 def test_all_application_error_children_map_to_error_codes():
     all_subclasses = ApplicationError.__subclasses__()
     for exec_type in all_subclasses:
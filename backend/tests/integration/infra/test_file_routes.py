@@ -0,0 +1,105 @@
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from jamflow.core.config import settings
+from jamflow.infra.bootstrap import default_audio_storage
+from jamflow.infra.storage.filesystem import FileSystemStorage
+
+
+@pytest.fixture(autouse=True)
+def file_system_backend(tmp_path: Path) -> Iterator[None]:
+    with (
+        mock.patch.object(settings, "STORAGE_BACKEND", "filesystem"),
+        mock.patch.object(settings, "STORAGE_DIR", tmp_path),
+        mock.patch.object(settings, "STORAGE_PUBLIC_URL", "http://test/api/v1/files/"),
+    ):
+        yield
+
+
+@pytest.fixture
+def storage() -> FileSystemStorage:
+    storage = default_audio_storage()
+    assert isinstance(storage, FileSystemStorage)
+    return storage
+
+
+async def test_file_read_with_signed_url_returns_file(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    await storage.store_file(b"0123456789", path="a/b.mp3", content_type="audio/mpeg")
+    url = await storage.generate_expiring_url("a/b.mp3")
+
+    response = await simple_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.content == b"0123456789"
+    assert response.headers["Content-Type"] == "audio/mpeg"
+
+    response = await simple_client.get(url, headers={"Range": "bytes=2-4"})
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.content == b"234"
+
+
+async def test_file_read_with_invalid_signature_returns_403(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    await storage.store_file(b"data", path="a/b.mp3", content_type="audio/mpeg")
+    url = await storage.generate_expiring_url("a/b.mp3")
+
+    response = await simple_client.get(url.replace("a/b.mp3", "a/c.mp3"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN, response.content
+
+
+async def test_file_read_of_missing_file_returns_404(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    url = await storage.generate_expiring_url("a/b.mp3")
+
+    response = await simple_client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.content
+
+
+async def test_file_upload_with_form_stores_file(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    upload_form = await storage.generate_upload_form(
+        "a/b.mp3", content_type="audio/mpeg", max_size=10
+    )
+
+    response = await simple_client.post(
+        upload_form.url,
+        data=upload_form.fields,
+        files={"file": ("b.mp3", b"data", "audio/mpeg")},
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.content
+    assert await storage.get_file_size("a/b.mp3") == 4
+
+
+async def test_file_upload_above_max_size_returns_400(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    upload_form = await storage.generate_upload_form(
+        "a/b.mp3", content_type="audio/mpeg", max_size=3
+    )
+
+    response = await simple_client.post(
+        upload_form.url,
+        data=upload_form.fields,
+        files={"file": ("b.mp3", b"data", "audio/mpeg")},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.content
+    assert await storage.get_file_size("a/b.mp3") is None
+
+
+async def test_file_routes_without_filesystem_backend_return_404(
+    simple_client: AsyncClient, storage: FileSystemStorage
+):
+    url = await storage.generate_expiring_url("a/b.mp3")
+
+    with mock.patch.object(settings, "STORAGE_BACKEND", "s3"):
+        response = await simple_client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.content
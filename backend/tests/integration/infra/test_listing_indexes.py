@@ -0,0 +1,55 @@
+import uuid
+
+import pytest
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.utils import timezone_now
+
+
+async def explain(pg_session: AsyncSession, query: str) -> str:
+    # Tables are near empty in tests, where a sequential scan always wins
+    await pg_session.exec(text("SET LOCAL enable_seqscan = off"))  # ty: ignore[no-matching-overload]
+    result = await pg_session.exec(  # ty: ignore[no-matching-overload]
+        text(f"EXPLAIN {query}"),
+        params={
+            "track_id": uuid.uuid4(),
+            "created_at": timezone_now(),
+            "id": uuid.uuid4(),
+        },
+    )
+    return "\n".join(row[0] for row in result)
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (
+            "SELECT * FROM clip WHERE track_id = :track_id ORDER BY created_at DESC",
+            "ix_clip_track_id_created_at_id",
+        ),
+        (
+            "SELECT * FROM clip "
+            "WHERE track_id = :track_id AND (created_at, id) < (:created_at, :id) "
+            "ORDER BY created_at DESC, id DESC LIMIT 51",
+            "ix_clip_track_id_created_at_id",
+        ),
+        (
+            "SELECT * FROM clip WHERE (created_at, id) > (:created_at, :id) "
+            "ORDER BY created_at, id LIMIT 51",
+            "ix_clip_created_at_id",
+        ),
+        (
+            "SELECT * FROM track WHERE (created_at, id) > (:created_at, :id) "
+            "ORDER BY created_at, id LIMIT 51",
+            "ix_track_created_at_id",
+        ),
+    ],
+)
+async def test_listings_are_read_in_index_order(
+    pg_session: AsyncSession, query: str, index: str
+):
+    plan = await explain(pg_session, query)
+
+    assert index in plan
+    assert "Sort" not in plan
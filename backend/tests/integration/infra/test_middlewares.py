@@ -1,9 +1,15 @@
 import re
+import time
 
 from fastapi import FastAPI
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
 
+from jamflow.core.config import settings
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.api.deps import ReadOnlySessionDep
+from jamflow.infra.api.middlewares import READ_PRIMARY_HEADER
+from jamflow.infra.database import get_replica_session, get_session
 from tests.fixtures.log import AssertLogRecords
 
 
@@ -69,3 +75,107 @@ async def test_request_details_logged(
             ),
         ],
     )
+
+
+async def test_writes_make_client_read_from_primary(
+    app: FastAPI,
+    simple_client: AsyncClient,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(settings, "DB_REPLICA_HOST", "replica")
+
+    @app.post("/test-read-your-writes")
+    async def test_write():
+        return {"message": "Reads should go to the primary for a while"}
+
+    before = time.time()
+    response = await simple_client.post("/test-read-your-writes")
+
+    assert response.status_code == 200
+    read_primary_until = float(response.headers[READ_PRIMARY_HEADER])
+    assert read_primary_until >= before + settings.DB_REPLICA_LAG_WINDOW
+    assert read_primary_until <= time.time() + settings.DB_REPLICA_LAG_WINDOW + 1
+
+
+async def test_reads_and_failed_writes_keep_client_on_replica(
+    app: FastAPI,
+    simple_client: AsyncClient,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(settings, "DB_REPLICA_HOST", "replica")
+
+    @app.get("/test-read-on-replica")
+    async def test_read():
+        return {"message": "Reads should stay on the replica"}
+
+    @app.post("/test-failed-write")
+    async def test_failed_write():
+        raise ValidationError("Nothing written")
+
+    read_response = await simple_client.get("/test-read-on-replica")
+    write_response = await simple_client.post("/test-failed-write")
+
+    assert read_response.status_code == 200
+    assert write_response.status_code == 400
+    assert READ_PRIMARY_HEADER not in read_response.headers
+    assert READ_PRIMARY_HEADER not in write_response.headers
+
+
+async def test_writes_without_replica_send_no_header(
+    app: FastAPI,
+    simple_client: AsyncClient,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(settings, "DB_REPLICA_HOST", None)
+
+    @app.post("/test-write-without-replica")
+    async def test_write():
+        return {"message": "There is no replica to lag behind"}
+
+    response = await simple_client.post("/test-write-without-replica")
+
+    assert response.status_code == 200
+    assert READ_PRIMARY_HEADER not in response.headers
+
+
+async def test_read_only_session_follows_echoed_header_of_write(
+    app: FastAPI,
+    simple_client: AsyncClient,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(settings, "DB_REPLICA_HOST", "replica")
+    primary_session = mocker.Mock()
+    replica_session = mocker.Mock()
+
+    @app.post("/test-write")
+    async def test_write():
+        return {"message": "Written"}
+
+    @app.get("/test-read-only-session")
+    async def test_read(session: ReadOnlySessionDep):
+        return {"primary": session is primary_session}
+
+    app.dependency_overrides[get_session] = lambda: primary_session
+    app.dependency_overrides[get_replica_session] = lambda: replica_session
+    try:
+        before_write = await simple_client.get("/test-read-only-session")
+        write = await simple_client.post("/test-write")
+        after_write = await simple_client.get(
+            "/test-read-only-session",
+            headers={READ_PRIMARY_HEADER: write.headers[READ_PRIMARY_HEADER]},
+        )
+        expired = await simple_client.get(
+            "/test-read-only-session",
+            headers={READ_PRIMARY_HEADER: str(int(time.time()) - 1)},
+        )
+        malformed = await simple_client.get(
+            "/test-read-only-session",
+            headers={READ_PRIMARY_HEADER: "soon"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert before_write.json() == {"primary": False}
+    assert after_write.json() == {"primary": True}
+    assert expired.json() == {"primary": False}
+    assert malformed.json() == {"primary": False}
@@ -76,6 +76,19 @@ async def test_get_file_for_missing_key_raises_storage_exception(
         await s3_storage.get_file(path="nonexistent.txt")
 
 
+async def test_delete_file_removes_file_and_tolerates_missing_file(
+    s3_storage: S3StorageService,
+    s3_client: S3Client,
+):
+    path = "test/test-file.txt"
+    await s3_client.put_object(Bucket=TEST_BUCKET_NAME, Key=path, Body=b"content")
+
+    await s3_storage.delete_file(path)
+    await s3_storage.delete_file(path)
+
+    assert await s3_storage.get_file_size(path) is None
+
+
 async def test_purge_bucket_removes_all_content(
     s3_storage: S3StorageService,
     s3_client: S3Client,
@@ -105,6 +118,20 @@ async def test_purge_bucket_removes_all_content(
     assert "Contents" not in response
 
 
+async def test_purge_with_prefix_removes_only_matching_files(
+    s3_storage: S3StorageService,
+    s3_client: S3Client,
+):
+    for path in ("tracks/a/1.mp3", "tracks/a/2.mp3", "tracks/b/1.mp3"):
+        await s3_storage.store_file(b"content", path=path, content_type="audio/mpeg")
+
+    deleted = await s3_storage.purge("tracks/a/")
+
+    assert deleted == 2
+    response = await s3_client.list_objects_v2(Bucket=TEST_BUCKET_NAME)
+    assert [obj["Key"] for obj in response["Contents"]] == ["tracks/b/1.mp3"]
+
+
 async def test_generate_presigned_url_returns_valid_url(s3_storage: S3StorageService):
     await s3_storage.store_file(
         b"test content",
@@ -1,3 +1,4 @@
+import json
 import uuid
 from pathlib import Path
 
@@ -108,7 +109,7 @@ async def test_track_create_with_invalid_file_format_returns_422(
     assert response_data["details"][0]["field"] == "upload_file"
     assert (
         response_data["details"][0]["message"]
-        == "Value error, Unsupported file format. Supported formats: mp3, wav, ogg"
+        == "Unsupported file format. Supported formats: mp3, wav, ogg"
     )
 
 
@@ -210,4 +211,115 @@ async def test_track_create_with_empty_file_returns_422(
     response_data = response.json()
     assert len(response_data["details"]) == 1
     assert response_data["details"][0]["field"] == "upload_file"
-    assert response_data["details"][0]["message"] == "Value error, File is empty"
+    assert response_data["details"][0]["message"] == "File is empty"
+
+
+async def test_track_list_with_limit_pages_through_tracks(
+    client: AsyncClient,
+    track_1: TrackReadDto,
+    track_2: TrackReadDto,
+    track_3: TrackReadDto,
+):
+    response = await client.get("/api/v1/tracks", params={"limit": 2})
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert [t["id"] for t in response.json()] == [str(track_1.id), str(track_2.id)]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/api/v1/tracks", params={"limit": 2, "cursor": cursor})
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert [t["id"] for t in response.json()] == [str(track_3.id)]
+    assert "X-Next-Cursor" not in response.headers
+
+
+async def test_track_list_accepting_ndjson_streams_all_tracks(
+    client: AsyncClient,
+    track_1: TrackReadDto,
+    track_2: TrackReadDto,
+    track_3: TrackReadDto,
+):
+    response = await client.get(
+        "/api/v1/tracks",
+        params={"limit": 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    tracks = [json.loads(line) for line in response.text.splitlines()]
+    assert [t["id"] for t in tracks] == [
+        str(track_1.id),
+        str(track_2.id),
+        str(track_3.id),
+    ]
+    assert tracks[0]["url"].startswith(("http://", "https://"))
+    assert "X-Next-Cursor" not in response.headers
+
+
+async def test_track_list_with_invalid_cursor_returns_400(client: AsyncClient):
+    response = await client.get("/api/v1/tracks", params={"cursor": "invalid"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.content
+    assert response.json()["details"][0]["field"] == "cursor"
+
+
+async def test_track_upload_start_returns_upload_form(client: AsyncClient):
+    response = await client.post("/api/v1/tracks/uploads", json={"format": "mp3"})
+    assert response.status_code == status.HTTP_201_CREATED, response.content
+    response_data = response.json()
+    assert set(response_data.keys()) == {"upload_id", "url", "fields", "expires_at"}
+    assert response_data["url"].startswith(("http://", "https://"))
+    assert response_data["fields"]["key"] == response_data["upload_id"]
+    assert response_data["fields"]["Content-Type"] == "audio/mpeg"
+
+
+async def test_track_upload_finish_after_direct_upload_creates_track(
+    client: AsyncClient,
+    track_data,
+    mp3_file: Path,
+    count_rows,
+):
+    response = await client.post("/api/v1/tracks/uploads", json={"format": "mp3"})
+    assert response.status_code == status.HTTP_201_CREATED, response.content
+    track_upload = response.json()
+
+    async with AsyncClient() as storage_client:
+        response = await storage_client.post(
+            track_upload["url"],
+            data=track_upload["fields"],
+            files={"file": ("dummy.mp3", mp3_file.read_bytes(), "audio/mpeg")},
+        )
+    assert response.is_success, response.content
+
+    response = await client.post(
+        "/api/v1/tracks/uploads/finish",
+        json=track_data | {"upload_id": track_upload["upload_id"]},
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.content
+    response_data = response.json()
+    assert response_data["title"] == track_data["title"]
+    assert response_data["format"] == "mp3"
+    assert 2400 <= response_data["duration"] <= 2600
+    assert await count_rows(Track) == 1
+
+
+async def test_track_upload_finish_without_upload_returns_404(
+    client: AsyncClient,
+    track_data,
+):
+    response = await client.post("/api/v1/tracks/uploads", json={"format": "mp3"})
+    upload_id = response.json()["upload_id"]
+
+    response = await client.post(
+        "/api/v1/tracks/uploads/finish", json=track_data | {"upload_id": upload_id}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.content
+
+
+async def test_track_upload_finish_with_invalid_upload_id_returns_400(
+    client: AsyncClient,
+    track_data,
+):
+    response = await client.post(
+        "/api/v1/tracks/uploads/finish",
+        json=track_data | {"upload_id": "../secret.mp3"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.content
+    assert response.json()["details"][0]["field"] == "upload_id"
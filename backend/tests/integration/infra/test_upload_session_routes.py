@@ -0,0 +1,124 @@
+import base64
+from pathlib import Path
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from jamflow.recordings.models import Track, UploadSession
+
+pytestmark = pytest.mark.usefixtures("audio_storage_isolation")
+
+TUS_HEADERS = {"Tus-Resumable": "1.0.0"}
+
+
+def encode_metadata(**fields: str) -> str:
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}"
+        for key, value in fields.items()
+    )
+
+
+@pytest.fixture
+def mp3_data(mp3_file: Path) -> bytes:
+    return mp3_file.read_bytes()
+
+
+@pytest.fixture
+async def upload_url(client: AsyncClient, mp3_data: bytes) -> str:
+    response = await client.post(
+        "/api/v1/tracks/resumable-uploads",
+        headers=TUS_HEADERS
+        | {
+            "Upload-Length": str(len(mp3_data)),
+            "Upload-Metadata": encode_metadata(
+                title="Test Track", recorded_date="2021-02-03"
+            ),
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.content
+    return response.headers["Location"]
+
+
+def chunk_headers(offset: int) -> dict[str, str]:
+    return TUS_HEADERS | {
+        "Upload-Offset": str(offset),
+        "Content-Type": "application/offset+octet-stream",
+    }
+
+
+async def test_upload_session_options_lists_extensions(client: AsyncClient):
+    response = await client.options("/api/v1/tracks/resumable-uploads")
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.content
+    assert response.headers["Tus-Version"] == "1.0.0"
+    assert response.headers["Tus-Extension"] == "creation,expiration,termination"
+
+
+async def test_upload_session_create_returns_session_at_offset_zero(
+    client: AsyncClient, upload_url: str, mp3_data: bytes
+):
+    response = await client.head(upload_url, headers=TUS_HEADERS)
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.headers["Upload-Offset"] == "0"
+    assert response.headers["Upload-Length"] == str(len(mp3_data))
+    assert response.headers["Upload-Expires"].endswith("GMT")
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+async def test_upload_session_create_with_invalid_metadata_returns_400(
+    client: AsyncClient,
+):
+    response = await client.post(
+        "/api/v1/tracks/resumable-uploads",
+        headers=TUS_HEADERS
+        | {"Upload-Length": "1000", "Upload-Metadata": "title not-base64!"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.content
+    assert response.json()["details"][0]["field"] == "Upload-Metadata"
+
+
+async def test_upload_session_append_last_chunk_creates_track(
+    client: AsyncClient, upload_url: str, mp3_data: bytes, count_rows
+):
+    response = await client.patch(
+        upload_url, headers=chunk_headers(0), content=mp3_data
+    )
+    assert response.status_code == status.HTTP_200_OK, response.content
+    assert response.headers["Upload-Offset"] == str(len(mp3_data))
+    response_data = response.json()
+    assert response_data["title"] == "Test Track"
+    assert response_data["format"] == "mp3"
+    assert 2400 <= response_data["duration"] <= 2600
+    assert await count_rows(Track) == 1
+    assert await count_rows(UploadSession) == 0
+
+
+async def test_upload_session_append_at_wrong_offset_returns_409(
+    client: AsyncClient, upload_url: str, mp3_data: bytes
+):
+    response = await client.patch(
+        upload_url, headers=chunk_headers(100), content=mp3_data[100:]
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT, response.content
+
+
+async def test_upload_session_append_without_chunk_content_type_returns_400(
+    client: AsyncClient, upload_url: str, mp3_data: bytes
+):
+    response = await client.patch(
+        upload_url,
+        headers=chunk_headers(0) | {"Content-Type": "audio/mpeg"},
+        content=mp3_data,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.content
+
+
+async def test_upload_session_delete_removes_session(
+    client: AsyncClient, upload_url: str, count_rows
+):
+    response = await client.delete(upload_url, headers=TUS_HEADERS)
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.content
+    assert await count_rows(UploadSession) == 0
+
+    response = await client.head(upload_url, headers=TUS_HEADERS)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
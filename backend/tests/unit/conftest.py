@@ -1,4 +1,7 @@
-from typing import AsyncGenerator
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock
 
 import pytest
@@ -12,7 +15,9 @@ from tests.unit.fakes import (
     FakeAudioProcessor,
     FakeAudioStorage,
     FakeClipRepository,
+    FakeDirectUploadRepository,
     FakeTrackRepository,
+    FakeUploadSessionRepository,
 )
 
 
@@ -70,6 +75,16 @@ def fake_track_repo() -> FakeTrackRepository:
     return FakeTrackRepository()
 
 
+@pytest.fixture
+def fake_upload_session_repo() -> FakeUploadSessionRepository:
+    return FakeUploadSessionRepository()
+
+
+@pytest.fixture
+def fake_direct_upload_repo() -> FakeDirectUploadRepository:
+    return FakeDirectUploadRepository()
+
+
 @pytest.fixture
 def fake_audio_storage() -> FakeAudioStorage:
     return FakeAudioStorage()
@@ -78,3 +93,64 @@ def fake_audio_storage() -> FakeAudioStorage:
 @pytest.fixture
 def fake_audio_processor() -> FakeAudioProcessor:
     return FakeAudioProcessor()
+
+
+class RangeServer:
+    """
+    HTTP server serving files with support for range requests, recording the
+    ranges requested.
+    """
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.requested_ranges: list[tuple[int, int]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/{path}"
+
+    def start(self) -> None:
+        threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        ).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                data = server.files.get(self.path.lstrip("/"))
+                if data is None:
+                    self.send_error(404)
+                    return
+                match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers["Range"] or "")
+                if match is None:
+                    self.send_response(200)
+                else:
+                    start, end = int(match[1]), int(match[2]) + 1
+                    server.requested_ranges.append((start, end))
+                    data = data[start:end]
+                    self.send_response(206)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def range_server() -> Generator[RangeServer]:
+    server = RangeServer()
+    server.start()
+    yield server
+    server.stop()
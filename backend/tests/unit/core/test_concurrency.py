@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from jamflow.core.concurrency import SingleFlight
+
+
+async def test_single_flight_shares_concurrent_calls():
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.create_task(single_flight.do("key", fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42, 42, 42]
+    assert calls == 1
+    assert "key" not in single_flight
+
+
+async def test_single_flight_runs_again_after_completion():
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    results = iter([1, 2])
+
+    async def fn() -> int:
+        return next(results)
+
+    assert await single_flight.do("key", fn) == 1
+    assert await single_flight.do("key", fn) == 2
+
+
+async def test_single_flight_shares_errors():
+    single_flight: SingleFlight[str, int] = SingleFlight()
+
+    async def fn() -> int:
+        await asyncio.sleep(0)
+        raise ValueError("failed")
+
+    waiters = [asyncio.create_task(single_flight.do("key", fn)) for _ in range(2)]
+
+    for waiter in waiters:
+        with pytest.raises(ValueError, match="failed"):
+            await waiter
+
+
+async def test_single_flight_keeps_running_when_caller_is_cancelled():
+    single_flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        await release.wait()
+        return 42
+
+    cancelled = asyncio.create_task(single_flight.do("key", fn))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    waiter = asyncio.create_task(single_flight.do("key", fn))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == 42
+    assert cancelled.cancelled()
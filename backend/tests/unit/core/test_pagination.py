@@ -0,0 +1,31 @@
+import base64
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.core.pagination import Cursor
+
+
+def test_cursor_survives_encoding():
+    cursor = Cursor(created_at=datetime(2025, 10, 17, 12, tzinfo=UTC), id=uuid.uuid4())
+
+    assert Cursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not a cursor", "bm90IGEgY3Vyc29y"])
+def test_cursor_decode_with_invalid_token_raises_validation_error(token: str):
+    with pytest.raises(ValidationError) as exc_info:
+        Cursor.decode(token)
+
+    assert exc_info.value.field == "cursor"
+
+
+def test_cursor_decode_with_naive_datetime_raises_validation_error():
+    token = base64.urlsafe_b64encode(f"2024-01-01T00:00:00|{uuid.uuid4()}".encode())
+
+    with pytest.raises(ValidationError) as exc_info:
+        Cursor.decode(token.decode())
+
+    assert exc_info.value.field == "cursor"
@@ -0,0 +1,107 @@
+import io
+from collections.abc import AsyncIterator
+
+import pytest
+
+from jamflow.core.streams import EdgeBuffer, prepend, read_at_least, rechunk
+
+
+async def iter_chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+async def test_read_at_least_stops_once_size_is_reached():
+    chunks = iter_chunks(b"ab", b"cd", b"ef")
+
+    assert await read_at_least(chunks, 3) == b"abcd"
+    assert await collect(chunks) == [b"ef"]
+
+
+async def test_read_at_least_returns_what_there_is_when_chunks_run_out():
+    assert await read_at_least(iter_chunks(b"ab"), 3) == b"ab"
+
+
+async def test_prepend_puts_data_in_front_of_remaining_chunks():
+    chunks = iter_chunks(b"ab", b"cd", b"ef")
+    head = await read_at_least(chunks, 1)
+
+    assert await collect(prepend(head, chunks)) == [b"ab", b"cd", b"ef"]
+
+
+async def test_rechunk_regroups_chunks_into_blocks():
+    chunks = iter_chunks(b"a", b"bcdefg", b"", b"hi")
+
+    assert await collect(rechunk(chunks, 3)) == [b"abc", b"def", b"ghi"]
+
+
+async def test_rechunk_yields_smaller_last_block():
+    assert await collect(rechunk(iter_chunks(b"abcd"), 3)) == [b"abc", b"d"]
+
+
+@pytest.fixture
+def data() -> bytes:
+    return bytes(range(256)) * 4
+
+
+@pytest.fixture
+def edge_buffer(data: bytes) -> EdgeBuffer:
+    edge_buffer = EdgeBuffer(head_size=100, tail_size=50)
+    for offset in range(0, len(data), 7):
+        edge_buffer.feed(data[offset : offset + 7])
+    return edge_buffer
+
+
+class CountingFile(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size: int | None = -1, /) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_edge_buffer_counts_size(edge_buffer: EdgeBuffer, data: bytes):
+    assert edge_buffer.size == len(data)
+
+
+def test_edge_buffer_serves_edges_without_fallback(
+    edge_buffer: EdgeBuffer, data: bytes
+):
+    fallback = CountingFile(data)
+
+    with edge_buffer.open(fallback) as file:
+        head = file.read(100)
+        file.seek(-50, io.SEEK_END)
+        tail = file.read()
+
+    assert head == data[:100]
+    assert tail == data[-50:]
+    assert fallback.reads == 0
+
+
+def test_edge_buffer_reads_between_edges_from_fallback(
+    edge_buffer: EdgeBuffer, data: bytes
+):
+    fallback = CountingFile(data)
+
+    with edge_buffer.open(fallback) as file:
+        whole = file.read()
+
+    assert whole == data
+    assert fallback.reads > 0
+
+
+def test_edge_buffer_keeps_short_stream_whole():
+    edge_buffer = EdgeBuffer(head_size=100, tail_size=50)
+    edge_buffer.feed(b"short")
+    fallback = CountingFile(b"")
+
+    with edge_buffer.open(fallback) as file:
+        assert file.read() == b"short"
+    assert fallback.reads == 0
@@ -1,7 +1,7 @@
 from polyfactory.decorators import post_generated
 from polyfactory.factories.pydantic_factory import ModelFactory
 
-from jamflow.recordings.models import AudioFileFormat, Clip, Track
+from jamflow.recordings.models import AudioFileFormat, Clip, ClipStatus, Track
 from jamflow.recordings.schemas import ClipCreateDto
 
 
@@ -25,6 +25,7 @@ class TrackFactory(ModelFactory[Track]):
 
 class ClipFactory(ModelFactory[Clip]):
     start = 1_000
+    status = ClipStatus.READY
 
     @post_generated
     @classmethod
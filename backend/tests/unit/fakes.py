@@ -1,11 +1,23 @@
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
 from io import BytesIO
 from types import TracebackType
 from typing import BinaryIO, Literal, Self, Sequence
 
-from jamflow.core.exceptions import StorageError
+from jamflow.core.exceptions import ConcurrentModificationError, StorageError
+from jamflow.core.pagination import Cursor, Page
+from jamflow.core.utils import timezone_now
 from jamflow.infra.database.models import BaseSQLModel
-from jamflow.recordings.models import AudioFileFormat, Clip, Track
+from jamflow.recordings.models import (
+    AudioFileFormat,
+    Clip,
+    ClipStatus,
+    DirectUpload,
+    Track,
+    UploadSession,
+)
+from jamflow.recordings.protocols import UploadForm
 
 
 class FakeBaseRepository[M: BaseSQLModel]:
@@ -22,18 +34,120 @@ class FakeBaseRepository[M: BaseSQLModel]:
     async def list_all(self) -> Sequence[M]:
         return list(self.models.values())
 
+    async def list_page(self, *, limit: int, cursor: Cursor | None = None) -> Page[M]:
+        return self._paginate(list(self.models.values()), limit, cursor)
+
+    async def iter_batches(self, *, batch_size: int) -> AsyncIterator[Sequence[M]]:
+        models = sorted(self.models.values(), key=lambda m: (m.created_at, m.id))
+        for start in range(0, len(models), batch_size):
+            yield models[start : start + batch_size]
+
     async def list_by_ids(self, ids: list[uuid.UUID]) -> Sequence[M]:
         return [m for (i, m) in self.models.items() if i in ids]
 
+    @staticmethod
+    def _paginate(
+        models: list[M],
+        limit: int,
+        cursor: Cursor | None,
+        descending: bool = False,
+    ) -> Page[M]:
+        models.sort(key=lambda m: (m.created_at, m.id), reverse=descending)
+        if cursor is not None:
+            position = (cursor.created_at, cursor.id)
+            models = [
+                m
+                for m in models
+                if (
+                    (m.created_at, m.id) < position
+                    if descending
+                    else (m.created_at, m.id) > position
+                )
+            ]
+        if len(models) <= limit:
+            return Page(items=models)
+        last = models[limit - 1]
+        return Page(
+            items=models[:limit],
+            next_cursor=Cursor(created_at=last.created_at, id=last.id),
+        )
+
 
 class FakeTrackRepository(FakeBaseRepository[Track]):
     pass
 
 
+class FakeUploadSessionRepository(FakeBaseRepository[UploadSession]):
+    async def save(self, upload_session: UploadSession) -> None:
+        self.models[upload_session.id] = upload_session
+
+    async def delete(self, upload_session: UploadSession) -> None:
+        self.models.pop(upload_session.id, None)
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[UploadSession]:
+        stale = [m for m in self.models.values() if m.updated_at < updated_before]
+        stale.sort(key=lambda m: m.updated_at)
+        return stale[:limit]
+
+
+class FakeDirectUploadRepository(FakeBaseRepository[DirectUpload]):
+    async def delete(self, direct_upload: DirectUpload) -> None:
+        if self.models.pop(direct_upload.id, None) is None:
+            raise ConcurrentModificationError("Direct upload was deleted concurrently")
+
+    async def list_stale(
+        self, *, updated_before: datetime, limit: int
+    ) -> Sequence[DirectUpload]:
+        stale = [m for m in self.models.values() if m.updated_at < updated_before]
+        stale.sort(key=lambda m: m.updated_at)
+        return stale[:limit]
+
+
 class FakeClipRepository(FakeBaseRepository[Clip]):
     async def list_by_track_id(self, track_id: uuid.UUID) -> Sequence[Clip]:
         return [c for c in self.models.values() if c.track_id == track_id]
 
+    async def find_ready_by_path(self, track_id: uuid.UUID, path: str) -> Clip | None:
+        for clip in self.models.values():
+            if (
+                clip.track_id == track_id
+                and clip.path == path
+                and clip.status == ClipStatus.READY
+            ):
+                return clip
+        return None
+
+    async def claim_next_pending(self) -> Clip | None:
+        now = timezone_now()
+        pending = [
+            c
+            for c in self.models.values()
+            if c.status == ClipStatus.PENDING
+            or (
+                c.status == ClipStatus.RENDERING
+                and c.leased_until is not None
+                and c.leased_until < now
+            )
+        ]
+        pending.sort(key=lambda c: c.created_at)
+        return pending[0] if pending else None
+
+    async def list_page_by_track_id(
+        self, track_id: uuid.UUID, *, limit: int, cursor: Cursor | None = None
+    ) -> Page[Clip]:
+        clips = [c for c in self.models.values() if c.track_id == track_id]
+        return self._paginate(clips, limit, cursor, descending=True)
+
+    async def iter_batches_by_track_id(
+        self, track_id: uuid.UUID, *, batch_size: int
+    ) -> AsyncIterator[Sequence[Clip]]:
+        clips = [c for c in self.models.values() if c.track_id == track_id]
+        clips.sort(key=lambda c: (c.created_at, c.id), reverse=True)
+        for start in range(0, len(clips), batch_size):
+            yield clips[start : start + batch_size]
+
 
 class FakeAudioProcessor:
     def __init__(
@@ -62,7 +176,7 @@ class FakeAudioProcessor:
         self._maybe_fail("get_size")
         return self.size
 
-    def clip(
+    async def clip(
         self, file: BinaryIO, file_format: AudioFileFormat, *, start: int, end: int
     ) -> BinaryIO:
         self._maybe_fail("clip")
@@ -87,6 +201,7 @@ class FakeAudioProcessor:
 class FakeAudioStorage:
     def __init__(self):
         self.files: dict[str, BinaryIO] = {}
+        self.multipart_uploads: dict[str, dict[int, bytes]] = {}
         self._checkpoint: set[str] = set()
 
     async def __aenter__(self) -> Self:
@@ -111,15 +226,96 @@ class FakeAudioStorage:
             file = BytesIO(file)
         self.files[path] = file
 
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        *,
+        path: str,
+        content_type: str,
+    ) -> None:
+        data = b"".join([chunk async for chunk in chunks])
+        self.files[path] = BytesIO(data)
+
+    async def start_multipart_upload(self, path: str, *, content_type: str) -> str:
+        upload_id = f"{path}:{uuid.uuid4()}"
+        self.multipart_uploads[upload_id] = {}
+        return upload_id
+
+    async def upload_part(
+        self, path: str, *, upload_id: str, number: int, data: bytes
+    ) -> str:
+        if upload_id not in self.multipart_uploads:
+            raise StorageError(f"Unable to upload part: Invalid {upload_id=}")
+        self.multipart_uploads[upload_id][number] = data
+        return f"tag-{number}-{len(data)}"
+
+    async def complete_multipart_upload(
+        self, path: str, *, upload_id: str, part_tags: Sequence[str]
+    ) -> None:
+        if upload_id not in self.multipart_uploads:
+            raise StorageError(f"Unable to complete upload: Invalid {upload_id=}")
+        parts = self.multipart_uploads.pop(upload_id)
+        numbers = range(1, len(part_tags) + 1)
+        self.files[path] = BytesIO(b"".join(parts[number] for number in numbers))
+
+    async def abort_multipart_upload(self, path: str, *, upload_id: str) -> None:
+        self.multipart_uploads.pop(upload_id, None)
+
+    async def delete_file(self, path: str) -> None:
+        self.files.pop(path, None)
+
     async def get_file(self, path: str) -> BinaryIO:
         if path not in self.files:
             raise StorageError(f"Unable to retrieve file: Invalid {path=}")
 
         return self.files[path]
 
+    async def download_file(self, path: str, file: BinaryIO) -> None:
+        source = await self.get_file(path)
+        source.seek(0)
+        file.write(source.read())
+        file.flush()
+        source.seek(0)
+
+    async def get_range(self, path: str, start_byte: int, end_byte: int) -> bytes:
+        file = await self.get_file(path)
+        file.seek(start_byte)
+        data = file.read(end_byte - start_byte)
+        file.seek(0)
+        return data
+
+    async def open_file(self, path: str, size: int | None = None) -> BinaryIO:
+        return await self.get_file(path)
+
+    async def get_file_size(self, path: str) -> int | None:
+        if path not in self.files:
+            return None
+        file = self.files[path]
+        size = file.seek(0, 2)
+        file.seek(0)
+        return size
+
     async def generate_expiring_url(self, path: str, expiration: int = 3600) -> str:
         return f"http://bogus.url{path}?expiration={expiration}"
 
+    async def generate_expiring_urls(
+        self, paths: Sequence[str], expiration: int = 3600
+    ) -> list[str]:
+        return [await self.generate_expiring_url(path, expiration) for path in paths]
+
+    async def generate_upload_form(
+        self,
+        path: str,
+        *,
+        content_type: str,
+        max_size: int,
+        expiration: int = 3600,
+    ) -> UploadForm:
+        return UploadForm(
+            url="http://bogus.url/upload",
+            fields={"key": path, "Content-Type": content_type},
+        )
+
     def checkpoint(self) -> Self:
         """
         Store the current state of files in the storage for to exclude them from a later `new_files` call.
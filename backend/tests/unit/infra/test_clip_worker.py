@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest_mock import MockerFixture
+
+from jamflow.infra.jobs import ClipWorkerPool
+
+
+def make_pool(
+    mocker: MockerFixture, results: list, poll_interval: float = 60
+) -> tuple[ClipWorkerPool, AsyncMock]:
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__ = AsyncMock()
+    session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    build = mocker.patch("jamflow.infra.jobs.clip_worker.build_render_clip")
+    build.return_value.execute = AsyncMock(side_effect=results)
+    pool = ClipWorkerPool(
+        workers=1, poll_interval=poll_interval, session_factory=session_factory
+    )
+    return pool, build.return_value.execute
+
+
+async def test_run_once_reports_whether_a_clip_was_rendered(mocker: MockerFixture):
+    pool, execute = make_pool(mocker, ["clip-id", None])
+
+    assert await pool.run_once() is True
+    assert await pool.run_once() is False
+    assert execute.await_count == 2
+
+
+async def test_worker_drains_queue_and_survives_errors(mocker: MockerFixture):
+    results = [RuntimeError("boom"), "clip-1", "clip-2", None]
+    pool, execute = make_pool(mocker, results, poll_interval=0)
+
+    pool.start()
+    while execute.await_count < len(results):
+        await asyncio.sleep(0)
+    await pool.stop()
+
+    assert execute.await_count == len(results)
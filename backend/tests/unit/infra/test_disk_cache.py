@@ -0,0 +1,198 @@
+import asyncio
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jamflow.infra.storage.disk_cache import DiskCache, DiskCachedAudioStorage
+from tests.unit.fakes import FakeAudioStorage
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DiskCache:
+    return DiskCache(tmp_path, max_size=10)
+
+
+def fetcher(data: bytes):
+    calls = []
+
+    async def fetch(file: BinaryIO):
+        calls.append(file.name)
+        await asyncio.sleep(0)
+        file.write(data)
+
+    return fetch, calls
+
+
+async def wait_for_entry(cache: DiskCache, path: str) -> BinaryIO:
+    async with asyncio.timeout(1):
+        while (file := cache.open(path)) is None:
+            await asyncio.sleep(0.01)
+    return file
+
+
+async def test_get_or_fill_fetches_only_on_miss(cache: DiskCache):
+    fetch, calls = fetcher(b"track")
+
+    with await cache.get_or_fill("a", fetch) as first:
+        assert first.read() == b"track"
+    with await cache.get_or_fill("a", fetch) as second:
+        assert second.read() == b"track"
+
+    assert len(calls) == 1
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+async def test_get_or_fill_shares_concurrent_misses(cache: DiskCache):
+    fetch, calls = fetcher(b"track")
+
+    files = await asyncio.gather(*(cache.get_or_fill("a", fetch) for _ in range(3)))
+
+    for file in files:
+        with file:
+            assert file.read() == b"track"
+    assert len(calls) == 1
+
+
+async def test_evicts_least_recently_used_entries(cache: DiskCache):
+    for path in ("a", "b"):
+        fetch, _ = fetcher(path.encode() * 4)
+        (await cache.get_or_fill(path, fetch)).close()
+    # use "a" so that "b" is evicted first
+    used = cache.open("a")
+    assert used is not None
+    used.close()
+
+    fetch, _ = fetcher(b"cccc")
+    (await cache.get_or_fill("c", fetch)).close()
+
+    assert cache.open("b") is None
+    assert cache.info().size == 8
+    assert cache.info().entries == 2
+
+
+async def test_keeps_entry_larger_than_budget_until_next_fill(cache: DiskCache):
+    fetch, _ = fetcher(b"x" * 20)
+    (await cache.get_or_fill("big", fetch)).close()
+
+    assert cache.info().entries == 1
+
+    fetch, _ = fetcher(b"small")
+    (await cache.get_or_fill("small", fetch)).close()
+
+    assert cache.open("big") is None
+
+
+async def test_fill_downloads_into_cache_directory(cache: DiskCache, tmp_path: Path):
+    fetch, calls = fetcher(b"track")
+
+    (await cache.get_or_fill("a", fetch)).close()
+
+    assert Path(calls[0]).parent == tmp_path
+    assert [file.read_bytes() for file in tmp_path.iterdir()] == [b"track"]
+
+
+async def test_failed_fill_leaves_no_entry(cache: DiskCache, tmp_path: Path):
+    async def fetch(file: BinaryIO):
+        file.write(b"tra")
+        raise OSError("network down")
+
+    with pytest.raises(OSError, match="network down"):
+        await cache.get_or_fill("a", fetch)
+
+    assert cache.info().entries == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_rebuilds_index_from_directory(cache: DiskCache, tmp_path: Path):
+    fetch, calls = fetcher(b"track")
+    (await cache.get_or_fill("a", fetch)).close()
+    (tmp_path / "leftover.partial").write_bytes(b"partial")
+
+    reloaded = DiskCache(tmp_path, max_size=10)
+
+    with await reloaded.get_or_fill("a", fetch) as file:
+        assert file.read() == b"track"
+    assert len(calls) == 1
+    assert not (tmp_path / "leftover.partial").exists()
+
+
+async def test_get_or_fill_in_background_opens_cached_copy_once_filled(
+    cache: DiskCache,
+):
+    fetch, calls = fetcher(b"track")
+
+    assert cache.get_or_fill_in_background("a", fetch) is None
+    assert cache.get_or_fill_in_background("a", fetch) is None
+    with await wait_for_entry(cache, "a"):
+        pass
+    cached = cache.get_or_fill_in_background("a", fetch)
+
+    assert cached is not None
+    with cached:
+        assert cached.read() == b"track"
+    assert len(calls) == 1
+    assert cache.info().hits == 1
+    assert cache.info().misses == 2
+
+
+async def test_get_or_fill_in_background_skips_files_beyond_budget(
+    cache: DiskCache,
+):
+    fetch, calls = fetcher(b"x" * 20)
+
+    assert cache.get_or_fill_in_background("big", fetch, size=20) is None
+    await asyncio.sleep(0.05)
+
+    assert calls == []
+    assert cache.info().entries == 0
+
+
+async def test_failed_background_fill_leaves_no_entry(cache: DiskCache, tmp_path: Path):
+    async def fetch(file: BinaryIO):
+        file.write(b"tra")
+        raise OSError("network down")
+
+    assert cache.get_or_fill_in_background("a", fetch) is None
+    await asyncio.sleep(0.05)
+
+    assert cache.info().entries == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_cached_audio_storage_reads_through_cache(
+    cache: DiskCache,
+    fake_audio_storage: FakeAudioStorage,
+    mocker: MockerFixture,
+):
+    await fake_audio_storage.store_file(b"track", path="a", content_type="a/b")
+    download_file = mocker.spy(fake_audio_storage, "download_file")
+    storage = DiskCachedAudioStorage(fake_audio_storage, cache)
+
+    async with storage:
+        (await storage.get_file("a")).close()
+        (await storage.get_file("a")).close()
+        assert await storage.get_range("a", 1, 3) == b"ra"
+
+    assert download_file.call_count == 1
+
+
+async def test_cached_audio_storage_opens_uncached_file_in_wrapped_storage(
+    cache: DiskCache,
+    fake_audio_storage: FakeAudioStorage,
+    mocker: MockerFixture,
+):
+    await fake_audio_storage.store_file(b"track", path="a", content_type="a/b")
+    open_file = mocker.spy(fake_audio_storage, "open_file")
+    storage = DiskCachedAudioStorage(fake_audio_storage, cache)
+
+    async with storage:
+        # The fake storage hands out its own file, which mustn't be closed
+        assert (await storage.open_file("a", size=5)).read() == b"track"
+        (await wait_for_entry(cache, "a")).close()
+        with await storage.open_file("a", size=5) as file:
+            assert file.read() == b"track"
+
+    open_file.assert_called_once_with("a", 5)
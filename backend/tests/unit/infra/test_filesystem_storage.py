@@ -0,0 +1,197 @@
+import io
+from collections.abc import AsyncIterator
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from jamflow.core.exceptions import AuthorizationError, StorageError
+from jamflow.infra.storage.filesystem import FileSystemStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> FileSystemStorage:
+    return FileSystemStorage(
+        tmp_path, base_url="http://test/api/v1/files", secret_key="secret"
+    )
+
+
+async def iter_chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_store_file_and_get_file_returns_file_on_disk(
+    storage: FileSystemStorage, tmp_path: Path
+):
+    async with storage:
+        await storage.store_file(
+            io.BytesIO(b"data"), path="tracks/a/b.mp3", content_type="a/b"
+        )
+        with await storage.get_file("tracks/a/b.mp3") as file:
+            assert file.read() == b"data"
+            assert file.name == str(tmp_path / "tracks/a/b.mp3")
+
+
+async def test_store_stream_leaves_nothing_behind_on_failing_chunks(
+    storage: FileSystemStorage, tmp_path: Path
+):
+    async def failing_chunks() -> AsyncIterator[bytes]:
+        yield b"data"
+        raise ConnectionError("Client disconnected")
+
+    with pytest.raises(ConnectionError):
+        await storage.store_stream(failing_chunks(), path="a/b.mp3", content_type="a/b")
+
+    assert list((tmp_path / "a").iterdir()) == []
+    assert await storage.get_file_size("a/b.mp3") is None
+
+
+async def test_store_stream_replaces_existing_file(storage: FileSystemStorage):
+    await storage.store_file(b"old data", path="a.mp3", content_type="a/b")
+    await storage.store_stream(
+        iter_chunks(b"new ", b"data"), path="a.mp3", content_type="a/b"
+    )
+
+    assert await storage.get_range("a.mp3", 4, 8) == b"data"
+    assert await storage.get_file_size("a.mp3") == 8
+
+
+async def test_download_file_copies_file(storage: FileSystemStorage, tmp_path: Path):
+    await storage.store_file(b"data", path="a.mp3", content_type="a/b")
+
+    with open(tmp_path / "copy.mp3", "wb+") as file:
+        await storage.download_file("a.mp3", file)
+
+    assert (tmp_path / "copy.mp3").read_bytes() == b"data"
+
+
+async def test_get_file_of_missing_file_raises_storage_exception(
+    storage: FileSystemStorage,
+):
+    with pytest.raises(StorageError, match="Failed to get file"):
+        await storage.get_file("missing.mp3")
+
+
+@pytest.mark.parametrize(
+    "path", ["", "../secret.mp3", "/etc/passwd", "a/../../b.mp3", ".uploads/x"]
+)
+async def test_invalid_path_raises_storage_exception(
+    storage: FileSystemStorage, path: str
+):
+    with pytest.raises(StorageError, match="Invalid path"):
+        await storage.store_file(b"data", path=path, content_type="a/b")
+
+
+async def test_multipart_upload_joins_parts_in_order(storage: FileSystemStorage):
+    upload_id = await storage.start_multipart_upload("a.mp3", content_type="a/b")
+    tag_2 = await storage.upload_part(
+        "a.mp3", upload_id=upload_id, number=2, data=b"45"
+    )
+    tag_1 = await storage.upload_part(
+        "a.mp3", upload_id=upload_id, number=1, data=b"0123"
+    )
+
+    assert await storage.get_file_size("a.mp3") is None
+    await storage.complete_multipart_upload(
+        "a.mp3", upload_id=upload_id, part_tags=[tag_1, tag_2]
+    )
+
+    assert await storage.get_range("a.mp3", 0, 6) == b"012345"
+    with pytest.raises(StorageError, match="Failed to upload part"):
+        await storage.upload_part("a.mp3", upload_id=upload_id, number=3, data=b"6")
+
+
+async def test_complete_multipart_upload_with_wrong_tag_raises_storage_exception(
+    storage: FileSystemStorage,
+):
+    upload_id = await storage.start_multipart_upload("a.mp3", content_type="a/b")
+    await storage.upload_part("a.mp3", upload_id=upload_id, number=1, data=b"0123")
+
+    with pytest.raises(StorageError, match="Failed to complete multipart upload"):
+        await storage.complete_multipart_upload(
+            "a.mp3", upload_id=upload_id, part_tags=["wrong"]
+        )
+    assert await storage.get_file_size("a.mp3") is None
+
+
+async def test_delete_file_tolerates_missing_file(storage: FileSystemStorage):
+    await storage.store_file(b"track", path="a.mp3", content_type="a/b")
+
+    await storage.delete_file("a.mp3")
+    await storage.delete_file("a.mp3")
+
+    assert await storage.get_file_size("a.mp3") is None
+
+
+async def test_abort_multipart_upload_tolerates_missing_upload(
+    storage: FileSystemStorage,
+):
+    upload_id = await storage.start_multipart_upload("a.mp3", content_type="a/b")
+    await storage.upload_part("a.mp3", upload_id=upload_id, number=1, data=b"0123")
+
+    await storage.abort_multipart_upload("a.mp3", upload_id=upload_id)
+    await storage.abort_multipart_upload("a.mp3", upload_id=upload_id)
+
+    with pytest.raises(StorageError, match="Failed to complete multipart upload"):
+        await storage.complete_multipart_upload(
+            "a.mp3", upload_id=upload_id, part_tags=[]
+        )
+
+
+async def test_expiring_url_is_verified_until_it_expires(
+    storage: FileSystemStorage, tmp_path: Path
+):
+    url = await storage.generate_expiring_url("tracks/a b.mp3", expiration=60)
+
+    parts = urlsplit(url)
+    query = {key: value for key, [value] in parse_qs(parts.query).items()}
+    assert parts.path == "/api/v1/files/tracks/a%20b.mp3"
+    target = storage.verify_url(
+        "tracks/a b.mp3", expires=int(query["expires"]), signature=query["signature"]
+    )
+    assert target == tmp_path / "tracks/a b.mp3"
+
+    with pytest.raises(AuthorizationError, match="Invalid signature"):
+        storage.verify_url(
+            "tracks/other.mp3",
+            expires=int(query["expires"]),
+            signature=query["signature"],
+        )
+    with pytest.raises(AuthorizationError, match="Signature expired"):
+        expired_url = await storage.generate_expiring_url("a.mp3", expiration=-1)
+        expired_query = parse_qs(urlsplit(expired_url).query)
+        storage.verify_url(
+            "a.mp3",
+            expires=int(expired_query["expires"][0]),
+            signature=expired_query["signature"][0],
+        )
+
+
+async def test_upload_form_is_verified_with_its_fields(storage: FileSystemStorage):
+    upload_form = await storage.generate_upload_form(
+        "a.mp3", content_type="audio/mpeg", max_size=1000
+    )
+
+    assert upload_form.url == "http://test/api/v1/files/"
+    assert storage.verify_upload_form(upload_form.fields) == (
+        "a.mp3",
+        "audio/mpeg",
+        1000,
+    )
+    with pytest.raises(AuthorizationError):
+        storage.verify_upload_form(upload_form.fields | {"max_size": "2000"})
+    with pytest.raises(AuthorizationError):
+        storage.verify_upload_form({"key": "a.mp3"})
+
+
+async def test_purge_deletes_files_under_prefix(storage: FileSystemStorage):
+    for path in ("tracks/a/1.mp3", "tracks/a/2.mp3", "tracks/b/1.mp3"):
+        await storage.store_file(b"data", path=path, content_type="a/b")
+    await storage.start_multipart_upload("tracks/a/3.mp3", content_type="a/b")
+
+    assert await storage.purge("tracks/a/") == 2
+    assert await storage.get_file_size("tracks/b/1.mp3") == 4
+
+    assert await storage.purge() == 1
+    assert await storage.get_file_size("tracks/b/1.mp3") is None
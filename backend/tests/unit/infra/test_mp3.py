@@ -0,0 +1,225 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from mutagen.mp3 import MP3
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.audio import mp3
+
+
+class CountingBytesIO(BytesIO):
+    bytes_read = 0
+
+    def read(self, size: int | None = -1, /) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+@pytest.fixture
+def mp3_bytes(mp3_file: Path) -> bytes:
+    return mp3_file.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def scale() -> AudioSegment:
+    """A tone rising every second, so that clips of the wrong region differ."""
+    return sum(
+        (
+            Sine(200 + 50 * second).to_audio_segment(duration=1000)
+            for second in range(30)
+        ),
+        start=AudioSegment.empty(),
+    )
+
+
+def export_mp3(segment: AudioSegment, bitrate: str, *, info_tag: bool = True) -> bytes:
+    buffer = BytesIO()
+    parameters = [] if info_tag else ["-write_xing", "0"]
+    segment.export(buffer, format="mp3", bitrate=bitrate, parameters=parameters)
+    return buffer.getvalue()
+
+
+def assert_clip_matches_reference(data: bytes, *, start: int, end: int):
+    clipped_file = mp3.clip(BytesIO(data), start=start, end=end)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="mp3")
+    reference = AudioSegment.from_file(BytesIO(data), format="mp3")[start:end]
+    assert len(clipped_segment) == end - start
+    # The bit reservoir of low bitrates reaches back further than the encoder
+    # delay can trim, which leaves the first frames of a clip partially decoded
+    lead_in = 100
+    assert (
+        clipped_segment[lead_in:].get_array_of_samples()
+        == reference[lead_in:].get_array_of_samples()
+    )
+
+
+def test_crc16_matches_reference_value():
+    assert mp3.crc16(b"123456789") == 0xBB3D
+
+
+def test_parse_frame_header_reads_layer_3_header():
+    header = mp3.parse_frame_header(b"\xff\xfb\x90\x64")
+
+    assert header is not None
+    assert header.bitrate == 128_000
+    assert header.sample_rate == 44100
+    assert header.samples_per_frame == 1152
+    assert header.frame_size == 417
+    assert not header.protected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\x00\xfb\x90\x64",  # no sync
+        b"\xff\xeb\x90\x64",  # reserved version
+        b"\xff\xf9\x90\x64",  # reserved layer
+        b"\xff\xfb\x00\x64",  # free format bitrate
+        b"\xff\xfb\xf0\x64",  # invalid bitrate
+        b"\xff\xfb\x9c\x64",  # reserved sample rate
+        b"\xff\xfb",  # truncated
+    ],
+)
+def test_parse_frame_header_rejects_invalid_header(data: bytes):
+    assert mp3.parse_frame_header(data) is None
+
+
+def test_iter_frames_skips_id3_tag_and_finds_all_frames(mp3_bytes: bytes):
+    frames = list(mp3.iter_frames(BytesIO(mp3_bytes)))
+
+    assert mp3_bytes.startswith(b"ID3")
+    assert frames[0].offset > 0
+    for previous, frame in zip(frames, frames[1:], strict=False):
+        assert previous.end == frame.offset
+
+
+def test_iter_frames_resynchronizes_after_garbage(mp3_bytes: bytes):
+    frames = list(mp3.iter_frames(BytesIO(mp3_bytes)))
+    split = frames[10].offset
+    corrupted = mp3_bytes[:split] + b"garbage" + mp3_bytes[split:]
+
+    corrupted_frames = list(mp3.iter_frames(BytesIO(corrupted)))
+
+    assert len(corrupted_frames) == len(frames)
+
+
+def test_read_info_tag_reads_lame_encoder_delay(mp3_bytes: bytes):
+    file = BytesIO(mp3_bytes)
+    first_frame = next(mp3.iter_frames(file))
+
+    info_tag = mp3.read_info_tag(file, first_frame)
+
+    assert info_tag is not None
+    assert info_tag.encoder_delay is not None
+    assert info_tag.encoder_delay > 0
+
+
+def test_read_info_tag_for_audio_frame_returns_none(mp3_bytes: bytes):
+    file = BytesIO(mp3_bytes)
+    audio_frame = list(mp3.iter_frames(file))[1]
+
+    assert mp3.read_info_tag(file, audio_frame) is None
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        (0, 1000),
+        (500, 1400),
+        (1200, 2100),
+        (2000, 2400),
+    ],
+)
+def test_clip_decodes_to_requested_length(mp3_bytes: bytes, start: int, end: int):
+    clipped_file = mp3.clip(BytesIO(mp3_bytes), start=start, end=end)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="mp3")
+    assert len(clipped_segment) == end - start
+
+
+def test_clip_with_deep_bit_reservoir_decodes_to_requested_length():
+    # Low bitrate VBR frames reference main data many frames back
+    buffer = BytesIO()
+    Sine(440).to_audio_segment(duration=2400).export(
+        buffer, format="mp3", parameters=["-q:a", "9"]
+    )
+
+    clipped_file = mp3.clip(BytesIO(buffer.getvalue()), start=1200, end=2100)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="mp3")
+    assert len(clipped_segment) == 900
+
+
+def test_clip_of_constant_bitrate_stream_reads_only_needed_region():
+    buffer = BytesIO()
+    AudioSegment.silent(duration=180_000).export(buffer, format="mp3", bitrate="64k")
+    file = CountingBytesIO(buffer.getvalue())
+
+    clipped_file = mp3.clip(file, start=120_000, end=121_000)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="mp3")
+    assert len(clipped_segment) == 1000
+    assert file.bytes_read < len(buffer.getvalue()) / 2
+
+
+@pytest.mark.parametrize("bitrate", ["32k", "64k", "96k"])
+@pytest.mark.parametrize("info_tag", [True, False])
+@pytest.mark.parametrize(("start", "end"), [(500, 1500), (20_000, 21_500)])
+def test_clip_of_constant_bitrate_stream_matches_reference(
+    scale: AudioSegment, bitrate: str, info_tag: bool, start: int, end: int
+):
+    data = export_mp3(scale, bitrate, info_tag=info_tag)
+
+    assert_clip_matches_reference(data, start=start, end=end)
+
+
+def test_clip_of_stream_changing_bitrate_after_info_tag_matches_reference(
+    scale: AudioSegment,
+):
+    # The info tag claims a constant bitrate, which the second half breaks
+    first_half = export_mp3(scale[:10_000], "32k")
+    second_half = export_mp3(scale[10_000:20_000], "128k", info_tag=False)
+    second_half_offset = next(mp3.iter_frames(BytesIO(second_half))).offset
+    data = first_half + second_half[second_half_offset:]
+
+    assert_clip_matches_reference(data, start=15_000, end=16_000)
+
+
+def test_clip_copies_frames_unchanged(mp3_bytes: bytes):
+    clipped_file = mp3.clip(BytesIO(mp3_bytes), start=1000, end=2000)
+
+    clipped_frames = list(mp3.iter_frames(clipped_file))
+    info_frame, audio_frames = clipped_frames[0], clipped_frames[1:]
+    clipped_file.seek(info_frame.end)
+    audio_data = clipped_file.read()
+    assert len(audio_frames) > 0
+    assert audio_data in mp3_bytes
+
+
+def test_clip_writes_valid_info_frame(mp3_bytes: bytes):
+    clipped_file = mp3.clip(BytesIO(mp3_bytes), start=1000, end=2000)
+
+    first_frame = next(mp3.iter_frames(clipped_file))
+    info_tag = mp3.read_info_tag(clipped_file, first_frame)
+    metadata = MP3(clipped_file)
+
+    assert info_tag is not None
+    assert info_tag.lame_tag is not None
+    assert info_tag.encoder_delay is not None
+    assert metadata.info is not None
+    assert 1000 <= metadata.info.length * 1000 <= 1200
+
+
+def test_clip_beyond_stream_raises_exception(mp3_bytes: bytes):
+    with pytest.raises(ValidationError, match="exceeds audio stream"):
+        mp3.clip(BytesIO(mp3_bytes), start=60_000, end=61_000)
+
+
+def test_clip_without_frames_raises_exception():
+    with pytest.raises(ValidationError, match="No MPEG audio frames found"):
+        mp3.clip(BytesIO(b"not an mp3 file" * 100), start=0, end=1000)
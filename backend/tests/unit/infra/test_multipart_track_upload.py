@@ -0,0 +1,201 @@
+import base64
+from collections.abc import AsyncIterator
+from datetime import date
+
+import httpx
+import pytest
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.api.uploads import (
+    MultipartTrackUpload,
+    parse_upload_session_create_dto,
+)
+
+
+def build_request(
+    data: dict | None = None,
+    files: dict | list | None = None,
+    *,
+    chunk_size: int = 7,
+    content_type: str | None = None,
+) -> Request:
+    encoded = httpx.Request("POST", "http://test", data=data, files=files)
+    body = encoded.read()
+    headers = dict(encoded.headers)
+    if content_type is not None:
+        headers["content-type"] = content_type
+    messages = [
+        {
+            "type": "http.request",
+            "body": body[offset : offset + chunk_size],
+            "more_body": offset + chunk_size < len(body),
+        }
+        for offset in range(0, len(body), chunk_size)
+    ]
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    return Request(scope, receive)
+
+
+async def read_all(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.fixture
+def file_data() -> bytes:
+    return bytes(range(256)) * 8
+
+
+async def test_iter_chunks_yields_file_and_collects_fields_sent_after_it(
+    file_data: bytes,
+):
+    # Files are encoded before the other fields, like the frontend sends them
+    request = build_request(
+        data={"title": "Test Track", "recorded_date": "2021-02-03"},
+        files={"upload_file": ("test.mp3", file_data, "audio/mpeg")},
+    )
+    track_upload = MultipartTrackUpload(request)
+
+    assert await read_all(track_upload.iter_chunks()) == file_data
+    track_create_dto = track_upload.get_track_create_dto()
+    assert track_create_dto.title == "Test Track"
+    assert track_create_dto.recorded_date == date(2021, 2, 3)
+
+
+async def test_iter_chunks_skips_other_files(file_data: bytes):
+    request = build_request(
+        data={"title": "Test Track"},
+        files=[
+            ("cover", ("cover.png", b"image", "image/png")),
+            ("upload_file", ("test.mp3", file_data, "audio/mpeg")),
+            ("upload_file", ("other.mp3", b"other", "audio/mpeg")),
+        ],
+    )
+    track_upload = MultipartTrackUpload(request)
+
+    assert await read_all(track_upload.iter_chunks()) == file_data
+
+
+def test_get_track_create_dto_before_reading_raises_error():
+    track_upload = MultipartTrackUpload(build_request(data={"title": "Test Track"}))
+
+    with pytest.raises(RuntimeError):
+        track_upload.get_track_create_dto()
+
+
+async def test_iter_chunks_without_file_raises_validation_error():
+    track_upload = MultipartTrackUpload(
+        build_request(
+            data={"title": "Test Track"},
+            files={"other": ("a.txt", b"a", "text/plain")},
+        )
+    )
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        await read_all(track_upload.iter_chunks())
+
+    (error,) = exc_info.value.errors()
+    assert error["loc"] == ("body", "upload_file")
+    assert error["msg"] == "Field required"
+
+
+async def test_iter_chunks_with_invalid_fields_raises_validation_error(
+    file_data: bytes,
+):
+    track_upload = MultipartTrackUpload(
+        build_request(
+            data={"title": " ", "recorded_date": "not a date"},
+            files={"upload_file": ("test.mp3", file_data, "audio/mpeg")},
+        )
+    )
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        await read_all(track_upload.iter_chunks())
+
+    locs = {error["loc"] for error in exc_info.value.errors()}
+    assert locs == {("body", "title"), ("body", "recorded_date")}
+
+
+async def test_iter_chunks_with_too_large_field_raises_validation_error(
+    file_data: bytes,
+):
+    track_upload = MultipartTrackUpload(
+        build_request(
+            data={"title": "A" * (64 * 1024 + 1)},
+            files={"upload_file": ("test.mp3", file_data, "audio/mpeg")},
+            chunk_size=4096,
+        )
+    )
+
+    with pytest.raises(ValidationError, match="Form field is too large"):
+        await read_all(track_upload.iter_chunks())
+
+
+async def test_iter_chunks_without_multipart_body_raises_validation_error():
+    track_upload = MultipartTrackUpload(build_request(data={"title": "Test Track"}))
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        await read_all(track_upload.iter_chunks())
+
+    (error,) = exc_info.value.errors()
+    assert error["loc"] == ("body", "upload_file")
+
+
+async def test_iter_chunks_without_boundary_raises_validation_error():
+    track_upload = MultipartTrackUpload(
+        build_request(
+            data={"title": "Test Track"},
+            files={"upload_file": ("test.mp3", b"data", "audio/mpeg")},
+            content_type="multipart/form-data",
+        )
+    )
+
+    with pytest.raises(ValidationError, match="Missing boundary"):
+        await read_all(track_upload.iter_chunks())
+
+
+def encode_metadata(**fields: str) -> str:
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}"
+        for key, value in fields.items()
+    )
+
+
+def test_parse_upload_session_create_dto_decodes_metadata():
+    upload_session_create_dto = parse_upload_session_create_dto(
+        "1000", encode_metadata(title="Jäm", recorded_date="2024-05-01") + ",flag"
+    )
+
+    assert upload_session_create_dto.title == "Jäm"
+    assert upload_session_create_dto.recorded_date == date(2024, 5, 1)
+    assert upload_session_create_dto.size == 1000
+
+
+def test_parse_upload_session_create_dto_with_invalid_base64_raises_error():
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse_upload_session_create_dto("1000", "title not-base64!")
+
+    (error,) = exc_info.value.errors()
+    assert error["loc"] == ("header", "Upload-Metadata")
+    assert error["msg"] == "Invalid base64 value of title"
+
+
+def test_parse_upload_session_create_dto_with_invalid_fields_raises_error():
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse_upload_session_create_dto(None, encode_metadata(recorded_date="never"))
+
+    locs = {error["loc"] for error in exc_info.value.errors()}
+    assert locs == {
+        ("header", "Upload-Length"),
+        ("header", "Upload-Metadata", "title"),
+        ("header", "Upload-Metadata", "recorded_date"),
+    }
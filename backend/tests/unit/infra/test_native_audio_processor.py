@@ -8,7 +8,8 @@ from pydub import AudioSegment
 from pytest_mock import MockerFixture
 
 from jamflow.core.exceptions import ValidationError
-from jamflow.infra.audio import AudioFileFormat, native_audio_processor
+from jamflow.infra.audio import native_audio_processor
+from jamflow.recordings.models import AudioFileFormat
 
 
 def test_get_format_returns_correct_format(mocker: MockerFixture):
@@ -39,7 +40,7 @@ def test_get_format_with_unsupported_type_raises_exception(
 def test_get_duration_for_valid_mp3_file_returns_duration_in_milliseconds(
     mocker: MockerFixture,
 ):
-    mock_mp3 = mocker.patch("jamflow.infra.audio.MP3")
+    mock_mp3 = mocker.patch("jamflow.infra.audio.processor.MP3")
     mock_metadata = MagicMock()
     mock_metadata.info.length = 5.0  # 5 seconds
     mock_mp3.return_value = mock_metadata
@@ -53,7 +54,7 @@ def test_get_duration_for_valid_mp3_file_returns_duration_in_milliseconds(
 def test_get_duration_with_metadata_error_raises_audio_service_exception(
     mocker: MockerFixture,
 ):
-    mock_mp3 = mocker.patch("jamflow.infra.audio.MP3")
+    mock_mp3 = mocker.patch("jamflow.infra.audio.processor.MP3")
     mock_mp3.side_effect = MutagenError("Metadata error")
 
     with pytest.raises(ValidationError, match="Failed to read metadata"):
@@ -63,7 +64,7 @@ def test_get_duration_with_metadata_error_raises_audio_service_exception(
 def test_get_duration_without_metadata_raises_audio_service_exception(
     mocker: MockerFixture,
 ):
-    mock_mp3 = mocker.patch("jamflow.infra.audio.MP3")
+    mock_mp3 = mocker.patch("jamflow.infra.audio.processor.MP3")
     mock_metadata = MagicMock(info=None)
     mock_mp3.return_value = mock_metadata
 
@@ -117,10 +118,10 @@ def test_get_size_on_closed_file_raises_value_error():
         native_audio_processor.get_size(file_like)
 
 
-def test_clip_returns_clipped_segment(wav_file: Path):
+async def test_clip_returns_clipped_segment(wav_file: Path):
     start, end = 1000, 2000
     with open(wav_file, "rb") as file_like:
-        clipped_file = native_audio_processor.clip(
+        clipped_file = await native_audio_processor.clip(
             file_like, AudioFileFormat.WAV, start=start, end=end
         )
 
@@ -131,9 +132,52 @@ def test_clip_returns_clipped_segment(wav_file: Path):
     assert original_segment[start:end].raw_data == clipped_segment.raw_data
 
 
-def test_clip_with_invalid_format_raises_exception():
+async def test_clip_copies_mp3_frames_without_reencoding(
+    mocker: MockerFixture, mp3_file: Path
+):
+    spy = mocker.spy(AudioSegment, "export")
+    with open(mp3_file, "rb") as file_like:
+        clipped_file = await native_audio_processor.clip(
+            file_like, AudioFileFormat.MP3, start=1000, end=2000
+        )
+
+    spy.assert_not_called()
+    clipped_segment = AudioSegment.from_file(clipped_file, format="mp3")
+    assert len(clipped_segment) == 1000
+
+
+async def test_clip_copies_ogg_packets_without_reencoding(
+    mocker: MockerFixture, ogg_file: Path
+):
+    spy = mocker.spy(AudioSegment, "export")
+    with open(ogg_file, "rb") as file_like:
+        clipped_file = await native_audio_processor.clip(
+            file_like, AudioFileFormat.OGG, start=1000, end=2000
+        )
+
+    spy.assert_not_called()
+    clipped_segment = AudioSegment.from_file(clipped_file, format="ogg")
+    assert 1000 <= len(clipped_segment) <= 1050
+
+
+async def test_clip_reencodes_ogg_other_than_vorbis(
+    mocker: MockerFixture, ogg_file: Path
+):
+    mocker.patch("jamflow.infra.audio.processor.ogg.is_vorbis", return_value=False)
+    spy = mocker.spy(AudioSegment, "export")
+    with open(ogg_file, "rb") as file_like:
+        clipped_file = await native_audio_processor.clip(
+            file_like, AudioFileFormat.OGG, start=1000, end=2000
+        )
+
+    spy.assert_called_once()
+    clipped_segment = AudioSegment.from_file(clipped_file, format="ogg")
+    assert 1000 <= len(clipped_segment) <= 1050
+
+
+async def test_clip_with_invalid_format_raises_exception():
     with pytest.raises(ValidationError, match="Unsupported file format: invalid"):
-        native_audio_processor.clip(
+        await native_audio_processor.clip(
             BytesIO(b"test data"),
             "invalid",  # ty: ignore[invalid-argument-type]
             start=0,
@@ -141,22 +185,22 @@ def test_clip_with_invalid_format_raises_exception():
         )
 
 
-def test_clip_with_negative_start_raises_exception():
+async def test_clip_with_negative_start_raises_exception():
     with pytest.raises(ValidationError, match="Start cannot be negative"):
-        native_audio_processor.clip(
+        await native_audio_processor.clip(
             BytesIO(b"test data"), AudioFileFormat.MP3, start=-1000, end=1000
         )
 
 
-def test_clip_with_invalid_range_raises_exception():
+async def test_clip_with_invalid_range_raises_exception():
     with pytest.raises(ValidationError, match="Start must be less than end"):
-        native_audio_processor.clip(
+        await native_audio_processor.clip(
             BytesIO(b"test data"), AudioFileFormat.MP3, start=2000, end=1000
         )
 
 
-def test_clip_with_empty_file_raises_exception():
+async def test_clip_with_empty_file_raises_exception():
     with pytest.raises(ValidationError, match="Cannot clip an empty file"):
-        native_audio_processor.clip(
+        await native_audio_processor.clip(
             BytesIO(b""), AudioFileFormat.MP3, start=0, end=1000
         )
@@ -0,0 +1,120 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from mutagen.oggvorbis import OggVorbis, OggVorbisInfo
+from pydub import AudioSegment
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.audio import ogg
+
+
+@pytest.fixture
+def ogg_bytes(ogg_file: Path) -> bytes:
+    return ogg_file.read_bytes()
+
+
+def _reference_crc32(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte << 24
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x04C11DB7 if crc & 0x80000000 else crc << 1
+            crc &= 0xFFFFFFFF
+    return crc
+
+
+@pytest.mark.parametrize("data", [b"", b"123456789", bytes(range(256))])
+def test_crc32_matches_bitwise_implementation(data: bytes):
+    assert ogg.crc32(data) == _reference_crc32(data)
+
+
+def test_iter_pages_finds_consecutive_pages(ogg_bytes: bytes):
+    pages = list(ogg.iter_pages(BytesIO(ogg_bytes)))
+
+    assert pages[0].offset == 0
+    assert pages[-1].end == len(ogg_bytes)
+    for previous, page in zip(pages, pages[1:], strict=False):
+        assert previous.end == page.offset
+        assert previous.sequence + 1 == page.sequence
+
+
+def test_iter_pages_resynchronizes_after_garbage(ogg_bytes: bytes):
+    pages = list(ogg.iter_pages(BytesIO(ogg_bytes)))
+    split = pages[2].offset
+    corrupted = ogg_bytes[:split] + b"OggS garbage" + ogg_bytes[split:]
+
+    corrupted_pages = list(ogg.iter_pages(BytesIO(corrupted)))
+
+    assert len(corrupted_pages) == len(pages)
+
+
+def test_is_vorbis(ogg_bytes: bytes):
+    assert ogg.is_vorbis(BytesIO(ogg_bytes))
+    assert not ogg.is_vorbis(BytesIO(b"not an ogg file"))
+
+
+def test_read_vorbis_info_reads_stream_parameters(ogg_bytes: bytes):
+    info = ogg.read_vorbis_info(BytesIO(ogg_bytes))
+
+    assert info.sample_rate == 44100
+    assert info.block_sizes == (256, 2048)
+    assert info.mode_block_flags == (False, True)
+    assert info.header_pages[0].offset == 0
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        (0, 1000),
+        (500, 1400),
+        (1200, 2100),
+        (2000, 2400),
+    ],
+)
+def test_clip_declares_requested_length(ogg_bytes: bytes, start: int, end: int):
+    clipped_file = ogg.clip(BytesIO(ogg_bytes), start=start, end=end)
+
+    metadata = OggVorbis(clipped_file)
+    assert isinstance(metadata.info, OggVorbisInfo)
+    assert metadata.info.length == pytest.approx((end - start) / 1000)
+
+
+@pytest.mark.parametrize("start,end", [(0, 1000), (1200, 2100)])
+def test_clip_decodes_to_requested_length(ogg_bytes: bytes, start: int, end: int):
+    clipped_file = ogg.clip(BytesIO(ogg_bytes), start=start, end=end)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="ogg")
+    # Decoders that ignore the trimmed start output up to one extra block
+    assert end - start <= len(clipped_segment) <= end - start + 50
+
+
+def test_clip_copies_header_pages_unchanged(ogg_bytes: bytes):
+    info = ogg.read_vorbis_info(BytesIO(ogg_bytes))
+
+    clipped_file = ogg.clip(BytesIO(ogg_bytes), start=1000, end=2000)
+
+    clipped_bytes = clipped_file.read()
+    assert clipped_bytes[: info.audio_offset] == ogg_bytes[: info.audio_offset]
+
+
+def test_clip_writes_valid_pages(ogg_bytes: bytes):
+    clipped_file = ogg.clip(BytesIO(ogg_bytes), start=1000, end=2000)
+    clipped_size = len(clipped_file.read())
+
+    pages = list(ogg.iter_pages(clipped_file))
+
+    assert pages[-1].end == clipped_size
+    assert [page.sequence for page in pages] == list(range(len(pages)))
+    assert pages[-1].header_type & 0x04
+    assert all(page.serial == pages[0].serial for page in pages)
+
+
+def test_clip_beyond_stream_raises_exception(ogg_bytes: bytes):
+    with pytest.raises(ValidationError, match="exceeds audio stream"):
+        ogg.clip(BytesIO(ogg_bytes), start=60_000, end=61_000)
+
+
+def test_clip_without_vorbis_stream_raises_exception():
+    with pytest.raises(ValidationError, match="No Vorbis stream found"):
+        ogg.clip(BytesIO(b"not an ogg file" * 100), start=0, end=1000)
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Generator
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import pytest
+from pydub import AudioSegment
+
+from jamflow.core.exceptions import (
+    ExternalServiceError,
+    RateLimitError,
+    ValidationError,
+)
+from jamflow.infra.audio import PooledAudioProcessor
+from jamflow.infra.storage.remote import RemoteFile
+from jamflow.recordings.models import AudioFileFormat
+from tests.unit.conftest import RangeServer
+
+
+@pytest.fixture
+def pooled_audio_processor() -> Generator[PooledAudioProcessor]:
+    processor = PooledAudioProcessor(max_workers=1, max_queue_size=0, timeout=30)
+    yield processor
+    processor.shutdown()
+
+
+async def test_clip_returns_clipped_segment(
+    pooled_audio_processor: PooledAudioProcessor, wav_file: Path
+):
+    start, end = 1000, 2000
+    with open(wav_file, "rb") as file_like:
+        clipped_file = await pooled_audio_processor.clip(
+            file_like, AudioFileFormat.WAV, start=start, end=end
+        )
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="wav")
+    original_segment = AudioSegment.from_file(wav_file, format="wav")
+    assert original_segment[start:end].raw_data == clipped_segment.raw_data
+
+
+async def test_clip_spools_file_without_path(
+    pooled_audio_processor: PooledAudioProcessor, wav_file: Path
+):
+    file_like = BytesIO(wav_file.read_bytes())
+
+    clipped_file = await pooled_audio_processor.clip(
+        file_like, AudioFileFormat.WAV, start=0, end=1000
+    )
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="wav")
+    assert len(clipped_segment) == 1000
+
+
+async def test_clip_reads_remote_file_in_worker(
+    pooled_audio_processor: PooledAudioProcessor,
+    range_server: RangeServer,
+    wav_file: Path,
+):
+    range_server.files["track.wav"] = wav_file.read_bytes()
+    remote_file = RemoteFile(
+        range_server.url("track.wav"), wav_file.stat().st_size, block_size=4096
+    )
+
+    clipped_file = await pooled_audio_processor.clip(
+        cast(BinaryIO, remote_file), AudioFileFormat.WAV, start=1000, end=1500
+    )
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="wav")
+    assert len(clipped_segment) == 500
+    assert sum(end - start for start, end in range_server.requested_ranges) < (
+        wav_file.stat().st_size
+    )
+
+
+async def test_clip_raises_worker_exception(
+    pooled_audio_processor: PooledAudioProcessor,
+):
+    with pytest.raises(ValidationError, match="Start must be less than end"):
+        await pooled_audio_processor.clip(
+            BytesIO(b"test data"), AudioFileFormat.MP3, start=2000, end=1000
+        )
+
+
+async def test_clip_with_full_queue_raises_exception(
+    pooled_audio_processor: PooledAudioProcessor, wav_file: Path
+):
+    running = asyncio.create_task(
+        pooled_audio_processor.clip(
+            BytesIO(wav_file.read_bytes()), AudioFileFormat.WAV, start=0, end=1000
+        )
+    )
+    await asyncio.sleep(0)
+
+    with pytest.raises(RateLimitError, match="Too many audio processing jobs"):
+        await pooled_audio_processor.clip(
+            BytesIO(wav_file.read_bytes()), AudioFileFormat.WAV, start=0, end=1000
+        )
+
+    await running
+
+
+async def test_clip_exceeding_timeout_raises_exception(wav_file: Path):
+    processor = PooledAudioProcessor(max_workers=1, max_queue_size=0, timeout=0.001)
+    try:
+        with pytest.raises(ExternalServiceError, match="timed out"):
+            await processor.clip(
+                BytesIO(wav_file.read_bytes()), AudioFileFormat.WAV, start=0, end=1000
+            )
+    finally:
+        processor.shutdown()
+
+
+async def test_timed_out_job_keeps_its_slot_until_it_is_over(wav_file: Path):
+    processor = PooledAudioProcessor(max_workers=1, max_queue_size=0, timeout=0.001)
+    try:
+        with pytest.raises(ExternalServiceError, match="timed out"):
+            await processor.clip(
+                BytesIO(wav_file.read_bytes()), AudioFileFormat.WAV, start=0, end=1000
+            )
+
+        # The job still occupies the only worker
+        with pytest.raises(RateLimitError, match="Too many audio processing jobs"):
+            await processor.clip(
+                BytesIO(wav_file.read_bytes()), AudioFileFormat.WAV, start=0, end=1000
+            )
+    finally:
+        processor.shutdown()
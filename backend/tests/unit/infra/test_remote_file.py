@@ -0,0 +1,79 @@
+import pickle
+from io import SEEK_CUR, SEEK_END
+
+import pytest
+
+from jamflow.core.exceptions import StorageError
+from jamflow.infra.storage.remote import RemoteFile
+from tests.unit.conftest import RangeServer
+
+DATA = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def remote_file(range_server: RangeServer) -> RemoteFile:
+    range_server.files["file"] = DATA
+    return RemoteFile(range_server.url("file"), len(DATA), block_size=1024)
+
+
+def test_read_returns_data_at_position(remote_file: RemoteFile):
+    remote_file.seek(1000)
+
+    assert remote_file.read(100) == DATA[1000:1100]
+    assert remote_file.tell() == 1100
+
+
+def test_read_past_end_returns_available_data(remote_file: RemoteFile):
+    remote_file.seek(-10, SEEK_END)
+
+    assert remote_file.read(100) == DATA[-10:]
+    assert remote_file.read(100) == b""
+
+
+def test_seek_relative_to_current_position(remote_file: RemoteFile):
+    remote_file.seek(100)
+    remote_file.seek(-50, SEEK_CUR)
+
+    assert remote_file.tell() == 50
+
+
+def test_seek_to_negative_position_raises_exception(remote_file: RemoteFile):
+    with pytest.raises(ValueError, match="Negative seek position"):
+        remote_file.seek(-1)
+
+
+def test_small_reads_are_served_from_cached_blocks(
+    remote_file: RemoteFile, range_server: RangeServer
+):
+    remote_file.seek(1000)
+    for _ in range(10):
+        remote_file.read(4)
+    remote_file.seek(1000)
+    remote_file.read(100)
+
+    assert range_server.requested_ranges == [(0, 1024), (1024, 2048)]
+
+
+def test_large_reads_are_fetched_at_once(
+    remote_file: RemoteFile, range_server: RangeServer
+):
+    remote_file.seek(100)
+
+    assert remote_file.read(5000) == DATA[100:5100]
+    assert remote_file.read() == DATA[5100:]
+    assert range_server.requested_ranges == [(100, 5100), (5100, len(DATA))]
+
+
+def test_pickled_file_keeps_position(remote_file: RemoteFile):
+    remote_file.seek(2000)
+
+    unpickled_file = pickle.loads(pickle.dumps(remote_file))
+
+    assert unpickled_file.read(10) == DATA[2000:2010]
+
+
+def test_read_of_missing_file_raises_storage_exception(range_server: RangeServer):
+    remote_file = RemoteFile(range_server.url("missing"), 100)
+
+    with pytest.raises(StorageError, match="Failed to read file range"):
+        remote_file.read(10)
@@ -1,10 +1,23 @@
+import asyncio
+from collections.abc import AsyncIterator
+from io import BytesIO
+
 import pytest
 from botocore.client import ClientError
 from botocore.exceptions import BotoCoreError
+from pydantic import HttpUrl
 from pytest_mock import MockerFixture
 
+from jamflow.core.config import settings
 from jamflow.core.exceptions import StorageError
-from jamflow.infra.storage.s3 import S3StorageService
+from jamflow.infra.storage.remote import RemoteFile
+from jamflow.infra.storage.s3 import S3StorageService, SharedStorageClient
+from jamflow.infra.storage.url_cache import expiring_url_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_expiring_url_cache():
+    expiring_url_cache.clear()
 
 
 @pytest.fixture
@@ -53,6 +66,48 @@ async def test_does_not_create_bucket_if_exists(mock_s3_client):
     mock_s3_client.create_bucket.assert_not_called()
 
 
+async def test_shared_client_skips_bucket_check_and_stays_open(mocker: MockerFixture):
+    shared_client = mocker.AsyncMock()
+
+    async with S3StorageService("test-bucket", client=shared_client) as service:
+        await service.store_file(b"test data", path="test/path", content_type="a/b")
+
+    shared_client.head_bucket.assert_not_called()
+    shared_client.put_object.assert_called_once()
+    shared_client.close.assert_not_called()
+
+
+async def test_shared_storage_client_checks_buckets_once_on_start(mock_s3_client):
+    shared_storage_client = SharedStorageClient()
+
+    await shared_storage_client.start(["bucket-1", "bucket-2"])
+
+    assert shared_storage_client.client is mock_s3_client
+    assert mock_s3_client.head_bucket.call_count == 2
+    mock_s3_client.close.assert_not_called()
+
+
+async def test_shared_storage_client_closes_client_on_stop(mock_s3_client):
+    shared_storage_client = SharedStorageClient()
+    await shared_storage_client.start(["test-bucket"])
+
+    await shared_storage_client.stop()
+
+    assert shared_storage_client.client is None
+    mock_s3_client.close.assert_called_once()
+
+
+async def test_shared_storage_client_closes_client_on_failed_start(mock_s3_client):
+    mock_s3_client.head_bucket.side_effect = ClientError({"Error": {"Code": "403"}}, "")
+    shared_storage_client = SharedStorageClient()
+
+    with pytest.raises(StorageError, match="Failed to access bucket"):
+        await shared_storage_client.start(["test-bucket"])
+
+    assert shared_storage_client.client is None
+    mock_s3_client.close.assert_called_once()
+
+
 async def test_store_file_calls_put_object_on_success(mock_s3_client):
     # not raise an exception to simulate a successful file storage
 
@@ -111,26 +166,253 @@ async def test_store_file_raises_storage_exception_on_error(mock_s3_client):
     )
 
 
-async def test_get_file_reads_all_chunks_and_returns_file(
-    mocker: MockerFixture, mock_s3_client
+@pytest.fixture
+def mock_multipart_client(mock_s3_client):
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+
+    async def upload_part(*, PartNumber, Body, **_):
+        return {"ETag": f"etag-{PartNumber}-{len(Body)}"}
+
+    mock_s3_client.upload_part.side_effect = upload_part
+    return mock_s3_client
+
+
+async def test_store_file_above_threshold_uploads_parts(mock_multipart_client):
+    service = S3StorageService(
+        "test-bucket",
+        multipart_threshold=8,
+        multipart_part_size=4,
+        multipart_concurrency=2,
+    )
+    async with service:
+        await service.store_file(
+            BytesIO(b"0123456789"), path="test/path", content_type="a/b"
+        )
+
+    mock_multipart_client.put_object.assert_not_called()
+    mock_multipart_client.create_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path", ContentType="a/b"
+    )
+    mock_multipart_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="test/path",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1-4"},
+                {"PartNumber": 2, "ETag": "etag-2-4"},
+                {"PartNumber": 3, "ETag": "etag-3-2"},
+            ]
+        },
+    )
+    mock_multipart_client.abort_multipart_upload.assert_not_called()
+
+
+async def test_store_file_aborts_multipart_upload_on_error(mock_multipart_client):
+    mock_multipart_client.upload_part.side_effect = ClientError(
+        {"Error": {"Code": "500"}}, "upload_part"
+    )
+    service = S3StorageService(
+        "test-bucket", multipart_threshold=0, multipart_part_size=4
+    )
+
+    async with service:
+        with pytest.raises(StorageError, match="Failed to store file"):
+            await service.store_file(
+                b"0123456789", path="test/path", content_type="a/b"
+            )
+
+    mock_multipart_client.complete_multipart_upload.assert_not_called()
+    mock_multipart_client.abort_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path", UploadId="upload-id"
+    )
+
+
+async def test_multipart_upload_in_separate_calls(mock_multipart_client):
+    async with S3StorageService("test-bucket") as service:
+        upload_id = await service.start_multipart_upload(
+            "test/path", content_type="a/b"
+        )
+        tags = [
+            await service.upload_part(
+                "test/path", upload_id=upload_id, number=number, data=data
+            )
+            for number, data in enumerate([b"0123", b"45"], start=1)
+        ]
+        await service.complete_multipart_upload(
+            "test/path", upload_id=upload_id, part_tags=tags
+        )
+
+    mock_multipart_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="test/path",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1-4"},
+                {"PartNumber": 2, "ETag": "etag-2-2"},
+            ]
+        },
+    )
+
+
+async def test_upload_part_raises_storage_exception_on_error(mock_s3_client):
+    mock_s3_client.upload_part.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchUpload"}}, "upload_part"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to upload part"):
+            await service.upload_part(
+                "test/path", upload_id="upload-id", number=1, data=b"data"
+            )
+
+
+async def test_abort_multipart_upload_ignores_missing_upload(mock_s3_client):
+    mock_s3_client.abort_multipart_upload.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchUpload"}}, "abort_multipart_upload"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        await service.abort_multipart_upload("test/path", upload_id="upload-id")
+
+
+async def test_abort_multipart_upload_raises_storage_exception_on_error(
+    mock_s3_client,
 ):
-    # mock the return value of get_object
-    mock_s3_client.get_object.return_value = {
-        "Body": mocker.AsyncMock(
-            read=mocker.AsyncMock(side_effect=[b"chunk1", b"chunk2", b""])
+    mock_s3_client.abort_multipart_upload.side_effect = ClientError(
+        {"Error": {"Code": "500"}}, "abort_multipart_upload"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to abort multipart upload"):
+            await service.abort_multipart_upload("test/path", upload_id="upload-id")
+
+
+async def test_delete_file_raises_storage_exception_on_error(mock_s3_client):
+    mock_s3_client.delete_object.side_effect = ClientError(
+        {"Error": {"Code": "500"}}, "delete_object"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to delete file"):
+            await service.delete_file("test/path")
+
+
+async def iter_chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_store_stream_below_threshold_puts_object(mock_s3_client):
+    service = S3StorageService("test-bucket", multipart_threshold=8)
+
+    async with service:
+        await service.store_stream(
+            iter_chunks(b"012", b"345"), path="test/path", content_type="a/b"
         )
-    }
+
+    mock_s3_client.put_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path", Body=b"012345", ContentType="a/b"
+    )
+    mock_s3_client.create_multipart_upload.assert_not_called()
+
+
+async def test_store_stream_above_threshold_uploads_regrouped_parts(
+    mock_multipart_client,
+):
+    service = S3StorageService(
+        "test-bucket", multipart_threshold=4, multipart_part_size=4
+    )
+
+    async with service:
+        await service.store_stream(
+            iter_chunks(b"012", b"3456", b"789"), path="test/path", content_type="a/b"
+        )
+
+    mock_multipart_client.put_object.assert_not_called()
+    mock_multipart_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="test/path",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1-4"},
+                {"PartNumber": 2, "ETag": "etag-2-4"},
+                {"PartNumber": 3, "ETag": "etag-3-2"},
+            ]
+        },
+    )
+
+
+async def test_store_stream_aborts_multipart_upload_on_failing_chunks(
+    mock_multipart_client,
+):
+    async def failing_chunks() -> AsyncIterator[bytes]:
+        yield b"0123"
+        yield b"4567"
+        raise ValueError("Broken stream")
+
+    service = S3StorageService(
+        "test-bucket", multipart_threshold=4, multipart_part_size=4
+    )
+
+    async with service:
+        with pytest.raises(ValueError, match="Broken stream"):
+            await service.store_stream(
+                failing_chunks(), path="test/path", content_type="a/b"
+            )
+
+    mock_multipart_client.complete_multipart_upload.assert_not_called()
+    mock_multipart_client.abort_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path", UploadId="upload-id"
+    )
+
+
+def serve_ranges(mocker: MockerFixture, data: bytes):
+    async def get_object(*, Range, **_):
+        start, end = map(int, Range.removeprefix("bytes=").split("-"))
+        if start >= len(data):
+            raise ClientError({"Error": {"Code": "InvalidRange"}}, "get_object")
+        chunk = data[start : end + 1]
+        # split the body to check that it is read until the end
+        pieces = [chunk[:2], chunk[2:], b""]
+        return {
+            "Body": mocker.AsyncMock(read=mocker.AsyncMock(side_effect=pieces)),
+            "ContentRange": f"bytes {start}-{start + len(chunk) - 1}/{len(data)}",
+        }
+
+    return get_object
+
+
+async def test_get_file_downloads_ranges_and_returns_file(
+    mocker: MockerFixture, mock_s3_client
+):
+    mock_s3_client.get_object.side_effect = serve_ranges(mocker, b"0123456789")
+
+    service = S3StorageService(
+        "test-bucket", download_chunk_size=4, download_concurrency=2
+    )
+    async with service:
+        file = await service.get_file("test/path")
+
+    ranges = {c.kwargs["Range"] for c in mock_s3_client.get_object.call_args_list}
+    assert ranges == {"bytes=0-3", "bytes=4-7", "bytes=8-11"}
+    with file:
+        assert file.read() == b"0123456789"
+
+
+async def test_get_file_with_empty_file_returns_empty_file(
+    mocker: MockerFixture, mock_s3_client
+):
+    mock_s3_client.get_object.side_effect = serve_ranges(mocker, b"")
 
     async with S3StorageService("test-bucket") as service:
         file = await service.get_file("test/path")
 
-    # verify that get_object was called with the correct parameters
-    mock_s3_client.get_object.assert_called_once_with(
-        Bucket="test-bucket", Key="test/path"
-    )
-    # verify that the file content is correct
+    mock_s3_client.get_object.assert_called_once()
     with file:
-        assert file.read() == b"chunk1chunk2"
+        assert file.read() == b""
 
 
 async def test_get_file_raises_storage_exception_on_error(mock_s3_client):
@@ -142,9 +424,66 @@ async def test_get_file_raises_storage_exception_on_error(mock_s3_client):
         with pytest.raises(StorageError):
             await service.get_file("test/path")
 
+    mock_s3_client.get_object.assert_called_once()
+
+
+async def test_get_range_requests_inclusive_byte_range(
+    mocker: MockerFixture, mock_s3_client
+):
+    mock_s3_client.get_object.return_value = {
+        "Body": mocker.AsyncMock(read=mocker.AsyncMock(return_value=b"range"))
+    }
+
+    async with S3StorageService("test-bucket") as service:
+        data = await service.get_range("test/path", 100, 105)
+
     mock_s3_client.get_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path", Range="bytes=100-104"
+    )
+    assert data == b"range"
+
+
+async def test_get_range_raises_storage_exception_on_error(mock_s3_client):
+    mock_s3_client.get_object.side_effect = BotoCoreError()
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to get file range"):
+            await service.get_range("test/path", 0, 10)
+
+
+async def test_open_file_returns_remote_file_with_internal_url(mock_s3_client):
+    mock_s3_client.generate_presigned_url.return_value = (
+        "http://internal:9000/test-bucket/test/path?Signature=xyz"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        file = await service.open_file("test/path", size=1234)
+
+    assert isinstance(file, RemoteFile)
+    assert file.url == "http://internal:9000/test-bucket/test/path?Signature=xyz"
+    assert file.size == 1234
+    mock_s3_client.head_object.assert_not_called()
+
+
+async def test_open_file_without_size_reads_size_from_storage(mock_s3_client):
+    mock_s3_client.head_object.return_value = {"ContentLength": 4321}
+    mock_s3_client.generate_presigned_url.return_value = "http://internal/url"
+
+    async with S3StorageService("test-bucket") as service:
+        file = await service.open_file("test/path")
+
+    mock_s3_client.head_object.assert_called_once_with(
         Bucket="test-bucket", Key="test/path"
     )
+    assert file.seek(0, 2) == 4321
+
+
+async def test_open_file_raises_storage_exception_on_error(mock_s3_client):
+    mock_s3_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "")
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to open file"):
+            await service.open_file("test/path")
 
 
 async def test_generate_expiring_url_returns_url_on_success(
@@ -173,6 +512,44 @@ async def test_generate_expiring_url_returns_url_on_success(
     mock_replace.assert_called_once()
 
 
+async def test_generate_expiring_url_reuses_cached_url(mock_s3_client):
+    mock_s3_client.generate_presigned_url.return_value = "http://example.com/url"
+
+    async with S3StorageService("test-bucket") as service:
+        first_url = await service.generate_expiring_url("test/path")
+        second_url = await service.generate_expiring_url("test/path")
+        await service.generate_expiring_url("test/path", expiration=7200)
+
+    assert first_url == second_url
+    assert mock_s3_client.generate_presigned_url.call_count == 2
+    assert expiring_url_cache.info().hits == 1
+
+
+async def test_generate_expiring_urls_returns_urls_in_order(mock_s3_client):
+    async def presign(_method, Params, **_):
+        return f"http://example.com/{Params['Key']}"
+
+    mock_s3_client.generate_presigned_url.side_effect = presign
+
+    async with S3StorageService("test-bucket") as service:
+        await service.generate_expiring_url("b")
+        urls = await service.generate_expiring_urls(["a", "b", "c", "a"])
+
+    assert [url.rsplit("/", 1)[-1] for url in urls] == ["a", "b", "c", "a"]
+    # "b" comes from the cache and the duplicate "a" is only signed once
+    assert mock_s3_client.generate_presigned_url.call_count == 3
+
+
+async def test_generate_expiring_urls_raises_storage_exception_on_error(
+    mock_s3_client,
+):
+    mock_s3_client.generate_presigned_url.side_effect = BotoCoreError()
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError):
+            await service.generate_expiring_urls(["a", "b"])
+
+
 async def test_generate_expiring_url_raises_storage_exception_on_error(mock_s3_client):
     # raise an error on generate_presigned_url to simulate a failure
     mock_s3_client.generate_presigned_url.side_effect = BotoCoreError()
@@ -195,15 +572,21 @@ async def test_purge_deletes_all_files_in_bucket(mock_s3_client):
     mock_s3_client.list_objects_v2.return_value = {
         "Contents": [{"Key": "file1.txt"}, {"Key": "file2.txt"}]
     }
+    mock_s3_client.delete_objects.return_value = {}
 
     async with S3StorageService("test-bucket") as service:
-        await service.purge()
+        deleted = await service.purge()
 
-    # verify that list_objects_v2 and delete_objects were called
-    mock_s3_client.list_objects_v2.assert_called_once_with(Bucket="test-bucket")
+    assert deleted == 2
+    mock_s3_client.list_objects_v2.assert_called_once_with(
+        Bucket="test-bucket", Prefix="", MaxKeys=1000
+    )
     mock_s3_client.delete_objects.assert_called_once_with(
         Bucket="test-bucket",
-        Delete={"Objects": [{"Key": "file1.txt"}, {"Key": "file2.txt"}]},
+        Delete={
+            "Objects": [{"Key": "file1.txt"}, {"Key": "file2.txt"}],
+            "Quiet": True,
+        },
     )
 
 
@@ -212,8 +595,152 @@ async def test_purge_does_nothing_if_bucket_is_empty(mock_s3_client):
     mock_s3_client.list_objects_v2.return_value = {}
 
     async with S3StorageService("test-bucket") as service:
-        await service.purge()
+        deleted = await service.purge()
 
     # verify that list_objects_v2 was called but delete_objects was not
-    mock_s3_client.list_objects_v2.assert_called_once_with(Bucket="test-bucket")
+    assert deleted == 0
+    mock_s3_client.list_objects_v2.assert_called_once()
     mock_s3_client.delete_objects.assert_not_called()
+
+
+async def test_purge_deletes_every_page_of_listing(mock_s3_client):
+    pages = [
+        {
+            "Contents": [{"Key": f"tracks/{page}/{i}"} for i in range(1000)],
+            "IsTruncated": page < 2,
+            "NextContinuationToken": f"token-{page}",
+        }
+        for page in range(3)
+    ]
+    mock_s3_client.list_objects_v2.side_effect = pages
+    mock_s3_client.delete_objects.return_value = {}
+
+    async with S3StorageService("test-bucket", delete_concurrency=2) as service:
+        deleted = await service.purge("tracks/")
+
+    assert deleted == 3000
+    assert [
+        call.kwargs.get("ContinuationToken")
+        for call in mock_s3_client.list_objects_v2.call_args_list
+    ] == [None, "token-0", "token-1"]
+    assert all(
+        call.kwargs["Prefix"] == "tracks/"
+        for call in mock_s3_client.list_objects_v2.call_args_list
+    )
+    batches = [
+        call.kwargs["Delete"]["Objects"]
+        for call in mock_s3_client.delete_objects.call_args_list
+    ]
+    assert [len(batch) for batch in batches] == [1000, 1000, 1000]
+
+
+async def test_purge_bounds_concurrent_deletions(mock_s3_client):
+    mock_s3_client.list_objects_v2.side_effect = [
+        {
+            "Contents": [{"Key": str(page)}],
+            "IsTruncated": True,
+            "NextContinuationToken": str(page),
+        }
+        for page in range(5)
+    ] + [{"IsTruncated": False}]
+    running = 0
+    max_running = 0
+
+    async def delete_objects(**_):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    mock_s3_client.delete_objects.side_effect = delete_objects
+
+    async with S3StorageService("test-bucket", delete_concurrency=2) as service:
+        assert await service.purge() == 5
+
+    assert max_running == 2
+
+
+async def test_purge_raises_storage_exception_on_failed_keys(mock_s3_client):
+    mock_s3_client.list_objects_v2.return_value = {"Contents": [{"Key": "file1.txt"}]}
+    mock_s3_client.delete_objects.return_value = {
+        "Errors": [{"Key": "file1.txt", "Code": "AccessDenied"}]
+    }
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to delete files") as exc_info:
+            await service.purge()
+
+    assert exc_info.value.context["s3_error_code"] == "AccessDenied"
+
+
+async def test_purge_raises_storage_exception_on_listing_error(mock_s3_client):
+    mock_s3_client.list_objects_v2.side_effect = ClientError(
+        {"Error": {"Code": "500"}}, "list_objects_v2"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to purge bucket"):
+            await service.purge()
+
+
+async def test_get_file_size_returns_content_length(mock_s3_client):
+    mock_s3_client.head_object.return_value = {"ContentLength": 1234}
+
+    async with S3StorageService("test-bucket") as service:
+        size = await service.get_file_size("test/path")
+
+    assert size == 1234
+    mock_s3_client.head_object.assert_called_once_with(
+        Bucket="test-bucket", Key="test/path"
+    )
+
+
+async def test_get_file_size_of_missing_file_returns_none(mock_s3_client):
+    mock_s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "head_object"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        assert await service.get_file_size("test/path") is None
+
+
+async def test_get_file_size_raises_storage_exception_on_error(mock_s3_client):
+    mock_s3_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "403"}}, "head_object"
+    )
+
+    async with S3StorageService("test-bucket") as service:
+        with pytest.raises(StorageError, match="Failed to get file size"):
+            await service.get_file_size("test/path")
+
+
+async def test_generate_upload_form_restricts_upload_and_uses_public_url(
+    mocker: MockerFixture, mock_s3_client
+):
+    mocker.patch.object(
+        settings, "STORAGE_PUBLIC_URL", HttpUrl("https://public.example")
+    )
+    mock_s3_client.generate_presigned_post.return_value = {
+        "url": "http://internal:9000/test-bucket",
+        "fields": {"key": "test/path", "policy": "abc"},
+    }
+
+    async with S3StorageService("test-bucket") as service:
+        form = await service.generate_upload_form(
+            "test/path", content_type="audio/mpeg", max_size=100, expiration=60
+        )
+
+    assert form.url == "https://public.example/test-bucket"
+    assert form.fields == {"key": "test/path", "policy": "abc"}
+    mock_s3_client.generate_presigned_post.assert_called_once_with(
+        Bucket="test-bucket",
+        Key="test/path",
+        Fields={"Content-Type": "audio/mpeg"},
+        Conditions=[
+            {"Content-Type": "audio/mpeg"},
+            ["content-length-range", 1, 100],
+        ],
+        ExpiresIn=60,
+    )
@@ -4,7 +4,9 @@ from datetime import UTC, datetime
 from typing import Protocol
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import SAWarning
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from jamflow.core.exceptions import DuplicateEntityError
@@ -68,6 +70,28 @@ async def test_create__adds_instance_and_flushes_session(
     assert persisted is not None
 
 
+async def test_create__inserts_complete_model_in_one_statement(
+    repo: DummyRepository,
+    sqli_engine: AsyncEngine,
+):
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = sqli_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        dummy = await repo.create(DummyModel(name="Dummy"))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # Timestamps are set in Python, so nothing has to be read back
+    assert [statement.split()[0] for statement in statements] == ["INSERT"]
+    assert dummy.created_at.tzinfo is not None
+    assert dummy.updated_at.tzinfo is not None
+
+
 async def test_create__persists_after_commit(
     repo: DummyRepository,
     make_dummy: DummyFactory,
@@ -186,3 +210,68 @@ async def test_list_by_ids__orders_by_created_at_desc(
 
     items = await repo.list_by_ids([dummy_1.id, dummy_2.id])
     assert items[0].created_at < items[1].created_at
+
+
+async def test_list_page__walks_all_instances_in_order_of_creation(
+    repo: DummyRepository,
+    make_dummy: DummyFactory,
+    sqli_session: AsyncSession,
+):
+    created_at = datetime(2025, 10, 17, tzinfo=UTC)
+    # instances created at the same time are ordered by their ID
+    dummies = [make_dummy(f"Name {i}", created_at=created_at) for i in range(3)]
+    dummies += [
+        make_dummy(f"Name {i}", created_at=datetime(2025, 10, 18 + i, tzinfo=UTC))
+        for i in range(2)
+    ]
+    sqli_session.add_all(dummies)
+    await sqli_session.flush()
+
+    pages = [await repo.list_page(limit=2)]
+    while (cursor := pages[-1].next_cursor) is not None:
+        pages.append(await repo.list_page(limit=2, cursor=cursor))
+
+    assert [len(page.items) for page in pages] == [2, 2, 1]
+    expected = sorted(dummies, key=lambda d: (d.created_at, d.id))
+    assert [d.id for page in pages for d in page.items] == [d.id for d in expected]
+
+
+async def test_list_page__with_exact_fit_has_no_next_cursor(
+    repo: DummyRepository,
+    make_dummy: DummyFactory,
+    sqli_session: AsyncSession,
+):
+    sqli_session.add_all([make_dummy("Name 1"), make_dummy("Name 2")])
+    await sqli_session.flush()
+
+    page = await repo.list_page(limit=2)
+
+    assert len(page.items) == 2
+    assert page.next_cursor is None
+
+
+async def test_iter_batches__walks_all_instances_in_order_of_creation(
+    repo: DummyRepository,
+    make_dummy: DummyFactory,
+    sqli_session: AsyncSession,
+):
+    dummies = [
+        make_dummy(f"Name {i}", created_at=datetime(2025, 10, 18 - i, tzinfo=UTC))
+        for i in range(5)
+    ]
+    sqli_session.add_all(dummies)
+    await sqli_session.flush()
+
+    batches = [batch async for batch in repo.iter_batches(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    expected = sorted(dummies, key=lambda d: (d.created_at, d.id))
+    assert [d.id for batch in batches for d in batch] == [d.id for d in expected]
+
+
+async def test_iter_batches__without_instances_yields_nothing(
+    repo: DummyRepository,
+):
+    batches = [batch async for batch in repo.iter_batches(batch_size=2)]
+
+    assert batches == []
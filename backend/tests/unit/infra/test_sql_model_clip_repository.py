@@ -1,11 +1,12 @@
 import uuid
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from jamflow.core.utils import timezone_now
 from jamflow.infra.database.repositories import SQLModelClipRepository
-from jamflow.recordings.models import AudioFileFormat, Clip, Track
+from jamflow.recordings.models import AudioFileFormat, Clip, ClipStatus, Track
 
 pytestmark = [pytest.mark.asyncio]
 
@@ -152,3 +153,47 @@ async def test_list_by_track_id__for_non_exising_track_returns_nothing(
     clips = await repo.list_by_track_id(uuid.uuid4())
 
     assert len(clips) == 0
+
+
+async def test_iter_batches_by_track_id__yields_clips_of_track_newest_first(
+    repo: SQLModelClipRepository,
+    track_1: Track,
+    clip_1: Clip,
+    clip_2: Clip,
+    clip_3: Clip,  # noqa: ARG001
+):
+    batches = [
+        batch async for batch in repo.iter_batches_by_track_id(track_1.id, batch_size=1)
+    ]
+
+    assert [[c.id for c in batch] for batch in batches] == [[clip_2.id], [clip_1.id]]
+
+
+async def test_claim_next_pending__skips_clips_with_running_lease(
+    repo: SQLModelClipRepository,
+    sqli_session: AsyncSession,
+    track_1: Track,
+):
+    clips = [
+        Clip(
+            id=uuid.uuid4(),
+            title=f"Clip {minutes}",
+            track_id=track_1.id,
+            duration=1000,
+            start=0,
+            end=1000,
+            format=AudioFileFormat.MP3,
+            size=None,
+            path=f"path/to/clip{minutes}.mp3",
+            status=ClipStatus.RENDERING,
+            leased_until=timezone_now() + timedelta(minutes=minutes),
+        )
+        for minutes in (1, -1)
+    ]
+    for clip in clips:
+        await save_obj(sqli_session, clip)
+
+    claimed = await repo.claim_next_pending()
+
+    assert claimed is not None
+    assert claimed.id == clips[1].id
@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ConcurrentModificationError
+from jamflow.core.utils import timezone_now
+from jamflow.infra.database.repositories import SQLModelDirectUploadRepository
+from jamflow.recordings.models import DirectUpload
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@pytest.fixture
+async def repo(sqli_session: AsyncSession) -> SQLModelDirectUploadRepository:
+    return SQLModelDirectUploadRepository(sqli_session)
+
+
+async def test_delete_of_deleted_upload_raises_error(
+    repo: SQLModelDirectUploadRepository,
+):
+    direct_upload = await repo.create(DirectUpload(path="path/to/track.mp3"))
+    await repo.delete(direct_upload)
+
+    assert await repo.get_by_id(direct_upload.id) is None
+    with pytest.raises(ConcurrentModificationError):
+        await repo.delete(direct_upload)
+
+
+async def test_list_stale_returns_oldest_first(repo: SQLModelDirectUploadRepository):
+    now = timezone_now()
+    uploads = [
+        await repo.create(
+            DirectUpload(
+                path=f"path/{hours}.mp3", updated_at=now - timedelta(hours=hours)
+            )
+        )
+        for hours in (2, 3, 0)
+    ]
+
+    stale = await repo.list_stale(updated_before=now - timedelta(hours=1), limit=10)
+
+    assert [upload.id for upload in stale] == [uploads[1].id, uploads[0].id]
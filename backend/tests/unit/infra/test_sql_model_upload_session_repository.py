@@ -0,0 +1,90 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from jamflow.core.exceptions import ConcurrentModificationError
+from jamflow.infra.database.repositories import SQLModelUploadSessionRepository
+from jamflow.recordings.models import UploadSession
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@pytest.fixture
+async def repo(sqli_session: AsyncSession) -> SQLModelUploadSessionRepository:
+    return SQLModelUploadSessionRepository(sqli_session)
+
+
+@pytest.fixture
+async def upload_session(repo: SQLModelUploadSessionRepository) -> UploadSession:
+    return await repo.create(UploadSession(title="Jam", recorded_date=None, size=1000))
+
+
+async def move_offset(sqli_session: AsyncSession, upload_session: UploadSession):
+    """Advance the offset behind the back of the loaded session."""
+    await sqli_session.exec(
+        update(UploadSession)
+        .where(UploadSession.id == upload_session.id)  # ty: ignore[invalid-argument-type]
+        .values(offset=upload_session.offset + 100)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def test_save_advances_offset(
+    repo: SQLModelUploadSessionRepository, upload_session: UploadSession
+):
+    upload_session.offset = 100
+    upload_session.part_tags = ["tag-1"]
+    await repo.save(upload_session)
+
+    saved = await repo.get_by_id(upload_session.id)
+    assert saved is not None
+    assert saved.offset == 100
+    assert saved.part_tags == ["tag-1"]
+
+
+async def test_save_after_concurrent_change_raises_error(
+    sqli_session: AsyncSession,
+    repo: SQLModelUploadSessionRepository,
+    upload_session: UploadSession,
+):
+    await move_offset(sqli_session, upload_session)
+
+    upload_session.offset = 100
+    with pytest.raises(ConcurrentModificationError):
+        await repo.save(upload_session)
+
+
+async def test_delete_after_concurrent_change_raises_error(
+    sqli_session: AsyncSession,
+    repo: SQLModelUploadSessionRepository,
+    upload_session: UploadSession,
+):
+    await move_offset(sqli_session, upload_session)
+
+    with pytest.raises(ConcurrentModificationError):
+        await repo.delete(upload_session)
+
+
+async def test_list_stale_returns_oldest_sessions_first(
+    repo: SQLModelUploadSessionRepository,
+):
+    now = datetime.now(UTC)
+    recent, older, oldest = [
+        await repo.create(
+            UploadSession(
+                title=f"Jam {hours}",
+                recorded_date=None,
+                size=1000,
+                updated_at=now - hours,
+            )
+        )
+        for hours in (timedelta(hours=1), timedelta(hours=30), timedelta(hours=50))
+    ]
+
+    stale = await repo.list_stale(updated_before=now - timedelta(hours=24), limit=10)
+    assert [s.id for s in stale] == [oldest.id, older.id]
+
+    stale = await repo.list_stale(updated_before=now - timedelta(hours=24), limit=1)
+    assert [s.id for s in stale] == [oldest.id]
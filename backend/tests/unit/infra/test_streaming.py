@@ -0,0 +1,58 @@
+import json
+from collections.abc import AsyncIterator
+
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+
+from jamflow.infra.api import streaming
+from jamflow.infra.api.streaming import NDJSONResponse, accepts_ndjson
+
+
+class Item(BaseModel):
+    name: str
+
+
+async def items(count: int) -> AsyncIterator[Item]:
+    for i in range(count):
+        yield Item(name=f"Item {i}")
+
+
+async def read_body(response: NDJSONResponse) -> list[bytes]:
+    chunks = []
+    async for chunk in response.body_iterator:
+        assert isinstance(chunk, bytes)
+        chunks.append(chunk)
+    return chunks
+
+
+def test_accepts_ndjson():
+    assert accepts_ndjson("application/x-ndjson")
+    assert accepts_ndjson("Application/X-NDJSON;q=0.9, application/json")
+    assert not accepts_ndjson("application/json")
+    assert not accepts_ndjson(None)
+
+
+async def test_response_has_one_item_per_line():
+    response = NDJSONResponse(items(3))
+
+    body = b"".join(await read_body(response))
+
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"name": "Item 0"},
+        {"name": "Item 1"},
+        {"name": "Item 2"},
+    ]
+
+
+async def test_response_sends_lines_in_chunks(mocker: MockerFixture):
+    mocker.patch.object(streaming, "_CHUNK_SIZE", 30)
+
+    chunks = await read_body(NDJSONResponse(items(5)))
+
+    # Each line is 19 bytes, so a chunk is full after two of them
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+async def test_response_without_items_is_empty():
+    assert await read_body(NDJSONResponse(items(0))) == []
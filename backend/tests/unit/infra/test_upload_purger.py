@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from pytest_mock import MockerFixture
+
+from jamflow.infra.jobs import UploadSessionPurger
+
+
+def make_purger(
+    mocker: MockerFixture, results: list, interval: float = 60
+) -> tuple[UploadSessionPurger, AsyncMock]:
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__ = AsyncMock()
+    session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    build = mocker.patch("jamflow.infra.jobs.upload_purger.build_purge_upload_sessions")
+    build.return_value.execute = AsyncMock(side_effect=results)
+    build_direct = mocker.patch(
+        "jamflow.infra.jobs.upload_purger.build_purge_direct_uploads"
+    )
+    build_direct.return_value.execute = AsyncMock(return_value=0)
+    purger = UploadSessionPurger(interval=interval, session_factory=session_factory)
+    return purger, build.return_value.execute
+
+
+async def test_run_once_purges_batches_until_none_are_left(mocker: MockerFixture):
+    purger, execute = make_purger(mocker, [100, 100, 3, 0])
+
+    assert await purger.run_once() == 203
+    assert execute.await_count == 4
+
+
+async def test_run_once_purges_direct_uploads_after_upload_sessions(
+    mocker: MockerFixture,
+):
+    purger, _ = make_purger(mocker, [2, 0])
+    build_direct = mocker.patch(
+        "jamflow.infra.jobs.upload_purger.build_purge_direct_uploads"
+    )
+    build_direct.return_value.execute = AsyncMock(side_effect=[3, 0])
+
+    assert await purger.run_once() == 5
+
+
+async def test_purger_survives_errors(mocker: MockerFixture):
+    results = [RuntimeError("boom"), 0, 0]
+    purger, execute = make_purger(mocker, results, interval=0)
+
+    purger.start()
+    while execute.await_count < len(results):
+        await asyncio.sleep(0)
+    await purger.stop()
+
+    assert execute.await_count == len(results)
@@ -0,0 +1,73 @@
+import pytest
+
+from jamflow.infra.storage.url_cache import ExpiringUrlCache, UrlCacheKey
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> ExpiringUrlCache:
+    return ExpiringUrlCache(max_size=2, min_validity=100, clock=clock)
+
+
+def _key(path: str, expiration: int = 3600) -> UrlCacheKey:
+    return UrlCacheKey("bucket", path, expiration)
+
+
+def test_get_returns_cached_url(cache: ExpiringUrlCache):
+    cache.put(_key("a"), "url-a")
+
+    assert cache.get(_key("a")) == "url-a"
+    assert cache.get(_key("a", expiration=60)) is None
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+def test_get_ignores_url_expiring_within_min_validity(
+    cache: ExpiringUrlCache, clock: FakeClock
+):
+    cache.put(_key("a"), "url-a")
+
+    clock.now = 3500
+    assert cache.get(_key("a")) == "url-a"
+    clock.now = 3501
+    assert cache.get(_key("a")) is None
+    assert cache.info().size == 0
+
+
+def test_put_evicts_least_recently_used_url(cache: ExpiringUrlCache):
+    cache.put(_key("a"), "url-a")
+    cache.put(_key("b"), "url-b")
+    cache.get(_key("a"))
+
+    cache.put(_key("c"), "url-c")
+
+    assert cache.get(_key("a")) == "url-a"
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("c")) == "url-c"
+
+
+def test_put_skips_url_expiring_within_min_validity(cache: ExpiringUrlCache):
+    cache.put(_key("a", expiration=100), "url-a")
+
+    assert cache.info().size == 0
+
+
+def test_clear_removes_urls_and_resets_counters(cache: ExpiringUrlCache):
+    cache.put(_key("a"), "url-a")
+    cache.get(_key("a"))
+
+    cache.clear()
+
+    assert cache.info() == (0, 0, 0, 2)
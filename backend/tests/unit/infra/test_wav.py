@@ -0,0 +1,101 @@
+import struct
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from pydub import AudioSegment
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.audio import wav
+
+
+@pytest.fixture
+def wav_bytes(wav_file: Path) -> bytes:
+    return wav_file.read_bytes()
+
+
+def _with_extra_chunk(wav_bytes: bytes) -> bytes:
+    """Insert an odd sized chunk between the format and data chunks."""
+    fmt_end = 12 + 8 + struct.unpack("<I", wav_bytes[16:20])[0]
+    extra_chunk = struct.pack("<4sI", b"LIST", 3) + b"abc\0"
+    return wav_bytes[:fmt_end] + extra_chunk + wav_bytes[fmt_end:]
+
+
+def test_read_layout_locates_data_chunk(wav_bytes: bytes):
+    layout = wav.read_layout(BytesIO(wav_bytes))
+
+    assert layout.sample_rate == 44100
+    assert layout.block_align == 2
+    assert layout.data_offset == 44
+    assert layout.data_size == len(wav_bytes) - 44
+
+
+def test_read_layout_skips_unknown_chunks(wav_bytes: bytes):
+    layout = wav.read_layout(BytesIO(_with_extra_chunk(wav_bytes)))
+
+    assert layout.data_offset == 44 + 12
+
+
+def test_read_layout_with_unknown_data_size_uses_file_size(wav_bytes: bytes):
+    streamed = wav_bytes[:40] + struct.pack("<I", 0xFFFFFFFF) + wav_bytes[44:]
+
+    layout = wav.read_layout(BytesIO(streamed))
+
+    assert layout.data_size == len(wav_bytes) - 44
+
+
+@pytest.mark.parametrize(
+    "data,message",
+    [
+        (b"not a wave file", "Not a WAVE file"),
+        (b"RIFF\x04\x00\x00\x00WAVE", "no data chunk"),
+        (b"RIFF\x0c\x00\x00\x00WAVEdata\x00\x00\x00\x00", "no format chunk"),
+    ],
+)
+def test_read_layout_with_invalid_file_raises_exception(data: bytes, message: str):
+    with pytest.raises(ValidationError, match=message):
+        wav.read_layout(BytesIO(data))
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        (0, 1000),
+        (333, 1777),
+        (2000, 2400),
+    ],
+)
+def test_clip_matches_decoded_slice(wav_file: Path, start: int, end: int):
+    with open(wav_file, "rb") as file:
+        clipped_file = wav.clip(file, start=start, end=end)
+
+    clipped_segment = AudioSegment.from_file(clipped_file, format="wav")
+    original_segment = AudioSegment.from_file(wav_file, format="wav")
+    assert clipped_segment.raw_data == original_segment[start:end].raw_data
+
+
+def test_clip_keeps_extra_chunks_out_of_the_clip(wav_bytes: bytes):
+    clipped_file = wav.clip(BytesIO(_with_extra_chunk(wav_bytes)), start=0, end=1000)
+
+    layout = wav.read_layout(clipped_file)
+    assert layout.data_offset == 44
+    assert layout.data_size == 44100 * 2
+
+
+def test_clip_writes_consistent_riff_size(wav_bytes: bytes):
+    clipped_file = wav.clip(BytesIO(wav_bytes), start=0, end=1000)
+
+    clipped = clipped_file.read()
+    assert struct.unpack("<I", clipped[4:8])[0] == len(clipped) - 8
+
+
+def test_clip_end_beyond_data_is_clamped(wav_bytes: bytes):
+    clipped_file = wav.clip(BytesIO(wav_bytes), start=2000, end=60_000)
+
+    layout = wav.read_layout(clipped_file)
+    assert layout.data_size == len(wav_bytes) - 44 - 2000 * 44100 // 1000 * 2
+
+
+def test_clip_beyond_data_raises_exception(wav_bytes: bytes):
+    with pytest.raises(ValidationError, match="exceeds audio stream"):
+        wav.clip(BytesIO(wav_bytes), start=60_000, end=61_000)
@@ -1,27 +1,25 @@
 from datetime import date
 
 import pytest
-from fastapi import UploadFile
 from pydantic import ValidationError
 
 from jamflow.recordings.schemas import TrackCreateDto
 
 
 @pytest.mark.parametrize("recorded_date", ["", None, date.today()])
-def test_track_create_dto_constructs_sucessfully(
-    recorded_date,
-    mp3_upload_file: UploadFile,
-):
+def test_track_create_dto_constructs_sucessfully(recorded_date):
     dto = TrackCreateDto(
         title="Test Track",
         recorded_date=recorded_date,
-        upload_file=mp3_upload_file,
     )
     expected_recorded_date = None if recorded_date == "" else recorded_date
     assert dto.title == "Test Track"
     assert dto.recorded_date == expected_recorded_date
-    assert dto.upload_file == mp3_upload_file
-    assert dto.upload_file.file.tell() == 0
+
+
+def test_track_create_dto_defaults_recorded_date_to_none():
+    dto = TrackCreateDto.model_validate({"title": "Test Track"})
+    assert dto.recorded_date is None
 
 
 @pytest.mark.parametrize(
@@ -38,56 +36,10 @@ def test_track_create_dto_constructs_sucessfully(
     ],
 )
 def test_track_create_dto_with_invalid_title_raises_validation_error(
-    title, expected_message, mp3_upload_file: UploadFile
+    title, expected_message
 ):
     with pytest.raises(ValidationError, match=expected_message):
         TrackCreateDto(
             title=title,
             recorded_date=date.today(),
-            upload_file=mp3_upload_file,
-        )
-
-
-@pytest.fixture
-def empty_mp3_upload_file(mp3_upload_file: UploadFile) -> UploadFile:
-    return UploadFile(
-        filename=mp3_upload_file.filename, file=mp3_upload_file.file, size=0
-    )
-
-
-@pytest.fixture
-def huge_mp3_upload_file(mp3_upload_file: UploadFile) -> UploadFile:
-    return UploadFile(
-        filename=mp3_upload_file.filename, file=mp3_upload_file.file, size=209715201
-    )
-
-
-@pytest.mark.parametrize(
-    "upload_file,expected_message",
-    [
-        (
-            "empty_mp3_upload_file",
-            "File is empty",
-        ),
-        (
-            "huge_mp3_upload_file",
-            "File is larger than 200 MB",
-        ),
-        (
-            "txt_upload_file",
-            "Unsupported file format. Supported formats: mp3, wav, ogg",
-        ),
-    ],
-)
-def test_track_create_dto_with_invalid_upload_file_raises_validaiton_error(
-    upload_file: str,
-    expected_message: str,
-    request: pytest.FixtureRequest,
-):
-    upload_file: UploadFile = request.getfixturevalue(upload_file)
-    with pytest.raises(ValidationError, match=expected_message):
-        TrackCreateDto(
-            title="Test Track",
-            recorded_date=date.today(),
-            upload_file=upload_file,
         )
@@ -0,0 +1,238 @@
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from jamflow.core.exceptions import (
+    ConcurrentModificationError,
+    ResourceNotFoundError,
+    StorageError,
+    ValidationError,
+)
+from jamflow.recordings.models import AudioFileFormat, UploadSession
+from jamflow.recordings.use_cases import AppendToUploadSession
+from tests.unit.fakes import (
+    FakeAudioStorage,
+    FakeTrackRepository,
+    FakeUploadSessionRepository,
+)
+
+PART_SIZE = 4096
+
+
+@pytest.fixture
+def mp3_data(mp3_file: Path) -> bytes:
+    return mp3_file.read_bytes()
+
+
+@pytest.fixture
+def use_case(
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_track_repo: FakeTrackRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> AppendToUploadSession:
+    from jamflow.infra.audio import native_audio_processor
+
+    return AppendToUploadSession(
+        upload_session_repo=fake_upload_session_repo,
+        track_repo=fake_track_repo,
+        session=mock_db_session,
+        audio_processor=native_audio_processor,
+        audio_storage=fake_audio_storage,
+        part_size=PART_SIZE,
+        expiration=3600,
+    )
+
+
+@pytest.fixture
+async def upload_session(
+    fake_upload_session_repo: FakeUploadSessionRepository, mp3_data: bytes
+) -> UploadSession:
+    upload_session = UploadSession(title="Jam", recorded_date=None, size=len(mp3_data))
+    return await fake_upload_session_repo.create(upload_session)
+
+
+async def chunk_of(data: bytes, size: int = 1000) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_whole_file_in_one_chunk_creates_track(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_track_repo: FakeTrackRepository,
+    fake_audio_storage: FakeAudioStorage,
+):
+    upload_session_dto = await use_case.execute(
+        upload_session.id, offset=0, chunk=chunk_of(mp3_data)
+    )
+
+    assert upload_session_dto.offset == len(mp3_data)
+    track = upload_session_dto.track
+    assert track is not None
+    assert track.id == upload_session.id
+    assert track.title == "Jam"
+    assert track.format == AudioFileFormat.MP3
+    assert track.size == len(mp3_data)
+    assert 2400 <= track.duration <= 2600
+    assert track.id in fake_track_repo.models
+    assert upload_session.id not in fake_upload_session_repo.models
+    (path,) = fake_audio_storage.new_files()
+    fake_audio_storage.files[path].seek(0)
+    assert fake_audio_storage.files[path].read() == mp3_data
+    assert not fake_audio_storage.multipart_uploads
+
+
+async def test_chunks_resume_at_returned_offset(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+    fake_audio_storage: FakeAudioStorage,
+):
+    first = await use_case.execute(
+        upload_session.id, offset=0, chunk=chunk_of(mp3_data[: 2 * PART_SIZE])
+    )
+    second = await use_case.execute(
+        upload_session.id,
+        offset=first.offset,
+        chunk=chunk_of(mp3_data[first.offset :]),
+    )
+
+    assert first.offset == 2 * PART_SIZE
+    assert first.track is None
+    assert second.track is not None
+    (path,) = fake_audio_storage.new_files()
+    fake_audio_storage.files[path].seek(0)
+    assert fake_audio_storage.files[path].read() == mp3_data
+
+
+async def test_rest_of_chunk_short_of_a_part_is_dropped(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+):
+    upload_session_dto = await use_case.execute(
+        upload_session.id, offset=0, chunk=chunk_of(mp3_data[: PART_SIZE + 100])
+    )
+
+    assert upload_session_dto.offset == PART_SIZE
+    assert upload_session.part_tags == [f"tag-1-{PART_SIZE}"]
+
+
+async def test_broken_off_chunk_keeps_parts_received_until_then(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+):
+    async def broken_chunk() -> AsyncIterator[bytes]:
+        yield mp3_data[: 2 * PART_SIZE + 100]
+        raise ConnectionError("Client disconnected")
+
+    with pytest.raises(ConnectionError):
+        await use_case.execute(upload_session.id, offset=0, chunk=broken_chunk())
+
+    assert upload_session.offset == 2 * PART_SIZE
+    assert len(upload_session.part_tags) == 2
+
+
+async def test_too_small_chunk_raises_validation_error_and_aborts_upload(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+    fake_audio_storage: FakeAudioStorage,
+):
+    with pytest.raises(ValidationError, match=f"at least {PART_SIZE} bytes"):
+        await use_case.execute(
+            upload_session.id, offset=0, chunk=chunk_of(mp3_data[:100])
+        )
+
+    assert upload_session.offset == 0
+    assert upload_session.storage_upload_id is None
+    assert not fake_audio_storage.multipart_uploads
+
+
+async def test_chunk_past_size_raises_validation_error(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+):
+    with pytest.raises(ValidationError, match="runs past the size"):
+        await use_case.execute(
+            upload_session.id, offset=0, chunk=chunk_of(mp3_data + b"\0")
+        )
+
+
+async def test_unsupported_file_raises_validation_error(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    fake_audio_storage: FakeAudioStorage,
+):
+    with pytest.raises(ValidationError, match="Unsupported file format"):
+        await use_case.execute(
+            upload_session.id, offset=0, chunk=chunk_of(b"testtext" * PART_SIZE)
+        )
+
+    assert not fake_audio_storage.multipart_uploads
+
+
+async def test_wrong_offset_raises_concurrent_modification_error(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+):
+    with pytest.raises(ConcurrentModificationError, match="offset is 0, not 10"):
+        await use_case.execute(upload_session.id, offset=10, chunk=chunk_of(mp3_data))
+
+
+async def test_concurrent_first_chunk_aborts_its_upload(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mocker,
+):
+    mocker.patch.object(
+        fake_upload_session_repo,
+        "save",
+        side_effect=ConcurrentModificationError("Changed concurrently"),
+    )
+
+    with pytest.raises(ConcurrentModificationError):
+        await use_case.execute(upload_session.id, offset=0, chunk=chunk_of(mp3_data))
+
+    assert not fake_audio_storage.multipart_uploads
+
+
+async def test_missing_session_raises_resource_not_found_error(
+    use_case: AppendToUploadSession, mp3_data: bytes
+):
+    with pytest.raises(ResourceNotFoundError):
+        await use_case.execute(uuid.uuid4(), offset=0, chunk=chunk_of(mp3_data))
+
+
+async def test_complete_upload_is_finished_again_after_failed_track_creation(
+    use_case: AppendToUploadSession,
+    upload_session: UploadSession,
+    mp3_data: bytes,
+    fake_track_repo: FakeTrackRepository,
+    mocker,
+):
+    mocker.patch.object(
+        fake_track_repo, "create", side_effect=StorageError("Database down")
+    )
+    with pytest.raises(StorageError):
+        await use_case.execute(upload_session.id, offset=0, chunk=chunk_of(mp3_data))
+    mocker.stopall()
+
+    upload_session_dto = await use_case.execute(
+        upload_session.id, offset=len(mp3_data), chunk=chunk_of(b"")
+    )
+
+    assert upload_session_dto.track is not None
+    assert upload_session_dto.track.id in fake_track_repo.models
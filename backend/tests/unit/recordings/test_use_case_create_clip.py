@@ -1,11 +1,13 @@
+import asyncio
 import uuid
 from unittest.mock import AsyncMock
 
 import pytest
+from pytest_mock import MockerFixture
 
 from jamflow.core.exceptions import ResourceNotFoundError, ValidationError
 from jamflow.infra.bootstrap import build_create_clip
-from jamflow.recordings.models import AudioFileFormat
+from jamflow.recordings.models import AudioFileFormat, ClipStatus
 from jamflow.recordings.use_cases import CreateClip
 from tests.unit.factories import ClipCreateDtoFactory, TrackFactory
 from tests.unit.fakes import (
@@ -77,6 +79,21 @@ async def test_creates_clip_in_repository(
     assert clip_read_dto.id in fake_clip_repo.models
 
 
+async def test_commits_clip_without_reading_it_back(
+    use_case: CreateClip,
+    mock_db_session: AsyncMock,
+    create_persisted_track: CreatePersistedTrack,
+):
+    track = await create_persisted_track()
+    clip_create_dto = ClipCreateDtoFactory.build(track_id=track.id)
+
+    clip_read_dto = await use_case.execute(clip_create_dto)
+
+    mock_db_session.commit.assert_awaited_once()
+    mock_db_session.refresh.assert_not_called()
+    assert clip_read_dto.created_at is not None
+
+
 async def test_stores_file_in_audio_storage(
     use_case: CreateClip,
     fake_audio_storage: FakeAudioStorage,
@@ -137,3 +154,137 @@ async def test_returns_clip_with_valid_url(
 
     url = str(clip_read_dto.url)
     assert url.startswith("http://bogus.url")
+
+
+async def test_deferred_returns_pending_clip_without_rendering(
+    use_case: CreateClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+):
+    track = await create_persisted_track()
+    fake_audio_storage.checkpoint()
+    clip_create_dto = ClipCreateDtoFactory.build(track_id=track.id)
+
+    clip_read_dto = await use_case.execute(clip_create_dto, defer=True)
+
+    assert clip_read_dto.status == ClipStatus.PENDING
+    assert clip_read_dto.url is None
+    assert clip_read_dto.size is None
+    assert fake_clip_repo.models[clip_read_dto.id].status == ClipStatus.PENDING
+    assert not fake_audio_storage.new_files()
+
+
+async def test_identical_clips_share_stored_file(
+    use_case: CreateClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+    mocker: MockerFixture,
+):
+    track = await create_persisted_track()
+    fake_audio_storage.checkpoint()
+    clip_spy = mocker.spy(fake_audio_processor, "clip")
+    clip_create_dto = ClipCreateDtoFactory.build(track_id=track.id)
+
+    first = await use_case.execute(clip_create_dto)
+    second = await use_case.execute(clip_create_dto)
+
+    assert first.id != second.id
+    assert fake_clip_repo.models[first.id].path == fake_clip_repo.models[second.id].path
+    assert first.size == second.size
+    assert len(fake_audio_storage.new_files()) == 1
+    assert clip_spy.await_count == 1
+
+
+async def test_concurrent_identical_clips_are_rendered_once(
+    use_case: CreateClip,
+    fake_audio_processor: FakeAudioProcessor,
+    create_persisted_track: CreatePersistedTrack,
+    mocker: MockerFixture,
+):
+    track = await create_persisted_track()
+    clip_spy = mocker.spy(fake_audio_processor, "clip")
+    clip_create_dto = ClipCreateDtoFactory.build(track_id=track.id)
+
+    clip_read_dtos = await asyncio.gather(
+        use_case.execute(clip_create_dto),
+        use_case.execute(clip_create_dto),
+    )
+
+    assert len({dto.id for dto in clip_read_dtos}) == 2
+    assert clip_spy.await_count == 1
+
+
+async def test_clips_of_different_ranges_are_stored_separately(
+    use_case: CreateClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+):
+    track = await create_persisted_track(TrackFactory.build(duration=60_000))
+    fake_audio_storage.checkpoint()
+
+    first = await use_case.execute(
+        ClipCreateDtoFactory.build(track_id=track.id, start=0, end=1_000)
+    )
+    second = await use_case.execute(
+        ClipCreateDtoFactory.build(track_id=track.id, start=0, end=2_000)
+    )
+
+    assert fake_clip_repo.models[first.id].path != fake_clip_repo.models[second.id].path
+    assert len(fake_audio_storage.new_files()) == 2
+
+
+async def test_rendering_outlives_cancelled_caller_that_started_it(
+    fake_clip_repo: FakeClipRepository,
+    fake_track_repo: FakeTrackRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    mock_db_session: AsyncMock,
+    create_persisted_track: CreatePersistedTrack,
+    mocker: MockerFixture,
+):
+    class ClosingAudioStorage(FakeAudioStorage):
+        closed = False
+
+        async def __aexit__(self, *exc_info) -> None:
+            self.closed = True
+
+        async def store_file(self, file, *, path, content_type) -> None:
+            assert not self.closed, "Storage used after it was closed"
+            await super().store_file(file, path=path, content_type=content_type)
+
+    def build_use_case() -> CreateClip:
+        return build_create_clip(
+            clip_repo=fake_clip_repo,
+            track_repo=fake_track_repo,
+            audio_processor=fake_audio_processor,
+            audio_storage=ClosingAudioStorage(),
+            session=mock_db_session,
+        )
+
+    track = await create_persisted_track()
+    clip_create_dto = ClipCreateDtoFactory.build(track_id=track.id)
+    clipping = asyncio.Event()
+    resume = asyncio.Event()
+    clip = fake_audio_processor.clip
+
+    async def slow_clip(*args, **kwargs):
+        clipping.set()
+        await resume.wait()
+        return await clip(*args, **kwargs)
+
+    mocker.patch.object(fake_audio_processor, "clip", side_effect=slow_clip)
+
+    first = asyncio.create_task(build_use_case().execute(clip_create_dto))
+    await clipping.wait()
+    second = asyncio.create_task(build_use_case().execute(clip_create_dto))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    resume.set()
+
+    clip_read_dto = await second
+    assert clip_read_dto.size is not None
+    assert first.cancelled()
@@ -1,14 +1,14 @@
 import uuid
-from datetime import date
 from unittest.mock import AsyncMock
 
 import pytest
-from fastapi import UploadFile
+from pytest_mock import MockerFixture
 
+from jamflow.core.exceptions import ValidationError
 from jamflow.infra.bootstrap import build_create_track
 from jamflow.recordings.models import AudioFileFormat
-from jamflow.recordings.schemas import TrackCreateDto
 from jamflow.recordings.use_cases import CreateTrack
+from tests.fixtures.files import InMemoryTrackUpload
 from tests.unit.fakes import (
     FakeAudioProcessor,
     FakeAudioStorage,
@@ -31,20 +31,8 @@ def use_case(
     )
 
 
-# TODO: replace with a polyfactory once the DTO is decoupled from fastAPI concerns
-@pytest.fixture
-def track_create_dto(mp3_upload_file: UploadFile) -> TrackCreateDto:
-    dto = TrackCreateDto(
-        title="Test Track",
-        recorded_date=date.today(),
-        upload_file=mp3_upload_file,
-    )
-    return dto
-
-
-@pytest.mark.xfail(reason="Duration check happens after file storage")
-async def test_format_inferr_failure_failure_prevents_persistence(
-    track_create_dto: TrackCreateDto,
+async def test_duration_failure_prevents_persistence(
+    mp3_track_upload: InMemoryTrackUpload,
     fake_audio_processor: FakeAudioProcessor,
     fake_audio_storage: FakeAudioStorage,
     fake_track_repo: FakeTrackRepository,
@@ -53,14 +41,14 @@ async def test_format_inferr_failure_failure_prevents_persistence(
     fake_audio_processor.fail_on("get_duration", Exception("Bad file"))
 
     with pytest.raises(Exception, match="Bad file"):
-        await use_case.execute(track_create_dto)
+        await use_case.execute(mp3_track_upload)
 
     assert not fake_audio_storage.files
     assert not fake_track_repo.models
 
 
 async def test_format_inferr_failure_prevents_persistence(
-    track_create_dto: TrackCreateDto,
+    mp3_track_upload: InMemoryTrackUpload,
     fake_audio_processor: FakeAudioProcessor,
     fake_audio_storage: FakeAudioStorage,
     fake_track_repo: FakeTrackRepository,
@@ -69,57 +57,193 @@ async def test_format_inferr_failure_prevents_persistence(
     fake_audio_processor.fail_on("get_format", Exception("Bad file"))
 
     with pytest.raises(Exception, match="Bad file"):
-        await use_case.execute(track_create_dto)
+        await use_case.execute(mp3_track_upload)
 
     assert not fake_audio_storage.files
     assert not fake_track_repo.models
 
 
-async def test_uses_inferred_file_type_over_passed_one(
-    track_create_dto: TrackCreateDto,
+async def test_metadata_validation_failure_deletes_stored_file(
+    mp3_track_upload: InMemoryTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    fake_track_repo: FakeTrackRepository,
+    use_case: CreateTrack,
+    mocker: MockerFixture,
+):
+    mocker.patch.object(
+        mp3_track_upload,
+        "get_track_create_dto",
+        side_effect=ValidationError("Title is required", field="title"),
+    )
+
+    with pytest.raises(ValidationError, match="Title is required"):
+        await use_case.execute(mp3_track_upload)
+
+    assert not fake_audio_storage.files
+    assert not fake_track_repo.models
+
+
+async def test_failed_commit_deletes_stored_file(
+    mp3_track_upload: InMemoryTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+    use_case: CreateTrack,
+):
+    mock_db_session.commit.side_effect = Exception("Connection lost")
+
+    with pytest.raises(Exception, match="Connection lost"):
+        await use_case.execute(mp3_track_upload)
+
+    assert not fake_audio_storage.files
+
+
+async def test_uses_inferred_file_type(
+    mp3_track_upload: InMemoryTrackUpload,
     fake_audio_processor: FakeAudioProcessor,
     use_case: CreateTrack,
 ):
-    track_create_dto.upload_file.filename = "test.foo"
     fake_audio_processor.file_format = AudioFileFormat.OGG
 
-    track_read_dto = await use_case.execute(track_create_dto)
+    track_read_dto = await use_case.execute(mp3_track_upload)
 
     assert track_read_dto.format == AudioFileFormat.OGG
 
 
 async def test_returns_track_with_correct_data(
-    track_create_dto: TrackCreateDto,
+    mp3_track_upload: InMemoryTrackUpload,
     fake_audio_processor: FakeAudioProcessor,
     use_case: CreateTrack,
 ):
     fake_audio_processor.file_format = AudioFileFormat.MP3
     fake_audio_processor.duration = 50_000
-    track_create_dto.upload_file.size = 321
 
-    track_read_dto = await use_case.execute(track_create_dto)
+    track_read_dto = await use_case.execute(mp3_track_upload)
 
     assert isinstance(track_read_dto.id, uuid.UUID)
+    assert track_read_dto.title == mp3_track_upload.track_create_dto.title
     assert track_read_dto.format == AudioFileFormat.MP3
     assert track_read_dto.duration == 50_000
-    assert track_read_dto.size == 321
+    assert track_read_dto.size == len(mp3_track_upload.data)
 
 
 async def test_creates_track_in_repository(
-    track_create_dto: TrackCreateDto,
+    mp3_track_upload: InMemoryTrackUpload,
     fake_track_repo: FakeTrackRepository,
     use_case: CreateTrack,
 ):
-    track_read_dto = await use_case.execute(track_create_dto)
+    track_read_dto = await use_case.execute(mp3_track_upload)
 
     assert track_read_dto.id in fake_track_repo.models
 
 
-async def test_creates_clip_in_repository(
-    track_create_dto: TrackCreateDto,
+async def test_commits_track_without_reading_it_back(
+    mp3_track_upload: InMemoryTrackUpload,
+    mock_db_session: AsyncMock,
+    use_case: CreateTrack,
+):
+    track_read_dto = await use_case.execute(mp3_track_upload)
+
+    mock_db_session.commit.assert_awaited_once()
+    mock_db_session.refresh.assert_not_called()
+    assert track_read_dto.created_at is not None
+
+
+async def test_stores_whole_file_in_audio_storage(
+    mp3_track_upload: InMemoryTrackUpload,
     fake_audio_storage: FakeAudioStorage,
     use_case: CreateTrack,
 ):
-    await use_case.execute(track_create_dto)
+    await use_case.execute(mp3_track_upload)
+
+    (path,) = fake_audio_storage.new_files()
+    stored_file = await fake_audio_storage.get_file(path)
+    assert stored_file.read() == mp3_track_upload.data
+
 
-    assert len(fake_audio_storage.new_files()) == 1
+@pytest.fixture
+def native_use_case(
+    fake_track_repo: FakeTrackRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> CreateTrack:
+    return build_create_track(
+        track_repo=fake_track_repo,
+        audio_storage=fake_audio_storage,
+        session=mock_db_session,
+    )
+
+
+@pytest.mark.parametrize(
+    "track_upload", ["mp3_track_upload", "ogg_track_upload", "wav_track_upload"]
+)
+async def test_reads_duration_from_kept_edges_of_file(
+    track_upload: str,
+    native_use_case: CreateTrack,
+    fake_audio_storage: FakeAudioStorage,
+    request: pytest.FixtureRequest,
+    mocker: MockerFixture,
+):
+    unreadable_file = mocker.Mock(**{"read.side_effect": AssertionError("Fetched")})
+    mocker.patch.object(fake_audio_storage, "open_file", return_value=unreadable_file)
+
+    track_read_dto = await native_use_case.execute(
+        request.getfixturevalue(track_upload)
+    )
+
+    assert 2400 <= track_read_dto.duration <= 2600
+
+
+async def test_reads_duration_between_edges_from_storage(
+    ogg_track_upload: InMemoryTrackUpload,
+    native_use_case: CreateTrack,
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "jamflow.recordings.use_cases.create_track.DURATION_PROBE_HEAD_SIZE", 16
+    )
+    mocker.patch(
+        "jamflow.recordings.use_cases.create_track.DURATION_PROBE_TAIL_SIZE", 16
+    )
+
+    track_read_dto = await native_use_case.execute(ogg_track_upload)
+
+    assert 2400 <= track_read_dto.duration <= 2600
+
+
+@pytest.mark.parametrize(
+    "data,expected_message",
+    [
+        (b"", "File is empty"),
+        (b"testtext", "Unsupported file format. Supported formats: mp3, wav, ogg"),
+    ],
+)
+async def test_invalid_file_raises_validation_error(
+    data: bytes,
+    expected_message: str,
+    native_use_case: CreateTrack,
+    fake_audio_storage: FakeAudioStorage,
+):
+    with pytest.raises(ValidationError, match=expected_message) as exc_info:
+        await native_use_case.execute(InMemoryTrackUpload(data))
+
+    assert exc_info.value.field == "upload_file"
+    assert not fake_audio_storage.files
+
+
+async def test_too_large_file_raises_validation_error(
+    fake_audio_storage: FakeAudioStorage,
+    fake_track_repo: FakeTrackRepository,
+    use_case: CreateTrack,
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "jamflow.recordings.use_cases.create_track.MAX_UPLOAD_FILE_SIZE",
+        2 * 1024 * 1024,
+    )
+    track_upload = InMemoryTrackUpload(b"\0" * (2 * 1024 * 1024 + 1))
+
+    with pytest.raises(ValidationError, match="File is larger than 2 MB"):
+        await use_case.execute(track_upload)
+
+    assert not fake_audio_storage.files
+    assert not fake_track_repo.models
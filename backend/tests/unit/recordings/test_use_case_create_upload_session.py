@@ -0,0 +1,55 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from jamflow.core.exceptions import ValidationError
+from jamflow.infra.bootstrap import build_create_upload_session
+from jamflow.recordings.schemas import MAX_UPLOAD_FILE_SIZE, UploadSessionCreateDto
+from jamflow.recordings.use_cases import CreateUploadSession
+from tests.unit.fakes import FakeUploadSessionRepository
+
+
+@pytest.fixture
+def use_case(
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    mock_db_session: AsyncMock,
+) -> CreateUploadSession:
+    return build_create_upload_session(
+        upload_session_repo=fake_upload_session_repo, session=mock_db_session
+    )
+
+
+async def test_creates_session_at_offset_zero(
+    use_case: CreateUploadSession,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    mock_db_session: AsyncMock,
+):
+    upload_session_dto = await use_case.execute(
+        UploadSessionCreateDto(title="Jam", recorded_date=None, size=1000)
+    )
+
+    upload_session = fake_upload_session_repo.models[upload_session_dto.id]
+    assert upload_session.title == "Jam"
+    assert upload_session_dto.size == 1000
+    assert upload_session_dto.offset == 0
+    assert upload_session_dto.track is None
+    assert upload_session_dto.expires_at > upload_session.updated_at
+    assert upload_session_dto.expires_at - upload_session.updated_at == timedelta(
+        hours=24
+    )
+    mock_db_session.commit.assert_awaited_once()
+
+
+async def test_too_large_file_raises_validation_error(
+    use_case: CreateUploadSession,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+):
+    with pytest.raises(ValidationError, match="File is larger than 200 MB"):
+        await use_case.execute(
+            UploadSessionCreateDto(
+                title="Jam", recorded_date=None, size=MAX_UPLOAD_FILE_SIZE + 1
+            )
+        )
+
+    assert not fake_upload_session_repo.models
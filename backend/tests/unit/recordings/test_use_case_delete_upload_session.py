@@ -0,0 +1,65 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from jamflow.core.exceptions import ResourceNotFoundError
+from jamflow.infra.bootstrap import build_delete_upload_session
+from jamflow.recordings.models import UploadSession
+from jamflow.recordings.use_cases import DeleteUploadSession
+from tests.unit.fakes import FakeAudioStorage, FakeUploadSessionRepository
+
+
+@pytest.fixture
+def use_case(
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> DeleteUploadSession:
+    return build_delete_upload_session(
+        upload_session_repo=fake_upload_session_repo,
+        session=mock_db_session,
+        audio_storage=fake_audio_storage,
+    )
+
+
+async def test_deletes_session_and_aborts_its_upload(
+    use_case: DeleteUploadSession,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+):
+    upload_id = await fake_audio_storage.start_multipart_upload(
+        "path/to/track.mp3", content_type="audio/mpeg"
+    )
+    upload_session = await fake_upload_session_repo.create(
+        UploadSession(
+            title="Jam",
+            recorded_date=None,
+            size=1000,
+            path="path/to/track.mp3",
+            storage_upload_id=upload_id,
+        )
+    )
+
+    await use_case.execute(upload_session.id)
+
+    assert upload_session.id not in fake_upload_session_repo.models
+    assert upload_id not in fake_audio_storage.multipart_uploads
+
+
+async def test_deletes_session_without_upload(
+    use_case: DeleteUploadSession,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+):
+    upload_session = await fake_upload_session_repo.create(
+        UploadSession(title="Jam", recorded_date=None, size=1000)
+    )
+
+    await use_case.execute(upload_session.id)
+
+    assert upload_session.id not in fake_upload_session_repo.models
+
+
+async def test_with_missing_session_raises_error(use_case: DeleteUploadSession):
+    with pytest.raises(ResourceNotFoundError, match="Upload session not found"):
+        await use_case.execute(uuid.uuid4())
@@ -0,0 +1,254 @@
+import uuid
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jamflow.core.exceptions import (
+    DuplicateEntityError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from jamflow.infra.bootstrap import build_finish_track_upload
+from jamflow.recordings.models import AudioFileFormat, DirectUpload
+from jamflow.recordings.schemas import TrackUploadFinishDto
+from jamflow.recordings.use_cases import FinishTrackUpload
+from jamflow.recordings.utils import generate_track_path, parse_track_path
+from tests.unit.factories import TrackFactory
+from tests.unit.fakes import (
+    FakeAudioStorage,
+    FakeDirectUploadRepository,
+    FakeTrackRepository,
+)
+
+
+@pytest.fixture
+def use_case(
+    fake_track_repo: FakeTrackRepository,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> FinishTrackUpload:
+    return build_finish_track_upload(
+        track_repo=fake_track_repo,
+        direct_upload_repo=fake_direct_upload_repo,
+        audio_storage=fake_audio_storage,
+        session=mock_db_session,
+    )
+
+
+async def upload(
+    fake_audio_storage: FakeAudioStorage,
+    data: bytes,
+    format: AudioFileFormat = AudioFileFormat.MP3,
+) -> str:
+    path = generate_track_path(uuid.uuid4(), format)
+    async with fake_audio_storage as storage:
+        await storage.store_file(data, path=path, content_type=format.mime_type)
+    return path
+
+
+@pytest.mark.parametrize(
+    "audio_file,format",
+    [
+        ("mp3_file", AudioFileFormat.MP3),
+        ("ogg_file", AudioFileFormat.OGG),
+        ("wav_file", AudioFileFormat.WAV),
+    ],
+)
+async def test_creates_track_from_uploaded_file(
+    audio_file: str,
+    format: AudioFileFormat,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    fake_track_repo: FakeTrackRepository,
+    request: pytest.FixtureRequest,
+):
+    data = Path(request.getfixturevalue(audio_file)).read_bytes()
+    path = await upload(fake_audio_storage, data, format)
+
+    track_read_dto = await use_case.execute(
+        TrackUploadFinishDto(
+            upload_id=path, title="Jam", recorded_date=date(2024, 5, 1)
+        )
+    )
+
+    assert track_read_dto.title == "Jam"
+    assert track_read_dto.recorded_date == date(2024, 5, 1)
+    assert track_read_dto.format == format
+    assert track_read_dto.size == len(data)
+    assert 2400 <= track_read_dto.duration <= 2600
+    track = fake_track_repo.models[track_read_dto.id]
+    assert track.path == path
+
+
+@pytest.mark.parametrize(
+    "audio_file,format",
+    [
+        ("mp3_file", AudioFileFormat.MP3),
+        ("ogg_file", AudioFileFormat.OGG),
+        ("wav_file", AudioFileFormat.WAV),
+    ],
+)
+async def test_reads_duration_from_edges_of_uploaded_file(
+    audio_file: str,
+    format: AudioFileFormat,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    request: pytest.FixtureRequest,
+    mocker: MockerFixture,
+):
+    data = Path(request.getfixturevalue(audio_file)).read_bytes()
+    path = await upload(fake_audio_storage, data, format)
+    get_range = mocker.spy(fake_audio_storage, "get_range")
+    unreadable_file = mocker.Mock(**{"read.side_effect": AssertionError("Fetched")})
+    mocker.patch.object(fake_audio_storage, "open_file", return_value=unreadable_file)
+
+    track_read_dto = await use_case.execute(
+        TrackUploadFinishDto(upload_id=path, title="Jam", recorded_date=None)
+    )
+
+    assert 2400 <= track_read_dto.duration <= 2600
+    # The test files are smaller than the edges
+    get_range.assert_awaited_once_with(path, 0, len(data))
+
+
+async def test_reads_duration_between_edges_from_storage(
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    ogg_file: Path,
+    mocker: MockerFixture,
+):
+    module = "jamflow.recordings.use_cases.finish_track_upload"
+    mocker.patch(f"{module}.DURATION_PROBE_HEAD_SIZE", 64)
+    mocker.patch(f"{module}.DURATION_PROBE_TAIL_SIZE", 16)
+    data = ogg_file.read_bytes()
+    path = await upload(fake_audio_storage, data, AudioFileFormat.OGG)
+    get_range = mocker.spy(fake_audio_storage, "get_range")
+
+    track_read_dto = await use_case.execute(
+        TrackUploadFinishDto(upload_id=path, title="Jam", recorded_date=None)
+    )
+
+    assert 2400 <= track_read_dto.duration <= 2600
+    assert get_range.await_args_list == [
+        mocker.call(path, 0, 64),
+        mocker.call(path, len(data) - 16, len(data)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "upload_id", ["", "clips/2023/01/a/b.mp3", "tracks/../../secret.mp3"]
+)
+async def test_invalid_upload_id_raises_validation_error(
+    upload_id: str, use_case: FinishTrackUpload
+):
+    with pytest.raises(ValidationError, match="Invalid upload ID") as exc_info:
+        await use_case.execute(TrackUploadFinishDto(upload_id=upload_id, title="Jam"))
+
+    assert exc_info.value.field == "upload_id"
+
+
+async def test_unsupported_format_in_upload_id_raises_validation_error(
+    use_case: FinishTrackUpload,
+):
+    path = generate_track_path(uuid.uuid4(), "txt")
+
+    with pytest.raises(ValidationError, match="Invalid upload ID"):
+        await use_case.execute(TrackUploadFinishDto(upload_id=path, title="Jam"))
+
+
+async def test_missing_upload_raises_resource_not_found_error(
+    use_case: FinishTrackUpload,
+):
+    path = generate_track_path(uuid.uuid4(), AudioFileFormat.MP3)
+
+    with pytest.raises(ResourceNotFoundError):
+        await use_case.execute(TrackUploadFinishDto(upload_id=path, title="Jam"))
+
+
+async def test_finishing_twice_raises_duplicate_entity_error(
+    mp3_file: Path,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+):
+    path = await upload(fake_audio_storage, mp3_file.read_bytes())
+    track_upload_finish_dto = TrackUploadFinishDto(upload_id=path, title="Jam")
+    await use_case.execute(track_upload_finish_dto)
+
+    with pytest.raises(DuplicateEntityError):
+        await use_case.execute(track_upload_finish_dto)
+
+
+@pytest.mark.parametrize(
+    "data,expected_message",
+    [
+        (b"", "File is empty"),
+        (b"testtext", "Unsupported file format. Supported formats: mp3, wav, ogg"),
+    ],
+)
+async def test_invalid_file_raises_validation_error(
+    data: bytes,
+    expected_message: str,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    fake_track_repo: FakeTrackRepository,
+):
+    path = await upload(fake_audio_storage, data)
+
+    with pytest.raises(ValidationError, match=expected_message) as exc_info:
+        await use_case.execute(TrackUploadFinishDto(upload_id=path, title="Jam"))
+
+    assert exc_info.value.field == "upload_file"
+    assert not fake_track_repo.models
+    assert not fake_audio_storage.files
+
+
+async def test_file_of_other_format_than_started_raises_validation_error(
+    wav_file: Path,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    fake_track_repo: FakeTrackRepository,
+):
+    path = await upload(fake_audio_storage, wav_file.read_bytes(), AudioFileFormat.MP3)
+
+    with pytest.raises(ValidationError, match="not of format mp3"):
+        await use_case.execute(TrackUploadFinishDto(upload_id=path, title="Jam"))
+
+    assert not fake_track_repo.models
+    assert not fake_audio_storage.files
+
+
+async def test_finishing_deletes_record_of_direct_upload(
+    mp3_file: Path,
+    use_case: FinishTrackUpload,
+    fake_audio_storage: FakeAudioStorage,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+):
+    path = await upload(fake_audio_storage, mp3_file.read_bytes())
+    track_id, _ = parse_track_path(path)
+    await fake_direct_upload_repo.create(DirectUpload(id=track_id, path=path))
+
+    await use_case.execute(TrackUploadFinishDto(upload_id=path, title="Jam"))
+
+    assert not fake_direct_upload_repo.models
+
+
+async def test_existing_track_is_left_alone(
+    use_case: FinishTrackUpload,
+    fake_track_repo: FakeTrackRepository,
+):
+    track_id = uuid.uuid4()
+    track = TrackFactory.build(
+        id=track_id, path=generate_track_path(track_id, AudioFileFormat.MP3)
+    )
+    await fake_track_repo.create(track)
+
+    with pytest.raises(DuplicateEntityError):
+        await use_case.execute(
+            TrackUploadFinishDto(upload_id=track.path, title="Overwritten")
+        )
+
+    assert fake_track_repo.models[track.id].title != "Overwritten"
@@ -31,7 +31,7 @@ async def test_without_track_id_returns_all_clips(
     await fake_clip_repo.create(clip_1)
     await fake_clip_repo.create(clip_2)
 
-    clip_read_dtos = await use_case.execute()
+    clip_read_dtos = (await use_case.execute()).items
 
     assert len(clip_read_dtos) == 2
     assert {clip_1.id, clip_2.id} == {c.id for c in clip_read_dtos}
@@ -47,7 +47,7 @@ async def test_filters_by_track_id(
     await fake_clip_repo.create(clip_1)
     await fake_clip_repo.create(clip_2)
 
-    clip_read_dtos = await use_case.execute(filter_id)
+    clip_read_dtos = (await use_case.execute(filter_id)).items
 
     assert len(clip_read_dtos) == 1
     assert {clip_2.id} == {c.id for c in clip_read_dtos}
@@ -56,6 +56,43 @@ async def test_filters_by_track_id(
 async def test_with_no_clips_returns_empty_list(
     use_case: ListClip,
 ):
-    clip_read_dtos = await use_case.execute()
+    clip_read_dtos = (await use_case.execute()).items
 
     assert len(clip_read_dtos) == 0
+
+
+async def test_pages_through_clips_of_track_with_cursor(
+    use_case: ListClip,
+    fake_clip_repo: FakeClipRepository,
+):
+    track_id = uuid.uuid4()
+    clips = [ClipFactory.build(track_id=track_id) for _ in range(3)]
+    for clip in clips:
+        await fake_clip_repo.create(clip)
+
+    first_page = await use_case.execute(track_id, limit=2)
+    second_page = await use_case.execute(
+        track_id, limit=2, cursor=first_page.next_cursor
+    )
+
+    assert len(first_page.items) == 2
+    assert second_page.next_cursor is None
+    assert {c.id for c in [*first_page.items, *second_page.items]} == {
+        c.id for c in clips
+    }
+
+
+async def test_stream_yields_clips_of_track_in_batches(
+    use_case: ListClip,
+    fake_clip_repo: FakeClipRepository,
+):
+    track_id = uuid.uuid4()
+    clips = [ClipFactory.build(track_id=track_id) for _ in range(3)]
+    for clip in [*clips, ClipFactory.build(track_id=uuid.uuid4())]:
+        await fake_clip_repo.create(clip)
+
+    clip_read_dtos = [c async for c in use_case.stream(track_id, batch_size=2)]
+
+    expected = sorted(clips, key=lambda c: (c.created_at, c.id), reverse=True)
+    assert [c.id for c in clip_read_dtos] == [c.id for c in expected]
+    assert all(c.url is not None for c in clip_read_dtos)
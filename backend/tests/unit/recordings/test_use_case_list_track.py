@@ -28,7 +28,7 @@ async def test_returns_all_tracks(
     track_1 = await create_persisted_track()
     track_2 = await create_persisted_track()
 
-    track_read_dtos = await use_case.execute()
+    track_read_dtos = (await use_case.execute()).items
 
     assert len(track_read_dtos) == 2
     assert {track_1.id, track_2.id} == {c.id for c in track_read_dtos}
@@ -37,7 +37,7 @@ async def test_returns_all_tracks(
 async def test_with_no_tracks_returns_empty_list(
     use_case: ListTrack,
 ):
-    track_read_dtos = await use_case.execute()
+    track_read_dtos = (await use_case.execute()).items
 
     assert len(track_read_dtos) == 0
 
@@ -50,8 +50,39 @@ async def test_read_from_audio_storage(
     await create_persisted_track()
     await create_persisted_track()
 
-    track_read_dto_1, track_read_dto_2 = await use_case.execute()
+    track_read_dto_1, track_read_dto_2 = (await use_case.execute()).items
 
     stored_paths = fake_audio_storage.files.keys()
     assert track_read_dto_1.url.path in stored_paths
     assert track_read_dto_2.url.path in stored_paths
+
+
+async def test_pages_through_tracks_with_cursor(
+    use_case: ListTrack,
+    create_persisted_track: CreatePersistedTrack,
+):
+    tracks = [await create_persisted_track() for _ in range(3)]
+
+    first_page = await use_case.execute(limit=2)
+    second_page = await use_case.execute(limit=2, cursor=first_page.next_cursor)
+
+    assert len(first_page.items) == 2
+    assert second_page.next_cursor is None
+    assert {t.id for t in [*first_page.items, *second_page.items]} == {
+        t.id for t in tracks
+    }
+
+
+async def test_stream_yields_all_tracks_in_order_of_creation(
+    use_case: ListTrack,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+):
+    tracks = [await create_persisted_track() for _ in range(3)]
+
+    track_read_dtos = [t async for t in use_case.stream(batch_size=2)]
+
+    expected = sorted(tracks, key=lambda t: (t.created_at, t.id))
+    assert [t.id for t in track_read_dtos] == [t.id for t in expected]
+    stored_paths = fake_audio_storage.files.keys()
+    assert all(t.url.path in stored_paths for t in track_read_dtos)
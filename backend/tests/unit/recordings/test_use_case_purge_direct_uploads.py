@@ -0,0 +1,113 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jamflow.core.exceptions import ConcurrentModificationError, StorageError
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.models import DirectUpload
+from jamflow.recordings.use_cases import PurgeDirectUploads
+from tests.unit.fakes import FakeAudioStorage, FakeDirectUploadRepository
+
+
+@pytest.fixture
+def use_case(
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> PurgeDirectUploads:
+    return PurgeDirectUploads(
+        direct_upload_repo=fake_direct_upload_repo,
+        session=mock_db_session,
+        audio_storage=fake_audio_storage,
+        expiration=3600,
+        batch_size=2,
+    )
+
+
+async def create_direct_upload(
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    *,
+    age: timedelta,
+) -> DirectUpload:
+    direct_upload = DirectUpload(path="", updated_at=timezone_now() - age)
+    direct_upload.path = f"path/to/{direct_upload.id}.mp3"
+    await fake_audio_storage.store_file(
+        b"track", path=direct_upload.path, content_type="audio/mpeg"
+    )
+    return await fake_direct_upload_repo.create(direct_upload)
+
+
+async def test_deletes_files_of_stale_uploads_in_batches(
+    use_case: PurgeDirectUploads,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+):
+    for _ in range(3):
+        await create_direct_upload(
+            fake_direct_upload_repo, fake_audio_storage, age=timedelta(hours=2)
+        )
+    fresh = await create_direct_upload(
+        fake_direct_upload_repo, fake_audio_storage, age=timedelta(minutes=1)
+    )
+
+    assert await use_case.execute() == 2
+    assert await use_case.execute() == 1
+    assert await use_case.execute() == 0
+
+    assert list(fake_direct_upload_repo.models) == [fresh.id]
+    assert list(fake_audio_storage.files) == [fresh.path]
+
+
+async def test_failed_upload_is_skipped(
+    use_case: PurgeDirectUploads,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+    mocker: MockerFixture,
+):
+    for _ in range(2):
+        await create_direct_upload(
+            fake_direct_upload_repo, fake_audio_storage, age=timedelta(hours=2)
+        )
+    mocker.patch.object(
+        fake_audio_storage,
+        "delete_file",
+        side_effect=[StorageError("Storage down"), None],
+    )
+
+    assert await use_case.execute() == 1
+    mock_db_session.rollback.assert_awaited_once()
+
+
+async def test_failing_uploads_dont_hold_up_newer_ones(
+    use_case: PurgeDirectUploads,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mocker: MockerFixture,
+):
+    # The batch holds the two oldest uploads, which keep failing
+    *failing, newest = [
+        await create_direct_upload(
+            fake_direct_upload_repo, fake_audio_storage, age=timedelta(hours=hours)
+        )
+        for hours in (4, 3, 2)
+    ]
+    failing_ids = {direct_upload.id for direct_upload in failing}
+    delete = fake_direct_upload_repo.delete
+
+    async def fail_for_failing_ids(direct_upload):
+        if direct_upload.id in failing_ids:
+            raise ConcurrentModificationError("Changed concurrently")
+        await delete(direct_upload)
+
+    mocker.patch.object(
+        fake_direct_upload_repo, "delete", side_effect=fail_for_failing_ids
+    )
+
+    assert await use_case.execute() == 0
+    assert await use_case.execute() == 1
+
+    assert set(fake_direct_upload_repo.models) == failing_ids
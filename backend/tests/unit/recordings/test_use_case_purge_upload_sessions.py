@@ -0,0 +1,144 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from jamflow.core.exceptions import ConcurrentModificationError, StorageError
+from jamflow.core.utils import timezone_now
+from jamflow.recordings.models import UploadSession
+from jamflow.recordings.use_cases import PurgeUploadSessions
+from tests.unit.fakes import FakeAudioStorage, FakeUploadSessionRepository
+
+
+@pytest.fixture
+def use_case(
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> PurgeUploadSessions:
+    return PurgeUploadSessions(
+        upload_session_repo=fake_upload_session_repo,
+        session=mock_db_session,
+        audio_storage=fake_audio_storage,
+        expiration=3600,
+        batch_size=2,
+    )
+
+
+async def create_upload_session(
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    *,
+    age: timedelta,
+) -> UploadSession:
+    upload_session = UploadSession(
+        title="Jam", recorded_date=None, size=1000, updated_at=timezone_now() - age
+    )
+    upload_session.path = f"path/to/{upload_session.id}.mp3"
+    upload_session.storage_upload_id = await fake_audio_storage.start_multipart_upload(
+        upload_session.path, content_type="audio/mpeg"
+    )
+    return await fake_upload_session_repo.create(upload_session)
+
+
+async def test_discards_stale_sessions_in_batches(
+    use_case: PurgeUploadSessions,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+):
+    for _ in range(3):
+        await create_upload_session(
+            fake_upload_session_repo, fake_audio_storage, age=timedelta(hours=2)
+        )
+    fresh = await create_upload_session(
+        fake_upload_session_repo, fake_audio_storage, age=timedelta(minutes=1)
+    )
+
+    assert await use_case.execute() == 2
+    assert await use_case.execute() == 1
+    assert await use_case.execute() == 0
+
+    assert list(fake_upload_session_repo.models) == [fresh.id]
+    assert list(fake_audio_storage.multipart_uploads) == [fresh.storage_upload_id]
+
+
+async def test_failed_session_is_skipped(
+    use_case: PurgeUploadSessions,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+    mocker: MockerFixture,
+):
+    for _ in range(2):
+        await create_upload_session(
+            fake_upload_session_repo, fake_audio_storage, age=timedelta(hours=2)
+        )
+    mocker.patch.object(
+        fake_audio_storage,
+        "abort_multipart_upload",
+        side_effect=[StorageError("Storage down"), None],
+    )
+
+    assert await use_case.execute() == 1
+    mock_db_session.rollback.assert_awaited_once()
+
+
+async def test_deletes_file_of_completed_upload(
+    use_case: PurgeUploadSessions,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+):
+    upload_session = await create_upload_session(
+        fake_upload_session_repo, fake_audio_storage, age=timedelta(hours=2)
+    )
+    assert upload_session.path is not None
+    assert upload_session.storage_upload_id is not None
+    # Completed, but creating the track failed afterwards
+    tag = await fake_audio_storage.upload_part(
+        upload_session.path,
+        upload_id=upload_session.storage_upload_id,
+        number=1,
+        data=b"0123",
+    )
+    await fake_audio_storage.complete_multipart_upload(
+        upload_session.path,
+        upload_id=upload_session.storage_upload_id,
+        part_tags=[tag],
+    )
+
+    assert await use_case.execute() == 1
+
+    assert not fake_upload_session_repo.models
+    assert not fake_audio_storage.files
+
+
+async def test_failing_sessions_dont_hold_up_newer_ones(
+    use_case: PurgeUploadSessions,
+    fake_upload_session_repo: FakeUploadSessionRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mocker: MockerFixture,
+):
+    # The batch holds the two oldest sessions, which keep failing
+    *failing, newest = [
+        await create_upload_session(
+            fake_upload_session_repo, fake_audio_storage, age=timedelta(hours=hours)
+        )
+        for hours in (4, 3, 2)
+    ]
+    failing_ids = {upload_session.id for upload_session in failing}
+    delete = fake_upload_session_repo.delete
+
+    async def fail_for_failing_ids(upload_session):
+        if upload_session.id in failing_ids:
+            raise ConcurrentModificationError("Changed concurrently")
+        await delete(upload_session)
+
+    mocker.patch.object(
+        fake_upload_session_repo, "delete", side_effect=fail_for_failing_ids
+    )
+
+    assert await use_case.execute() == 0
+    assert await use_case.execute() == 1
+
+    assert set(fake_upload_session_repo.models) == failing_ids
@@ -5,6 +5,7 @@ import pytest
 
 from jamflow.core.exceptions import ResourceNotFoundError
 from jamflow.infra.bootstrap import build_read_clip
+from jamflow.recordings.models import ClipStatus
 from jamflow.recordings.use_cases import ReadClip
 from tests.unit.factories import ClipFactory
 from tests.unit.fakes import FakeAudioStorage, FakeClipRepository
@@ -41,3 +42,16 @@ async def test_returns_correct_clip(
     clip_read_dto = await use_case.execute(clip_1.id)
 
     assert clip_read_dto.id == clip_1.id
+
+
+async def test_pending_clip_has_no_url(
+    use_case: ReadClip,
+    fake_clip_repo: FakeClipRepository,
+):
+    clip = ClipFactory.build(status=ClipStatus.PENDING)
+    await fake_clip_repo.create(clip)
+
+    clip_read_dto = await use_case.execute(clip.id)
+
+    assert clip_read_dto.status == ClipStatus.PENDING
+    assert clip_read_dto.url is None
@@ -0,0 +1,161 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from jamflow.core.utils import timezone_now
+from jamflow.infra.bootstrap import build_render_clip
+from jamflow.recordings.models import ClipStatus
+from jamflow.recordings.use_cases import RenderClip
+from tests.unit.factories import ClipFactory
+from tests.unit.fakes import (
+    FakeAudioProcessor,
+    FakeAudioStorage,
+    FakeClipRepository,
+    FakeTrackRepository,
+)
+from tests.unit.recordings.conftest import CreatePersistedTrack
+
+
+@pytest.fixture
+def use_case(
+    fake_clip_repo: FakeClipRepository,
+    fake_track_repo: FakeTrackRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> RenderClip:
+    return build_render_clip(
+        clip_repo=fake_clip_repo,
+        track_repo=fake_track_repo,
+        audio_processor=fake_audio_processor,
+        audio_storage=fake_audio_storage,
+        session=mock_db_session,
+    )
+
+
+async def test_without_pending_clips_returns_none(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+):
+    await fake_clip_repo.create(ClipFactory.build(status=ClipStatus.READY))
+
+    assert await use_case.execute() is None
+
+
+async def test_renders_pending_clip(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+    mock_db_session: AsyncMock,
+):
+    track = await create_persisted_track()
+    clip = ClipFactory.build(track_id=track.id, status=ClipStatus.PENDING, size=None)
+    await fake_clip_repo.create(clip)
+    fake_audio_processor.size = 123
+    committed = []
+    mock_db_session.commit.side_effect = lambda: committed.append(clip.status)
+
+    clip_id = await use_case.execute()
+
+    assert clip_id == clip.id
+    assert clip.status == ClipStatus.READY
+    assert clip.size == 123
+    assert clip.leased_until is None
+    assert clip.path in fake_audio_storage.files
+    # The lease is committed before the clip is rendered
+    assert committed == [ClipStatus.RENDERING, ClipStatus.READY]
+
+
+async def test_failed_rendering_marks_clip_failed(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    create_persisted_track: CreatePersistedTrack,
+    mock_db_session: AsyncMock,
+):
+    track = await create_persisted_track()
+    clip = ClipFactory.build(track_id=track.id, status=ClipStatus.PENDING, size=None)
+    await fake_clip_repo.create(clip)
+    fake_audio_processor.fail_on("clip")
+
+    clip_id = await use_case.execute()
+
+    assert clip_id == clip.id
+    assert clip.status == ClipStatus.FAILED
+    assert clip.leased_until is None
+    mock_db_session.rollback.assert_awaited_once()
+    assert mock_db_session.commit.await_count == 2
+
+
+async def test_rolls_back_failed_transaction_before_marking_clip_failed(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+    create_persisted_track: CreatePersistedTrack,
+    mock_db_session: AsyncMock,
+):
+    track = await create_persisted_track()
+    clip = ClipFactory.build(track_id=track.id, status=ClipStatus.PENDING, size=None)
+    await fake_clip_repo.create(clip)
+    mock_db_session.commit.side_effect = [Exception("Connection lost"), None]
+
+    await use_case.execute()
+
+    assert clip.status == ClipStatus.FAILED
+    assert mock_db_session.mock_calls[-2:] == [
+        ("rollback", (), {}),
+        ("commit", (), {}),
+    ]
+
+
+async def test_takes_over_clip_with_expired_lease(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+    create_persisted_track: CreatePersistedTrack,
+):
+    track = await create_persisted_track()
+    leased = ClipFactory.build(
+        track_id=track.id,
+        status=ClipStatus.RENDERING,
+        leased_until=timezone_now() + timedelta(minutes=1),
+        size=None,
+    )
+    await fake_clip_repo.create(leased)
+    expired = ClipFactory.build(
+        track_id=track.id,
+        status=ClipStatus.RENDERING,
+        leased_until=timezone_now() - timedelta(minutes=1),
+        size=None,
+    )
+    await fake_clip_repo.create(expired)
+
+    assert await use_case.execute() == expired.id
+    assert await use_case.execute() is None
+    assert expired.status == ClipStatus.READY
+    assert leased.status == ClipStatus.RENDERING
+
+
+async def test_reuses_file_of_identical_rendered_clip(
+    use_case: RenderClip,
+    fake_clip_repo: FakeClipRepository,
+    fake_audio_processor: FakeAudioProcessor,
+    fake_audio_storage: FakeAudioStorage,
+    create_persisted_track: CreatePersistedTrack,
+):
+    track = await create_persisted_track()
+    rendered = ClipFactory.build(track_id=track.id, status=ClipStatus.READY, size=321)
+    await fake_clip_repo.create(rendered)
+    clip = ClipFactory.build(
+        track_id=track.id, path=rendered.path, status=ClipStatus.PENDING, size=None
+    )
+    await fake_clip_repo.create(clip)
+    fake_audio_processor.fail_on("clip")
+    fake_audio_storage.checkpoint()
+
+    await use_case.execute()
+
+    assert clip.status == ClipStatus.READY
+    assert clip.size == 321
+    assert not fake_audio_storage.new_files()
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from jamflow.core.utils import timezone_now
+from jamflow.infra.bootstrap import build_start_track_upload
+from jamflow.recordings.models import AudioFileFormat
+from jamflow.recordings.schemas import TrackUploadStartDto
+from jamflow.recordings.use_cases import StartTrackUpload
+from jamflow.recordings.utils import parse_track_path
+from tests.unit.fakes import FakeAudioStorage, FakeDirectUploadRepository
+
+
+@pytest.fixture
+def use_case(
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+) -> StartTrackUpload:
+    return build_start_track_upload(
+        direct_upload_repo=fake_direct_upload_repo,
+        audio_storage=fake_audio_storage,
+        session=mock_db_session,
+    )
+
+
+async def test_upload_id_is_new_track_path_of_requested_format(
+    use_case: StartTrackUpload,
+):
+    track_upload_dto = await use_case.execute(
+        TrackUploadStartDto(format=AudioFileFormat.OGG)
+    )
+
+    _, extension = parse_track_path(track_upload_dto.upload_id)
+    assert extension == "ogg"
+
+
+async def test_upload_ids_are_unique(use_case: StartTrackUpload):
+    track_upload_start_dto = TrackUploadStartDto(format=AudioFileFormat.MP3)
+
+    first = await use_case.execute(track_upload_start_dto)
+    second = await use_case.execute(track_upload_start_dto)
+
+    assert first.upload_id != second.upload_id
+
+
+async def test_returns_form_restricted_to_path_and_content_type(
+    use_case: StartTrackUpload,
+):
+    track_upload_dto = await use_case.execute(
+        TrackUploadStartDto(format=AudioFileFormat.MP3)
+    )
+
+    assert track_upload_dto.fields == {
+        "key": track_upload_dto.upload_id,
+        "Content-Type": "audio/mpeg",
+    }
+
+
+async def test_expires_after_configured_time(
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    fake_audio_storage: FakeAudioStorage,
+    mock_db_session: AsyncMock,
+):
+    use_case = StartTrackUpload(
+        direct_upload_repo=fake_direct_upload_repo,
+        session=mock_db_session,
+        audio_storage=fake_audio_storage,
+        expiration=600,
+    )
+
+    track_upload_dto = await use_case.execute(
+        TrackUploadStartDto(format=AudioFileFormat.MP3)
+    )
+
+    expected_expiry = timezone_now() + timedelta(seconds=600)
+    assert abs(track_upload_dto.expires_at - expected_expiry) < timedelta(seconds=5)
+
+
+async def test_stores_nothing(
+    use_case: StartTrackUpload, fake_audio_storage: FakeAudioStorage
+):
+    await use_case.execute(TrackUploadStartDto(format=AudioFileFormat.WAV))
+
+    assert not fake_audio_storage.files
+
+
+async def test_records_upload_to_purge_it_if_never_finished(
+    use_case: StartTrackUpload,
+    fake_direct_upload_repo: FakeDirectUploadRepository,
+    mock_db_session: AsyncMock,
+):
+    track_upload_dto = await use_case.execute(
+        TrackUploadStartDto(format=AudioFileFormat.MP3)
+    )
+
+    track_id, _ = parse_track_path(track_upload_dto.upload_id)
+    direct_upload = fake_direct_upload_repo.models[track_id]
+    assert direct_upload.path == track_upload_dto.upload_id
+    mock_db_session.commit.assert_awaited_once()
@@ -4,7 +4,12 @@ from datetime import datetime
 import pytest
 from pytest_mock import MockerFixture
 
-from jamflow.recordings.utils import generate_clip_path, generate_track_path
+from jamflow.recordings.utils import (
+    generate_clip_content_id,
+    generate_clip_path,
+    generate_track_path,
+    parse_track_path,
+)
 
 
 def test_generate_track_path_returns_path_nested_by_year_and_month(
@@ -30,6 +35,29 @@ def test_generate_track_path_raises_value_error_on_empty_extension():
         generate_track_path(uuid.uuid4(), "")
 
 
+def test_parse_track_path_returns_id_and_extension_of_generated_path():
+    track_id = uuid.uuid4()
+
+    path = generate_track_path(track_id, "mp3")
+
+    assert parse_track_path(path) == (track_id, "mp3")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "",
+        "tracks/2023/01/1234567890abcdef1234567890abcdef/fedcba0987654321fedcba0987654321.mp3",
+        "tracks/2023/01/1234567890abcdef1234567890abcdef/1234567890abcdef1234567890abcdef",
+        "clips/2023/01/1234567890abcdef1234567890abcdef/1234567890abcdef1234567890abcdef.mp3",
+        "../tracks/2023/01/1234567890abcdef1234567890abcdef/1234567890abcdef1234567890abcdef.mp3",
+    ],
+)
+def test_parse_track_path_raises_value_error_on_other_paths(path: str):
+    with pytest.raises(ValueError, match="Not a track path"):
+        parse_track_path(path)
+
+
 def test_generate_clip_path_returns_path_nested_under_track_directory():
     track_path = "tracks/2023/01/1234567890abcdef1234567890abcdef/1234567890abcdef1234567890abcdef.txt"
     clip_id = uuid.UUID(hex="fedcba0987654321fedcba0987654321")
@@ -62,3 +90,25 @@ def test_generate_clip_path_raises_value_error_on_empty_extension():
 
     with pytest.raises(ValueError, match="Extension must not be empty"):
         generate_clip_path(track_path, clip_id, "")
+
+
+def test_generate_clip_content_id_is_stable_for_identical_clips():
+    track_id = uuid.uuid4()
+
+    assert generate_clip_content_id(track_id, 0, 1_000, "mp3") == (
+        generate_clip_content_id(track_id, 0, 1_000, "mp3")
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "extension"),
+    [(1, 1_000, "mp3"), (0, 1_001, "mp3"), (0, 1_000, "wav")],
+)
+def test_generate_clip_content_id_differs_for_different_clips(
+    start: int, end: int, extension: str
+):
+    track_id = uuid.uuid4()
+
+    assert generate_clip_content_id(track_id, 0, 1_000, "mp3") != (
+        generate_clip_content_id(track_id, start, end, extension)
+    )
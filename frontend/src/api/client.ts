@@ -2,8 +2,30 @@ import axios from "axios";
 
 import { appConfig } from "@/config/app";
 
+// Sent after writes with a Unix time until which reads should go to the
+// primary database, so that the replica is not asked for what was just
+// written. Echoed back in a header, since cookies don't cross origins here.
+const READ_PRIMARY_HEADER = "x-read-primary-until";
+
+let readPrimaryUntil: string | null = null;
+
 export const apiClient = axios.create({
   baseURL: appConfig.API_BASE_URL,
   // TODO: find a sane value that works for large file uploads
   // timeout: 10 * 1_000, // Milliseconds
 });
+
+apiClient.interceptors.request.use((config) => {
+  if (readPrimaryUntil && Number(readPrimaryUntil) * 1_000 > Date.now()) {
+    config.headers.set(READ_PRIMARY_HEADER, readPrimaryUntil);
+  }
+  return config;
+});
+
+apiClient.interceptors.response.use((response) => {
+  const value = response.headers[READ_PRIMARY_HEADER];
+  if (typeof value === "string") {
+    readPrimaryUntil = value;
+  }
+  return response;
+});
@@ -1,6 +1,7 @@
 import { apiClient } from "@/api/client";
 import { mapAxiosError } from "@/api/errorHandler";
 import { mapClipToInternal } from "@/api/mappers";
+import { getAllPages } from "@/api/pagination";
 import type { ClipCreateRequest, ClipResponse, QueryParams } from "@/api/types";
 import type { Clip } from "@/types";
 
@@ -41,10 +42,8 @@ export async function listClips(trackId?: string): Promise<Clip[]> {
   }
 
   try {
-    const response = await apiClient.get<ClipResponse[]>(resource, {
-      params,
-    });
-    return response.data.map(mapClipToInternal);
+    const clips = await getAllPages<ClipResponse>(resource, params);
+    return clips.map(mapClipToInternal);
   } catch (error) {
     throw mapAxiosError(error);
   }
@@ -0,0 +1,22 @@
+import { apiClient } from "@/api/client";
+import type { QueryParams } from "@/api/types";
+
+// Listings are served in pages, with the cursor of the next page in a header
+const NEXT_CURSOR_HEADER = "x-next-cursor";
+const PAGE_SIZE = 200; // largest page the API serves
+
+export async function getAllPages<T>(
+  url: string,
+  params: QueryParams = {},
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const response = await apiClient.get<T[]>(url, {
+      params: { ...params, limit: PAGE_SIZE, ...(cursor && { cursor }) },
+    });
+    items.push(...response.data);
+    cursor = response.headers[NEXT_CURSOR_HEADER] as string | undefined;
+  } while (cursor);
+  return items;
+}
@@ -104,6 +104,7 @@ describe("track api", () => {
     it("calls the mapper", async () => {
       apiClientGetMock.mockResolvedValueOnce({
         data: Array(3).fill(null).map(createTestTrackResponse),
+        headers: {},
       });
       const mapTrackToInternalSpy = vi.spyOn(mappers, "mapTrackToInternal");
 
@@ -114,6 +115,29 @@ describe("track api", () => {
       mapTrackToInternalSpy.mockClear();
     });
 
+    it("follows the next cursor until the last page", async () => {
+      apiClientGetMock
+        .mockResolvedValueOnce({
+          data: Array(2).fill(null).map(createTestTrackResponse),
+          headers: { "x-next-cursor": "next" },
+        })
+        .mockResolvedValueOnce({
+          data: [createTestTrackResponse()],
+          headers: {},
+        });
+
+      const tracks = await listTracks();
+
+      expect(tracks).toHaveLength(3);
+      expect(apiClientGetMock).toHaveBeenCalledTimes(2);
+      const [firstPath, firstConfig] = apiClientGetMock.mock.calls[0];
+      const [secondPath, secondConfig] = apiClientGetMock.mock.calls[1];
+      expect(firstPath).toBe("/tracks");
+      expect(firstConfig.params.cursor).toBeUndefined();
+      expect(secondPath).toBe("/tracks");
+      expect(secondConfig.params.cursor).toBe("next");
+    });
+
     it("catches errors and passes them to the mapper", async () => {
       const originalError = new Error("Something went wrong");
       apiClientGetMock.mockRejectedValueOnce(originalError);
@@ -1,6 +1,7 @@
 import { apiClient } from "@/api/client";
 import { mapAxiosError } from "@/api/errorHandler";
 import { mapTrackToInternal } from "@/api/mappers";
+import { getAllPages } from "@/api/pagination";
 import type { TrackResponse } from "@/api/types";
 import type { Track, TrackCreateForm } from "@/types";
 
@@ -37,8 +38,8 @@ export async function getTrack(id: string): Promise<Track> {
 
 export async function listTracks(): Promise<Track[]> {
   try {
-    const response = await apiClient.get<TrackResponse[]>(resource);
-    return response.data.map(mapTrackToInternal);
+    const tracks = await getAllPages<TrackResponse>(resource);
+    return tracks.map(mapTrackToInternal);
   } catch (error) {
     throw mapAxiosError(error);
   }